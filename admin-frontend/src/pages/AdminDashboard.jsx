@@ -145,8 +145,16 @@ const AdminDashboard = () => {
   const fetchUsers = async () => {
     try {
       setUsersLoading(true);
-      const response = await api.get('/admin/users');
-      setUsers(response.data.users || []);
+      // 페이지 단위 응답: next_cursor가 없을 때까지 이어서 조회
+      const allUsers = [];
+      let cursor = null;
+      do {
+        const query = cursor ? `limit=500&cursor=${encodeURIComponent(cursor)}` : 'limit=500';
+        const response = await api.get(`/admin/users?${query}`);
+        allUsers.push(...(response.data.users || []));
+        cursor = response.data.next_cursor;
+      } while (cursor);
+      setUsers(allUsers);
     } catch (error) {
       console.error('Failed to fetch users:', error);
       alert('사용자 목록 조회 실패');
@@ -0,0 +1,48 @@
+"""Add user trade rollups materialized view
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+This migration adds the user_trade_rollups materialized view (PostgreSQL only)
+used by the admin user list when ADMIN_USER_ROLLUP_VIEW=true:
+- one row per user: total_trades, total_pnl, winning_trades, losing_trades
+- unique index on user_id so it can be refreshed CONCURRENTLY
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS user_trade_rollups AS
+        SELECT
+            user_id,
+            COUNT(id) AS total_trades,
+            COALESCE(SUM(pnl), 0) AS total_pnl,
+            COUNT(*) FILTER (WHERE pnl > 0) AS winning_trades,
+            COUNT(*) FILTER (WHERE pnl < 0) AS losing_trades
+        FROM trades
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    """)
+    op.create_index('ux_user_trade_rollups_user_id', 'user_trade_rollups', ['user_id'], unique=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS user_trade_rollups")
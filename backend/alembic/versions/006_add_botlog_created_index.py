@@ -0,0 +1,29 @@
+"""Add bot_logs (created_at, id) index
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+This migration adds idx_botlog_created_id on bot_logs (created_at, id) for:
+- keyset pagination of admin system/bot logs without a user filter
+- day-range scans of the bot log retention job
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_botlog_created_id', 'bot_logs', ['created_at', 'id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_botlog_created_id', table_name='bot_logs', if_exists=True)
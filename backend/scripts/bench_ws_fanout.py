@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+시세 → 브라우저 경로 마이크로 벤치마크
+
+거래소 프레임 파싱(feed_manager) → 가격 메시지 생성 → broadcast_hub (price:BTCUSDT 토픽)
+경로를 연결 N개에 대해 돌려 초당 틱 수를 측정합니다.
+
+- baseline: 표준 json 파싱 + 연결마다 send_json을 차례로 await (기존 방식)
+- hub: utils.fast_json 파싱 + 메시지당 한 번 직렬화, 연결별 송신 큐/writer 태스크
+
+소켓은 실제 네트워크 대신 전송 바이트만 세는 가짜 객체를 사용합니다 (직렬화/분배 비용만 측정).
+지연 없는 소켓만 있으면 baseline은 문맥 전환이 없어 hub보다 빠르게 나오고 (hub는 연결마다 writer 전환 비용),
+--slow로 전송마다 지연되는 연결을 섞으면 baseline은 그 연결만큼 느려지지만 hub 처리량은 유지됩니다.
+
+Usage:
+    python scripts/bench_ws_fanout.py                       # 연결 1,000개, 틱 500개
+    python scripts/bench_ws_fanout.py --connections 5000 --ticks 200
+    python scripts/bench_ws_fanout.py --slow 10             # 전송당 5ms 걸리는 연결 10개 포함
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 경로 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.services.exchanges.feed_manager import BinanceFeedProtocol  # noqa: E402
+from src.utils import fast_json  # noqa: E402
+from src.websockets.broadcast_hub import BroadcastHub  # noqa: E402
+
+
+class CountingSocket:
+    """전송 메시지/바이트만 세는 WebSocket (delay > 0이면 느린 브라우저)"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = 0
+        self.sent_bytes = 0
+        self.closed = False
+
+    async def send_text(self, text: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent += 1
+        self.sent_bytes += len(text)
+
+    async def send_json(self, data):
+        # Starlette WebSocket.send_json과 같은 직렬화
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed = True
+
+
+def make_frames(count: int):
+    return [
+        json.dumps({
+            "stream": "btcusdt@miniTicker",
+            "data": {
+                "e": "24hrMiniTicker", "E": 1700000000000 + i, "s": "BTCUSDT",
+                "c": f"{50000 + i * 0.1:.1f}", "o": "49000.0", "h": "51000.0", "l": "48000.0",
+                "v": "12345.678", "q": "617283900.12",
+            },
+        })
+        for i in range(count)
+    ]
+
+
+def price_message(record):
+    return {
+        "type": "price_update",
+        "symbol": record.symbol,
+        "price": record.price,
+        "timestamp": record.ts,
+    }
+
+
+async def baseline(protocol, frames, sockets):
+    """기존 방식: 표준 json 파싱 + 연결마다 send_json"""
+    orjson_available = fast_json.ORJSON_AVAILABLE
+    fast_json.ORJSON_AVAILABLE = False
+    try:
+        for frame in frames:
+            for _, record in protocol.parse(frame):
+                data = price_message(record)
+                for socket in sockets:
+                    await socket.send_json(data)
+    finally:
+        fast_json.ORJSON_AVAILABLE = orjson_available
+
+
+async def hub_fanout(protocol, frames, hub):
+    """새 방식: fast_json 파싱 + broadcast_hub 발행 (큐 적재만, 전송은 writer 태스크)"""
+    for frame in frames:
+        for _, record in protocol.parse(frame):
+            hub.publish("price:BTCUSDT", price_message(record))
+        await asyncio.sleep(0)  # 다음 틱 전에 writer 태스크에 한 번 양보 (실제 피드 간격 대신)
+
+
+async def main(connections: int, ticks: int, slow: int, slow_delay: float):
+    protocol = BinanceFeedProtocol()
+    protocol.register(("ticker", "BTCUSDT", ""))
+    frames = make_frames(ticks)
+
+    print(f"orjson: {'yes' if fast_json.ORJSON_AVAILABLE else 'no (stdlib json fallback)'}")
+    print(f"connections: {connections:,} (slow: {slow}), ticks: {ticks:,}")
+
+    def make_sockets():
+        return [CountingSocket(delay=slow_delay if i < slow else 0.0) for i in range(connections)]
+
+    sockets = make_sockets()
+    started = time.perf_counter()
+    await baseline(protocol, frames, sockets)
+    elapsed = time.perf_counter() - started
+    base_rate = ticks / elapsed
+    print(f"baseline: {base_rate:10,.1f} ticks/s  ({base_rate * connections:14,.0f} messages/s, {elapsed:.2f}s)")
+
+    hub = BroadcastHub(max_queue=1024)
+    sockets = make_sockets()
+    conns = [hub.connect(socket, user_id) for user_id, socket in enumerate(sockets)]
+    for conn in conns:
+        hub.subscribe(conn, ["price:BTCUSDT"])
+
+    started = time.perf_counter()
+    await hub_fanout(protocol, frames, hub)
+    publish_elapsed = time.perf_counter() - started
+    while any(conn.queued for conn in conns[slow:]):  # 빠른 연결의 큐가 빌 때까지
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    hub_rate = ticks / elapsed
+    delivered = sum(s.sent for s in sockets)
+    print(
+        f"     hub: {hub_rate:10,.1f} ticks/s  ({delivered / elapsed:14,.0f} messages/s, {elapsed:.2f}s, "
+        f"publish {publish_elapsed:.2f}s)"
+    )
+    if slow:
+        print(f"    slow: {sum(s.sent for s in sockets[:slow]):,} sent (rest conflated into latest price), "
+              f"{hub.get_stats()['slow_disconnects']} disconnected")
+    print(f" speedup: {hub_rate / base_rate:.2f}x")
+    await hub.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=0, help="느린 연결 수")
+    parser.add_argument("--slow-delay", type=float, default=0.005, help="느린 연결의 전송당 지연 (초)")
+    args = parser.parse_args()
+    asyncio.run(main(args.connections, args.ticks, args.slow, args.slow_delay))
@@ -8,6 +8,7 @@
 - AgentTask: 에이전트 작업 정의
 - AgentState: 에이전트 상태 관리
 - RedisClient: 에이전트 간 통신
+- AgentStore: 배치(write-behind) 결과 저장소
 - Models: 데이터베이스 모델
 
 에이전트 타입:
@@ -100,6 +101,14 @@ from .risk_monitor import (
     RiskAction,
 )
 
+# Agent store (Redis 파이프라인 / 메모리 구현)
+from .agent_store import (
+    AgentStore,
+    RedisAgentStore,
+    InMemoryAgentStore,
+    create_agent_store,
+)
+
 # 버전 정보
 __version__ = "0.2.0"
 
@@ -117,6 +126,11 @@ __all__ = [
     "RedisConfig",
     "get_agent_config",
     "set_agent_config",
+    # Agent Store
+    "AgentStore",
+    "RedisAgentStore",
+    "InMemoryAgentStore",
+    "create_agent_store",
     # Market Regime Agent
     "MarketRegimeAgent",
     "MarketRegime",
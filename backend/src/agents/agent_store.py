@@ -0,0 +1,447 @@
+"""
+에이전트 저장소 (Agent Store)
+
+에이전트 결과/알림 저장용 배치 키-값 계층
+- Write-behind: 쓰기를 버퍼에 모았다가 크기(max_batch) 또는 시간(flush_interval)
+  기준으로 하나의 파이프라인으로 전송
+- MGET/MSET 헬퍼
+- 바이너리 직렬화 (msgpack 설치 시, 없으면 JSON)
+- 호출별 지연 시간, 파이프라인 채움률 메트릭
+
+RedisAgentStore와 InMemoryAgentStore는 같은 버퍼링 코드를 공유하므로
+테스트/로컬 실행도 운영과 같은 경로를 탑니다.
+
+set/get 시그니처는 RedisClient와 호환됩니다. 에이전트는 생성 시 as_agent_store()로
+전달받은 클라이언트(redis.asyncio, RedisClient, AgentStore)를 저장소로 감쌉니다.
+
+사용 예:
+```python
+store = create_agent_store(redis)          # redis=None이면 메모리 저장소
+await store.set("agent:key", {"a": 1}, ttl=60)
+values = await store.mget(["agent:key", "agent:other"])
+await store.close()                        # 남은 쓰기 flush
+```
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 직렬화
+# ============================================================
+
+class JsonSerializer:
+    """JSON 직렬화 (decode_responses=True 연결에서도 사용 가능)"""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, default=str)
+
+    def loads(self, raw: Any) -> Any:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            return raw
+
+
+class MsgpackSerializer:
+    """msgpack 바이너리 직렬화 (기존 JSON 값도 읽기 가능)"""
+
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True, default=str)
+
+    def loads(self, raw: Any) -> Any:
+        if isinstance(raw, bytes):
+            try:
+                return msgpack.unpackb(raw, raw=False)
+            except Exception:
+                raw = raw.decode("utf-8", errors="replace")
+        return JsonSerializer.loads(self, raw)
+
+
+def default_serializer(binary: bool = True):
+    """binary=True이고 msgpack이 있으면 msgpack, 아니면 JSON"""
+    if binary and MSGPACK_AVAILABLE:
+        return MsgpackSerializer()
+    return JsonSerializer()
+
+
+# ============================================================
+# 메트릭
+# ============================================================
+
+class StoreMetrics:
+    """호출별 지연 시간과 파이프라인 채움률"""
+
+    def __init__(self, max_batch: int):
+        self.max_batch = max_batch
+        self.calls: Dict[str, List[float]] = {}  # op → [count, total_sec, max_sec]
+        self.flushes = 0
+        self.flushed_ops = 0
+        self.flush_reasons: Dict[str, int] = {}
+        self.errors = 0
+
+    def record(self, op: str, elapsed: float):
+        stats = self.calls.setdefault(op, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+
+    def record_flush(self, ops: int, reason: str):
+        self.flushes += 1
+        self.flushed_ops += ops
+        self.flush_reasons[reason] = self.flush_reasons.get(reason, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": {
+                op: {
+                    "count": count,
+                    "avg_ms": round(total / count * 1000, 3) if count else 0,
+                    "max_ms": round(worst * 1000, 3),
+                }
+                for op, (count, total, worst) in self.calls.items()
+            },
+            "flushes": self.flushes,
+            "flushed_ops": self.flushed_ops,
+            "avg_ops_per_flush": round(self.flushed_ops / self.flushes, 2) if self.flushes else 0,
+            "fill_rate": (
+                round(self.flushed_ops / (self.flushes * self.max_batch), 3) if self.flushes else 0
+            ),
+            "flush_reasons": dict(self.flush_reasons),
+            "errors": self.errors,
+        }
+
+
+# ============================================================
+# 공통 write-behind 저장소
+# ============================================================
+
+# 버퍼 연산: (종류, 키, payload, 인자)
+# - ("set", key, payload, ttl)
+# - ("lpush_trim", key, payload, maxlen)
+# - ("delete", key, None, None)
+_Op = Tuple[str, str, Any, Optional[int]]
+_DELETED = object()
+
+
+class AgentStore:
+    """
+    Write-behind 배치 저장소 베이스
+
+    서브클래스는 _execute(ops), _read(keys), _publish(channel, message)만 구현합니다.
+    """
+
+    def __init__(self, serializer=None, max_batch: int = 100, flush_interval: float = 0.05):
+        self.serializer = serializer or default_serializer()
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+
+        self._ops: List[_Op] = []
+        self._pending: Dict[str, Any] = {}  # 아직 flush되지 않은 set/delete (read-your-writes)
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_tasks: set = set()  # 크기 기준 flush 태스크 (참조 유지)
+        self._flush_lock = asyncio.Lock()
+        self.metrics = StoreMetrics(max_batch)
+
+    # ==================== 쓰기 (버퍼링) ====================
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, serialize: bool = True
+    ) -> bool:
+        """키-값 저장 (버퍼링, ttl 초)"""
+        payload = self.serializer.dumps(value) if serialize else value
+        self._pending[key] = payload
+        self._enqueue(("set", key, payload, ttl))
+        return True
+
+    async def setex(self, key: str, ttl: int, value: Any) -> bool:
+        """redis-py 호환 setex"""
+        return await self.set(key, value, ttl=ttl)
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """여러 키 저장 (같은 flush에 포함)"""
+        for key, value in mapping.items():
+            payload = self.serializer.dumps(value)
+            self._pending[key] = payload
+            self._ops.append(("set", key, payload, ttl))
+        self._schedule_flush()
+        return True
+
+    async def lpush_trim(self, key: str, value: Any, maxlen: int):
+        """리스트 앞에 추가 후 maxlen개만 유지 (최근 N개 목록용)"""
+        self._enqueue(("lpush_trim", key, self.serializer.dumps(value), maxlen))
+
+    async def delete(self, *keys: str) -> int:
+        for key in keys:
+            self._pending[key] = _DELETED
+            self._ops.append(("delete", key, None, None))
+        self._schedule_flush()
+        return len(keys)
+
+    def _enqueue(self, op: _Op):
+        self._ops.append(op)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if len(self._ops) >= self.max_batch:
+            task = asyncio.create_task(self.flush("size"))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        # 타이머가 취소돼도 전송 중인 배치는 끝까지 보냄
+        await asyncio.shield(self.flush("time"))
+
+    async def flush(self, reason: str = "manual"):
+        """버퍼된 쓰기를 한 번에 전송"""
+        async with self._flush_lock:
+            while self._ops:
+                batch = self._ops[: self.max_batch]
+                del self._ops[: len(batch)]
+
+                started = time.perf_counter()
+                try:
+                    await self._execute(batch)
+                except Exception as e:
+                    self.metrics.errors += 1
+                    logger.error(f"Agent store flush failed ({len(batch)} ops dropped): {e}")
+                finally:
+                    self.metrics.record("flush", time.perf_counter() - started)
+                    self.metrics.record_flush(len(batch), reason)
+                    self._clear_pending(batch)
+
+    def _clear_pending(self, batch: Sequence[_Op]):
+        for kind, key, payload, _ in batch:
+            if kind == "lpush_trim":
+                continue
+            current = self._pending.get(key)
+            # 이후 같은 키에 새 쓰기가 들어왔으면 유지
+            if current is payload or (kind == "delete" and current is _DELETED):
+                del self._pending[key]
+
+    # ==================== 읽기 ====================
+
+    async def get(self, key: str, deserialize: bool = True, default: Any = None) -> Any:
+        """키 조회 (flush 대기 중인 쓰기 우선)"""
+        return (await self.mget([key], deserialize=deserialize, default=default))[0]
+
+    async def mget(
+        self, keys: Sequence[str], deserialize: bool = True, default: Any = None
+    ) -> List[Any]:
+        """여러 키를 한 번에 조회"""
+        results: List[Any] = [None] * len(keys)
+        missing: List[int] = []
+
+        for i, key in enumerate(keys):
+            pending = self._pending.get(key)
+            if pending is None:
+                missing.append(i)
+            elif pending is not _DELETED:
+                results[i] = pending
+
+        if missing:
+            started = time.perf_counter()
+            try:
+                raw = await self._read([keys[i] for i in missing])
+            except Exception as e:
+                self.metrics.errors += 1
+                logger.error(f"Agent store read failed: {e}")
+                raw = [None] * len(missing)
+            self.metrics.record("mget", time.perf_counter() - started)
+            for i, value in zip(missing, raw):
+                results[i] = value
+
+        return [
+            default if value is None else (self.serializer.loads(value) if deserialize else value)
+            for value in results
+        ]
+
+    async def lrange(self, key: str, start: int = 0, end: int = -1) -> List[Any]:
+        """리스트 조회 (대기 중인 쓰기를 먼저 flush)"""
+        await self.flush("read")
+        started = time.perf_counter()
+        raw = await self._lrange(key, start, end)
+        self.metrics.record("lrange", time.perf_counter() - started)
+        return [self.serializer.loads(value) for value in raw]
+
+    # ==================== Pub/Sub ====================
+
+    async def publish(self, channel: str, message: Any) -> int:
+        """즉시 발행 (버퍼링하지 않음, 메시지는 JSON 문자열)"""
+        if not isinstance(message, str):
+            message = json.dumps(message, default=str)
+        started = time.perf_counter()
+        try:
+            return await self._publish(channel, message)
+        finally:
+            self.metrics.record("publish", time.perf_counter() - started)
+
+    # ==================== 수명 주기 ====================
+
+    async def close(self):
+        """타이머 정리 후 남은 쓰기 flush"""
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush("close")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self).__name__,
+            "serializer": self.serializer.name,
+            "buffered_ops": len(self._ops),
+            **self.metrics.to_dict(),
+        }
+
+    # ==================== 백엔드 ====================
+
+    async def _execute(self, ops: Sequence[_Op]):
+        raise NotImplementedError
+
+    async def _read(self, keys: Sequence[str]) -> List[Any]:
+        raise NotImplementedError
+
+    async def _lrange(self, key: str, start: int, end: int) -> List[Any]:
+        raise NotImplementedError
+
+    async def _publish(self, channel: str, message: str) -> int:
+        raise NotImplementedError
+
+
+class RedisAgentStore(AgentStore):
+    """redis.asyncio 클라이언트 기반 저장소 (비트랜잭션 파이프라인)"""
+
+    def __init__(self, redis, serializer=None, **kwargs):
+        if serializer is None:
+            # decode_responses=True 연결은 바이너리 값을 읽을 수 없음
+            pool = getattr(redis, "connection_pool", None)
+            decode = getattr(pool, "connection_kwargs", {}).get("decode_responses", False)
+            serializer = default_serializer(binary=not decode)
+        super().__init__(serializer=serializer, **kwargs)
+        self.redis = redis
+
+    async def _execute(self, ops: Sequence[_Op]):
+        pipe = self.redis.pipeline(transaction=False)
+        for kind, key, payload, arg in ops:
+            if kind == "set":
+                pipe.set(key, payload, ex=arg)
+            elif kind == "lpush_trim":
+                pipe.lpush(key, payload)
+                pipe.ltrim(key, 0, arg - 1)
+            elif kind == "delete":
+                pipe.delete(key)
+        await pipe.execute()
+
+    async def _read(self, keys: Sequence[str]) -> List[Any]:
+        return await self.redis.mget(list(keys))
+
+    async def _lrange(self, key: str, start: int, end: int) -> List[Any]:
+        return await self.redis.lrange(key, start, end)
+
+    async def _publish(self, channel: str, message: str) -> int:
+        return await self.redis.publish(channel, message)
+
+    def pubsub(self):
+        """구독은 원본 클라이언트 사용"""
+        return self.redis.pubsub()
+
+
+class InMemoryAgentStore(AgentStore):
+    """Redis 없는 환경용 메모리 저장소 (같은 버퍼링 경로 사용)"""
+
+    def __init__(self, serializer=None, **kwargs):
+        super().__init__(serializer=serializer, **kwargs)
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}  # key → (payload, expires_at)
+        self._lists: Dict[str, List[Any]] = {}
+        self._subscribers: Dict[str, List[Callable[[str], Any]]] = {}
+
+    async def _execute(self, ops: Sequence[_Op]):
+        now = time.monotonic()
+        for kind, key, payload, arg in ops:
+            if kind == "set":
+                self._data[key] = (payload, now + arg if arg else None)
+            elif kind == "lpush_trim":
+                items = self._lists.setdefault(key, [])
+                items.insert(0, payload)
+                del items[arg:]
+            elif kind == "delete":
+                self._data.pop(key, None)
+                self._lists.pop(key, None)
+
+    async def _read(self, keys: Sequence[str]) -> List[Any]:
+        now = time.monotonic()
+        values = []
+        for key in keys:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= now:
+                del self._data[key]
+                entry = None
+            values.append(entry[0] if entry else None)
+        return values
+
+    async def _lrange(self, key: str, start: int, end: int) -> List[Any]:
+        items = self._lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    async def _publish(self, channel: str, message: str) -> int:
+        callbacks = self._subscribers.get(channel, [])
+        for callback in callbacks:
+            try:
+                result = callback(message)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"In-memory subscriber error on '{channel}': {e}")
+        return len(callbacks)
+
+    def subscribe(self, channel: str, callback: Callable[[str], Any]):
+        """채널 구독 (메모리 저장소 전용)"""
+        self._subscribers.setdefault(channel, []).append(callback)
+
+
+def create_agent_store(redis=None, **kwargs) -> AgentStore:
+    """Redis 클라이언트가 있으면 RedisAgentStore, 없으면 InMemoryAgentStore"""
+    if redis is not None:
+        return RedisAgentStore(redis, **kwargs)
+    return InMemoryAgentStore(**kwargs)
+
+
+def as_agent_store(client) -> Optional[AgentStore]:
+    """
+    에이전트에 전달된 클라이언트를 AgentStore로 변환
+
+    - None: None (저장 생략)
+    - AgentStore: 그대로 사용 (여러 에이전트가 공유 가능)
+    - RedisClient: 연결된 redis.asyncio 클라이언트를 감쌈
+    - redis.asyncio 클라이언트: RedisAgentStore로 감쌈
+    """
+    if client is None or isinstance(client, AgentStore):
+        return client
+    redis = getattr(client, "_client", None) or client  # agents.redis_client.RedisClient
+    if not hasattr(redis, "pipeline"):
+        raise TypeError(f"Unsupported agent store client: {type(client).__name__}")
+    return RedisAgentStore(redis)
@@ -15,6 +15,7 @@ import json
 from typing import Any, List, Optional, Dict
 from datetime import datetime, timedelta
 
+from ..agent_store import as_agent_store
 from ..base import BaseAgent, AgentTask
 from .models import (
     AnomalyType,
@@ -55,7 +56,7 @@ class AnomalyDetectionAgent(BaseAgent):
         ai_service=None
     ):
         super().__init__(agent_id, name, config)
-        self.redis_client = redis_client
+        self.redis_client = as_agent_store(redis_client)  # AgentStore (배치 쓰기)
         self.db_session = db_session
         self.ai_service = ai_service  # IntegratedAIService
         self._active_alerts: List[AnomalyAlert] = []
@@ -492,21 +493,19 @@ class AnomalyDetectionAgent(BaseAgent):
 
         try:
             key = f"agent:anomaly:alert:{alert.alert_id}"
-            await self.redis_client.setex(
-                key, 3600, alert.model_dump_json()  # 1시간 TTL
+            await self.redis_client.set(
+                key, alert.model_dump(mode="json"), ttl=3600  # 1시간 TTL
             )
 
             # 사용자별 알림 리스트
             if alert.user_id:
                 list_key = f"agent:anomaly:user:{alert.user_id}:alerts"
-                await self.redis_client.lpush(list_key, alert.alert_id)
-                await self.redis_client.ltrim(list_key, 0, 99)  # 최대 100개 유지
+                await self.redis_client.lpush_trim(list_key, alert.alert_id, 100)  # 최대 100개 유지
 
             # 봇별 알림 리스트
             if alert.bot_instance_id:
                 list_key = f"agent:anomaly:bot:{alert.bot_instance_id}:alerts"
-                await self.redis_client.lpush(list_key, alert.alert_id)
-                await self.redis_client.ltrim(list_key, 0, 49)  # 최대 50개 유지
+                await self.redis_client.lpush_trim(list_key, alert.alert_id, 50)  # 최대 50개 유지
 
         except Exception as e:
             logger.error(f"Failed to save alert to Redis: {e}")
@@ -565,8 +564,8 @@ class AnomalyDetectionAgent(BaseAgent):
 
         try:
             key = f"agent:circuit_breaker:user:{status.user_id}"
-            await self.redis_client.setex(
-                key, 86400, status.model_dump_json()  # 24시간 TTL
+            await self.redis_client.set(
+                key, status.model_dump(mode="json"), ttl=86400  # 24시간 TTL
             )
         except Exception as e:
             logger.error(f"Failed to save circuit breaker status: {e}")
@@ -18,6 +18,8 @@ from enum import Enum
 from typing import Any, Dict, Optional, Set
 from dataclasses import dataclass, field
 
+from .agent_store import AgentStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,6 +222,11 @@ class BaseAgent(ABC):
                 except asyncio.CancelledError:
                     pass
 
+        # 결과 저장소의 버퍼된 쓰기 flush (공유 저장소여도 close 후 계속 사용 가능)
+        store = getattr(self, "redis_client", None)
+        if isinstance(store, AgentStore):
+            await store.close()
+
         logger.info(f"✅ Agent '{self.name}' stopped")
 
     async def pause(self):
@@ -17,11 +17,10 @@ import time
 from typing import Any, Optional, Dict
 from datetime import datetime
 
+from ..agent_store import as_agent_store
 from ..base import BaseAgent, AgentTask
 from .models import MarketRegime, RegimeType
 from .indicators import RegimeIndicators
-from src.ml.models import EnsemblePredictor
-from src.ml.features import FeaturePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -108,12 +107,12 @@ class MarketRegimeAgent(BaseAgent):
         # 외부 의존성
         self.bitget_client = bitget_client
         self.candle_cache = candle_cache
-        self.redis_client = redis_client
+        self.redis_client = as_agent_store(redis_client)  # AgentStore (배치 쓰기)
         self.ai_service = ai_service  # IntegratedAIService
 
-        # ML 통합
-        self.ml_predictor = EnsemblePredictor()
-        self.feature_pipeline = FeaturePipeline()
+        # ML 통합 (예측기/피처 파이프라인은 첫 분석 시 생성, import 시점 cold start 단축)
+        self._ml_predictor = None
+        self._feature_pipeline = None
         self.enable_ml = config.get("enable_ml", True) if config else True
 
         # 설정 (config에서 가져오거나 기본값)
@@ -133,6 +132,34 @@ class MarketRegimeAgent(BaseAgent):
             f"candle_limit={self.candle_limit}, AI={self.enable_ai}, ML={self.enable_ml}"
         )
 
+    # ==================== ML (첫 분석 시 로드) ====================
+
+    @property
+    def ml_predictor(self):
+        """LightGBM 앙상블 예측기 (pandas/lightgbm/모델 파일은 처음 사용할 때 로드)"""
+        if self._ml_predictor is None:
+            from src.ml.models import EnsemblePredictor
+
+            self._ml_predictor = EnsemblePredictor()
+        return self._ml_predictor
+
+    @ml_predictor.setter
+    def ml_predictor(self, value):
+        self._ml_predictor = value
+
+    @property
+    def feature_pipeline(self):
+        """피처 추출 파이프라인 (처음 사용할 때 로드)"""
+        if self._feature_pipeline is None:
+            from src.ml.features import FeaturePipeline
+
+            self._feature_pipeline = FeaturePipeline()
+        return self._feature_pipeline
+
+    @feature_pipeline.setter
+    def feature_pipeline(self, value):
+        self._feature_pipeline = value
+
     async def process_task(self, task: AgentTask) -> Any:
         """
         작업 처리
@@ -296,7 +323,7 @@ class MarketRegimeAgent(BaseAgent):
         ml_volatility_check = None
         ml_confidence_boost = 0.0
 
-        if self.enable_ml and self.ml_predictor:
+        if self.enable_ml:
             try:
                 # 피처 추출
                 features_df = self.feature_pipeline.extract_features(
@@ -612,11 +639,19 @@ Provide your AI-based market regime analysis. Return JSON only:"""
             result = await self.ai_service.call_ai(
                 agent_type="market_regime",
                 prompt=user_prompt,
+                # 캐시 키는 이 컨텍스트로만 만들어지므로 프롬프트의 지표 입력을 모두 포함
                 context={
                     "symbol": symbol,
                     "price": current_price,
-                    "adx": indicators['adx'],
-                    "atr": indicators['atr'],
+                    **{
+                        name: indicators[name]
+                        for name in (
+                            "adx", "atr", "volatility", "bb_width", "ema_20", "ema_50",
+                            "upper_bb", "lower_bb", "current_volume", "avg_volume",
+                        )
+                    },
+                    "rule_based_regime": rule_based_regime,
+                    "rule_based_confidence": rule_based_confidence,
                 },
                 system_prompt=system_prompt,
                 response_type="market_analysis",
@@ -10,6 +10,7 @@ import uuid
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 
+from ..agent_store import as_agent_store
 from .models import (
     EventType,
     OrchestrationEvent,
@@ -48,7 +49,7 @@ class AgentOrchestrator:
         redis_client=None,
         db_session=None,
     ):
-        self.redis_client = redis_client
+        self.redis_client = as_agent_store(redis_client)  # AgentStore (배치 쓰기)
         self.db_session = db_session
 
         # 등록된 에이전트들
@@ -178,7 +179,7 @@ class AgentOrchestrator:
 
         백그라운드에서 실행되며 이벤트를 수신하여 처리
         """
-        if not self.redis_client:
+        if not hasattr(self.redis_client, "pubsub"):
             logger.warning("Redis client not available, cannot subscribe to events")
             return
 
@@ -514,7 +515,7 @@ class AgentOrchestrator:
 
         try:
             key = f"orchestration:result:{result.event_id}"
-            await self.redis_client.setex(key, 3600, result.model_dump_json())
+            await self.redis_client.set(key, result.model_dump(mode="json"), ttl=3600)
         except Exception as e:
             logger.error(f"Failed to save result to Redis: {e}")
 
@@ -5,10 +5,12 @@ Portfolio Optimization Agent (포트폴리오 최적화 에이전트)
 """
 
 from .agent import PortfolioOptimizationAgent
+from .covariance import ReturnCovarianceEngine
 from .models import RiskLevel, PortfolioAnalysis, RebalancingSuggestion
 
 __all__ = [
     "PortfolioOptimizationAgent",
+    "ReturnCovarianceEngine",
     "RiskLevel",
     "PortfolioAnalysis",
     "RebalancingSuggestion",
@@ -9,6 +9,7 @@ AI Enhancement:
 - 비용 최적화 (PERIODIC 샘플링, Response Caching)
 """
 
+import asyncio
 import logging
 import uuid
 import json
@@ -16,7 +17,9 @@ import numpy as np
 from typing import Any, List, Dict, Optional
 from datetime import datetime, timedelta
 
+from ..agent_store import as_agent_store
 from ..base import BaseAgent, AgentTask
+from .covariance import ReturnCovarianceEngine, load_return_history
 from .models import (
     RiskLevel,
     BotPerformanceMetrics,
@@ -46,6 +49,8 @@ class PortfolioOptimizationAgent(BaseAgent):
     - suggest_rebalancing: 리밸런싱 제안
     - apply_rebalancing: 리밸런싱 적용
     - calculate_correlation: 상관관계 계산
+    - record_trade: 청산 거래 수익률 반영 (공분산 점진 갱신)
+    - record_equity: 에퀴티 스냅샷 반영
     """
 
     def __init__(
@@ -55,11 +60,13 @@ class PortfolioOptimizationAgent(BaseAgent):
         config: dict = None,
         redis_client=None,
         db_session=None,
-        ai_service=None
+        ai_service=None,
+        session_factory=None,
     ):
         super().__init__(agent_id, name, config)
-        self.redis_client = redis_client
+        self.redis_client = as_agent_store(redis_client)  # AgentStore (배치 쓰기)
         self.db_session = db_session
+        self.session_factory = session_factory  # 장기 실행 시 이력 로드용 (db_session보다 우선)
         self.ai_service = ai_service  # IntegratedAIService
 
         # 최적화 제약 조건
@@ -69,6 +76,24 @@ class PortfolioOptimizationAgent(BaseAgent):
         self.rebalancing_threshold = cfg.get("rebalancing_threshold", 5.0)  # 5% 이상 차이나면 리밸런싱
         self.enable_ai = cfg.get("enable_ai", True)
 
+        # 수익률 공분산 엔진 (일간 + 분봉 단위)
+        self.correlation_horizon = cfg.get("correlation_horizon", "daily")
+        self.history_lookback_days = cfg.get("history_lookback_days", 90)
+        self.covariance_engines: Dict[str, ReturnCovarianceEngine] = {
+            "daily": ReturnCovarianceEngine(
+                bucket_seconds=86400,
+                halflife_buckets=cfg.get("correlation_halflife_days", 20),
+                min_observations=cfg.get("min_correlation_observations", 5),
+            ),
+            "intraday": ReturnCovarianceEngine(
+                bucket_seconds=cfg.get("intraday_bucket_seconds", 3600),
+                halflife_buckets=cfg.get("intraday_halflife_buckets", 48),
+                min_observations=cfg.get("min_correlation_observations", 5),
+            ),
+        }
+        self._history_loaded: set = set()
+        self._history_loads: Dict[int, asyncio.Future] = {}  # user_id → 진행 중인 이력 로드
+
         logger.info(
             f"PortfolioOptimizationAgent initialized: "
             f"allocation_range=[{self.min_allocation_percent}%, {self.max_allocation_percent}%], "
@@ -94,6 +119,12 @@ class PortfolioOptimizationAgent(BaseAgent):
         elif task_type == "calculate_correlation":
             return await self._calculate_correlation(params)
 
+        elif task_type == "record_trade":
+            return await self._record_trade(params)
+
+        elif task_type == "record_equity":
+            return await self._record_equity(params)
+
         else:
             raise ValueError(f"Unknown task type: {task_type}")
 
@@ -129,7 +160,9 @@ class PortfolioOptimizationAgent(BaseAgent):
             )
 
         # 1. 상관관계 계산
-        correlation_matrix = await self._calculate_correlation_internal(bot_performance)
+        correlation_matrix = await self._calculate_correlation_internal(
+            bot_performance, user_id=user_id
+        )
 
         # 2. 리스크 기여도 계산
         risk_contributions = await self._calculate_risk_contributions(
@@ -399,35 +432,139 @@ class PortfolioOptimizationAgent(BaseAgent):
             BotPerformanceMetrics(**bot) for bot in bot_performance_data
         ]
 
-        return await self._calculate_correlation_internal(bot_performance)
+        return await self._calculate_correlation_internal(
+            bot_performance,
+            user_id=params.get("user_id"),
+            horizon=params.get("horizon"),
+        )
+
+    async def _record_trade(self, params: dict) -> bool:
+        """
+        청산 거래 반영
+
+        Args:
+            params: {
+                "user_id": int,
+                "bot_instance_id": int,
+                "pnl": float,
+                "timestamp": datetime | str (optional),
+                "allocation_amount": float (optional)
+            }
+        """
+        user_id = params["user_id"]
+        bot_id = params["bot_instance_id"]
+        allocation = params.get("allocation_amount")
+        if allocation:
+            for engine in self.covariance_engines.values():
+                engine.set_allocation(user_id, bot_id, allocation)
+
+        if await self._ensure_return_history(user_id):
+            # 방금 로드한 DB 이력에 이미 포함됨
+            return True
+
+        timestamp = self._parse_timestamp(params.get("timestamp"))
+        for engine in self.covariance_engines.values():
+            engine.record_trade(user_id, bot_id, params.get("pnl", 0.0), timestamp)
+
+        return True
+
+    async def _record_equity(self, params: dict) -> bool:
+        """
+        에퀴티 스냅샷 반영
+
+        Args:
+            params: {"user_id": int, "value": float, "timestamp": datetime | str (optional)}
+        """
+        user_id = params["user_id"]
+        if await self._ensure_return_history(user_id):
+            return True
+
+        timestamp = self._parse_timestamp(params.get("timestamp"))
+        for engine in self.covariance_engines.values():
+            engine.record_equity(user_id, params["value"], timestamp)
+
+        return True
 
     # ==================== Helper Methods ====================
 
+    @staticmethod
+    def _parse_timestamp(value) -> datetime:
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return datetime.utcnow()
+
+    async def _ensure_return_history(self, user_id: int) -> bool:
+        """
+        사용자 수익률 이력을 DB에서 1회 로드 (이후에는 점진 갱신만)
+
+        다른 호출이 로드 중이면 빈 행렬로 진행하지 않고 그 로드가 끝날 때까지 기다립니다.
+
+        Returns:
+            이번 호출에서 (또는 기다린 로드에서) 이력을 로드했으면 True
+        """
+        if user_id in self._history_loaded or not (self.session_factory or self.db_session):
+            return False
+
+        pending = self._history_loads.get(user_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._history_loads[user_id] = future
+        loaded = False
+        try:
+            events = await self._load_return_history(user_id)
+            for engine in self.covariance_engines.values():
+                engine.replay(user_id, events)
+            self._history_loaded.add(user_id)
+            loaded = True
+            logger.info(f"Loaded {len(events)} return events for user {user_id}")
+        except Exception as e:
+            # 로드 완료로 표시하지 않음 (다음 호출에서 재시도)
+            logger.error(f"Failed to load return history for user {user_id}: {e}")
+        finally:
+            del self._history_loads[user_id]
+            future.set_result(loaded)
+        return loaded
+
+    async def _load_return_history(self, user_id: int) -> list:
+        if self.session_factory is None:
+            return await load_return_history(self.db_session, user_id, self.history_lookback_days)
+        async with self.session_factory() as session:
+            return await load_return_history(session, user_id, self.history_lookback_days)
+
     async def _calculate_correlation_internal(
-        self, bot_performance: List[BotPerformanceMetrics]
+        self,
+        bot_performance: List[BotPerformanceMetrics],
+        user_id: Optional[int] = None,
+        horizon: Optional[str] = None,
     ) -> Optional[CorrelationMatrix]:
-        """상관관계 계산 (내부 로직)"""
+        """
+        상관관계 계산 (내부 로직)
+
+        봇별 수익률 시계열의 EWMA 공분산에서 계산합니다.
+        관측치가 부족한 봇은 다른 봇과 독립(0)으로 간주합니다.
+        """
         if len(bot_performance) < 2:
             return None
 
-        # TODO: 실제로는 각 봇의 일일 수익률 시계열 데이터 필요
-        # 여기서는 간소화하여 랜덤 상관관계 생성 (예시)
-        n = len(bot_performance)
         bot_ids = [bot.bot_instance_id for bot in bot_performance]
 
-        # 실제 구현 시: 각 봇의 거래 내역에서 일일 수익률 계산 후
-        # np.corrcoef() 사용
-        # 예시: 대각선 1.0, 나머지는 0.3~0.7 사이
-        matrix = np.eye(n)
-        for i in range(n):
-            for j in range(i + 1, n):
-                # 같은 심볼이면 상관관계 높음
-                if bot_performance[i].symbol == bot_performance[j].symbol:
-                    corr = 0.7
-                else:
-                    corr = 0.3
-                matrix[i][j] = corr
-                matrix[j][i] = corr
+        if user_id is None:
+            return CorrelationMatrix(bot_ids=bot_ids, matrix=np.eye(len(bot_ids)).tolist())
+
+        engine = self.covariance_engines.get(
+            horizon or self.correlation_horizon, self.covariance_engines["daily"]
+        )
+        # 이력 재생 전에 배분 금액을 먼저 반영 (손익 -> 수익률 변환 기준을 맞춤)
+        for bot in bot_performance:
+            engine.set_allocation(user_id, bot.bot_instance_id, bot.current_allocation_amount)
+
+        await self._ensure_return_history(user_id)
+
+        matrix = engine.correlation(user_id, bot_ids)
 
         return CorrelationMatrix(bot_ids=bot_ids, matrix=matrix.tolist())
 
@@ -673,7 +810,7 @@ class PortfolioOptimizationAgent(BaseAgent):
 
         try:
             key = f"agent:portfolio:analysis:user:{analysis.user_id}"
-            await self.redis_client.setex(key, 3600, analysis.model_dump_json())
+            await self.redis_client.set(key, analysis.model_dump(mode="json"), ttl=3600)
         except Exception as e:
             logger.error(f"Failed to save analysis to Redis: {e}")
 
@@ -684,7 +821,7 @@ class PortfolioOptimizationAgent(BaseAgent):
 
         try:
             key = f"agent:portfolio:suggestion:user:{suggestion.user_id}"
-            await self.redis_client.setex(key, 7200, suggestion.model_dump_json())  # 2시간
+            await self.redis_client.set(key, suggestion.model_dump(mode="json"), ttl=7200)  # 2시간
         except Exception as e:
             logger.error(f"Failed to save suggestion to Redis: {e}")
 
@@ -695,12 +832,11 @@ class PortfolioOptimizationAgent(BaseAgent):
 
         try:
             key = f"agent:portfolio:history:{history.rebalancing_id}"
-            await self.redis_client.setex(key, 2592000, history.model_dump_json())  # 30일
+            await self.redis_client.set(key, history.model_dump(mode="json"), ttl=2592000)  # 30일
 
             # 사용자별 이력 리스트
             list_key = f"agent:portfolio:user:{history.user_id}:history"
-            await self.redis_client.lpush(list_key, history.rebalancing_id)
-            await self.redis_client.ltrim(list_key, 0, 19)  # 최대 20개 유지
+            await self.redis_client.lpush_trim(list_key, history.rebalancing_id, 20)  # 최대 20개 유지
         except Exception as e:
             logger.error(f"Failed to save history to Redis: {e}")
 
@@ -739,11 +875,19 @@ Return ONLY valid JSON:
 
         # 봇 성과 요약
         bots_summary = "\n".join([
-            f"- Bot {bot.bot_id}: ROI={bot.roi_percent:.1f}%, Sharpe={bot.sharpe_ratio:.2f}, "
+            f"- Bot {bot.bot_instance_id}: ROI={bot.roi:.1f}%, Sharpe={bot.sharpe_ratio:.2f}, "
             f"Win Rate={bot.win_rate:.1f}%, Volatility={bot.volatility:.1f}%"
             for bot in bot_performance[:10]  # 최대 10개만
         ])
 
+        # 상관관계 요약 (대각선 제외)
+        average_correlation, max_correlation = 0.0, 0.0
+        if analysis.correlation_matrix and len(analysis.correlation_matrix.bot_ids) > 1:
+            corr = np.array(analysis.correlation_matrix.matrix)
+            off_diagonal = corr[~np.eye(len(corr), dtype=bool)]
+            average_correlation = float(off_diagonal.mean())
+            max_correlation = float(off_diagonal.max())
+
         # 사용자 프롬프트
         user_prompt = f"""Analyze this cryptocurrency trading portfolio:
 
@@ -751,8 +895,8 @@ Total Bots: {len(bot_performance)}
 Risk Level: {risk_level.value}
 
 Portfolio Metrics:
-- Total Return: {analysis.total_return_percent:.1f}%
-- Total Risk: {analysis.total_risk_percent:.1f}%
+- Total Return: {analysis.portfolio_roi:.1f}%
+- Total Risk: {analysis.portfolio_volatility:.1f}%
 - Portfolio Sharpe: {analysis.portfolio_sharpe:.2f}
 - Diversification Ratio: {analysis.diversification_ratio:.2f}
 
@@ -760,11 +904,11 @@ Top Bots Performance:
 {bots_summary}
 
 Correlation Analysis:
-- Average Correlation: {analysis.correlation_matrix.average_correlation:.2f}
-- Max Correlation: {analysis.correlation_matrix.max_correlation:.2f}
+- Average Correlation: {average_correlation:.2f}
+- Max Correlation: {max_correlation:.2f}
 
 Risk Contributions:
-{', '.join([f'{rc.bot_id}={rc.contribution_percent:.1f}%' for rc in analysis.risk_contributions[:5]])}
+{', '.join([f'{rc.bot_instance_id}={rc.contribution_percent:.1f}%' for rc in analysis.risk_contributions[:5]])}
 
 Provide insights, warnings, and recommendations in JSON:"""
 
@@ -773,11 +917,26 @@ Provide insights, warnings, and recommendations in JSON:"""
             result = await self.ai_service.call_ai(
                 agent_type="portfolio_optimizer",
                 prompt=user_prompt,
+                # 캐시 키는 이 컨텍스트로만 만들어지므로 프롬프트의 수익률/상관관계 입력을 모두 포함
                 context={
                     "user_id": user_id,
                     "bot_count": len(bot_performance),
                     "risk_level": risk_level.value,
                     "portfolio_sharpe": analysis.portfolio_sharpe,
+                    "total_return": analysis.portfolio_roi,
+                    "total_risk": analysis.portfolio_volatility,
+                    "diversification_ratio": analysis.diversification_ratio,
+                    "average_correlation": average_correlation,
+                    "max_correlation": max_correlation,
+                    "bot_ids": [bot.bot_instance_id for bot in bot_performance[:10]],
+                    "bot_returns": [bot.roi for bot in bot_performance[:10]],
+                    "bot_sharpes": [bot.sharpe_ratio for bot in bot_performance[:10]],
+                    "bot_win_rates": [bot.win_rate for bot in bot_performance[:10]],
+                    "bot_volatilities": [bot.volatility for bot in bot_performance[:10]],
+                    "risk_contributions": [
+                        [rc.bot_instance_id, rc.contribution_percent]
+                        for rc in analysis.risk_contributions[:5]
+                    ],
                 },
                 system_prompt=system_prompt,
                 response_type="portfolio_optimization",
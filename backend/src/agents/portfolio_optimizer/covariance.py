@@ -0,0 +1,300 @@
+"""
+Return Covariance Engine (수익률 공분산 엔진)
+
+봇별 수익률 시계열로부터 지수가중(EWMA) 공분산 행렬을 점진적으로 갱신합니다.
+
+- Trade 레코드의 실현 손익 → 봇별 버킷(일간/분봉) 수익률
+- Equity 레코드 → 봇 할당 금액을 모를 때 사용할 자본 기준값
+- 새 관측치 1개당 O(k²) 갱신 (k = 사용자의 봇 수), 과거 이력 재계산 없음
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _UserReturnState:
+    """사용자별 공분산 상태"""
+
+    index: Dict[int, int] = field(default_factory=dict)  # bot_id → 행렬 인덱스
+    mean: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    cov: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    current_bucket: Optional[int] = None
+    pending: Dict[int, float] = field(default_factory=dict)  # 진행 중인 버킷의 수익률 누적
+
+    equity: float = 0.0
+    allocations: Dict[int, float] = field(default_factory=dict)
+    observations: int = 0
+
+
+class ReturnCovarianceEngine:
+    """
+    봇 수익률 EWMA 공분산 엔진
+
+    관측 단위는 bucket_seconds 길이의 시간 버킷입니다.
+    버킷이 닫히면 해당 버킷의 봇별 수익률 벡터(거래 없는 봇은 0)로
+    평균/공분산을 갱신합니다:
+
+        d = x - μ
+        μ ← μ + α·d
+        Σ ← (1 - α)·(Σ + α·d·dᵀ)
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = 86400,
+        halflife_buckets: float = 20.0,
+        min_observations: int = 5,
+        max_gap_buckets: Optional[int] = None,
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.alpha = 1.0 - 0.5 ** (1.0 / halflife_buckets)
+        self.min_observations = min_observations
+        # 긴 공백 구간의 0 수익률 버킷은 반감기의 몇 배까지만 반영 (그 이후는 영향 미미)
+        self.max_gap_buckets = max_gap_buckets or int(halflife_buckets * 4)
+
+        self._users: Dict[int, _UserReturnState] = {}
+
+    # ==================== 입력 ====================
+
+    def set_allocation(self, user_id: int, bot_id: int, amount: float):
+        """봇 할당 금액 설정 (수익률 계산 기준)"""
+        state = self._get_state(user_id)
+        self._ensure_bot(state, bot_id)
+        if amount and amount > 0:
+            state.allocations[bot_id] = float(amount)
+
+    def record_trade(
+        self,
+        user_id: int,
+        bot_id: int,
+        pnl: float,
+        timestamp: datetime,
+        capital: Optional[float] = None,
+    ):
+        """
+        청산된 거래의 실현 손익 반영
+
+        Args:
+            user_id: 사용자 ID
+            bot_id: 봇 인스턴스 ID
+            pnl: 실현 손익 (USDT)
+            timestamp: 청산 시각
+            capital: 수익률 계산 기준 자본 (없으면 봇 할당 금액 → 사용자 에퀴티 순)
+        """
+        state = self._get_state(user_id)
+        self._ensure_bot(state, bot_id)
+        self._advance(state, self._bucket_of(timestamp))
+
+        base = capital or state.allocations.get(bot_id) or state.equity
+        if not base or base <= 0:
+            return
+
+        state.pending[bot_id] = state.pending.get(bot_id, 0.0) + float(pnl) / base
+
+    def record_equity(self, user_id: int, value: float, timestamp: datetime):
+        """사용자 에퀴티 스냅샷 반영 (자본 기준값 갱신 + 버킷 진행)"""
+        state = self._get_state(user_id)
+        self._advance(state, self._bucket_of(timestamp))
+        if value and value > 0:
+            state.equity = float(value)
+
+    def remove_bot(self, user_id: int, bot_id: int):
+        """봇 제거 (행/열 삭제)"""
+        state = self._users.get(user_id)
+        if not state or bot_id not in state.index:
+            return
+
+        pos = state.index.pop(bot_id)
+        state.mean = np.delete(state.mean, pos)
+        state.counts = np.delete(state.counts, pos)
+        state.cov = np.delete(np.delete(state.cov, pos, axis=0), pos, axis=1)
+        state.pending.pop(bot_id, None)
+        state.allocations.pop(bot_id, None)
+
+        for other, idx in state.index.items():
+            if idx > pos:
+                state.index[other] = idx - 1
+
+    def replay(self, user_id: int, events: List[Tuple[datetime, str, dict]]):
+        """
+        과거 이벤트 일괄 반영 (warm start)
+
+        Args:
+            events: (timestamp, "trade" | "equity", payload) 리스트, 시간순 정렬
+        """
+        for timestamp, kind, payload in events:
+            if kind == "equity":
+                self.record_equity(user_id, payload["value"], timestamp)
+            elif kind == "trade":
+                self.record_trade(user_id, payload["bot_id"], payload["pnl"], timestamp)
+
+    # ==================== 조회 ====================
+
+    def has_user(self, user_id: int) -> bool:
+        return user_id in self._users
+
+    def observation_count(self, user_id: int) -> int:
+        state = self._users.get(user_id)
+        return state.observations if state else 0
+
+    def covariance(self, user_id: int, bot_ids: List[int]) -> np.ndarray:
+        """
+        봇 목록 순서의 공분산 부분 행렬
+
+        관측치가 부족한 봇의 행/열은 0입니다.
+        """
+        n = len(bot_ids)
+        result = np.zeros((n, n))
+        state = self._users.get(user_id)
+        if not state:
+            return result
+
+        rows = [i for i, bot_id in enumerate(bot_ids) if self._is_ready(state, bot_id)]
+        if not rows:
+            return result
+
+        idx = [state.index[bot_ids[i]] for i in rows]
+        result[np.ix_(rows, rows)] = state.cov[np.ix_(idx, idx)]
+        return result
+
+    def correlation(self, user_id: int, bot_ids: List[int]) -> np.ndarray:
+        """
+        봇 목록 순서의 상관관계 행렬
+
+        관측치가 부족하거나 분산이 0인 봇은 다른 봇과 독립(0)으로 간주합니다.
+        """
+        cov = self.covariance(user_id, bot_ids)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        corr = np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    # ==================== 내부 ====================
+
+    def _get_state(self, user_id: int) -> _UserReturnState:
+        state = self._users.get(user_id)
+        if state is None:
+            state = _UserReturnState()
+            self._users[user_id] = state
+        return state
+
+    def _ensure_bot(self, state: _UserReturnState, bot_id: int):
+        """신규 봇이면 행렬 확장 (평균 0, 분산 0에서 시작)"""
+        if bot_id in state.index:
+            return
+
+        state.index[bot_id] = len(state.mean)
+        state.mean = np.append(state.mean, 0.0)
+        state.counts = np.append(state.counts, 0)
+        state.cov = np.pad(state.cov, ((0, 1), (0, 1)))
+
+    def _is_ready(self, state: _UserReturnState, bot_id: int) -> bool:
+        pos = state.index.get(bot_id)
+        return pos is not None and state.counts[pos] >= self.min_observations
+
+    def _bucket_of(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.bucket_seconds)
+
+    def _advance(self, state: _UserReturnState, bucket: int):
+        """버킷 진행: 닫힌 버킷과 공백 버킷을 관측치로 반영"""
+        if state.current_bucket is None:
+            state.current_bucket = bucket
+            return
+
+        if bucket <= state.current_bucket:
+            # 늦게 도착한 데이터는 현재 버킷에 합산
+            return
+
+        self._observe(state, state.pending)
+        state.pending = {}
+
+        gap = min(bucket - state.current_bucket - 1, self.max_gap_buckets)
+        for _ in range(gap):
+            self._observe(state, {})
+
+        state.current_bucket = bucket
+
+    def _observe(self, state: _UserReturnState, returns: Dict[int, float]):
+        """관측 벡터 1개로 EWMA 평균/공분산 갱신 - O(k²)"""
+        k = len(state.mean)
+        if k == 0:
+            return
+
+        x = np.zeros(k)
+        for bot_id, value in returns.items():
+            x[state.index[bot_id]] = value
+
+        a = self.alpha
+        diff = x - state.mean
+        state.mean += a * diff
+        state.cov += a * np.outer(diff, diff)
+        state.cov *= 1.0 - a
+
+        state.counts += 1
+        state.observations += 1
+
+
+async def load_return_history(
+    session, user_id: int, lookback_days: int = 90
+) -> List[Tuple[datetime, str, dict]]:
+    """
+    DB에서 봇 거래/에퀴티 이력을 읽어 시간순 이벤트 목록으로 변환
+
+    Trade에는 청산 시각 컬럼이 없어 실현 손익을 진입 시각(created_at) 버킷에 넣습니다.
+    실시간 record_trade는 청산 시각을 쓰므로, 버킷보다 오래 보유한 거래는
+    재생한 이력과 실시간 갱신의 버킷이 다를 수 있습니다 (일간 버킷에서는 대부분 같은 날).
+
+    Args:
+        session: AsyncSession
+        user_id: 사용자 ID
+        lookback_days: 조회 기간
+
+    Returns:
+        ReturnCovarianceEngine.replay()에 전달할 이벤트 목록
+    """
+    from sqlalchemy import select
+
+    from ...database.models import Equity, Trade
+
+    since = datetime.utcnow() - timedelta(days=lookback_days)
+
+    trade_rows = await session.execute(
+        select(Trade.bot_instance_id, Trade.pnl, Trade.created_at)
+        .where(
+            Trade.user_id == user_id,
+            Trade.bot_instance_id.isnot(None),
+            Trade.exit_price.isnot(None),
+            Trade.created_at >= since,
+        )
+        .order_by(Trade.created_at)
+    )
+    equity_rows = await session.execute(
+        select(Equity.value, Equity.timestamp)
+        .where(Equity.user_id == user_id, Equity.timestamp >= since)
+        .order_by(Equity.timestamp)
+    )
+
+    events: List[Tuple[datetime, str, dict]] = [
+        (created_at, "trade", {"bot_id": bot_id, "pnl": float(pnl or 0)})
+        for bot_id, pnl, created_at in trade_rows.all()
+    ]
+    events.extend(
+        (timestamp, "equity", {"value": float(value)})
+        for value, timestamp in equity_rows.all()
+    )
+    # 같은 시각이면 에퀴티를 먼저 반영해 자본 기준값을 확보
+    events.sort(key=lambda e: (e[0], e[1] != "equity"))
+    return events
@@ -10,10 +10,12 @@ Risk Monitor Agent (리스크 모니터링 에이전트)
 """
 
 from .agent import RiskMonitorAgent
+from .engine import RiskEngine
 from .models import RiskAlert, RiskLevel, RiskAction
 
 __all__ = [
     "RiskMonitorAgent",
+    "RiskEngine",
     "RiskAlert",
     "RiskLevel",
     "RiskAction",
@@ -11,6 +11,7 @@ from typing import Any, List, Optional
 from ..base import BaseAgent, AgentTask
 from .models import RiskAlert, RiskLevel, RiskAction, PositionRisk
 from .actions import RiskActions
+from .engine import RiskEngine
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,9 @@ class RiskMonitorAgent(BaseAgent):
     - monitor_position: 포지션 리스크 모니터링
     - check_daily_loss: 일일 손실 한도 체크
     - check_drawdown: 최대 낙폭 체크
+
+    실시간 포지션 감시는 작업 큐 대신 self.engine (RiskEngine)으로
+    가격 tick마다 전체 포지션을 한 번에 평가합니다.
     """
 
     def __init__(self, agent_id: str, name: str, config: dict = None):
@@ -42,6 +46,13 @@ class RiskMonitorAgent(BaseAgent):
         self.max_drawdown_percent = config.get("max_drawdown_percent", 10.0) if config else 10.0
         self.liquidation_warning_percent = config.get("liquidation_warning_percent", 10.0) if config else 10.0
 
+        # 스트리밍 리스크 엔진 (봇 루프에서 tick마다 호출)
+        self.engine = RiskEngine(
+            max_position_loss_percent=self.max_position_loss_percent,
+            liquidation_warning_percent=self.liquidation_warning_percent,
+        )
+        self.engine.subscribe(lambda position_id, alert: self._active_alerts.append(alert))
+
     async def process_task(self, task: AgentTask) -> Any:
         """
         작업 처리
@@ -0,0 +1,308 @@
+"""
+스트리밍 리스크 엔진 (Risk Engine)
+
+모든 봇의 열린 포지션을 심볼별 배열 테이블(structure-of-arrays)로 보관하고,
+가격 tick 하나로 해당 심볼의 전체 포지션 PnL/청산가 거리를 한 번에 계산합니다.
+
+- 봇/tick마다 AgentTask를 만들고 큐를 거치지 않음 (tick당 수 μs)
+- 알림은 조건에 진입할 때 한 번만 발생 (조건 해제 후 재진입 시 다시 발생)
+- 알림은 구독 콜백으로 전달
+
+사용 예:
+```python
+engine = RiskEngine(max_position_loss_percent=5.0, liquidation_warning_percent=10.0)
+engine.subscribe(lambda position_id, alert: ...)
+engine.upsert(bot_id, "BTCUSDT", "long", size=0.1, entry_price=60000, leverage=10)
+engine.on_price("BTCUSDT", 57000)
+```
+"""
+
+import logging
+import time
+import uuid
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from .models import RiskAlert, RiskLevel, RiskAction
+
+logger = logging.getLogger(__name__)
+
+# (position_id, alert) → None
+AlertCallback = Callable[[Hashable, RiskAlert], None]
+
+# 청산가 미제공 시 추정용 유지 증거금 비율 (기존 봇 루프와 동일)
+LIQUIDATION_BUFFER = 0.9
+
+
+def normalize_symbol(symbol: str) -> str:
+    return symbol.replace("/", "").replace("-", "").upper()
+
+
+class _SymbolBook:
+    """심볼 하나의 포지션 테이블 (행 추가/삭제 O(1), 삭제는 마지막 행과 교체)"""
+
+    def __init__(self, capacity: int = 8):
+        self.ids: List[Hashable] = []
+        self.index: Dict[Hashable, int] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        old = getattr(self, "entry", None)
+        n = len(self.ids)
+        fields = {}
+        for name in ("entry", "size", "side", "leverage", "liq", "pnl", "pnl_pct", "distance"):
+            arr = np.zeros(capacity)
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            fields[name] = arr
+        for name in ("loss_flag", "liq_flag"):
+            arr = np.zeros(capacity, dtype=bool)
+            if old is not None:
+                arr[:n] = getattr(self, name)[:n]
+            fields[name] = arr
+        for name, arr in fields.items():
+            setattr(self, name, arr)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def upsert(self, position_id: Hashable, values: Tuple[float, float, float, float, float]):
+        entry, size, side, leverage, liq = values
+        i = self.index.get(position_id)
+        if i is None:
+            i = len(self.ids)
+            if i == len(self.entry):
+                self._allocate(len(self.entry) * 2)
+            self.ids.append(position_id)
+            self.index[position_id] = i
+            self.loss_flag[i] = False
+            self.liq_flag[i] = False
+        elif (self.entry[i], self.size[i], self.side[i], self.leverage[i], self.liq[i]) == values:
+            return
+        self.entry[i] = entry
+        self.size[i] = size
+        self.side[i] = side
+        self.leverage[i] = leverage
+        self.liq[i] = liq
+
+    def remove(self, position_id: Hashable):
+        i = self.index.pop(position_id, None)
+        if i is None:
+            return
+        last = len(self.ids) - 1
+        if i != last:
+            moved = self.ids[last]
+            self.ids[i] = moved
+            self.index[moved] = i
+            for name in (
+                "entry", "size", "side", "leverage", "liq", "pnl", "pnl_pct", "distance",
+                "loss_flag", "liq_flag",
+            ):
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+        self.ids.pop()
+
+
+class RiskEngine:
+    """
+    전체 포지션 스트리밍 리스크 평가
+
+    임계값은 RiskMonitorAgent와 같습니다.
+    - 포지션 손실률 < -max_position_loss_percent → position_loss (HIGH, 청산 권고)
+    - 청산가 거리 < liquidation_warning_percent → liquidation_risk (CRITICAL, 축소 권고)
+    """
+
+    def __init__(
+        self,
+        max_position_loss_percent: float = 5.0,
+        liquidation_warning_percent: float = 10.0,
+    ):
+        self.max_position_loss_percent = max_position_loss_percent
+        self.liquidation_warning_percent = liquidation_warning_percent
+        self._books: Dict[str, _SymbolBook] = {}
+        self._symbols: Dict[Hashable, str] = {}  # position_id → 심볼
+        self._callbacks: List[AlertCallback] = []
+        self.stats = {
+            "evaluations": 0,
+            "positions_evaluated": 0,
+            "alerts": 0,
+            "eval_time_total": 0.0,
+            "eval_time_max": 0.0,
+        }
+
+    # ==================== 포지션 ====================
+
+    def upsert(
+        self,
+        position_id: Hashable,
+        symbol: str,
+        side: str,
+        size: float,
+        entry_price: float,
+        leverage: float,
+        liquidation_price: Optional[float] = None,
+    ):
+        """포지션 추가/갱신 (값이 같으면 아무 것도 하지 않음)"""
+        symbol = normalize_symbol(symbol)
+        previous = self._symbols.get(position_id)
+        if previous is not None and previous != symbol:
+            self.remove(position_id)
+
+        sign = 1.0 if side == "long" else -1.0
+        leverage = float(leverage or 1)
+        if not liquidation_price or liquidation_price <= 0:
+            liquidation_price = entry_price * (1 - sign * LIQUIDATION_BUFFER / leverage)
+
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = _SymbolBook()
+        book.upsert(
+            position_id,
+            (float(entry_price), float(size), sign, leverage, float(liquidation_price)),
+        )
+        self._symbols[position_id] = symbol
+
+    def remove(self, position_id: Hashable):
+        """포지션 제거 (청산/봇 종료 시)"""
+        symbol = self._symbols.pop(position_id, None)
+        if symbol is None:
+            return
+        book = self._books[symbol]
+        book.remove(position_id)
+        if not len(book):
+            del self._books[symbol]
+
+    # ==================== 평가 ====================
+
+    def on_price(self, symbol: str, price: float) -> List[Tuple[Hashable, RiskAlert]]:
+        """
+        가격 tick 반영: 심볼의 모든 포지션을 한 번에 평가
+
+        Returns:
+            새로 발생한 (position_id, 알림) 목록 (구독 콜백에도 전달)
+        """
+        book = self._books.get(normalize_symbol(symbol))
+        if book is None or price <= 0:
+            return []
+
+        started = time.perf_counter()
+        n = len(book)
+        entry = book.entry[:n]
+        side = book.side[:n]
+        liq = book.liq[:n]
+
+        diff = side * (price - entry)
+        book.pnl[:n] = diff * book.size[:n]
+        pnl_pct = np.divide(diff * 100, entry, out=np.zeros(n), where=entry > 0)
+        book.pnl_pct[:n] = pnl_pct
+        distance = np.abs(price - liq) / price * 100
+        book.distance[:n] = distance
+
+        losing = pnl_pct < -self.max_position_loss_percent
+        near = distance < self.liquidation_warning_percent
+
+        # 조건 진입 시점에만 알림
+        new_loss = losing & ~book.loss_flag[:n]
+        new_liq = near & ~book.liq_flag[:n]
+        book.loss_flag[:n] = losing
+        book.liq_flag[:n] = near
+
+        alerts: List[Tuple[Hashable, RiskAlert]] = []
+        if new_loss.any() or new_liq.any():
+            for i in np.flatnonzero(new_loss):
+                alerts.append((book.ids[i], self._loss_alert(book, i, symbol)))
+            for i in np.flatnonzero(new_liq):
+                alerts.append((book.ids[i], self._liquidation_alert(book, i, symbol)))
+
+        elapsed = time.perf_counter() - started
+        self.stats["evaluations"] += 1
+        self.stats["positions_evaluated"] += n
+        self.stats["eval_time_total"] += elapsed
+        self.stats["eval_time_max"] = max(self.stats["eval_time_max"], elapsed)
+
+        for position_id, alert in alerts:
+            self.stats["alerts"] += 1
+            for callback in self._callbacks:
+                try:
+                    callback(position_id, alert)
+                except Exception as e:
+                    logger.error(f"Risk alert callback error: {e}")
+        return alerts
+
+    def _loss_alert(self, book: _SymbolBook, i: int, symbol: str) -> RiskAlert:
+        pnl_pct = float(book.pnl_pct[i])
+        return RiskAlert(
+            alert_id=str(uuid.uuid4()),
+            alert_type="position_loss",
+            risk_level=RiskLevel.HIGH,
+            message=f"Position loss exceeds threshold: {pnl_pct:.2f}%",
+            current_value=pnl_pct,
+            threshold_value=-self.max_position_loss_percent,
+            recommended_action=RiskAction.CLOSE_POSITION,
+            auto_execute=False,
+            metadata={
+                "symbol": symbol,
+                "side": "long" if book.side[i] > 0 else "short",
+                "unrealized_pnl": float(book.pnl[i]),
+            },
+        )
+
+    def _liquidation_alert(self, book: _SymbolBook, i: int, symbol: str) -> RiskAlert:
+        distance = float(book.distance[i])
+        return RiskAlert(
+            alert_id=str(uuid.uuid4()),
+            alert_type="liquidation_risk",
+            risk_level=RiskLevel.CRITICAL,
+            message=f"Position near liquidation: {distance:.2f}%",
+            current_value=distance,
+            threshold_value=self.liquidation_warning_percent,
+            recommended_action=RiskAction.REDUCE_POSITION,
+            auto_execute=False,
+            metadata={
+                "symbol": symbol,
+                "liquidation_price": float(book.liq[i]),
+            },
+        )
+
+    # ==================== 구독/조회 ====================
+
+    def subscribe(self, callback: AlertCallback):
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: AlertCallback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def get_position(self, position_id: Hashable) -> Optional[Dict[str, Any]]:
+        """포지션의 마지막 평가 결과"""
+        symbol = self._symbols.get(position_id)
+        if symbol is None:
+            return None
+        book = self._books[symbol]
+        i = book.index[position_id]
+        return {
+            "symbol": symbol,
+            "side": "long" if book.side[i] > 0 else "short",
+            "size": float(book.size[i]),
+            "entry_price": float(book.entry[i]),
+            "leverage": float(book.leverage[i]),
+            "liquidation_price": float(book.liq[i]),
+            "unrealized_pnl": float(book.pnl[i]),
+            "unrealized_pnl_percent": float(book.pnl_pct[i]),
+            "distance_to_liquidation": float(book.distance[i]),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        evaluations = self.stats["evaluations"]
+        return {
+            "positions": len(self._symbols),
+            "symbols": len(self._books),
+            "evaluations": evaluations,
+            "positions_evaluated": self.stats["positions_evaluated"],
+            "alerts": self.stats["alerts"],
+            "avg_eval_us": (
+                round(self.stats["eval_time_total"] / evaluations * 1e6, 2) if evaluations else 0
+            ),
+            "max_eval_us": round(self.stats["eval_time_max"] * 1e6, 2),
+        }
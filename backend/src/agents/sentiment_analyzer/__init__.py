@@ -13,6 +13,7 @@ from .models import (
     SentimentStrength,
 )
 from .data_sources import CryptoPanicSource, RedditSource
+from .refresher import SentimentRefresher, sentiment_refresher
 
 __all__ = [
     "SentimentAnalyzerAgent",
@@ -23,4 +24,6 @@ __all__ = [
     "SentimentStrength",
     "CryptoPanicSource",
     "RedditSource",
+    "SentimentRefresher",
+    "sentiment_refresher",
 ]
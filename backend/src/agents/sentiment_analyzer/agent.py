@@ -6,11 +6,9 @@ FinBERT를 사용한 금융 뉴스 감성 분석 에이전트
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from typing import Any, Dict, List, Optional, Tuple
 
+from ...ml.models.model_registry import model_registry
 from ..base import BaseAgent, AgentTask
 from .models import (
     MarketSentiment,
@@ -24,6 +22,21 @@ from .data_sources import CryptoPanicSource, RedditSource
 logger = logging.getLogger(__name__)
 
 
+def _load_finbert(model_name: str) -> Tuple[Any, Any]:
+    """토크나이저 + 추론 모드 모델 로드 (model_registry 로더)"""
+    logger.info(f"FinBERT 모델 로드 중: {model_name}")
+
+    # torch/transformers는 모델을 처음 로드할 때 import (서버 시작 시간에서 제외)
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    logger.info("✅ FinBERT 모델 로드 완료")
+    return tokenizer, model
+
+
 class SentimentAnalyzerAgent(BaseAgent):
     """
     감성 분석 에이전트
@@ -67,18 +80,12 @@ class SentimentAnalyzerAgent(BaseAgent):
         self._cache_ttl = timedelta(minutes=cfg.get("cache_ttl_minutes", 30))
 
     def _load_model(self):
-        """FinBERT 모델 로드"""
+        """FinBERT 모델 로드 (프로세스당 한 번, 모든 에이전트가 공유)"""
         try:
-            logger.info(f"FinBERT 모델 로드 중: {self.model_name}")
-
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                self.model_name
+            self.tokenizer, self.model = model_registry.get(
+                f"finbert:{self.model_name}",
+                lambda: _load_finbert(self.model_name),
             )
-            self.model.eval()
-
-            logger.info("✅ FinBERT 모델 로드 완료")
-
         except Exception as e:
             logger.error(f"❌ FinBERT 모델 로드 실패: {e}")
             self.model = None
@@ -86,44 +93,59 @@ class SentimentAnalyzerAgent(BaseAgent):
 
     def _analyze_text_sentiment(self, text: str) -> tuple:
         """텍스트 감성 분석"""
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+    ) -> List[Tuple[float, SentimentLabel, float]]:
+        """
+        여러 텍스트 감성 분석 (패딩 배치, CPU 동기 실행 - 이벤트 루프 밖에서 호출)
+
+        Returns:
+            텍스트별 (점수, 라벨, 신뢰도)
+        """
+        neutral = (0.0, SentimentLabel.NEUTRAL, 0.0)
         if not self.model or not self.tokenizer:
-            return 0.0, SentimentLabel.NEUTRAL, 0.0
+            return [neutral] * len(texts)
 
-        try:
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512
-            )
+        import torch
 
-            with torch.no_grad():
-                outputs = self.model(**inputs)
+        results: List[Tuple[float, SentimentLabel, float]] = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            try:
+                inputs = self.tokenizer(
+                    chunk,
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=512
+                )
 
-            logits = outputs.logits
-            probs = torch.softmax(logits, dim=1)[0]
+                with torch.no_grad():
+                    outputs = self.model(**inputs)
 
-            pos_prob = probs[0].item()
-            neg_prob = probs[1].item()
-            neu_prob = probs[2].item()
+                probs = torch.softmax(outputs.logits, dim=1).tolist()
+                results.extend(self._to_sentiment(*row) for row in probs)
 
-            score = pos_prob - neg_prob
+            except Exception as e:
+                logger.error(f"감성 분석 에러: {e}")
+                results.extend([neutral] * len(chunk))
 
-            if pos_prob > neg_prob and pos_prob > neu_prob:
-                label = SentimentLabel.POSITIVE
-                confidence = pos_prob
-            elif neg_prob > pos_prob and neg_prob > neu_prob:
-                label = SentimentLabel.NEGATIVE
-                confidence = neg_prob
-            else:
-                label = SentimentLabel.NEUTRAL
-                confidence = neu_prob
+        return results
 
-            return score, label, confidence
+    @staticmethod
+    def _to_sentiment(pos_prob: float, neg_prob: float, neu_prob: float) -> Tuple[float, SentimentLabel, float]:
+        """FinBERT 확률 [positive, negative, neutral] → (점수, 라벨, 신뢰도)"""
+        score = pos_prob - neg_prob
 
-        except Exception as e:
-            logger.error(f"감성 분석 에러: {e}")
-            return 0.0, SentimentLabel.NEUTRAL, 0.0
+        if pos_prob > neg_prob and pos_prob > neu_prob:
+            return score, SentimentLabel.POSITIVE, pos_prob
+        elif neg_prob > pos_prob and neg_prob > neu_prob:
+            return score, SentimentLabel.NEGATIVE, neg_prob
+        return score, SentimentLabel.NEUTRAL, neu_prob
 
     def _calculate_strength(self, score: float) -> SentimentStrength:
         """감성 점수 to 강도 변환"""
@@ -171,7 +193,29 @@ class SentimentAnalyzerAgent(BaseAgent):
         logger.info(f"시장 감성 분석 시작: symbol={symbol}, hours={hours}")
 
         news_items = await self._fetch_all_news([symbol], hours)
+        if not news_items:
+            return self.build_market_sentiment(symbol, news_items)
+
+        scores = self.analyze_batch([news.title for news in news_items])
+        for news, (score, label, confidence) in zip(news_items, scores):
+            news.sentiment_score = score
+            news.sentiment_label = label
+            news.confidence = confidence
+
+        sentiment = self.build_market_sentiment(symbol, news_items)
+        self._cache[cache_key] = sentiment
 
+        logger.info(
+            f"✅ 감성 분석 완료: {symbol} | "
+            f"Score={sentiment.score:.3f} | "
+            f"Strength={sentiment.strength.value} | "
+            f"News={sentiment.news_count}"
+        )
+
+        return sentiment
+
+    def build_market_sentiment(self, symbol: str, news_items: List[NewsItem]) -> MarketSentiment:
+        """점수가 매겨진 뉴스로 시장 감성 집계"""
         if not news_items:
             logger.warning(f"뉴스 없음: {symbol}")
             return MarketSentiment(
@@ -186,54 +230,24 @@ class SentimentAnalyzerAgent(BaseAgent):
                 news_items=[],
             )
 
-        total_score = 0.0
-        total_confidence = 0.0
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-
-        for news in news_items:
-            score, label, confidence = self._analyze_text_sentiment(news.title)
-            news.sentiment_score = score
-            news.sentiment_label = label
-            news.confidence = confidence
-            total_score += score
-            total_confidence += confidence
-
-            if label == SentimentLabel.POSITIVE:
-                positive_count += 1
-            elif label == SentimentLabel.NEGATIVE:
-                negative_count += 1
-            else:
-                neutral_count += 1
+        labels = [news.sentiment_label for news in news_items]
+        positive_count = labels.count(SentimentLabel.POSITIVE)
+        negative_count = labels.count(SentimentLabel.NEGATIVE)
+        avg_score = sum(news.sentiment_score or 0.0 for news in news_items) / len(news_items)
+        avg_confidence = sum(news.confidence or 0.0 for news in news_items) / len(news_items)
 
-        avg_score = total_score / len(news_items)
-        avg_confidence = total_confidence / len(news_items)
-        strength = self._calculate_strength(avg_score)
-
-        sentiment = MarketSentiment(
+        return MarketSentiment(
             symbol=symbol,
             score=avg_score,
-            strength=strength,
+            strength=self._calculate_strength(avg_score),
             confidence=avg_confidence,
             news_count=len(news_items),
             positive_count=positive_count,
             negative_count=negative_count,
-            neutral_count=neutral_count,
+            neutral_count=len(news_items) - positive_count - negative_count,
             news_items=news_items,
         )
 
-        self._cache[cache_key] = sentiment
-
-        logger.info(
-            f"✅ 감성 분석 완료: {symbol} | "
-            f"Score={avg_score:.3f} | "
-            f"Strength={strength.value} | "
-            f"News={len(news_items)}"
-        )
-
-        return sentiment
-
     def generate_sentiment_signal(
         self,
         sentiment: MarketSentiment
@@ -305,3 +319,7 @@ class SentimentAnalyzerAgent(BaseAgent):
 
         else:
             return {"error": f"Unknown task type: {task_type}"}
+
+    async def process_task(self, task: AgentTask) -> Any:
+        """BaseAgent 작업 처리 (process로 위임)"""
+        return await self.process(task)
@@ -4,6 +4,7 @@ Sentiment Analyzer - Data Sources (CryptoPanic, Reddit)
 뉴스 데이터 수집을 위한 클라이언트 구현
 """
 
+import asyncio
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -81,7 +82,9 @@ class CryptoPanicSource(NewsDataSource):
 
             logger.info(f"CryptoPanic API 요청: symbols={symbols}, hours={hours}")
 
-            response = requests.get(
+            # requests는 블로킹이므로 스레드에서 실행
+            response = await asyncio.to_thread(
+                requests.get,
                 self.BASE_URL,
                 params=params,
                 timeout=10
@@ -118,6 +121,7 @@ class CryptoPanicSource(NewsDataSource):
                         source="cryptopanic",
                         published_at=created_at,
                         currencies=currencies,
+                        news_id=str(item["id"]) if item.get("id") is not None else None,
                     )
                     news_items.append(news_item)
 
@@ -39,6 +39,12 @@ class NewsItem:
     sentiment_score: Optional[float] = None  # -1.0 ~ 1.0
     sentiment_label: Optional[SentimentLabel] = None
     confidence: Optional[float] = None  # 0.0 ~ 1.0
+    news_id: Optional[str] = None  # 소스의 뉴스 ID (점수 캐시 키)
+
+    @property
+    def key(self) -> str:
+        """중복 판별 키 (ID > URL > 제목)"""
+        return f"{self.source}:{self.news_id}" if self.news_id else (self.url or self.title)
 
 
 @dataclass
@@ -0,0 +1,180 @@
+"""
+Sentiment Refresher - 공유 감성 갱신 서비스
+
+전략 인스턴스마다 감성 분석을 하지 않고, 백그라운드에서 코인별 뉴스를 주기적으로
+수집/분석해 결과를 게시합니다. 전략은 get_signal()로 마지막 결과만 읽습니다 (블로킹 없음).
+
+- 전략이 track(coin)으로 코인 등록 (워커 스레드에서 호출해도 안전)
+- periodic_scheduler의 ("sentiment", "news") 작업이 interval마다 코인별로 갱신
+- 처음 보는 헤드라인만 FinBERT 패딩 배치로 점수 계산 (이벤트 루프 밖 스레드)
+- 헤드라인 점수는 뉴스 ID로 캐시 (반복 수집된 뉴스는 다시 계산하지 않음)
+
+사용 예시:
+    from src.agents.sentiment_analyzer.refresher import sentiment_refresher
+
+    sentiment_refresher.track("ETH")
+    signal = sentiment_refresher.get_signal("ETH")  # 아직 갱신 전이면 None
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .agent import SentimentAnalyzerAgent
+from .models import MarketSentiment, NewsItem, SentimentLabel
+
+logger = logging.getLogger(__name__)
+
+Score = Tuple[float, SentimentLabel, float]
+
+
+def _default_agent() -> SentimentAnalyzerAgent:
+    return SentimentAnalyzerAgent(agent_id="sentiment_shared", name="SentimentAnalyzer")
+
+
+class SentimentRefresher:
+    """코인별 감성 백그라운드 갱신 + 게시"""
+
+    def __init__(
+        self,
+        interval: float = 900.0,
+        hours: int = 24,
+        batch_size: int = 32,
+        max_scores: int = 5000,
+        agent_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.interval = interval  # CryptoPanic 무료 플랜 100 req/day 고려 (코인당 15분)
+        self.hours = hours
+        self.batch_size = batch_size
+        self.max_scores = max_scores
+        self._agent_factory = agent_factory or _default_agent
+        self._agent = None
+        self._agent_lock = asyncio.Lock()
+
+        self._coins: Dict[str, None] = {}
+        self._coins_lock = threading.Lock()
+        self._scores: "OrderedDict[str, Score]" = OrderedDict()
+        self._sentiment: Dict[str, MarketSentiment] = {}
+        self._signals: Dict[str, Dict[str, Any]] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        self.stats = {
+            "refreshes": 0,
+            "news_fetched": 0,
+            "headlines_scored": 0,
+            "score_cache_hits": 0,
+            "batches": 0,
+            "errors": 0,
+            "last_refresh_ms": 0.0,
+        }
+
+    # ==================== 등록/조회 (전략용) ====================
+
+    def track(self, coin: str):
+        """갱신 대상 코인 등록"""
+        coin = coin.upper()
+        if coin not in self._coins:
+            with self._coins_lock:
+                self._coins[coin] = None
+
+    def get_sentiment(self, coin: str) -> Optional[MarketSentiment]:
+        return self._sentiment.get(coin.upper())
+
+    def get_signal(self, coin: str) -> Optional[Dict[str, Any]]:
+        """마지막으로 게시된 감성 시그널 (ETHAIFusionStrategy 필터 형식)"""
+        return self._signals.get(coin.upper())
+
+    # ==================== 갱신 ====================
+
+    async def refresh(self):
+        """등록된 모든 코인 갱신 (periodic_scheduler가 호출)"""
+        started = time.perf_counter()
+        with self._coins_lock:
+            coins = list(self._coins)
+        for coin in coins:
+            try:
+                await self.refresh_coin(coin)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Sentiment refresh failed for {coin}: {e}")
+        self.stats["last_refresh_ms"] = (time.perf_counter() - started) * 1000
+
+    async def refresh_coin(self, coin: str) -> MarketSentiment:
+        """코인 하나의 뉴스 수집 → 새 헤드라인만 점수 계산 → 게시"""
+        agent = await self._get_agent()
+        news_items: List[NewsItem] = await agent._fetch_all_news([coin], self.hours)
+        self.stats["news_fetched"] += len(news_items)
+
+        # 같은 뉴스가 여러 번 포함돼도 한 번만 계산
+        scores: Dict[str, Score] = {}
+        unseen: Dict[str, str] = {}
+        for news in news_items:
+            cached = self._scores.get(news.key)
+            if cached is not None:
+                self.stats["score_cache_hits"] += 1
+                self._scores.move_to_end(news.key)
+                scores[news.key] = cached
+            else:
+                unseen.setdefault(news.key, news.title)
+
+        if unseen:
+            titles = list(unseen.values())
+            results = await asyncio.to_thread(agent.analyze_batch, titles, self.batch_size)
+            self.stats["headlines_scored"] += len(titles)
+            self.stats["batches"] += -(-len(titles) // self.batch_size)
+            for key, score in zip(unseen, results):
+                scores[key] = self._scores[key] = score
+            while len(self._scores) > self.max_scores:
+                self._scores.popitem(last=False)
+
+        for news in news_items:
+            news.sentiment_score, news.sentiment_label, news.confidence = scores[news.key]
+
+        sentiment = agent.build_market_sentiment(coin, news_items)
+        signal = agent.generate_sentiment_signal(sentiment)
+        self._sentiment[coin] = sentiment
+        self._signals[coin] = {
+            "score": sentiment.score,
+            "strength": sentiment.strength.value if sentiment.strength else "unknown",
+            "should_block": signal.should_block if signal else False,
+            "confidence_multiplier": signal.confidence_multiplier if signal else 1.0,
+            "reason": signal.reason if signal else None,
+        }
+        self._refreshed_at[coin] = time.time()
+        self.stats["refreshes"] += 1
+
+        logger.info(
+            f"✅ 감성 갱신: {coin} | Score={sentiment.score:.3f} | "
+            f"News={sentiment.news_count} | New={len(unseen)}"
+        )
+        return sentiment
+
+    async def _get_agent(self):
+        """공유 에이전트 (FinBERT 로드는 스레드에서 한 번만)"""
+        if self._agent is None:
+            async with self._agent_lock:
+                if self._agent is None:
+                    self._agent = await asyncio.to_thread(self._agent_factory)
+        return self._agent
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            **self.stats,
+            "last_refresh_ms": round(self.stats["last_refresh_ms"], 1),
+            "interval_s": self.interval,
+            "cached_scores": len(self._scores),
+            "coins": {
+                coin: {
+                    "score": round(self._sentiment[coin].score, 3) if coin in self._sentiment else None,
+                    "age_s": round(now - self._refreshed_at[coin]) if coin in self._refreshed_at else None,
+                }
+                for coin in list(self._coins)
+            },
+        }
+
+
+# 싱글톤 인스턴스
+sentiment_refresher = SentimentRefresher()
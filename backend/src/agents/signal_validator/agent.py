@@ -14,11 +14,10 @@ import asyncio
 import json
 from typing import Any, Dict, List, Optional
 
+from ..agent_store import as_agent_store
 from ..base import BaseAgent, AgentTask
 from .models import SignalValidation, ValidationResult, ValidationRule
 from .rules import ValidationRules
-from src.ml.models import EnsemblePredictor
-from src.ml.features import FeaturePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -49,17 +48,45 @@ class SignalValidatorAgent(BaseAgent):
         super().__init__(agent_id, name, config)
         self.rules_engine = ValidationRules()
         self._validation_rules = self._init_rules()
-        self.redis_client = redis_client
+        self.redis_client = as_agent_store(redis_client)  # AgentStore (배치 쓰기)
         self.ai_service = ai_service  # IntegratedAIService
         self.enable_ai = config.get("enable_ai", True) if config else True  # AI 활성화
 
-        # ML 통합
-        self.ml_predictor = EnsemblePredictor()
-        self.feature_pipeline = FeaturePipeline()
+        # ML 통합 (예측기/피처 파이프라인은 첫 분석 시 생성, import 시점 cold start 단축)
+        self._ml_predictor = None
+        self._feature_pipeline = None
         self.enable_ml = config.get("enable_ml", True) if config else True
 
         logger.info(f"SignalValidatorAgent initialized with AI={self.enable_ai}, ML={self.enable_ml}")
 
+    # ==================== ML (첫 분석 시 로드) ====================
+
+    @property
+    def ml_predictor(self):
+        """LightGBM 앙상블 예측기 (pandas/lightgbm/모델 파일은 처음 사용할 때 로드)"""
+        if self._ml_predictor is None:
+            from src.ml.models import EnsemblePredictor
+
+            self._ml_predictor = EnsemblePredictor()
+        return self._ml_predictor
+
+    @ml_predictor.setter
+    def ml_predictor(self, value):
+        self._ml_predictor = value
+
+    @property
+    def feature_pipeline(self):
+        """피처 추출 파이프라인 (처음 사용할 때 로드)"""
+        if self._feature_pipeline is None:
+            from src.ml.features import FeaturePipeline
+
+            self._feature_pipeline = FeaturePipeline()
+        return self._feature_pipeline
+
+    @feature_pipeline.setter
+    def feature_pipeline(self, value):
+        self._feature_pipeline = value
+
     async def validate_signal(self, params: dict) -> SignalValidation:
         """
         Public method for signal validation (wraps _validate_signal)
@@ -336,7 +363,7 @@ class SignalValidatorAgent(BaseAgent):
         ml_confidence_adjustment = 0.0
         ml_should_reject = False
 
-        if self.enable_ml and self.ml_predictor and params.get("candles"):
+        if self.enable_ml and params.get("candles"):
             try:
                 candles = params.get("candles", [])
 
@@ -619,11 +646,18 @@ Provide your AI-based signal validation. Return JSON only:"""
             result = await self.ai_service.call_ai(
                 agent_type="signal_validator",
                 prompt=user_prompt,
+                # 캐시 키는 이 컨텍스트로만 만들어지므로 판단에 쓰이는 입력을 모두 포함 (signal_id 제외)
                 context={
                     "symbol": symbol,
                     "action": action,
                     "confidence": confidence,
+                    "price": current_price,
                     "market_regime": market_regime.get("regime_type"),
+                    "volatility": market_regime.get("volatility", 0.0),
+                    "trend_strength": market_regime.get("trend_strength", 0.0),
+                    "rule_based_result": rule_based_result,
+                    "rule_based_score": rule_based_score,
+                    "failed_rules": sorted(failed_rules or []),
                 },
                 system_prompt=system_prompt,
                 response_type="signal_validation",
@@ -39,14 +39,10 @@ async def balance(
             detail="API keys not configured. Please add your exchange API keys in Settings."
         )
 
-    # 캐시 확인 (10초 TTL - 잔고는 자주 변경될 수 있음)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 조회 (10초 TTL - 잔고는 자주 변경될 수 있음)
     cache_key = make_cache_key("balance", user_id)
-    cached_balance = await cache_manager.get(cache_key)
-    if cached_balance is not None:
-        logger.debug(f"Cache hit for balance user {user_id}")
-        return cached_balance
 
-    try:
+    async def fetch_balance():
         # 거래소 클라이언트 가져오기 (서비스 레이어 사용)
         client, exchange_name = await ExchangeService.get_user_exchange_client(
             session, user_id
@@ -80,11 +76,10 @@ async def balance(
             "exchange": exchange_name,
         }
 
-        # 캐시에 저장 (10초 TTL)
-        await cache_manager.set(cache_key, response, ttl=10)
-        logger.debug(f"Cached balance for user {user_id}")
-
         return response
+
+    try:
+        return await cache_manager.get_or_set(cache_key, fetch_balance, ttl=10)
     except HTTPException:
         # ExchangeService에서 발생한 HTTPException은 그대로 전달
         raise
@@ -111,14 +106,10 @@ async def positions(
             detail="API keys not configured. Please add your exchange API keys in Settings."
         )
 
-    # 캐시 확인 (5초 TTL - 포지션은 자주 변경될 수 있음)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 조회 (5초 TTL - 포지션은 자주 변경될 수 있음)
     cache_key = make_cache_key("positions", user_id)
-    cached_positions = await cache_manager.get(cache_key)
-    if cached_positions is not None:
-        logger.debug(f"Cache hit for positions user {user_id}")
-        return cached_positions
 
-    try:
+    async def fetch_positions():
         # 거래소 클라이언트 가져오기 (서비스 레이어 사용)
         client, exchange_name = await ExchangeService.get_user_exchange_client(
             session, user_id
@@ -130,11 +121,10 @@ async def positions(
 
         response = {"result": "true", "data": positions_data, "exchange": exchange_name}
 
-        # 캐시에 저장 (5초 TTL)
-        await cache_manager.set(cache_key, response, ttl=5)
-        logger.debug(f"Cached positions for user {user_id}")
-
         return response
+
+    try:
+        return await cache_manager.get_or_set(cache_key, fetch_positions, ttl=5)
     except HTTPException:
         # ExchangeService에서 발생한 HTTPException은 그대로 전달
         raise
@@ -288,14 +278,10 @@ async def get_risk_settings(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (60초 TTL - 리스크 설정은 자주 변경되지 않음)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 조회 (60초 TTL - 리스크 설정은 자주 변경되지 않음)
     cache_key = make_cache_key("risk_settings", user_id)
-    cached_settings = await cache_manager.get(cache_key)
-    if cached_settings is not None:
-        logger.debug(f"Cache hit for risk_settings user {user_id}")
-        return RiskSettingsResponse(**cached_settings)
 
-    try:
+    async def load_settings():
         result = await session.execute(
             select(RiskSettings).where(RiskSettings.user_id == user_id)
         )
@@ -321,10 +307,10 @@ async def get_risk_settings(
                 "updated_at": settings.updated_at.isoformat() if settings.updated_at else None,
             }
 
-        # 캐시에 저장 (60초 TTL)
-        await cache_manager.set(cache_key, response_data, ttl=60)
-        logger.debug(f"Cached risk_settings for user {user_id}")
+        return response_data
 
+    try:
+        response_data = await cache_manager.get_or_set(cache_key, load_settings, ttl=60)
         return RiskSettingsResponse(**response_data)
 
     except Exception as e:
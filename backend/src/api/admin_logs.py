@@ -1,10 +1,20 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, desc, or_
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
 from ..database.db import get_session
-from ..database.models import BotLog, Trade, User
+from ..database.models import BotLog, Trade
+from ..services.admin_log_history import (
+    NDJSON_MEDIA_TYPE,
+    bot_log_query,
+    fetch_page,
+    iter_ndjson,
+    log_row,
+    trade_log_query,
+    trade_row,
+)
 from ..utils.auth_dependencies import require_admin
 from ..utils.structured_logging import get_logger
 import logging
@@ -21,6 +31,9 @@ async def get_system_logs(
     admin_id: int = Depends(require_admin),
     level: Optional[str] = Query(None, description="Log level filter: CRITICAL, ERROR, WARNING, INFO"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
 ):
     """
     관리자 전용: 시스템 로그 조회
@@ -33,49 +46,19 @@ async def get_system_logs(
     Args:
         level: 로그 레벨 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 이전 응답의 next_cursor (다음 페이지, (created_at, id) keyset)
+        start, end: created_at 범위 (선택)
 
     Returns:
-        시스템 로그 목록
+        시스템 로그 목록 + next_cursor (마지막 페이지면 None)
     """
     try:
         # BotLog 테이블에서 시스템 로그 조회
-        # event_type에 'error', 'warning', 'critical', 'system' 등이 포함된 로그
-        query = select(BotLog).where(
-            or_(
-                BotLog.event_type.like('%error%'),
-                BotLog.event_type.like('%warning%'),
-                BotLog.event_type.like('%critical%'),
-                BotLog.event_type.like('%system%'),
-            )
-        )
-
-        # 레벨 필터 적용
-        if level:
-            level_lower = level.lower()
-            query = query.where(BotLog.event_type.like(f'%{level_lower}%'))
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(BotLog.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        logs = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        log_list = []
-        for log in logs:
-            user_result = await session.execute(
-                select(User.email).where(User.id == log.user_id)
-            )
-            user_email = user_result.scalar()
-
-            log_list.append({
-                "id": log.id,
-                "user_id": log.user_id,
-                "user_email": user_email,
-                "event_type": log.event_type,
-                "message": log.message,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            })
+        # event_type에 'error', 'warning', 'critical', 'system' 등이 포함된 로그 (레벨 필터 선택)
+        # 최신순 (created_at, id) keyset 페이지, 사용자 이메일은 같은 쿼리에서 join
+        query = bot_log_query("system", level=level, start=start, end=end)
+        rows, next_cursor = await fetch_page(session, query, BotLog, limit, cursor)
+        log_list = [log_row(row) for row in rows]
 
         structured_logger.info(
             "admin_system_logs_accessed",
@@ -90,8 +73,11 @@ async def get_system_logs(
             "total_count": len(log_list),
             "level_filter": level,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         structured_logger.error(
             "admin_system_logs_error",
@@ -108,6 +94,9 @@ async def get_bot_logs(
     admin_id: int = Depends(require_admin),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
 ):
     """
     관리자 전용: 봇 로그 조회
@@ -120,49 +109,18 @@ async def get_bot_logs(
     Args:
         user_id: 사용자 ID 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 이전 응답의 next_cursor (다음 페이지, (created_at, id) keyset)
+        start, end: created_at 범위 (선택)
 
     Returns:
-        봇 로그 목록
+        봇 로그 목록 + next_cursor (마지막 페이지면 None)
     """
     try:
         # BotLog 테이블에서 봇 로그 조회
-        # event_type에 'bot', 'start', 'stop', 'trade' 등이 포함된 로그
-        query = select(BotLog).where(
-            or_(
-                BotLog.event_type.like('%bot%'),
-                BotLog.event_type.like('%start%'),
-                BotLog.event_type.like('%stop%'),
-                BotLog.event_type.like('%trade%'),
-                BotLog.event_type.like('%signal%'),
-            )
-        )
-
-        # 사용자 필터 적용
-        if user_id:
-            query = query.where(BotLog.user_id == user_id)
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(BotLog.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        logs = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        log_list = []
-        for log in logs:
-            user_result = await session.execute(
-                select(User.email).where(User.id == log.user_id)
-            )
-            user_email = user_result.scalar()
-
-            log_list.append({
-                "id": log.id,
-                "user_id": log.user_id,
-                "user_email": user_email,
-                "event_type": log.event_type,
-                "message": log.message,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            })
+        # event_type에 'bot', 'start', 'stop', 'trade', 'signal' 등이 포함된 로그 (사용자 필터 선택)
+        query = bot_log_query("bot", user_id=user_id, start=start, end=end)
+        rows, next_cursor = await fetch_page(session, query, BotLog, limit, cursor)
+        log_list = [log_row(row) for row in rows]
 
         structured_logger.info(
             "admin_bot_logs_accessed",
@@ -177,8 +135,11 @@ async def get_bot_logs(
             "total_count": len(log_list),
             "user_id_filter": user_id,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         structured_logger.error(
             "admin_bot_logs_error",
@@ -196,6 +157,9 @@ async def get_trading_logs(
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     symbol: Optional[str] = Query(None, description="Filter by symbol (e.g., BTCUSDT)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
 ):
     """
     관리자 전용: 거래 로그 조회
@@ -210,51 +174,17 @@ async def get_trading_logs(
         user_id: 사용자 ID 필터 (선택)
         symbol: 심볼 필터 (선택)
         limit: 조회할 최대 로그 수 (기본값: 100)
+        cursor: 이전 응답의 next_cursor (다음 페이지, (created_at, id) keyset)
+        start, end: created_at 범위 (선택)
 
     Returns:
-        거래 로그 목록
+        거래 로그 목록 + next_cursor (마지막 페이지면 None)
     """
     try:
-        # Trade 테이블에서 거래 로그 조회
-        query = select(Trade)
-
-        # 사용자 필터 적용
-        if user_id:
-            query = query.where(Trade.user_id == user_id)
-
-        # 심볼 필터 적용
-        if symbol:
-            query = query.where(Trade.symbol == symbol.upper())
-
-        # 최신순 정렬 및 limit 적용
-        query = query.order_by(desc(Trade.created_at)).limit(limit)
-
-        result = await session.execute(query)
-        trades = result.scalars().all()
-
-        # 사용자 정보 함께 조회
-        trade_list = []
-        for trade in trades:
-            user_result = await session.execute(
-                select(User.email).where(User.id == trade.user_id)
-            )
-            user_email = user_result.scalar()
-
-            trade_list.append({
-                "id": trade.id,
-                "user_id": trade.user_id,
-                "user_email": user_email,
-                "symbol": trade.symbol,
-                "side": trade.side,
-                "qty": trade.qty,
-                "entry_price": float(trade.entry_price) if trade.entry_price else None,
-                "exit_price": float(trade.exit_price) if trade.exit_price else None,
-                "pnl": float(trade.pnl) if trade.pnl else 0.0,
-                "pnl_percent": trade.pnl_percent,
-                "leverage": trade.leverage,
-                "exit_reason": trade.exit_reason.value if trade.exit_reason else None,
-                "created_at": trade.created_at.isoformat() if trade.created_at else None,
-            })
+        # Trade 테이블에서 거래 로그 조회 (사용자/심볼 필터 선택)
+        query = trade_log_query(user_id=user_id, symbol=symbol, start=start, end=end)
+        rows, next_cursor = await fetch_page(session, query, Trade, limit, cursor)
+        trade_list = [trade_row(row) for row in rows]
 
         structured_logger.info(
             "admin_trading_logs_accessed",
@@ -271,8 +201,11 @@ async def get_trading_logs(
             "user_id_filter": user_id,
             "symbol_filter": symbol,
             "limit": limit,
+            "next_cursor": next_cursor,
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         structured_logger.error(
             "admin_trading_logs_error",
@@ -281,3 +214,42 @@ async def get_trading_logs(
             error=str(e)
         )
         raise HTTPException(status_code=500, detail=f"Failed to get trading logs: {str(e)}")
+
+
+@router.get("/export")
+async def export_logs(
+    admin_id: int = Depends(require_admin),
+    kind: str = Query(..., pattern="^(system|bot|trading)$", description="system, bot or trading"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
+    level: Optional[str] = Query(None, description="Log level filter (system)"),
+    user_id: Optional[int] = Query(None, description="Filter by user ID (bot, trading)"),
+    symbol: Optional[str] = Query(None, description="Filter by symbol (trading)"),
+):
+    """
+    관리자 전용: 로그/거래 내역 NDJSON 내보내기
+
+    기간 전체를 한 줄에 한 건씩 (오래된 순) 스트리밍합니다.
+    결과를 메모리에 모으지 않고 1000건 단위 keyset 조회를 이어서 전송합니다.
+    """
+    if kind == "trading":
+        query, model, to_dict = trade_log_query(user_id=user_id, symbol=symbol, start=start, end=end), Trade, trade_row
+    else:
+        query = bot_log_query(kind, level=level, user_id=user_id, start=start, end=end)
+        model, to_dict = BotLog, log_row
+
+    structured_logger.info(
+        "admin_logs_exported",
+        f"Admin {admin_id} exported {kind} logs",
+        admin_id=admin_id,
+        kind=kind,
+        start=start.isoformat() if start else None,
+        end=end.isoformat() if end else None,
+    )
+
+    filename = f"{kind}-logs-{datetime.utcnow():%Y%m%d%H%M%S}.ndjson"
+    return StreamingResponse(
+        iter_ndjson(query, model, to_dict),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -4,14 +4,28 @@ Admin Monitoring API
 관리자용 모니터링 엔드포인트.
 시스템 상태, 사용자 활동, 백테스트 통계 조회.
 """
+import asyncio
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from ..database.session import get_session
 from ..database.models import BacktestResult, User
+from ..services.account_state_service import account_state_service
+from ..services.admin_user_stats import user_rollups
+from ..services.candle_warm_start import bot_start_admission, candle_warm_store
+from ..services.ccxt_price_collector import price_collector
+from ..services.exchanges.feed_manager import feed_manager
+from ..services.log_retention import bot_log_retention
+from ..services.periodic_scheduler import periodic_scheduler
+from ..services.persistence_queue import persistence_queue
+from ..services.strategy_executor import strategy_executor
+from ..services.trading_state_cache import trading_state_cache
 from ..utils.monitoring import monitor
 from ..utils.auth_dependencies import require_admin
+from ..utils.startup_profile import startup_profile
+from ..websockets.broadcast_hub import broadcast_hub
 
 router = APIRouter(prefix="/admin/monitoring", tags=["admin", "monitoring"])
 
@@ -30,6 +44,203 @@ async def get_monitoring_stats(admin_id: int = Depends(require_admin)):
     return monitor.get_stats()
 
 
+@router.get("/order-path")
+async def get_order_path_stats(admin_id: int = Depends(require_admin)):
+    """
+    주문 경로 통계.
+
+    Returns:
+    - set_leverage 호출/생략 횟수
+    - 신호 → 주문 ACK 지연 시간 (p50, p95, max)
+    - 주문 요청 왕복 시간
+    """
+    return trading_state_cache.get_stats()
+
+
+@router.get("/account-state")
+async def get_account_state_stats(admin_id: int = Depends(require_admin)):
+    """
+    계좌 상태 스냅샷 통계.
+
+    Returns:
+    - 실제 잔고/포지션 API 호출 수
+    - 스냅샷 재사용 및 동시 요청 합치기 횟수
+    """
+    return account_state_service.get_stats()
+
+
+@router.get("/periodic-jobs")
+async def get_periodic_job_stats(admin_id: int = Depends(require_admin)):
+    """
+    주기 작업 스케줄러 상태.
+
+    Returns:
+    - 등록된 작업 (키, 주기, 소유 봇 수, 다음 실행까지 남은 시간)
+    - 작업 종류별 실행 시간, deadline 초과, 겹침 건너뜀 통계
+    """
+    return {**periodic_scheduler.get_stats(), "job_list": periodic_scheduler.get_jobs()}
+
+
+@router.get("/warm-start")
+async def get_warm_start_stats(admin_id: int = Depends(require_admin)):
+    """
+    봇 시작 경로 통계.
+
+    Returns:
+    - 캔들 웜스타트 저장소 (디스크 로드, 보충/전체 조회, 합쳐진 요청 수)
+    - 봇 시작 허용 큐 (허용 수, 대기 중, 최대 대기 시간)
+    """
+    return {
+        "candles": candle_warm_store.get_stats(),
+        "admission": bot_start_admission.get_stats(),
+    }
+
+
+@router.get("/price-collector")
+async def get_price_collector_stats(admin_id: int = Depends(require_admin)):
+    """
+    가격 수집기 현황.
+
+    Returns:
+    - 수집 중인 심볼 (봇 심볼별 봇 수, 열린 차트 심볼)
+    - 일괄 조회 횟수/실패 수, 마지막 조회 시간 (ms)
+    - 심볼별 틱 수, 마지막 가격, 틱 지연 (마지막/평균/최대, ms)
+    """
+    return price_collector.get_stats()
+
+
+@router.get("/feeds")
+async def get_feed_stats(admin_id: int = Depends(require_admin)):
+    """
+    거래소 WebSocket 피드 현황.
+
+    Returns:
+    - 거래소별 연결 상태, 스트림별 구독자 수
+    - 연결/재연결 수, 메시지/레코드 수, 파싱/콜백 오류 수
+    - 누락 감지 수 (reconnect/sequence/candle), 마지막 메시지 후 경과 시간
+    """
+    return feed_manager.get_stats()
+
+
+@router.get("/websockets")
+async def get_websocket_stats(admin_id: int = Depends(require_admin)):
+    """
+    브라우저 WebSocket 브로드캐스트 현황.
+
+    Returns:
+    - 연결 수, 토픽별 구독 연결 수
+    - 발행/큐 적재 수, 느린 소비자 종료 수, 전체 대기 메시지 수
+    - 대기 메시지가 많은 연결 상위 10개 (토픽, 전송/conflation 수, 최대 전송 시간)
+    """
+    return broadcast_hub.get_stats()
+
+
+@router.get("/startup")
+async def get_startup_profile(admin_id: int = Depends(require_admin)):
+    """
+    서버 시작(cold start) 프로파일.
+
+    Returns:
+    - ready/warming: 트레이딩 서브시스템 워밍업 상태, 실패 시 오류
+    - 그룹별 합계 (app, lifespan, lazy; ms)
+    - 가장 느린 import 20개 (누적 시간, 중첩 포함)
+    - lifespan 단계별/지연 로드 모듈별 소요 시간
+    """
+    return startup_profile.get_stats()
+
+
+@router.get("/user-rollups")
+async def get_user_rollup_stats(admin_id: int = Depends(require_admin)):
+    """
+    관리자 회원 목록용 거래 집계 materialized view 상태.
+
+    Returns:
+    - enabled/available: ADMIN_USER_ROLLUP_VIEW 설정, 조회에 사용 중인지 (False면 직접 집계)
+    - 마지막 갱신 시각/소요 시간, 갱신 횟수, 마지막 오류
+    """
+    return user_rollups.get_stats()
+
+
+@router.get("/log-retention")
+async def get_log_retention_stats(admin_id: int = Depends(require_admin)):
+    """
+    bot_logs 보관 작업 상태.
+
+    Returns:
+    - 보관 기간(일, 0이면 비활성화), 보관 경로
+    - 보관한 날짜/행 수, 삭제한 파티션 수
+    - 마지막 실행 시각, 마지막 오류
+    """
+    return bot_log_retention.get_stats()
+
+
+@router.get("/persistence-queue")
+async def get_persistence_queue_stats(admin_id: int = Depends(require_admin)):
+    """
+    DB 쓰기 지연 큐 통계.
+
+    Returns:
+    - 큐 깊이 (대기 중인 INSERT/UPDATE 수, 최대 깊이)
+    - flush 지연 (평균/최대/마지막, ms), 기록 행 수, 실행 문장 수
+    - 재시도/실패/버려진 쓰기 수
+    """
+    return persistence_queue.get_stats()
+
+
+@router.get("/strategy-executor")
+async def get_strategy_executor_stats(admin_id: int = Depends(require_admin)):
+    """
+    전략 실행 풀 통계.
+
+    Returns:
+    - 워커 수, 대기 시간 제한, 실행 중인 작업 수
+    - 전략별 호출/타임아웃/실행 중 건너뜀/오류 수
+    - 전략별 CPU 시간, 평균/최대 실행 시간, 평균 워커 대기 시간 (ms)
+    """
+    return strategy_executor.get_stats()
+
+
+@router.get("/models")
+async def get_model_registry_stats(admin_id: int = Depends(require_admin)):
+    """
+    공유 ML 모델 현황.
+
+    Returns:
+    - 모델별 버전, 추정 메모리(MB), 로드 시간, 조회 수, 교체 횟수
+    - 전체 메모리 합계
+    """
+    from ..ml.models.model_registry import model_registry
+
+    return model_registry.get_stats()
+
+
+@router.post("/models/reload")
+async def reload_models(force: bool = False, admin_id: int = Depends(require_admin)):
+    """
+    재학습된 LightGBM 모델로 교체.
+
+    saved_models 파일 버전이 바뀐 경우에만 새로 로드합니다 (force=true면 항상).
+    로드는 스레드에서 수행되고, 교체 전까지 기존 모델로 계속 예측합니다.
+    """
+    from ..ml.models import reload_ensemble_models
+
+    return await asyncio.to_thread(reload_ensemble_models, None, force)
+
+
+@router.get("/sentiment")
+async def get_sentiment_stats(admin_id: int = Depends(require_admin)):
+    """
+    공유 감성 갱신 현황.
+
+    Returns:
+    - 코인별 마지막 감성 점수와 갱신 후 경과 시간
+    - 수집 뉴스 수, 새로 계산한 헤드라인 수, 점수 캐시 적중 수, FinBERT 배치 수
+    """
+    from ..agents.sentiment_analyzer.refresher import sentiment_refresher
+
+    return sentiment_refresher.get_stats()
+
+
 @router.get("/backtest/summary")
 async def get_backtest_summary(
     session: Session = Depends(get_session),
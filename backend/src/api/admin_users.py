@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func, and_
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+from typing import Optional
 
 from ..database.db import get_session
 from ..database.models import User, ApiKey, BotStatus, Trade
+from ..services.admin_user_stats import (
+    SORT_KEYS,
+    list_users_page,
+    profit_stats,
+    trade_stats,
+    user_summary,
+)
 from ..schemas.admin_schema import ApiKeyCreate, ApiKeyUpdate, UserCreate
 from ..utils.auth_dependencies import require_admin
 from ..utils.crypto_secrets import encrypt_secret, decrypt_secret
@@ -104,56 +112,34 @@ async def create_user(
 
 @router.get("")
 async def get_users(
+    sort: str = Query("id", description="정렬 키: " + ", ".join(SORT_KEYS)),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    search: Optional[str] = Query(None, max_length=100, description="이메일/이름 검색"),
+    role: Optional[str] = Query(None),
+    is_active: Optional[bool] = Query(None),
     session: AsyncSession = Depends(get_session),
     admin_id: int = Depends(require_admin),
 ):
     """
-    관리자 전용: 모든 회원 목록 조회 (통계 포함)
+    관리자 전용: 회원 목록 조회 (통계 포함)
 
     각 회원의 기본 정보와 함께 간단한 통계를 제공:
     - 총 거래 수
     - 총 손익 (P&L)
     - 활성 봇 수
-    """
-    result = await session.execute(select(User))
-    users = result.scalars().all()
-
-    users_with_stats = []
-    for user in users:
-        # 거래 통계
-        trades_result = await session.execute(
-            select(func.count(Trade.id), func.sum(Trade.pnl)).where(
-                Trade.user_id == user.id
-            )
-        )
-        trade_count, total_pnl = trades_result.first()
-
-        # 활성 봇 수
-        active_bots_result = await session.execute(
-            select(func.count(BotStatus.user_id)).where(
-                and_(BotStatus.user_id == user.id, BotStatus.is_running == True)
-            )
-        )
-        active_bots_count = active_bots_result.scalar()
 
-        users_with_stats.append(
-            {
-                "id": user.id,
-                "email": user.email,
-                "role": user.role,
-                "is_active": user.is_active if hasattr(user, "is_active") else True,
-                "suspended_at": user.suspended_at.isoformat()
-                if hasattr(user, "suspended_at") and user.suspended_at
-                else None,
-                "created_at": user.created_at.isoformat() if user.created_at else None,
-                # 통계
-                "total_trades": trade_count or 0,
-                "total_pnl": round(float(total_pnl), 2) if total_pnl else 0.0,
-                "active_bots_count": active_bots_count or 0,
-            }
+    통계는 회원별 반복 조회 없이 한 번의 집계 쿼리로 계산합니다.
+    다음 페이지는 응답의 next_cursor를 cursor로 전달해 조회합니다 (없으면 마지막 페이지).
+    """
+    try:
+        return await list_users_page(
+            session, sort=sort, order=order, limit=limit, cursor=cursor,
+            search=search, role=role, is_active=is_active,
         )
-
-    return {"users": users_with_stats}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{user_id}")
@@ -171,16 +157,7 @@ async def get_user_detail(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return {
-        "id": user.id,
-        "email": user.email,
-        "role": user.role,
-        "is_active": user.is_active if hasattr(user, "is_active") else True,
-        "suspended_at": user.suspended_at.isoformat()
-        if hasattr(user, "suspended_at") and user.suspended_at
-        else None,
-        "created_at": user.created_at.isoformat() if user.created_at else None,
-    }
+    return user_summary(user)
 
 
 @router.get("/{user_id}/detail")
@@ -206,16 +183,8 @@ async def get_user_comprehensive_detail(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # 거래 통계
-    trades_result = await session.execute(select(Trade).where(Trade.user_id == user_id))
-    trades = trades_result.scalars().all()
-
-    total_trades = len(trades)
-    total_pnl = sum(trade.pnl for trade in trades if trade.pnl is not None)
-    winning_trades = len([t for t in trades if t.pnl and t.pnl > 0])
-    losing_trades = len([t for t in trades if t.pnl and t.pnl < 0])
-    win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
-    avg_pnl = total_pnl / total_trades if total_trades > 0 else 0.0
+    # 거래 통계 (SQL 집계)
+    stats = await trade_stats(session, user_id)
 
     # 봇 현황
     bots_result = await session.execute(
@@ -242,21 +211,14 @@ async def get_user_comprehensive_detail(
 
     return {
         # 기본 정보
-        "id": user.id,
-        "email": user.email,
-        "role": user.role,
-        "is_active": user.is_active if hasattr(user, "is_active") else True,
-        "suspended_at": user.suspended_at.isoformat()
-        if hasattr(user, "suspended_at") and user.suspended_at
-        else None,
-        "created_at": user.created_at.isoformat() if user.created_at else None,
+        **user_summary(user),
         # 거래 통계
-        "total_trades": total_trades,
-        "total_pnl": round(total_pnl, 2),
-        "winning_trades": winning_trades,
-        "losing_trades": losing_trades,
-        "win_rate": round(win_rate, 1),
-        "avg_pnl": round(avg_pnl, 2),
+        "total_trades": stats["total_trades"],
+        "total_pnl": stats["total_pnl"],
+        "winning_trades": stats["winning_trades"],
+        "losing_trades": stats["losing_trades"],
+        "win_rate": stats["win_rate"],
+        "avg_pnl": stats["avg_pnl"],
         "total_balance": 0.0,  # TODO: 실제 잔고 조회 구현
         # 봇 정보
         "active_bots_count": active_bots_count,
@@ -804,8 +766,6 @@ async def get_user_profit_stats(
 
     일별, 주별, 월별 수익 통계 및 상세 지표 제공
     """
-    from datetime import timedelta
-
     try:
         # 사용자 확인
         result = await session.execute(select(User).where(User.id == user_id))
@@ -814,89 +774,13 @@ async def get_user_profit_stats(
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        now = datetime.utcnow()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=7)
-        month_start = today_start - timedelta(days=30)
-
-        # 전체 거래 조회
-        trades_result = await session.execute(
-            select(Trade).where(Trade.user_id == user_id)
-        )
-        all_trades = trades_result.scalars().all()
-
-        # 오늘 거래 필터
-        today_trades = [
-            t for t in all_trades if t.created_at and t.created_at >= today_start
-        ]
-        week_trades = [
-            t for t in all_trades if t.created_at and t.created_at >= week_start
-        ]
-        month_trades = [
-            t for t in all_trades if t.created_at and t.created_at >= month_start
-        ]
-
-        def calc_stats(trades):
-            if not trades:
-                return {
-                    "total_trades": 0,
-                    "total_pnl": 0.0,
-                    "winning_trades": 0,
-                    "losing_trades": 0,
-                    "win_rate": 0.0,
-                    "avg_pnl": 0.0,
-                    "max_profit": 0.0,
-                    "max_loss": 0.0,
-                    "profit_factor": 0.0,
-                }
-
-            total = len(trades)
-            pnl_values = [t.pnl for t in trades if t.pnl is not None]
-            total_pnl = sum(pnl_values) if pnl_values else 0
-            wins = [p for p in pnl_values if p > 0]
-            losses = [p for p in pnl_values if p < 0]
-
-            total_wins = sum(wins) if wins else 0
-            total_losses = abs(sum(losses)) if losses else 0
-            profit_factor = (total_wins / total_losses) if total_losses > 0 else 0
-
-            return {
-                "total_trades": total,
-                "total_pnl": round(total_pnl, 2),
-                "winning_trades": len(wins),
-                "losing_trades": len(losses),
-                "win_rate": round(len(wins) / total * 100, 1) if total > 0 else 0.0,
-                "avg_pnl": round(total_pnl / total, 2) if total > 0 else 0.0,
-                "max_profit": round(max(pnl_values), 2) if pnl_values else 0.0,
-                "max_loss": round(min(pnl_values), 2) if pnl_values else 0.0,
-                "profit_factor": round(profit_factor, 2),
-            }
-
-        # 일별 수익 (최근 7일)
-        daily_pnl = []
-        for i in range(7):
-            day = today_start - timedelta(days=i)
-            day_end = day + timedelta(days=1)
-            day_trades = [
-                t for t in all_trades if t.created_at and day <= t.created_at < day_end
-            ]
-            day_pnl = sum(t.pnl for t in day_trades if t.pnl is not None)
-            daily_pnl.append(
-                {
-                    "date": day.strftime("%Y-%m-%d"),
-                    "pnl": round(day_pnl, 2),
-                    "trades": len(day_trades),
-                }
-            )
+        # 기간별/일별 통계 (SQL 조건부 집계)
+        stats = await profit_stats(session, user_id)
 
         return {
             "user_id": user_id,
             "email": user.email,
-            "today": calc_stats(today_trades),
-            "week": calc_stats(week_trades),
-            "month": calc_stats(month_trades),
-            "all_time": calc_stats(all_trades),
-            "daily_pnl": daily_pnl[::-1],  # 오래된 순서로 정렬
+            **stats,
             "generated_at": datetime.utcnow().isoformat(),
         }
 
@@ -61,7 +61,7 @@ async def generate_strategies(
 
     try:
         # DeepSeek AI로 전략 생성
-        strategies_data = deepseek_service.generate_trading_strategies()
+        strategies_data = await deepseek_service.generate_trading_strategies()
 
         created_strategies = []
 
@@ -41,14 +41,10 @@ async def get_dashboard_summary(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (15초 TTL - 대시보드는 빠른 갱신 필요)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 계산 (15초 TTL - 대시보드는 빠른 갱신 필요)
     cache_key = make_cache_key("dashboard_summary", user_id)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        logger.debug(f"Cache hit for dashboard_summary user {user_id}")
-        return cached_data
 
-    try:
+    async def build_summary():
         structured_logger.info(
             "dashboard_summary_requested",
             "Dashboard summary requested",
@@ -230,10 +226,6 @@ async def get_dashboard_summary(
             "cached_at": datetime.utcnow().isoformat(),
         }
 
-        # 캐시에 저장 (15초 TTL)
-        await cache_manager.set(cache_key, response, ttl=15)
-        logger.debug(f"Cached dashboard_summary for user {user_id}")
-
         structured_logger.info(
             "dashboard_summary_calculated",
             f"Dashboard summary calculated: {len(all_trades)} total trades",
@@ -243,6 +235,8 @@ async def get_dashboard_summary(
 
         return response
 
+    try:
+        return await cache_manager.get_or_set(cache_key, build_summary, ttl=15)
     except Exception as e:
         structured_logger.error(
             "dashboard_summary_failed",
@@ -307,14 +301,10 @@ async def get_equity_curve(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (60초 TTL)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 계산 (60초 TTL)
     cache_key = make_cache_key("equity_curve", user_id, period)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        logger.debug(f"Cache hit for equity_curve user {user_id} period {period}")
-        return cached_data
 
-    try:
+    async def build_equity_curve():
         structured_logger.info(
             "equity_curve_requested",
             f"Equity curve requested for period {period}",
@@ -381,10 +371,6 @@ async def get_equity_curve(
             "count": len(data),
         }
 
-        # 캐시에 저장 (60초 TTL)
-        await cache_manager.set(cache_key, response, ttl=60)
-        logger.debug(f"Cached equity_curve for user {user_id} period {period}")
-
         structured_logger.info(
             "equity_curve_fetched",
             f"Equity curve fetched: {len(data)} points",
@@ -395,6 +381,8 @@ async def get_equity_curve(
 
         return response
 
+    try:
+        return await cache_manager.get_or_set(cache_key, build_equity_curve, ttl=60)
     except HTTPException:
         raise
     except Exception as e:
@@ -431,14 +419,10 @@ async def get_risk_metrics(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (30초 TTL - 리스크 지표는 자주 변경됨)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 계산 (30초 TTL - 리스크 지표는 자주 변경됨)
     cache_key = make_cache_key("risk_metrics", user_id)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        logger.debug(f"Cache hit for risk_metrics user {user_id}")
-        return cached_data
 
-    try:
+    async def build_risk_metrics():
         structured_logger.info(
             "risk_metrics_requested",
             "Risk metrics calculation requested",
@@ -569,10 +553,6 @@ async def get_risk_metrics(
             "data_sufficient": total_trades >= 10,  # 최소 10거래 필요
         }
 
-        # 캐시에 저장 (30초 TTL)
-        await cache_manager.set(cache_key, response, ttl=30)
-        logger.debug(f"Cached risk_metrics for user {user_id}")
-
         structured_logger.info(
             "risk_metrics_calculated",
             f"Risk metrics calculated: {total_trades} trades",
@@ -583,6 +563,8 @@ async def get_risk_metrics(
 
         return response
 
+    try:
+        return await cache_manager.get_or_set(cache_key, build_risk_metrics, ttl=30)
     except Exception as e:
         structured_logger.error(
             "risk_metrics_failed",
@@ -698,16 +680,10 @@ async def get_performance_metrics(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (60초 TTL)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 계산 (60초 TTL)
     cache_key = make_cache_key("performance_metrics", user_id, period)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        logger.debug(
-            f"Cache hit for performance_metrics user {user_id} period {period}"
-        )
-        return cached_data
 
-    try:
+    async def build_performance():
         structured_logger.info(
             "performance_metrics_requested",
             f"Performance metrics requested for period {period}",
@@ -762,9 +738,7 @@ async def get_performance_metrics(
                 "best_trade": None,
                 "worst_trade": None,
             }
-            # 빈 데이터도 캐시 (60초 TTL)
-            await cache_manager.set(cache_key, response, ttl=60)
-            return response
+            return response  # 빈 데이터도 캐시
 
         # 통계 계산 (Null 체크 강화)
         total_pnl = 0.0
@@ -845,10 +819,6 @@ async def get_performance_metrics(
             else None,
         }
 
-        # 캐시에 저장 (60초 TTL)
-        await cache_manager.set(cache_key, response, ttl=60)
-        logger.debug(f"Cached performance_metrics for user {user_id} period {period}")
-
         structured_logger.info(
             "performance_metrics_calculated",
             f"Performance metrics calculated: {len(trades)} trades",
@@ -860,6 +830,8 @@ async def get_performance_metrics(
 
         return response
 
+    try:
+        return await cache_manager.get_or_set(cache_key, build_performance, ttl=60)
     except HTTPException:
         raise
     except Exception as e:
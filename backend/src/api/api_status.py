@@ -4,12 +4,13 @@ API 연결 상태 확인
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-import requests
+import httpx
 from typing import Optional
 
 from ..database.db import get_session
 from ..config import settings
 from ..utils.jwt_auth import get_current_user_id
+from ..utils.http_client import request_with_retry
 
 router = APIRouter(prefix="/api/status", tags=["API Status"])
 
@@ -25,7 +26,7 @@ async def get_all_api_status(
     deepseek_status = check_deepseek_api()
 
     # 2. Bitget 상태
-    bitget_status = check_bitget_api()
+    bitget_status = await check_bitget_api()
 
     # 3. 데이터베이스 상태
     db_status = await check_database(session)
@@ -82,11 +83,17 @@ def check_deepseek_api() -> dict:
         }
 
 
-def check_bitget_api() -> dict:
+async def check_bitget_api() -> dict:
     """Bitget API 상태 확인"""
     try:
-        # 공개 API로 연결 테스트
-        response = requests.get("https://api.bitget.com/api/v2/public/time", timeout=5)
+        # 공개 API로 연결 테스트 (상태 확인은 재시도하지 않음)
+        response = await request_with_retry(
+            "bitget_public",
+            "GET",
+            "https://api.bitget.com/api/v2/public/time",
+            max_retries=0,
+            timeout=5.0,
+        )
 
         if response.status_code == 200:
             return {
@@ -108,7 +115,7 @@ def check_bitget_api() -> dict:
                 "details": {},
             }
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return {
             "name": "Bitget Exchange",
             "connected": False,
@@ -191,19 +191,14 @@ async def get_positions(
     cache_suffix = f"positions:{symbol}" if symbol else "positions"
     cache_key = make_cache_key(cache_suffix, user_id)
 
-    # 캐시 확인 (3초 TTL - 포지션은 빠르게 변할 수 있음)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        return cached_data
-
-    try:
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 조회 (3초 TTL - 포지션은 빠르게 변할 수 있음)
+    async def fetch_positions():
         client = await get_user_bitget_client(user_id, session)
         positions = await client.get_positions(symbol=symbol)
-        response = {"positions": positions}
+        return {"positions": positions}
 
-        # 캐시 저장
-        await cache_manager.set(cache_key, response, ttl=3)
-        return response
+    try:
+        return await cache_manager.get_or_set(cache_key, fetch_positions, ttl=3)
 
     except HTTPException:
         raise
@@ -227,13 +222,10 @@ async def get_account(
     """
     from ..utils.cache_manager import cache_manager, make_cache_key
 
-    # 캐시 확인 (5초 TTL)
+    # 캐시 조회, 미스 시 동시 요청도 한 번만 조회 (5초 TTL)
     cache_key = make_cache_key("bitget_account", user_id)
-    cached_data = await cache_manager.get(cache_key)
-    if cached_data is not None:
-        return cached_data
 
-    try:
+    async def fetch_account():
         client = await get_user_bitget_client(user_id, session)
         account_data = await client.get_account_info()
 
@@ -272,12 +264,11 @@ async def get_account(
             # If it's already a dict (unlikely but handle it)
             response_data = account_data
 
-        # 캐시 저장
-        if response_data:
-            await cache_manager.set(cache_key, response_data, ttl=5)
-
         return response_data
 
+    try:
+        return await cache_manager.get_or_set(cache_key, fetch_account, ttl=5)
+
     except HTTPException:
         raise
     except Exception as e:
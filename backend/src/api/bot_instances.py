@@ -45,6 +45,7 @@ from ..schemas.bot_instance_schema import (
     SuccessResponse,
     ErrorResponse,
 )
+from ..services.allocation_manager import allocation_manager
 from ..utils.jwt_auth import get_current_user_id
 from ..utils.structured_logging import get_logger
 
@@ -351,6 +352,7 @@ async def update_bot_instance(
 
     bot.updated_at = datetime.utcnow()
     await session.commit()
+    allocation_manager.invalidate_allocation(bot_id)
 
     structured_logger.info(
         "bot_instance_updated",
@@ -392,6 +394,7 @@ async def delete_bot_instance(
     bot.is_active = False
     bot.updated_at = datetime.utcnow()
     await session.commit()
+    allocation_manager.invalidate_allocation(bot_id)
 
     structured_logger.info(
         "bot_instance_deleted",
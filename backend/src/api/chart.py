@@ -15,6 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..database.db import get_session
 from ..database.models import Position, Trade
 from ..services.candle_generator import get_candle_generator
+from ..services.ccxt_price_collector import price_collector
+from ..services.chart_candle_service import get_chart_candle_service
 from ..utils.jwt_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -44,63 +46,20 @@ async def get_candles(
     Returns:
         List of candle data with OHLCV values
     """
-    try:
-        candles = []
+    # Keep live ticks flowing for this symbol while the chart is open
+    price_collector.touch_chart(symbol)
 
-        # Only use candle generator for 1m timeframe (real-time updates)
-        if timeframe == "1m":
-            candle_gen = get_candle_generator()
-            candles = candle_gen.get_all_candles(
-                symbol=symbol.upper(), limit=limit, include_current=include_current
+    try:
+        # Served from in-memory multi-timeframe buffers (backfilled once per symbol/timeframe)
+        try:
+            candles = await get_chart_candle_service().get_candles(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=limit,
+                include_current=include_current,
             )
-
-        # If no candles from generator or different timeframe, fetch from Bitget API
-        if not candles or len(candles) < min(50, limit):
-            logger.info(f"Fetching {timeframe} candles from Bitget API for {symbol}")
-            import ccxt.async_support as ccxt
-
-            try:
-                # Use public API without authentication
-                exchange = ccxt.bitget(
-                    {"enableRateLimit": True, "options": {"defaultType": "swap"}}
-                )
-
-                # Convert symbol format: BTCUSDT -> BTC/USDT:USDT
-                if symbol.upper().endswith("USDT"):
-                    base = symbol.upper().replace("USDT", "")
-                    bitget_symbol = f"{base}/USDT:USDT"
-                else:
-                    bitget_symbol = symbol
-
-                # Fetch candles from Bitget
-                ohlcv = await exchange.fetch_ohlcv(
-                    bitget_symbol, timeframe=timeframe, limit=limit
-                )
-
-                await exchange.close()
-
-                if ohlcv:
-                    candles = []
-                    for candle in ohlcv:
-                        # CCXT format: [timestamp, open, high, low, close, volume]
-                        candles.append(
-                            {
-                                "time": int(candle[0] / 1000),  # ms to seconds
-                                "open": float(candle[1]),
-                                "high": float(candle[2]),
-                                "low": float(candle[3]),
-                                "close": float(candle[4]),
-                                "volume": float(candle[5]) if len(candle) > 5 else 0.0,
-                                "tick_count": 1,
-                            }
-                        )
-
-                    logger.info(
-                        f"Fetched {len(candles)} {timeframe} candles from Bitget for {symbol}"
-                    )
-
-            except Exception as e:
-                logger.warning(f"Bitget API failed: {e}")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # If still no candles, return error
         if not candles:
@@ -129,6 +88,8 @@ async def get_candles(
             "count": len(candles),
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching candles for {symbol}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -307,6 +268,7 @@ async def get_chart_status(
         return {
             "status": "operational",
             "candle_generator": status,
+            "chart_candles": get_chart_candle_service().get_status(),
             "timestamp": int(datetime.utcnow().timestamp()),
         }
 
@@ -9,11 +9,13 @@ Health Check 엔드포인트
 import time
 from datetime import datetime
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.db import get_session
 from ..config import settings
+from ..utils.startup_profile import startup_profile
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -91,13 +93,15 @@ async def readiness_check(session: AsyncSession = Depends(get_session)):
 
     서비스가 트래픽을 받을 준비가 되었는지 확인합니다.
     - 데이터베이스 연결 확인
+    - 트레이딩 서브시스템 워밍업 완료 (FAST_STARTUP으로 백그라운드 시작 중이면 False)
 
     Returns:
-        - ready: True/False
+        - ready: True/False (False면 503)
         - checks: 각 컴포넌트 상태
     """
     checks = {
-        "database": False
+        "database": False,
+        "trading": startup_profile.ready,
     }
 
     # 데이터베이스 연결 확인
@@ -110,11 +114,16 @@ async def readiness_check(session: AsyncSession = Depends(get_session)):
 
     all_ready = all(checks.values())
 
-    return {
+    body = {
         "ready": all_ready,
         "checks": checks,
         "timestamp": datetime.utcnow().isoformat()
     }
+    if startup_profile.warmup_error:
+        body["warmup_error"] = startup_profile.warmup_error
+    if not all_ready:
+        return JSONResponse(status_code=503, content=body)
+    return body
 
 
 @router.get("/live")
@@ -31,6 +31,9 @@ class RateLimitConfig:
     WINDOW_HOUR = 3600
     WINDOW_DAY = 86400
 
+    # 저장소: "memory" (워커별) 또는 "redis" (멀티 워커 공유, cache_manager Redis 사용)
+    BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+
 
 class PaginationConfig:
     """페이지네이션 기본 설정"""
@@ -148,6 +151,26 @@ class Settings(BaseModel):
     # Frontend URL (OAuth 후 리다이렉트)
     frontend_url: str = os.getenv("FRONTEND_URL", "http://localhost:5173")
 
+    # 이벤트 루프 정지 감지 (0이면 비활성화): 이 시간 이상 루프를 블로킹한 콜백의 스택을 로그로 남김
+    event_loop_stall_threshold_ms: int = int(os.getenv("EVENT_LOOP_STALL_THRESHOLD_MS", "250"))
+
+    # 빠른 시작: 헬스/readiness 엔드포인트를 먼저 열고 트레이딩 서브시스템(가격 수집, 봇 부트스트랩 등)은
+    # 백그라운드에서 시작. 끝날 때까지 /health/ready는 503
+    fast_startup: bool = os.getenv("FAST_STARTUP", "false").lower() == "true"
+
+    # 전략 실행 워커 스레드 수와 시그널 대기 시간 (넘기면 hold)
+    strategy_workers: int = int(os.getenv("STRATEGY_WORKERS", "4"))
+    strategy_timeout_ms: int = int(os.getenv("STRATEGY_TIMEOUT_MS", "2000"))
+
+    # 관리자 회원 목록의 사용자별 거래 집계를 materialized view(user_trade_rollups, PostgreSQL)에서 읽음.
+    # 집계 컬럼 정렬이 빨라지는 대신 값이 최대 갱신 주기만큼 늦음
+    admin_user_rollup_view: bool = os.getenv("ADMIN_USER_ROLLUP_VIEW", "false").lower() == "true"
+    admin_user_rollup_refresh_seconds: int = int(os.getenv("ADMIN_USER_ROLLUP_REFRESH_SECONDS", "300"))
+
+    # bot_logs 보관 기간 (일, 0이면 비활성화): 지난 로그는 일 단위 gzip NDJSON으로 보관 후 DB에서 삭제
+    bot_log_retention_days: int = int(os.getenv("BOT_LOG_RETENTION_DAYS", "0"))
+    bot_log_archive_dir: str = os.getenv("BOT_LOG_ARCHIVE_DIR", "./log_archive")
+
     @model_validator(mode="after")
     def validate_jwt_secret(self) -> "Settings":
         """JWT Secret 검증: 프로덕션에서는 필수, 개발 환경에서는 경고만"""
@@ -29,22 +29,26 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
-@asynccontextmanager
-async def lifespan(app):
-    """Application lifespan - startup and shutdown logic"""
+async def _start_services(app):
+    """
+    트레이딩 서브시스템 시작 (단계별 시간은 startup_profile에 기록)
+
+    FAST_STARTUP이면 lifespan이 이 함수를 기다리지 않고 백그라운드로 실행하므로
+    /health, /health/live는 바로 응답하고 /health/ready는 끝날 때까지 503입니다.
+    """
     import asyncio
     import logging
     from ..database.models import Base
     from ..services.chart_data_service import get_chart_service
+    from ..utils.startup_profile import startup_profile
 
     logger = logging.getLogger(__name__)
-
-    # Startup
-    logger.info("🚀 Starting application...")
+    phase = startup_profile.phase
 
     # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    with phase("create tables"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
     logger.info("✅ Database tables created")
 
     # Get market queue and bot manager from app state
@@ -53,79 +57,190 @@ async def lifespan(app):
     logger.info(f"📊 Market queue created: {market_queue}")
 
     # Start CCXT price collector for real-time market data (reliable alternative)
-    from ..services.ccxt_price_collector import ccxt_price_collector
+    with phase("price collector"):
+        from ..services.ccxt_price_collector import ccxt_price_collector
 
-    # Create separate queue for chart service to avoid competition with bot
-    chart_queue = asyncio.Queue(maxsize=1000)
+        # Create separate queue for chart service to avoid competition with bot
+        chart_queue = asyncio.Queue(maxsize=1000)
 
-    # Start collector - it will feed both queues
-    asyncio.create_task(ccxt_price_collector(market_queue, chart_queue))
+        # Start collector - it will feed both queues
+        asyncio.create_task(ccxt_price_collector(market_queue, chart_queue))
     logger.info("✅ CCXT price collector started (production mode)")
 
     # Start chart data service with dedicated queue
-    chart_service = await get_chart_service(chart_queue)
+    with phase("chart data service"):
+        chart_service = await get_chart_service(chart_queue)
     logger.info(f"✅ Chart data service started: {chart_service}")
 
     # Initialize cache manager (Redis with in-memory fallback)
-    from ..utils.cache_manager import cache_manager
+    with phase("cache manager"):
+        from ..utils.cache_manager import cache_manager
 
-    await cache_manager.initialize()
+        await cache_manager.initialize()
     logger.info("✅ Cache manager initialized")
 
     # Initialize AI Cost Optimization Service
-    from ..services import initialize_ai_service
+    with phase("ai service"):
+        from ..services import initialize_ai_service
 
-    await initialize_ai_service()
+        await initialize_ai_service()
     logger.info("✅ AI Cost Optimization Service initialized")
 
     # Bootstrap bot manager
-    await bot_manager.bootstrap()
+    with phase("bot manager bootstrap"):
+        await bot_manager.bootstrap()
     logger.info("✅ Bot manager bootstrapped")
 
     # Start alert scheduler
-    from ..services.alert_scheduler import alert_scheduler
+    with phase("alert scheduler"):
+        from ..services.alert_scheduler import alert_scheduler
 
-    asyncio.create_task(alert_scheduler.start())
+        asyncio.create_task(alert_scheduler.start())
     logger.info("✅ Alert scheduler started")
 
+    # Refresh admin user rollup view (ADMIN_USER_ROLLUP_VIEW, PostgreSQL only)
+    with phase("user rollup view"):
+        from ..services.admin_user_stats import user_rollups
+
+        user_rollups.start()
+
+    # Archive old bot logs (BOT_LOG_RETENTION_DAYS)
+    with phase("bot log retention"):
+        from ..services.log_retention import bot_log_retention
+
+        bot_log_retention.start()
+
     # Start price alert service (for chart annotations)
-    from ..services.price_alert_service import price_alert_service
+    with phase("price alert service"):
+        from ..services.price_alert_service import price_alert_service
 
-    await price_alert_service.start()
+        await price_alert_service.start()
     logger.info("✅ Price alert service started")
 
     # Start Telegram bot handler (for responding to button clicks)
-    from ..services.telegram.bot_handler import start_telegram_bot
+    with phase("telegram bot handler"):
+        from ..services.telegram.bot_handler import start_telegram_bot
 
-    asyncio.create_task(start_telegram_bot())
+        asyncio.create_task(start_telegram_bot())
     logger.info("✅ Telegram bot handler started")
 
     # Start snapshot worker for dashboard pre-caching (Phase 0 - Zero-Wait UX)
-    from ..services.snapshot_worker import start_snapshot_worker
+    with phase("snapshot worker"):
+        from ..services.snapshot_worker import start_snapshot_worker
 
-    asyncio.create_task(start_snapshot_worker())
+        asyncio.create_task(start_snapshot_worker())
     logger.info("✅ Dashboard snapshot worker started")
 
+
+async def _warm_up(app):
+    """_start_services 실행 후 readiness 갱신 (FAST_STARTUP이 아니면 실패 시 시작 중단)"""
+    import logging
+    from ..utils.startup_profile import startup_profile
+
+    logger = logging.getLogger(__name__)
+
+    startup_profile.begin_warmup()
+    try:
+        await _start_services(app)
+    except Exception as e:
+        startup_profile.mark_ready(error=f"{type(e).__name__}: {e}")
+        if not settings.fast_startup:
+            raise
+        logger.error(f"❌ Trading subsystem warm-up failed: {e}", exc_info=True)
+        return
+
+    startup_profile.mark_ready()
+    startup_profile.log_summary()
     logger.info("🎉 Application startup complete!")
 
+
+@asynccontextmanager
+async def lifespan(app):
+    """Application lifespan - startup and shutdown logic"""
+    import asyncio
+    import logging
+    from ..utils.startup_profile import startup_profile
+
+    logger = logging.getLogger(__name__)
+
+    # Startup
+    logger.info("🚀 Starting application...")
+
+    # Event loop stall detector (logs a stack sample when a callback blocks the loop)
+    from ..utils.loop_monitor import start_loop_monitor, stop_loop_monitor
+
+    if settings.event_loop_stall_threshold_ms > 0:
+        with startup_profile.phase("event loop monitor"):
+            await start_loop_monitor(settings.event_loop_stall_threshold_ms)
+        logger.info("✅ Event loop stall detector started")
+
+    warmup_task = None
+    if settings.fast_startup:
+        # 헬스 엔드포인트를 먼저 열고 트레이딩 서브시스템은 백그라운드에서 시작
+        warmup_task = asyncio.create_task(_warm_up(app))
+        logger.info("⚡ Fast startup: serving health endpoints while trading subsystems warm up")
+    else:
+        await _warm_up(app)
+
     try:
         yield
     finally:
         # Shutdown
         logger.info("🛑 Shutting down application...")
 
+        # 아직 워밍업 중이면 중단
+        if warmup_task and not warmup_task.done():
+            warmup_task.cancel()
+            try:
+                await warmup_task
+            except asyncio.CancelledError:
+                pass
+
         # Stop price alert service
         from ..services.price_alert_service import price_alert_service
 
         await price_alert_service.stop()
         logger.info("✅ Price alert service stopped")
 
+        from ..services.admin_user_stats import user_rollups
+        from ..services.log_retention import bot_log_retention
+
+        from ..services.periodic_scheduler import periodic_scheduler
+
+        user_rollups.stop()
+        bot_log_retention.stop()
+        await periodic_scheduler.stop()
+        logger.info("✅ Periodic scheduler stopped")
+
         # Issue #2.2: Close all Bitget REST clients (aiohttp sessions)
         from ..services.bitget_rest import close_all_rest_clients
 
         await close_all_rest_clients()
         logger.info("✅ Bitget REST clients closed")
 
+        # Close the shared chart candle exchange client
+        from ..services.chart_candle_service import close_chart_candle_service
+
+        await close_chart_candle_service()
+
+        # Close exchange WebSocket feeds
+        from ..services.exchanges.feed_manager import feed_manager
+
+        await feed_manager.close()
+
+        # Stop browser WebSocket writer tasks
+        from ..websockets.broadcast_hub import broadcast_hub
+
+        await broadcast_hub.close()
+
+        # Flush queued Telegram notifications, then close shared HTTP clients
+        from ..services.telegram import get_telegram_notifier
+        from ..utils.http_client import close_http_clients
+
+        await get_telegram_notifier().close()
+        await close_http_clients()
+        logger.info("✅ Telegram notifier and shared HTTP clients closed")
+
         # Shutdown AI Cost Optimization Service
         from ..services import shutdown_ai_service
 
@@ -138,6 +253,19 @@ async def lifespan(app):
         await cache_manager.close()
         logger.info("✅ Cache manager closed")
 
+        await stop_loop_monitor()
+
+        # Stop strategy worker threads
+        from ..services.strategy_executor import strategy_executor
+
+        strategy_executor.shutdown()
+
+        # Flush queued trade/bot status/log writes before closing the pool
+        from ..services.persistence_queue import persistence_queue
+
+        await persistence_queue.close()
+        logger.info("✅ Persistence queue flushed")
+
         await engine.dispose()
         logger.info("✅ Application shutdown complete")
 
@@ -588,6 +588,8 @@ class BotLog(Base):
     __table_args__ = (
         # 사용자별 로그 조회용 (최신순 정렬)
         Index("idx_botlog_user_created", "user_id", "created_at"),
+        # 전체 로그 최신순 keyset 페이지/보관 작업 날짜 범위 조회용
+        Index("idx_botlog_created_id", "created_at", "id"),
         # 이벤트 타입별 조회용
         Index("idx_botlog_event_type", "event_type"),
     )
@@ -15,58 +15,64 @@ logging.basicConfig(
 logging.getLogger("src.services.bot_runner").setLevel(logging.INFO)
 logging.getLogger("src.workers.manager").setLevel(logging.INFO)
 
-from .api import (
-    admin_diagnostics,
-    admin_monitoring,
-    admin_users,
-    admin_bots,
-    admin_analytics,
-    admin_logs,
-    admin_grid_template,  # 그리드 템플릿 관리자 API (NEW)
-    ai_cost,  # AI 비용 최적화 API (NEW)
-    annotations,  # 차트 어노테이션 API (NEW)
-    auth,
-    oauth,
-    bot,
-    bot_instances,  # 다중 봇 시스템 API (NEW)
-    grid_bot,  # 그리드 봇 API (NEW)
-    grid_template,  # 그리드 템플릿 사용자 API (NEW)
-    multibot,  # 멀티봇 트레이딩 API v2.0 (NEW)
-    strategy,
-    account,
-    order,
-    chart,
-    backtest,
-    backtest_result,
-    backtest_history,
-    ai_strategy,
-    api_status,
-    trades,
-    health,
-    analytics,
-    positions,
-    alerts,
-    bitget_market,
-    upload,
-    two_factor,
-    telegram,
-    user_backtest,  # 일반 회원용 캐시 백테스트 (NEW)
-    trend_template,  # AI 추세 템플릿 사용자 API (NEW)
-)
-from .config import settings
-from .database import db
-from .database.models import Base
-from .database.db import lifespan
-from .websockets import ws_server
-from .services.bitget_ws_collector import bitget_ws_collector
-from .workers.manager import BotManager
-from .middleware.rate_limit_improved import EnhancedRateLimitMiddleware
-from .middleware.error_handler import register_exception_handlers
-from .middleware.request_context import RequestContextMiddleware
-from .middleware.admin_ip_whitelist import AdminIPWhitelistMiddleware
-from .middleware.security_headers import SecurityHeadersMiddleware
-from .middleware.csrf import CSRFMiddleware
-from .config import RateLimitConfig
+from .utils.startup_profile import startup_profile
+
+# 라우터/서비스 import 시간 기록 (모듈별 누적 시간, /admin/monitoring/startup)
+# 무거운 라이브러리(ccxt, pandas, lightgbm, torch)는 처음 사용하는 함수 안에서 import
+_TRACKED_IMPORTS = (f"{__package__}.api.", f"{__package__}.services.")
+with startup_profile.track_imports(prefixes=_TRACKED_IMPORTS):
+    from .api import (
+        admin_diagnostics,
+        admin_monitoring,
+        admin_users,
+        admin_bots,
+        admin_analytics,
+        admin_logs,
+        admin_grid_template,  # 그리드 템플릿 관리자 API (NEW)
+        ai_cost,  # AI 비용 최적화 API (NEW)
+        annotations,  # 차트 어노테이션 API (NEW)
+        auth,
+        oauth,
+        bot,
+        bot_instances,  # 다중 봇 시스템 API (NEW)
+        grid_bot,  # 그리드 봇 API (NEW)
+        grid_template,  # 그리드 템플릿 사용자 API (NEW)
+        multibot,  # 멀티봇 트레이딩 API v2.0 (NEW)
+        strategy,
+        account,
+        order,
+        chart,
+        backtest,
+        backtest_result,
+        backtest_history,
+        ai_strategy,
+        api_status,
+        trades,
+        health,
+        analytics,
+        positions,
+        alerts,
+        bitget_market,
+        upload,
+        two_factor,
+        telegram,
+        user_backtest,  # 일반 회원용 캐시 백테스트 (NEW)
+        trend_template,  # AI 추세 템플릿 사용자 API (NEW)
+    )
+    from .config import settings
+    from .database import db
+    from .database.models import Base
+    from .database.db import lifespan
+    from .websockets import ws_server
+    from .services.bitget_ws_collector import bitget_ws_collector
+    from .workers.manager import BotManager
+    from .middleware.rate_limit_improved import EnhancedRateLimitMiddleware
+    from .middleware.error_handler import register_exception_handlers
+    from .middleware.request_context import RequestContextMiddleware
+    from .middleware.admin_ip_whitelist import AdminIPWhitelistMiddleware
+    from .middleware.security_headers import SecurityHeadersMiddleware
+    from .middleware.csrf import CSRFMiddleware
+    from .config import RateLimitConfig
 
 
 def create_app() -> FastAPI:
@@ -319,7 +325,8 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+with startup_profile.phase("create_app", group="app"):
+    app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
@@ -4,9 +4,9 @@
 JWT 기반 사용자별 Rate Limiting 및 엔드포인트별 세분화된 설정.
 Rate Limit 헤더 추가 지원.
 """
+import heapq
 import time
 import logging
-from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Dict, Tuple
 from fastapi import Request, Response
@@ -20,70 +20,149 @@ from ..utils.exceptions import RateLimitExceededError
 logger = logging.getLogger(__name__)
 
 
-class RateLimitStore:
-    """Rate Limit 요청 저장소 (메모리 기반, 메모리 누수 방지)"""
+class SlidingWindowCounter:
+    """
+    슬라이딩 윈도우 카운터 (키당 고정 메모리)
 
-    # 최대 저장소 크기 제한 (메모리 누수 방지)
-    MAX_IP_ENTRIES = 10000
-    MAX_USER_ENTRIES = 1000
-    CLEANUP_INTERVAL = 300  # 5분마다 정리
+    현재/직전 고정 윈도우의 요청 수만 저장하고, 직전 윈도우 카운트를
+    경과 비율만큼 가중해 슬라이딩 윈도우 요청 수를 근사합니다.
 
-    def __init__(self):
-        # IP 기반: ip -> [timestamp, ...]
-        self.ip_requests: Dict[str, list] = defaultdict(list)
+        estimate = previous × (window - elapsed) / window + current
+    """
 
-        # 사용자별: user_id -> endpoint -> [timestamp, ...]
-        self.user_requests: Dict[int, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    __slots__ = ("window_start", "current", "previous", "expires_at")
+
+    def __init__(self, now: float, window: int):
+        # 윈도우는 키의 첫 요청 시각부터 시작 (epoch 정렬 시 모든 키가 동시에 리셋됨)
+        self.window_start = now
+        self.current = 0
+        self.previous = 0
+        self.expires_at = now + 2 * window
+
+    def roll(self, now: float, window: int) -> bool:
+        """필요 시 윈도우 전환. 전환되었으면 True"""
+        elapsed = now - self.window_start
+        if elapsed < window:
+            return False
+
+        self.previous = self.current if elapsed < 2 * window else 0
+        self.current = 0
+        self.window_start += (elapsed // window) * window
+        self.expires_at = self.window_start + 2 * window
+        return True
+
+    def estimate(self, now: float, window: int) -> float:
+        weight = (window - (now - self.window_start)) / window
+        return self.previous * weight + self.current
+
+    def reset_time(self, now: float, limit: int, window: int) -> int:
+        """다음 요청이 허용되는 시각 (Unix timestamp)"""
+        window_end = self.window_start + window
+
+        if self.current < limit:
+            if self.previous <= 0:
+                return int(window_end)
+            # previous 가중치가 줄어 estimate + 1 <= limit 이 되는 시점
+            fraction = 1 - (limit - 1 - self.current) / self.previous
+            return int(self.window_start + window * max(0.0, fraction)) + 1
+
+        # 현재 윈도우가 가득 참: 다음 윈도우에서 current가 previous가 되어 감쇠
+        fraction = 1 - (limit - 1) / self.current if self.current else 0.0
+        return int(window_end + window * max(0.0, fraction)) + 1
+
+
+def check_sliding_window(
+    counter: SlidingWindowCounter, now: float, limit: int, window: int
+) -> Tuple[bool, int, int, float]:
+    """
+    슬라이딩 윈도우 카운터로 Rate limit 체크 및 기록 - O(1)
 
-        # 마지막 정리 시간
-        self._last_cleanup = time.time()
+    Returns:
+        (allowed, remaining, reset_time, estimate)
+    """
+    counter.roll(now, window)
+    estimate = counter.estimate(now, window)
 
-    def _maybe_cleanup(self, now: float) -> None:
-        """오래된 엔트리 정리 (메모리 누수 방지)"""
-        if now - self._last_cleanup < self.CLEANUP_INTERVAL:
-            return
+    if estimate + 1 > limit:
+        return False, 0, counter.reset_time(now, limit, window), estimate
 
-        self._last_cleanup = now
+    counter.current += 1
+    remaining = max(0, int(limit - estimate - 1))
+    return True, remaining, int(counter.window_start + window), estimate
 
-        # IP 저장소 정리: 1시간 이상 된 엔트리 제거
-        keys_to_remove = []
-        for key, requests in self.ip_requests.items():
-            if not requests or (now - max(requests)) > 3600:
-                keys_to_remove.append(key)
 
-        for key in keys_to_remove:
-            del self.ip_requests[key]
+class _UserBucket(dict):
+    """사용자별 엔드포인트 카운터 (owner = user_id)"""
 
-        # IP 저장소 크기 제한
-        if len(self.ip_requests) > self.MAX_IP_ENTRIES:
-            # 가장 오래된 엔트리 제거
-            sorted_keys = sorted(
-                self.ip_requests.keys(),
-                key=lambda k: max(self.ip_requests[k]) if self.ip_requests[k] else 0
-            )
-            for key in sorted_keys[:len(self.ip_requests) - self.MAX_IP_ENTRIES]:
-                del self.ip_requests[key]
-
-        # 사용자 저장소 정리
-        user_keys_to_remove = []
-        for user_id, endpoints in self.user_requests.items():
-            # 빈 엔드포인트 제거
-            empty_endpoints = [ep for ep, reqs in endpoints.items() if not reqs]
-            for ep in empty_endpoints:
-                del endpoints[ep]
-
-            # 빈 사용자 제거
-            if not endpoints:
-                user_keys_to_remove.append(user_id)
-
-        for user_id in user_keys_to_remove:
-            del self.user_requests[user_id]
-
-        # 사용자 저장소 크기 제한
-        if len(self.user_requests) > self.MAX_USER_ENTRIES:
-            sorted_users = sorted(self.user_requests.keys())
-            for user_id in sorted_users[:len(self.user_requests) - self.MAX_USER_ENTRIES]:
-                del self.user_requests[user_id]
+    def __init__(self, owner: int):
+        super().__init__()
+        self.owner = owner
+
+
+class _UserStorage(dict):
+    """user_id -> _UserBucket (없으면 생성)"""
+
+    def __missing__(self, user_id: int) -> _UserBucket:
+        bucket = _UserBucket(user_id)
+        self[user_id] = bucket
+        return bucket
+
+
+class RateLimitStore:
+    """
+    Rate Limit 요청 저장소 (메모리 기반)
+
+    - 키당 SlidingWindowCounter 1개 (요청 수와 무관한 고정 메모리)
+    - 만료 시각 min-heap으로 오래된 키를 O(log n)에 정리 (전체 스캔/정렬 없음)
+    """
+
+    # 최대 저장소 크기 제한 (메모리 누수 방지)
+    MAX_IP_ENTRIES = 10000
+    MAX_USER_ENTRIES = 1000
+
+    def __init__(self):
+        # IP 기반: key -> SlidingWindowCounter
+        self.ip_requests: Dict[str, SlidingWindowCounter] = {}
+
+        # 사용자별: user_id -> endpoint -> SlidingWindowCounter
+        self.user_requests: Dict[int, Dict[str, SlidingWindowCounter]] = _UserStorage()
+
+        # 만료 힙: (expires_at, seq, storage, key)
+        # IP/사용자 저장소는 힙과 크기 제한을 따로 둠 (IP 키가 몰려도 사용자 카운터는 밀려나지 않음)
+        self._ip_heap: list = []
+        self._user_heap: list = []
+        self._seq = 0
+
+    def _heap_for(self, storage: dict) -> list:
+        return self._user_heap if isinstance(storage, _UserBucket) else self._ip_heap
+
+    def _schedule_expiry(self, storage: dict, key: str, counter: SlidingWindowCounter) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap_for(storage), (counter.expires_at, self._seq, storage, key))
+
+    def _remove(self, storage: dict, key: str) -> None:
+        storage.pop(key, None)
+        if isinstance(storage, _UserBucket) and not storage:
+            if self.user_requests.get(storage.owner) is storage:
+                del self.user_requests[storage.owner]
+
+    def _expire(self, now: float) -> None:
+        """만료된 키 제거 (힙 앞부분만 확인, 지연 삭제)"""
+        for heap in (self._ip_heap, self._user_heap):
+            while heap and heap[0][0] <= now:
+                _, _, storage, key = heapq.heappop(heap)
+                counter = storage.get(key)
+                # 윈도우가 전환되어 만료 시각이 늦춰진 키는 새 힙 항목이 있으므로 건너뜀
+                if counter is not None and counter.expires_at <= now:
+                    self._remove(storage, key)
+
+    def _evict_oldest(self, heap: list, predicate) -> None:
+        """크기 초과 시 해당 저장소에서 만료가 가장 임박한 키부터 제거"""
+        while heap and predicate():
+            _, _, storage, key = heapq.heappop(heap)
+            counter = storage.get(key)
+            if counter is not None:
+                self._remove(storage, key)
 
     def check_and_record(
         self,
@@ -108,35 +187,92 @@ class RateLimitStore:
             - reset_time: Rate limit 리셋 시간 (Unix timestamp)
         """
         now = time.time()
+        self._expire(now)
+
+        counter = storage.get(key)
+        if counter is None:
+            counter = SlidingWindowCounter(now, window)
+            storage[key] = counter
+            self._schedule_expiry(storage, key, counter)
+
+            if isinstance(storage, _UserBucket):
+                if len(self.user_requests) > self.MAX_USER_ENTRIES:
+                    self._evict_oldest(
+                        self._user_heap, lambda: len(self.user_requests) > self.MAX_USER_ENTRIES
+                    )
+            elif len(self.ip_requests) > self.MAX_IP_ENTRIES:
+                self._evict_oldest(self._ip_heap, lambda: len(self.ip_requests) > self.MAX_IP_ENTRIES)
+        elif counter.roll(now, window):
+            self._schedule_expiry(storage, key, counter)
+
+        allowed, remaining, reset_time, _ = check_sliding_window(counter, now, limit, window)
+        return allowed, remaining, reset_time
+
+
+# Redis 공유 모드: 여러 uvicorn 워커가 같은 카운터를 사용
+_SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local estimate = previous * (window - elapsed) / window + current
+if estimate + 1 > limit then
+    return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], window * 2)
+end
+return {1, current, previous}
+"""
+
 
-        # 주기적으로 오래된 엔트리 정리
-        self._maybe_cleanup(now)
+class RedisRateLimitStore:
+    """
+    Redis 기반 슬라이딩 윈도우 카운터 (멀티 워커 공유)
+
+    키당 윈도우별 정수 카운터 2개만 사용하며 Lua 스크립트로 원자적으로 체크/기록합니다.
+    """
 
-        requests = storage[key]
+    KEY_PREFIX = "ratelimit"
 
-        # 오래된 요청 제거 (Sliding Window)
-        requests = [req_time for req_time in requests if now - req_time < window]
-        storage[key] = requests
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self._script = redis_client.register_script(_SLIDING_WINDOW_LUA)
 
-        # 현재 요청 수
-        current_count = len(requests)
+    async def check_and_record(
+        self,
+        key: str,
+        storage: dict,
+        limit: int,
+        window: int
+    ) -> Tuple[bool, int, int]:
+        """RateLimitStore.check_and_record와 동일한 의미 (storage는 사용자 구분에만 사용)"""
+        now = time.time()
+        window_index = int(now // window)
+        window_start = window_index * window
 
-        # 리셋 시간 계산
-        if requests:
-            oldest_request = min(requests)
-            reset_time = int(oldest_request + window)
+        owner = getattr(storage, "owner", None)
+        if owner is not None:
+            base = f"{self.KEY_PREFIX}:user:{owner}:{key}"
         else:
-            reset_time = int(now + window)
+            base = f"{self.KEY_PREFIX}:{key}"
 
-        # Rate limit 체크
-        if current_count >= limit:
-            return False, 0, reset_time
+        allowed, current, previous = await self._script(
+            keys=[f"{base}:{window_index}", f"{base}:{window_index - 1}"],
+            args=[limit, window, now - window_start],
+        )
 
-        # 요청 기록
-        requests.append(now)
-        remaining = limit - current_count - 1
+        counter = SlidingWindowCounter(window_start, window)
+        counter.current = int(current)
+        counter.previous = int(previous)
 
-        return True, remaining, reset_time
+        if not allowed:
+            return False, 0, counter.reset_time(now, limit, window)
+
+        estimate = counter.estimate(now, window)
+        return True, max(0, int(limit - estimate)), int(window_start + window)
 
 
 class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
@@ -172,6 +308,38 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app):
         super().__init__(app)
         self.store = RateLimitStore()
+        self._shared_store: Optional[RedisRateLimitStore] = None
+        self._shared_client = None
+
+    def _get_shared_store(self) -> Optional[RedisRateLimitStore]:
+        """RATE_LIMIT_BACKEND=redis 이고 Redis 연결이 있으면 공유 저장소 반환"""
+        if RateLimitConfig.BACKEND != "redis":
+            return None
+
+        from ..utils.cache_manager import cache_manager
+
+        client = cache_manager.redis_client if cache_manager.use_redis else None
+        if client is None:
+            return None
+        if client is not self._shared_client:
+            self._shared_store = RedisRateLimitStore(client)
+            self._shared_client = client
+        return self._shared_store
+
+    async def _check(
+        self, key: str, storage: dict, limit: int, window: int
+    ) -> Tuple[bool, int, int]:
+        """공유 저장소 우선, Redis 오류 시 워커 로컬 저장소로 폴백"""
+        shared = self._get_shared_store()
+        if shared is not None:
+            try:
+                return await shared.check_and_record(key, storage, limit, window)
+            except Exception as e:
+                logger.warning(f"Shared rate limit store unavailable, using local store: {e}")
+
+        return self.store.check_and_record(
+            key=key, storage=storage, limit=limit, window=window
+        )
 
     async def dispatch(self, request: Request, call_next):
         """Rate limit 체크 및 헤더 추가"""
@@ -279,7 +447,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
 
         # 백테스트는 더 엄격하게
         if "/backtest/start" in path:
-            return self.store.check_and_record(
+            return await self._check(
                 key=f"ip:{ip}:backtest",
                 storage=self.store.ip_requests,
                 limit=RateLimitConfig.IP_BACKTEST_PER_MINUTE,
@@ -287,7 +455,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
             )
 
         # 일반 API
-        return self.store.check_and_record(
+        return await self._check(
             key=f"ip:{ip}:general",
             storage=self.store.ip_requests,
             limit=RateLimitConfig.IP_GENERAL_PER_MINUTE,
@@ -303,7 +471,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
         for endpoint_path, (limit, window, name) in self.ENDPOINT_LIMITS.items():
             if endpoint_path in path:
                 user_storage = self.store.user_requests[user_id]
-                return self.store.check_and_record(
+                return await self._check(
                     key=name,
                     storage=user_storage,
                     limit=limit,
@@ -312,7 +480,7 @@ class EnhancedRateLimitMiddleware(BaseHTTPMiddleware):
 
         # 기본 설정
         user_storage = self.store.user_requests[user_id]
-        return self.store.check_and_record(
+        return await self._check(
             key="general",
             storage=user_storage,
             limit=RateLimitConfig.USER_GENERAL_PER_MINUTE,
@@ -371,7 +539,7 @@ class EndpointRateLimiter:
         self.limit = limit
         self.window = window
         self.name = name
-        self.requests: Dict[int, list] = defaultdict(list)
+        self.requests: Dict[int, SlidingWindowCounter] = {}
 
     def check(self, user_id: int) -> Tuple[bool, int, int]:
         """
@@ -387,23 +555,17 @@ class EndpointRateLimiter:
             RateLimitExceededError: Rate limit 초과 시
         """
         now = time.time()
-        requests = self.requests[user_id]
-
-        # 오래된 요청 제거
-        requests = [req_time for req_time in requests if now - req_time < self.window]
-        self.requests[user_id] = requests
+        counter = self.requests.get(user_id)
+        if counter is None or now >= counter.expires_at:
+            counter = SlidingWindowCounter(now, self.window)
+            self.requests[user_id] = counter
 
-        current_count = len(requests)
-
-        # 리셋 시간
-        if requests:
-            oldest_request = min(requests)
-            reset_time = int(oldest_request + self.window)
-        else:
-            reset_time = int(now + self.window)
+        allowed, remaining, reset_time, estimate = check_sliding_window(
+            counter, now, self.limit, self.window
+        )
 
         # Rate limit 체크
-        if current_count >= self.limit:
+        if not allowed:
             wait_seconds = reset_time - int(now)
             raise RateLimitExceededError(
                 f"{self.name.replace('_', ' ').title()} rate limit exceeded. "
@@ -414,14 +576,10 @@ class EndpointRateLimiter:
                     "limit": self.limit,
                     "window": self.window,
                     "reset_at": reset_time,
-                    "current_count": current_count
+                    "current_count": int(estimate)
                 }
             )
 
-        # 요청 기록
-        requests.append(now)
-        remaining = self.limit - current_count - 1
-
         return True, remaining, reset_time
 
 
@@ -24,22 +24,31 @@ Sub-modules:
 - monitoring: 성능 모니터링, 알림
 """
 
-# Features
-from .features.feature_pipeline import FeaturePipeline
-
-# Models
-from .models.ensemble_predictor import EnsemblePredictor, MLPrediction
+from ..utils.lazy_import import lazy_exports
 
 # Training (lazy import to avoid circular dependencies)
 # from .training import DataCollector, Labeler, ModelTrainer
 
-# Validation
-from .validation.backtester import Backtester, BacktestResult
-from .validation.ab_tester import ABTester, ABTestResult
-
-# Monitoring
-from .monitoring.metrics_collector import MetricsCollector, ModelMetrics
-from .monitoring.alerter import Alerter, AlertLevel, Alert
+# 하위 모듈은 pandas/numpy/lightgbm을 import하므로 처음 사용할 때 로드
+# (src.ml.models.model_registry 등 가벼운 모듈만 쓰는 쪽이 함께 로드하지 않도록)
+__getattr__ = lazy_exports(__name__, {
+    # Features
+    "FeaturePipeline": ".features.feature_pipeline",
+    # Models
+    "EnsemblePredictor": ".models.ensemble_predictor",
+    "MLPrediction": ".models.ensemble_predictor",
+    # Validation
+    "Backtester": ".validation.backtester",
+    "BacktestResult": ".validation.backtester",
+    "ABTester": ".validation.ab_tester",
+    "ABTestResult": ".validation.ab_tester",
+    # Monitoring
+    "MetricsCollector": ".monitoring.metrics_collector",
+    "ModelMetrics": ".monitoring.metrics_collector",
+    "Alerter": ".monitoring.alerter",
+    "AlertLevel": ".monitoring.alerter",
+    "Alert": ".monitoring.alerter",
+})
 
 __all__ = [
     # Features
@@ -4,10 +4,15 @@ ML Features Module - 기술적 지표 및 피처 파이프라인
 50개 기술적 피처 + 10개 시장 구조 피처 + 10개 MTF 피처 = 70개 피처
 """
 
-from .feature_pipeline import FeaturePipeline
-from .technical_features import TechnicalFeatures
-from .structure_features import StructureFeatures
-from .mtf_features import MTFFeatures
+from ...utils.lazy_import import lazy_exports
+
+# 피처 모듈은 pandas/numpy를 import하므로 처음 사용할 때 로드
+__getattr__ = lazy_exports(__name__, {
+    "FeaturePipeline": ".feature_pipeline",
+    "TechnicalFeatures": ".technical_features",
+    "StructureFeatures": ".structure_features",
+    "MTFFeatures": ".mtf_features",
+})
 
 __all__ = [
     "FeaturePipeline",
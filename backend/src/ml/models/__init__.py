@@ -9,9 +9,20 @@ ML Models Package - LightGBM Model Implementations
 5. PositionSizeModel: 최적 포지션 크기 계산
 """
 
-from .ensemble_predictor import EnsemblePredictor, MLPrediction
+from ...utils.lazy_import import lazy_exports
+from .model_registry import ModelRegistry, model_registry
+
+# ensemble_predictor는 pandas/lightgbm을 import하므로 처음 사용할 때 로드
+__getattr__ = lazy_exports(__name__, {
+    "EnsemblePredictor": ".ensemble_predictor",
+    "MLPrediction": ".ensemble_predictor",
+    "reload_ensemble_models": ".ensemble_predictor",
+})
 
 __all__ = [
     "EnsemblePredictor",
     "MLPrediction",
+    "reload_ensemble_models",
+    "ModelRegistry",
+    "model_registry",
 ]
@@ -8,13 +8,16 @@ LightGBM 네이티브 형식(.txt)으로 모델 저장/로드
 import logging
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 import pandas as pd
 
+from .model_registry import model_registry
+
 logger = logging.getLogger(__name__)
 
 # LightGBM은 선택적 import (학습 시에만 필요)
@@ -187,6 +190,114 @@ class MLPrediction:
         return False
 
 
+MODEL_FILES = {
+    "direction": "lightgbm_direction.txt",
+    "volatility": "lightgbm_volatility.txt",
+    "timing": "lightgbm_timing.txt",
+    "stoploss": "lightgbm_stoploss.txt",
+    "position_size": "lightgbm_position_size.txt",
+}
+
+DEFAULT_MODELS_DIR = Path(__file__).parent.parent / "saved_models"
+
+
+@dataclass(frozen=True)
+class LightGBMBundle:
+    """한 버전의 5개 부스터 + 학습 피처 목록 (여러 예측기가 읽기 전용으로 공유)"""
+    models: Mapping[str, Any]
+    training_features: Optional[Tuple[str, ...]]
+    models_loaded: bool
+
+
+def models_version(models_dir: Path) -> str:
+    """모델 파일 수정 시각 기반 버전 (재학습으로 파일이 바뀌면 달라짐)"""
+    stamps = [
+        (models_dir / filename).stat().st_mtime_ns
+        for filename in MODEL_FILES.values()
+        if (models_dir / filename).exists()
+    ]
+    if not stamps:
+        return "none"
+    return datetime.utcfromtimestamp(max(stamps) / 1e9).strftime("%Y%m%d%H%M%S%f")
+
+
+def load_lightgbm_bundle(models_dir: Path) -> LightGBMBundle:
+    """
+    저장된 모델 로드
+
+    LightGBM 네이티브 형식 (.txt) 사용
+    피처 중요도 파일에서 학습 피처 목록도 로드
+    """
+    models: Dict[str, Any] = {name: None for name in MODEL_FILES}
+    if not LIGHTGBM_AVAILABLE:
+        logger.warning("LightGBM not available, using fallback predictions")
+        return LightGBMBundle(MappingProxyType(models), None, False)
+
+    loaded_count = 0
+    for name, filename in MODEL_FILES.items():
+        model_path = models_dir / filename
+        if model_path.exists():
+            try:
+                # LightGBM 네이티브 형식으로 로드
+                models[name] = lgb.Booster(model_file=str(model_path))
+                loaded_count += 1
+                logger.debug(f"Loaded {name} model from {filename}")
+            except Exception as e:
+                logger.error(f"Failed to load {name}: {e}")
+
+    logger.info(f"Loaded {loaded_count}/{len(MODEL_FILES)} models")
+    return LightGBMBundle(
+        models=MappingProxyType(models),
+        # 학습 시 사용된 피처 목록 로드 (direction 모델의 피처 중요도 파일에서)
+        training_features=_load_training_features(models_dir),
+        models_loaded=loaded_count == len(MODEL_FILES),
+    )
+
+
+def _load_training_features(models_dir: Path) -> Optional[Tuple[str, ...]]:
+    """피처 중요도 파일에서 학습 시 사용된 피처 목록 로드"""
+    fi_path = models_dir / "direction_feature_importance.csv"
+    if not fi_path.exists():
+        logger.debug("No feature importance file found")
+        return None
+    try:
+        import csv
+        with open(fi_path, 'r') as f:
+            reader = csv.DictReader(f)
+            features = tuple(row['feature'] for row in reader)
+        logger.info(f"Loaded {len(features)} training features from feature importance")
+        return features
+    except Exception as e:
+        logger.warning(f"Failed to load training features: {e}")
+        return None
+
+
+def _registry_key(models_dir: Path) -> str:
+    return f"lightgbm:{models_dir.resolve()}"
+
+
+def reload_ensemble_models(models_dir: Optional[Path] = None, force: bool = False) -> Dict[str, Any]:
+    """
+    재학습된 모델로 교체 (모든 EnsemblePredictor에 다음 예측부터 적용)
+
+    Args:
+        models_dir: 모델 디렉토리 (기본 saved_models)
+        force: 파일 버전이 같아도 다시 로드
+
+    Returns:
+        {"swapped": bool, "version": str}
+    """
+    models_dir = Path(models_dir or DEFAULT_MODELS_DIR)
+    key = _registry_key(models_dir)
+    version = models_version(models_dir)
+    current = model_registry.entry(key)
+    if current is not None and current.version == version and not force:
+        return {"swapped": False, "version": version}
+
+    model_registry.swap(key, lambda: load_lightgbm_bundle(models_dir), version=version)
+    return {"swapped": True, "version": version}
+
+
 class EnsemblePredictor:
     """
     5개 LightGBM 모델 앙상블 예측기
@@ -194,6 +305,9 @@ class EnsemblePredictor:
     모델 저장/로드: LightGBM 네이티브 형식 (.txt)
     메타데이터: JSON 형식
 
+    부스터는 model_registry에서 디렉토리별로 한 번만 로드되어 모든 인스턴스가 공유합니다.
+    예측 한 번은 시작 시점의 버전 하나만 사용합니다 (교체 중에도 섞이지 않음).
+
     사용법:
     ```python
     predictor = EnsemblePredictor()
@@ -202,79 +316,36 @@ class EnsemblePredictor:
     """
 
     def __init__(self, models_dir: Optional[Path] = None):
-        self.models_dir = models_dir or Path(__file__).parent.parent / "saved_models"
+        self.models_dir = models_dir or DEFAULT_MODELS_DIR
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        self._registry_key = _registry_key(self.models_dir)
 
-        # 5개 모델 (LightGBM Booster 객체)
-        self.models = {
-            "direction": None,
-            "volatility": None,
-            "timing": None,
-            "stoploss": None,
-            "position_size": None,
-        }
-
-        self.models_loaded = False
-        self.training_features: Optional[List[str]] = None  # 학습 시 사용된 피처 목록
-
-        # 모델 로드 시도
-        self._load_models()
-
+        # 모델 로드 시도 (이미 로드된 버전이 있으면 공유)
         logger.info(f"EnsemblePredictor initialized: models_loaded={self.models_loaded}")
 
-    def _load_models(self):
-        """
-        저장된 모델 로드
-
-        LightGBM 네이티브 형식 (.txt) 사용
-        피처 중요도 파일에서 학습 피처 목록도 로드
-        """
-        if not LIGHTGBM_AVAILABLE:
-            logger.warning("LightGBM not available, using fallback predictions")
-            return
-
-        model_files = {
-            "direction": "lightgbm_direction.txt",
-            "volatility": "lightgbm_volatility.txt",
-            "timing": "lightgbm_timing.txt",
-            "stoploss": "lightgbm_stoploss.txt",
-            "position_size": "lightgbm_position_size.txt",
-        }
-
-        loaded_count = 0
-        for name, filename in model_files.items():
-            model_path = self.models_dir / filename
-            if model_path.exists():
-                try:
-                    # LightGBM 네이티브 형식으로 로드
-                    self.models[name] = lgb.Booster(model_file=str(model_path))
-                    loaded_count += 1
-                    logger.debug(f"Loaded {name} model from {filename}")
-                except Exception as e:
-                    logger.error(f"Failed to load {name}: {e}")
+    @property
+    def bundle(self) -> LightGBMBundle:
+        """현재 버전 모델 묶음"""
+        models_dir = self.models_dir
+        return model_registry.get(
+            self._registry_key,
+            lambda: load_lightgbm_bundle(models_dir),
+            version=lambda: models_version(models_dir),
+        )
 
-        self.models_loaded = loaded_count == len(model_files)
+    @property
+    def models(self) -> Mapping[str, Any]:
+        # 5개 모델 (LightGBM Booster 객체)
+        return self.bundle.models
 
-        # 학습 시 사용된 피처 목록 로드 (direction 모델의 피처 중요도 파일에서)
-        self._load_training_features()
+    @property
+    def models_loaded(self) -> bool:
+        return self.bundle.models_loaded
 
-        logger.info(f"Loaded {loaded_count}/{len(model_files)} models")
-
-    def _load_training_features(self):
-        """피처 중요도 파일에서 학습 시 사용된 피처 목록 로드"""
-        fi_path = self.models_dir / "direction_feature_importance.csv"
-        if fi_path.exists():
-            try:
-                import csv
-                with open(fi_path, 'r') as f:
-                    reader = csv.DictReader(f)
-                    self.training_features = [row['feature'] for row in reader]
-                logger.info(f"Loaded {len(self.training_features)} training features from feature importance")
-            except Exception as e:
-                logger.warning(f"Failed to load training features: {e}")
-                self.training_features = None
-        else:
-            logger.debug("No feature importance file found")
+    @property
+    def training_features(self) -> Optional[Tuple[str, ...]]:
+        # 학습 시 사용된 피처 목록
+        return self.bundle.training_features
 
     def predict(
         self,
@@ -297,11 +368,13 @@ class EnsemblePredictor:
             logger.warning("Empty features, using fallback prediction")
             return self._fallback_prediction(symbol, rule_based_signal)
 
+        bundle = self.bundle
+
         # 학습 피처와 일치시키기
-        if self.training_features:
+        if bundle.training_features:
             # 학습 시 사용된 피처만 선택 (없는 피처는 0으로 채움)
             aligned_features = pd.DataFrame(index=features.index)
-            for feat in self.training_features:
+            for feat in bundle.training_features:
                 if feat in features.columns:
                     aligned_features[feat] = features[feat]
                 else:
@@ -313,7 +386,7 @@ class EnsemblePredictor:
 
         try:
             # 5개 모델 예측
-            direction = self._predict_direction(latest, rule_based_signal)
+            direction = self._predict_direction(latest, rule_based_signal, bundle.models["direction"])
             volatility = self._predict_volatility(latest)
             timing = self._predict_timing(latest)
             stoploss = self._predict_stoploss(latest, volatility)
@@ -332,7 +405,7 @@ class EnsemblePredictor:
                 stoploss=stoploss,
                 position_size=position_size,
                 combined_confidence=combined_confidence,
-                models_loaded=self.models_loaded,
+                models_loaded=bundle.models_loaded,
             )
 
             logger.info(
@@ -352,14 +425,15 @@ class EnsemblePredictor:
     def _predict_direction(
         self,
         features: pd.Series,
-        rule_based_signal: Optional[str]
+        rule_based_signal: Optional[str],
+        model: Any = None,
     ) -> DirectionPrediction:
         """Model 1: 방향 예측"""
         # 실제 모델이 로드되어 있으면 사용
-        if self.models["direction"] is not None and LIGHTGBM_AVAILABLE:
+        if model is not None and LIGHTGBM_AVAILABLE:
             try:
                 feature_array = features.values.reshape(1, -1)
-                probs = self.models["direction"].predict(feature_array)[0]
+                probs = model.predict(feature_array)[0]
                 # [neutral, long, short] 순서 가정
                 direction_idx = int(np.argmax(probs))
                 directions = [DirectionType.NEUTRAL, DirectionType.LONG, DirectionType.SHORT]
@@ -641,12 +715,15 @@ class EnsemblePredictor:
 
     def get_status(self) -> Dict[str, Any]:
         """모델 상태 조회"""
+        bundle = self.bundle
+        entry = model_registry.entry(self._registry_key)
         return {
-            "models_loaded": self.models_loaded,
+            "models_loaded": bundle.models_loaded,
             "lightgbm_available": LIGHTGBM_AVAILABLE,
             "models": {
                 name: (model is not None)
-                for name, model in self.models.items()
+                for name, model in bundle.models.items()
             },
             "models_dir": str(self.models_dir),
+            "version": entry.version if entry else None,
         }
@@ -0,0 +1,182 @@
+"""
+Model Registry - 프로세스 전역 공유 모델 저장소
+
+LightGBM 부스터, FinBERT 등 무거운 모델을 프로세스당 한 번만 로드하고
+모든 전략/에이전트 인스턴스가 읽기 전용으로 공유합니다.
+
+- get(): 이름별 현재 버전 반환, 없으면 한 번만 로드 (동시 요청은 로드를 기다림)
+- swap(): 새 버전을 먼저 로드한 뒤 참조만 교체 (진행 중인 예측은 이전 버전으로 끝남)
+- get_stats(): 모델별 버전, 추정 메모리, 로드 시간
+
+사용법:
+```python
+from src.ml.models.model_registry import model_registry
+
+bundle = model_registry.get("lightgbm:/path/to/models", lambda: load_bundle(path))
+model_registry.swap("lightgbm:/path/to/models", lambda: load_bundle(path), version="v2")
+```
+"""
+
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 버전 문자열 또는 로드할 때만 호출되는 버전 함수
+Version = Union[str, Callable[[], str], None]
+
+
+def estimate_model_bytes(obj: Any, _depth: int = 0) -> int:
+    """
+    모델 메모리 추정 (바이트)
+
+    - torch 모듈: 파라미터 + 버퍼 크기
+    - LightGBM Booster: 모델 문자열 크기
+    - numpy 배열: nbytes
+    - dict/list/tuple/dataclass: 하위 항목 합
+    """
+    if obj is None or _depth > 4:
+        return 0
+    if hasattr(obj, "parameters") and hasattr(obj, "buffers"):
+        tensors = list(obj.parameters()) + list(obj.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    if hasattr(obj, "model_to_string"):
+        return len(obj.model_to_string())
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, dict) or hasattr(obj, "items"):
+        return sum(estimate_model_bytes(v, _depth + 1) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(estimate_model_bytes(v, _depth + 1) for v in obj)
+    if hasattr(obj, "__dataclass_fields__"):
+        return sum(
+            estimate_model_bytes(getattr(obj, name), _depth + 1)
+            for name in obj.__dataclass_fields__
+        )
+    return sys.getsizeof(obj)
+
+
+@dataclass(frozen=True)
+class ModelEntry:
+    """로드된 모델 한 버전"""
+    name: str
+    version: str
+    model: Any
+    size_bytes: int
+    load_seconds: float
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class ModelRegistry:
+    """
+    이름별 현재 모델 버전 보관
+
+    조회는 잠금 없이 dict 참조만 읽고, 로드/교체만 이름별 잠금을 사용합니다.
+    로드는 전략 실행 스레드에서도 일어날 수 있으므로 threading.Lock을 씁니다.
+    """
+
+    def __init__(self):
+        self._current: Dict[str, ModelEntry] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._swaps: Dict[str, int] = {}
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(name)
+            if lock is None:
+                lock = self._locks[name] = threading.Lock()
+            return lock
+
+    def _load(self, name: str, loader: Callable[[], Any], version: Version) -> ModelEntry:
+        if callable(version):
+            version = version()
+        started = time.perf_counter()
+        model = loader()
+        elapsed = time.perf_counter() - started
+        try:
+            size = estimate_model_bytes(model)
+        except Exception as e:
+            logger.debug(f"Model size estimate failed for {name}: {e}")
+            size = 0
+        entry = ModelEntry(
+            name=name,
+            version=version or "default",
+            model=model,
+            size_bytes=size,
+            load_seconds=elapsed,
+        )
+        logger.info(
+            f"Model loaded: {name} (version={entry.version}, "
+            f"{size / 1024 / 1024:.1f}MB, {elapsed:.2f}s)"
+        )
+        return entry
+
+    def get(self, name: str, loader: Callable[[], Any], version: Version = None) -> Any:
+        """
+        현재 버전 모델 반환 (없으면 loader로 한 번만 로드)
+
+        Args:
+            name: 모델 이름 (예: "finbert:ProsusAI/finbert")
+            loader: 모델 로드 함수 (인자 없음)
+            version: 처음 로드할 때 기록할 버전 (문자열 또는 로드할 때만 호출되는 함수)
+        """
+        entry = self._current.get(name)
+        if entry is None:
+            with self._lock_for(name):
+                entry = self._current.get(name)
+                if entry is None:
+                    entry = self._current[name] = self._load(name, loader, version)
+        self._hits[name] = self._hits.get(name, 0) + 1
+        return entry.model
+
+    def swap(self, name: str, loader: Callable[[], Any], version: Version = None) -> Any:
+        """
+        새 버전 로드 후 교체 (재학습 후 호출)
+
+        로드가 실패하면 현재 버전을 유지하고 예외를 그대로 전달합니다.
+        """
+        with self._lock_for(name):
+            entry = self._load(name, loader, version)
+            previous = self._current.get(name)
+            self._current[name] = entry
+            self._swaps[name] = self._swaps.get(name, 0) + 1
+        if previous is not None:
+            logger.info(f"Model swapped: {name} {previous.version} -> {entry.version}")
+        return entry.model
+
+    def entry(self, name: str) -> Optional[ModelEntry]:
+        """현재 버전 정보 (로드되지 않았으면 None)"""
+        return self._current.get(name)
+
+    def remove(self, name: str):
+        """모델 참조 해제 (사용 중인 인스턴스가 끝나면 메모리 반환)"""
+        with self._lock_for(name):
+            self._current.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        models = {
+            name: {
+                "version": entry.version,
+                "size_mb": round(entry.size_bytes / 1024 / 1024, 2),
+                "load_seconds": round(entry.load_seconds, 3),
+                "loaded_at": entry.loaded_at.isoformat(),
+                "hits": self._hits.get(name, 0),
+                "swaps": self._swaps.get(name, 0),
+            }
+            for name, entry in list(self._current.items())
+        }
+        return {
+            "models": models,
+            "total_mb": round(sum(m["size_mb"] for m in models.values()), 2),
+        }
+
+
+# 싱글톤 인스턴스
+model_registry = ModelRegistry()
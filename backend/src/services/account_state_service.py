@@ -0,0 +1,222 @@
+"""
+계좌 상태 서비스 (Account State Service)
+
+사용자별 잔고/포지션 스냅샷을 하나로 공유합니다.
+
+- 같은 사용자에 대한 동시 fetch_balance/get_positions 요청은 한 번의 API 호출로 합침
+- 스냅샷 나이가 max_age 이내면 API를 호출하지 않음 (명시적 staleness 한도)
+- 스냅샷이 갱신되면 구독자에게 push (WebSocket 모니터 등)
+- invalidate() 이전에 시작된 조회 결과는 캐시하거나 합치지 않음 (세대 번호로 구분)
+
+할당 관리자, 알림 모니터, WebSocket 모니터, 봇 루프가 같은 스냅샷을 사용해
+봇이 많은 사용자도 거래소 호출 수가 봇 수에 비례해 늘지 않습니다.
+
+사용 예시:
+    from services.account_state_service import account_state_service
+
+    balance = await account_state_service.get_balance(user_id, client, max_age=5)
+    positions = await account_state_service.get_positions(user_id, client)
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BALANCE = "balance"
+POSITIONS = "positions"
+
+# (kind, value) → None
+AccountListener = Callable[[str, Any], None]
+
+
+@dataclass
+class AccountSnapshot:
+    """잔고/포지션 스냅샷"""
+
+    value: Any
+    fetched_at: float  # time.monotonic(), 조회 시작 시각 (이 시점 이후의 변경은 반영되지 않았을 수 있음)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+def usdt_balance(balance: Dict[str, Any]) -> Dict[str, float]:
+    """
+    잔고 응답에서 USDT total/free/used 추출
+
+    BitgetRestClient.fetch_balance ({"USDT": {...}})와
+    거래소 어댑터 (get_futures_balance: {"total", "free", "used"}) 형식 모두 지원
+    """
+    data = balance.get("USDT") if isinstance(balance.get("USDT"), dict) else balance
+    return {
+        "total": float(data.get("total", 0) or 0),
+        "free": float(data.get("free", 0) or 0),
+        "used": float(data.get("used", 0) or 0),
+    }
+
+
+class AccountStateService:
+    """
+    사용자별 계좌 상태 스냅샷
+
+    스냅샷은 (user_id, 종류, 클라이언트 클래스) 단위로 보관합니다.
+    클라이언트마다 응답 형식이 달라 형식이 다른 데이터가 섞이지 않도록 합니다.
+    """
+
+    BALANCE_MAX_AGE = 5.0
+    POSITIONS_MAX_AGE = 2.0
+
+    def __init__(self):
+        self._snapshots: Dict[Tuple[int, str, str], AccountSnapshot] = {}
+        self._inflight: Dict[Tuple[int, str, str], Tuple[int, asyncio.Future]] = {}
+        self._generations: Dict[Tuple[int, str], int] = {}  # (user_id, 종류) → invalidate 횟수
+        self._listeners: Dict[int, Dict[int, AccountListener]] = {}
+        self._tokens = itertools.count(1)
+        self.stats = {
+            "fetches": 0,
+            "fetch_errors": 0,
+            "snapshot_hits": 0,
+            "coalesced": 0,
+            "stale_discarded": 0,
+        }
+
+    # ==================== 조회 ====================
+
+    async def get_balance(
+        self, user_id: int, client, max_age: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        잔고 조회 (스냅샷 나이가 max_age 이내면 재사용)
+
+        Args:
+            user_id: 사용자 ID
+            client: 거래소 클라이언트 (fetch_balance 또는 get_futures_balance)
+            max_age: 허용 스냅샷 나이 (초, 0이면 항상 새로 조회)
+        """
+        fetch = getattr(client, "fetch_balance", None) or client.get_futures_balance
+        return await self._get(
+            user_id, client, BALANCE, fetch,
+            self.BALANCE_MAX_AGE if max_age is None else max_age,
+        )
+
+    async def get_positions(
+        self, user_id: int, client, max_age: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        전체 포지션 조회 (스냅샷 나이가 max_age 이내면 재사용)
+
+        Args:
+            user_id: 사용자 ID
+            client: 거래소 클라이언트 (fetch_positions 또는 get_positions)
+            max_age: 허용 스냅샷 나이 (초, 0이면 항상 새로 조회)
+        """
+        fetch = getattr(client, "fetch_positions", None) or client.get_positions
+        return await self._get(
+            user_id, client, POSITIONS, fetch,
+            self.POSITIONS_MAX_AGE if max_age is None else max_age,
+        )
+
+    async def _get(self, user_id: int, client, kind: str, fetch, max_age: float):
+        key = (user_id, kind, type(client).__name__)
+
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.age <= max_age:
+            self.stats["snapshot_hits"] += 1
+            return snapshot.value
+
+        generation = self._generations.get((user_id, kind), 0)
+        pending = self._inflight.get(key)
+        if pending is not None and pending[0] == generation:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending[1])
+
+        # invalidate 이전에 시작된 조회에는 합류하지 않고 새로 조회
+        future = asyncio.get_running_loop().create_future()
+        entry = (generation, future)
+        self._inflight[key] = entry
+        started = time.monotonic()
+        try:
+            self.stats["fetches"] += 1
+            value = await fetch()
+        except BaseException as e:
+            if not isinstance(e, asyncio.CancelledError):
+                self.stats["fetch_errors"] += 1
+                future.set_exception(e)
+                future.exception()  # 대기자가 없어도 경고 없이 정리
+            else:
+                future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is entry:
+                del self._inflight[key]
+
+        future.set_result(value)
+        if generation != self._generations.get((user_id, kind), 0):
+            # 조회 도중 무효화됨 (주문 체결 등): 호출자에게만 반환하고 캐시/push하지 않음
+            self.stats["stale_discarded"] += 1
+            return value
+
+        current = self._snapshots.get(key)
+        if current is None or current.fetched_at <= started:
+            self._snapshots[key] = AccountSnapshot(value=value, fetched_at=started)
+            self._notify(user_id, kind, value)
+        return value
+
+    def peek(self, user_id: int, kind: str) -> Optional[AccountSnapshot]:
+        """가장 최근 스냅샷 (클라이언트 종류 무관, API 호출 없음)"""
+        latest = None
+        for (uid, k, _), snapshot in self._snapshots.items():
+            if uid == user_id and k == kind:
+                if latest is None or snapshot.fetched_at > latest.fetched_at:
+                    latest = snapshot
+        return latest
+
+    def invalidate(self, user_id: int, kind: Optional[str] = None):
+        """
+        스냅샷 무효화 (주문 체결 후 등, kind 생략 시 전체)
+
+        진행 중인 조회는 결과를 캐시하지 않으며, 이후 조회는 그 결과를 기다리지 않고 새로 조회합니다.
+        """
+        for k in (BALANCE, POSITIONS) if kind is None else (kind,):
+            self._generations[(user_id, k)] = self._generations.get((user_id, k), 0) + 1
+        for key in [k for k in self._snapshots if k[0] == user_id and (kind is None or k[1] == kind)]:
+            del self._snapshots[key]
+
+    # ==================== 구독 ====================
+
+    def subscribe(self, user_id: int, listener: AccountListener) -> int:
+        """스냅샷 갱신 구독 (반환된 토큰으로 해제)"""
+        token = next(self._tokens)
+        self._listeners.setdefault(user_id, {})[token] = listener
+        return token
+
+    def unsubscribe(self, user_id: int, token: int):
+        listeners = self._listeners.get(user_id)
+        if listeners is None:
+            return
+        listeners.pop(token, None)
+        if not listeners:
+            del self._listeners[user_id]
+
+    def _notify(self, user_id: int, kind: str, value: Any):
+        for listener in list(self._listeners.get(user_id, {}).values()):
+            try:
+                listener(kind, value)
+            except Exception as e:
+                logger.error(f"Account state listener error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "snapshots": len(self._snapshots),
+            "subscribed_users": len(self._listeners),
+        }
+
+
+account_state_service = AccountStateService()
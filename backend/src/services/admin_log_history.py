@@ -0,0 +1,192 @@
+"""
+관리자 로그/거래 내역 조회 (keyset 페이지네이션 + NDJSON 스트리밍)
+
+- (created_at, id) keyset으로 페이지 조회 (idx_botlog_user_created / idx_trade_user_created 사용)
+- ORM 객체 대신 필요한 컬럼만 조회, 사용자 이메일은 같은 쿼리에서 outer join
+- 긴 기간 내보내기는 batch 단위 keyset 조회를 이어 NDJSON으로 스트리밍
+  (결과 전체를 메모리에 올리지 않고, 요청 세션 대신 batch마다 짧은 세션 사용)
+
+사용 예시:
+    from services.admin_log_history import bot_log_query, fetch_page, iter_ndjson, log_row
+
+    query = bot_log_query("system", level="error")
+    rows, next_cursor = await fetch_page(session, query, BotLog, limit=100, cursor=cursor)
+
+    StreamingResponse(iter_ndjson(query, BotLog, log_row), media_type=NDJSON_MEDIA_TYPE)
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import desc, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database.models import BotLog, Trade, User
+from ..utils import fast_json
+from ..utils.keyset import after, decode_cursor, encode_cursor
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_BATCH_SIZE = 1000
+
+# 로그 분류별 event_type 패턴
+LOG_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "system": ("error", "warning", "critical", "system"),
+    "bot": ("bot", "start", "stop", "trade", "signal"),
+}
+
+
+def _time_range(query, created_col, start: Optional[datetime], end: Optional[datetime]):
+    if start is not None:
+        query = query.where(created_col >= start)
+    if end is not None:
+        query = query.where(created_col < end)
+    return query
+
+
+def bot_log_query(
+    category: str,
+    level: Optional[str] = None,
+    user_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """BotLog 조회 SELECT (정렬/limit 없음)"""
+    query = (
+        select(
+            BotLog.id,
+            BotLog.user_id,
+            User.email.label("user_email"),
+            BotLog.event_type,
+            BotLog.message,
+            BotLog.created_at,
+        )
+        .outerjoin(User, User.id == BotLog.user_id)
+        .where(or_(*(BotLog.event_type.like(f"%{p}%") for p in LOG_CATEGORIES[category])))
+    )
+    if level:
+        query = query.where(BotLog.event_type.like(f"%{level.lower()}%"))
+    if user_id:
+        query = query.where(BotLog.user_id == user_id)
+    return _time_range(query, BotLog.created_at, start, end)
+
+
+def trade_log_query(
+    user_id: Optional[int] = None,
+    symbol: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+):
+    """Trade 조회 SELECT (정렬/limit 없음)"""
+    query = select(
+        Trade.id,
+        Trade.user_id,
+        User.email.label("user_email"),
+        Trade.symbol,
+        Trade.side,
+        Trade.qty,
+        Trade.entry_price,
+        Trade.exit_price,
+        Trade.pnl,
+        Trade.pnl_percent,
+        Trade.leverage,
+        Trade.exit_reason,
+        Trade.created_at,
+    ).outerjoin(User, User.id == Trade.user_id)
+    if user_id:
+        query = query.where(Trade.user_id == user_id)
+    if symbol:
+        query = query.where(Trade.symbol == symbol.upper())
+    return _time_range(query, Trade.created_at, start, end)
+
+
+def _paged(query, model, limit: int, cursor: Optional[str], descending: bool):
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, "datetime")
+        query = query.where(after(model.created_at, model.id, created_at, row_id, descending))
+    order = (desc(model.created_at), desc(model.id)) if descending else (model.created_at, model.id)
+    return query.order_by(*order).limit(limit)
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query,
+    model,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = True,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (created_at, id) keyset 페이지 조회
+
+    Returns:
+        (행 목록, 다음 페이지 cursor 또는 None)
+
+    Raises:
+        ValueError: 잘못된 cursor
+    """
+    rows = (await session.execute(_paged(query, model, limit + 1, cursor, descending))).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def iter_ndjson(
+    query,
+    model,
+    to_dict: Callable[[Any], Dict[str, Any]],
+    batch_size: int = EXPORT_BATCH_SIZE,
+    descending: bool = False,
+    session_factory=None,
+) -> AsyncIterator[bytes]:
+    """
+    조회 결과 전체를 NDJSON으로 스트리밍 (batch마다 새 세션으로 keyset 조회)
+
+    StreamingResponse가 보내는 동안 요청 세션은 이미 닫혔을 수 있어 세션을 직접 엽니다.
+    """
+    if session_factory is None:
+        from ..database.db import AsyncSessionLocal
+
+        session_factory = AsyncSessionLocal
+
+    cursor = None
+    while True:
+        async with session_factory() as session:
+            rows, cursor = await fetch_page(session, query, model, batch_size, cursor, descending)
+        if rows:
+            yield b"".join(fast_json.dumps_bytes(to_dict(row)) + b"\n" for row in rows)
+        if cursor is None:
+            return
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def log_row(row) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "user_email": row.user_email,
+        "event_type": row.event_type,
+        "message": row.message,
+        "created_at": _iso(row.created_at),
+    }
+
+
+def trade_row(row) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "user_email": row.user_email,
+        "symbol": row.symbol,
+        "side": row.side,
+        "qty": row.qty,
+        "entry_price": float(row.entry_price) if row.entry_price else None,
+        "exit_price": float(row.exit_price) if row.exit_price else None,
+        "pnl": float(row.pnl) if row.pnl else 0.0,
+        "pnl_percent": row.pnl_percent,
+        "leverage": row.leverage,
+        "exit_reason": row.exit_reason.value if row.exit_reason else None,
+        "created_at": _iso(row.created_at),
+    }
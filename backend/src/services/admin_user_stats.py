@@ -0,0 +1,373 @@
+"""
+관리자 회원 통계 쿼리 (SQL 집계)
+
+회원 목록/상세 통계를 사용자별 반복 쿼리나 Trade 전체 로드 없이 한 번의 집계 쿼리로 계산합니다.
+
+- 회원 목록: 사용자 + 거래 집계 + 실행 중 봇 수를 한 쿼리로, keyset(cursor) 페이지네이션
+  - 회원 컬럼(id, created_at, email) 정렬: 페이지 사용자 id만 먼저 고르고 그 사용자 거래만 집계
+  - 집계 컬럼(total_trades, total_pnl 등) 정렬: 전체 사용자별 집계가 필요하므로
+    ADMIN_USER_ROLLUP_VIEW가 켜져 있으면 materialized view(user_trade_rollups)를 사용
+- 회원 상세: 조건부 집계(CASE)로 승/패 수, 기간별(오늘/7일/30일/전체/일별) 통계를 한 번에 계산
+
+사용 예시:
+    from services.admin_user_stats import list_users_page, trade_stats
+
+    page = await list_users_page(session, sort="total_pnl", order="desc", limit=50)
+    stats = await trade_stats(session, user_id)
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, column, func, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..database.models import BotStatus, Trade, User
+from ..utils import keyset
+from ..utils.keyset import after, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# 정렬 키 -> 값 종류 (cursor 복원용)
+SORT_KEYS: Dict[str, str] = {
+    "id": "int",
+    "created_at": "datetime",
+    "email": "str",
+    "total_trades": "int",
+    "total_pnl": "decimal",
+    "active_bots_count": "int",
+}
+USER_SORT_KEYS = {"id", "created_at", "email"}
+
+# created_at이 없는 (오래된) 회원은 가장 오래된 것으로 정렬
+_EPOCH = datetime(1970, 1, 1)
+
+# migration 005에서 생성 (PostgreSQL 전용)
+ROLLUP_VIEW = "user_trade_rollups"
+user_trade_rollups = table(
+    ROLLUP_VIEW,
+    column("user_id"),
+    column("total_trades"),
+    column("total_pnl"),
+    column("winning_trades"),
+    column("losing_trades"),
+)
+
+
+def _pnl_count(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def trade_rollup_query(where=None):
+    """사용자별 거래 집계 SELECT (materialized view 정의와 같은 컬럼)"""
+    query = select(
+        Trade.user_id.label("user_id"),
+        func.count(Trade.id).label("total_trades"),
+        func.coalesce(func.sum(Trade.pnl), 0).label("total_pnl"),
+        _pnl_count(Trade.pnl > 0).label("winning_trades"),
+        _pnl_count(Trade.pnl < 0).label("losing_trades"),
+    )
+    if where is not None:
+        query = query.where(where)
+    return query.group_by(Trade.user_id)
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """cursor -> (정렬 값, 사용자 id), 형식이 잘못되면 ValueError"""
+    return keyset.decode_cursor(cursor, SORT_KEYS[sort])
+
+
+def _user_filters(search: Optional[str], role: Optional[str], is_active: Optional[bool]) -> List:
+    filters = []
+    if search:
+        pattern = f"%{search.strip()}%"
+        filters.append(or_(User.email.ilike(pattern), User.name.ilike(pattern)))
+    if role:
+        filters.append(User.role == role)
+    if is_active is not None:
+        filters.append(User.is_active == is_active)
+    return filters
+
+
+async def list_users_page(
+    session: AsyncSession,
+    sort: str = "id",
+    order: str = "asc",
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    search: Optional[str] = None,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    회원 목록 한 페이지 (통계 포함, 쿼리 1회)
+
+    Args:
+        sort: SORT_KEYS 중 하나
+        order: "asc" / "desc"
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor
+        search: 이메일/이름 부분 일치
+        role, is_active: 일치 필터
+
+    Returns:
+        {"users": [...], "next_cursor": str | None, "stats_as_of": ISO | None (view 사용 시)}
+
+    Raises:
+        ValueError: 알 수 없는 정렬 키 또는 잘못된 cursor
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"unknown sort key: {sort}")
+    descending = order == "desc"
+    filters = _user_filters(search, role, is_active)
+    use_view = sort not in USER_SORT_KEYS and user_rollups.available
+
+    user_sort = {
+        "id": User.id,
+        "created_at": func.coalesce(User.created_at, _EPOCH),
+        "email": User.email,
+    }
+
+    if sort in USER_SORT_KEYS:
+        # 페이지 사용자를 먼저 고르고 그 사용자들의 거래만 집계
+        sort_expr = user_sort[sort]
+        page_filters = list(filters)
+        if cursor:
+            page_filters.append(after(sort_expr, User.id, *decode_cursor(cursor, sort), descending))
+        page_users = (
+            select(User.id)
+            .where(*page_filters)
+            .order_by(sort_expr.desc() if descending else sort_expr, User.id.desc() if descending else User.id)
+            .limit(limit + 1)
+            .cte("page_users")
+        )
+        page_ids = select(page_users.c.id)
+        filters = [User.id.in_(page_ids)]
+        rollup = trade_rollup_query(Trade.user_id.in_(page_ids)).subquery("rollup")
+    elif use_view:
+        rollup = user_trade_rollups
+    else:
+        rollup = trade_rollup_query().subquery("rollup")
+
+    running_bots = (
+        select(BotStatus.user_id.label("user_id"), func.count().label("active_bots_count"))
+        .where(BotStatus.is_running == True)  # noqa: E712
+        .group_by(BotStatus.user_id)
+        .subquery("running_bots")
+    )
+
+    total_trades = func.coalesce(rollup.c.total_trades, 0).label("total_trades")
+    total_pnl = func.coalesce(rollup.c.total_pnl, 0).label("total_pnl")
+    active_bots = func.coalesce(running_bots.c.active_bots_count, 0).label("active_bots_count")
+    sort_expr = {
+        **user_sort,
+        "total_trades": func.coalesce(rollup.c.total_trades, 0),
+        "total_pnl": func.coalesce(rollup.c.total_pnl, 0),
+        "active_bots_count": func.coalesce(running_bots.c.active_bots_count, 0),
+    }[sort]
+    if cursor and sort not in USER_SORT_KEYS:
+        filters.append(after(sort_expr, User.id, *decode_cursor(cursor, sort), descending))
+
+    query = (
+        select(User, total_trades, total_pnl, active_bots, sort_expr.label("sort_value"))
+        .outerjoin(rollup, rollup.c.user_id == User.id)
+        .outerjoin(running_bots, running_bots.c.user_id == User.id)
+        .where(*filters)
+        .order_by(sort_expr.desc() if descending else sort_expr, User.id.desc() if descending else User.id)
+        .limit(limit + 1)
+    )
+    rows = (await session.execute(query)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.sort_value, last.User.id)
+
+    return {
+        "users": [
+            {
+                **user_summary(row.User),
+                "total_trades": int(row.total_trades),
+                "total_pnl": round(float(row.total_pnl), 2),
+                "active_bots_count": int(row.active_bots_count),
+            }
+            for row in rows
+        ],
+        "next_cursor": next_cursor,
+        "stats_as_of": user_rollups.refreshed_at_iso() if use_view else None,
+    }
+
+
+def user_summary(user: User) -> Dict[str, Any]:
+    """회원 기본 정보"""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active if hasattr(user, "is_active") else True,
+        "suspended_at": user.suspended_at.isoformat()
+        if hasattr(user, "suspended_at") and user.suspended_at
+        else None,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
+def _window_columns(prefix: str, condition) -> List:
+    """기간 조건에 해당하는 거래의 집계 컬럼 (조건이 None이면 전체)"""
+
+    def only(expr):
+        return expr if condition is None else case((condition, expr), else_=None)
+
+    pnl = only(Trade.pnl)
+    return [
+        func.count(only(Trade.id)).label(f"{prefix}_trades"),
+        func.coalesce(func.sum(pnl), 0).label(f"{prefix}_pnl"),
+        func.count(case((pnl > 0, 1))).label(f"{prefix}_wins"),
+        func.count(case((pnl < 0, 1))).label(f"{prefix}_losses"),
+        func.coalesce(func.sum(case((pnl > 0, pnl))), 0).label(f"{prefix}_gross_profit"),
+        func.coalesce(func.sum(case((pnl < 0, pnl))), 0).label(f"{prefix}_gross_loss"),
+        func.max(pnl).label(f"{prefix}_max"),
+        func.min(pnl).label(f"{prefix}_min"),
+    ]
+
+
+def _window_stats(row, prefix: str) -> Dict[str, Any]:
+    total = getattr(row, f"{prefix}_trades")
+    total_pnl = float(getattr(row, f"{prefix}_pnl"))
+    wins = getattr(row, f"{prefix}_wins")
+    losses = getattr(row, f"{prefix}_losses")
+    gross_profit = float(getattr(row, f"{prefix}_gross_profit"))
+    gross_loss = abs(float(getattr(row, f"{prefix}_gross_loss")))
+    max_pnl = getattr(row, f"{prefix}_max")
+    min_pnl = getattr(row, f"{prefix}_min")
+    return {
+        "total_trades": total,
+        "total_pnl": round(total_pnl, 2),
+        "winning_trades": wins,
+        "losing_trades": losses,
+        "win_rate": round(wins / total * 100, 1) if total > 0 else 0.0,
+        "avg_pnl": round(total_pnl / total, 2) if total > 0 else 0.0,
+        "max_profit": round(float(max_pnl), 2) if max_pnl is not None else 0.0,
+        "max_loss": round(float(min_pnl), 2) if min_pnl is not None else 0.0,
+        "profit_factor": round(gross_profit / gross_loss, 2) if gross_loss > 0 else 0.0,
+    }
+
+
+async def trade_stats(session: AsyncSession, user_id: int) -> Dict[str, Any]:
+    """회원 전체 거래 통계 (쿼리 1회)"""
+    row = (await session.execute(select(*_window_columns("all", None)).where(Trade.user_id == user_id))).one()
+    return _window_stats(row, "all")
+
+
+async def profit_stats(session: AsyncSession, user_id: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    회원 기간별 수익 통계 (쿼리 1회)
+
+    오늘/7일/30일/전체 통계와 최근 7일 일별 손익을 조건부 집계로 한 번에 계산합니다.
+    """
+    now = now or datetime.utcnow()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    windows = {
+        "today": Trade.created_at >= today_start,
+        "week": Trade.created_at >= today_start - timedelta(days=7),
+        "month": Trade.created_at >= today_start - timedelta(days=30),
+        "all_time": None,
+    }
+    days = [today_start - timedelta(days=i) for i in range(6, -1, -1)]  # 오래된 순서
+
+    columns = [c for prefix, condition in windows.items() for c in _window_columns(prefix, condition)]
+    for i, day in enumerate(days):
+        in_day = and_(Trade.created_at >= day, Trade.created_at < day + timedelta(days=1))
+        columns.append(func.count(case((in_day, Trade.id))).label(f"day{i}_trades"))
+        columns.append(func.coalesce(func.sum(case((in_day, Trade.pnl))), 0).label(f"day{i}_pnl"))
+
+    row = (await session.execute(select(*columns).where(Trade.user_id == user_id))).one()
+
+    return {
+        **{prefix: _window_stats(row, prefix) for prefix in windows},
+        "daily_pnl": [
+            {
+                "date": day.strftime("%Y-%m-%d"),
+                "pnl": round(float(getattr(row, f"day{i}_pnl")), 2),
+                "trades": getattr(row, f"day{i}_trades"),
+            }
+            for i, day in enumerate(days)
+        ],
+    }
+
+
+class UserRollupView:
+    """
+    user_trade_rollups materialized view 주기 갱신
+
+    ADMIN_USER_ROLLUP_VIEW=true이고 PostgreSQL일 때만 동작합니다. 첫 갱신이 성공해야
+    available이 True가 되고, 그 전이나 갱신 실패 후에는 목록 쿼리가 직접 집계로 돌아갑니다.
+    view 값은 최대 refresh 주기만큼 늦을 수 있습니다 (응답의 stats_as_of).
+    """
+
+    def __init__(self):
+        self.available = False
+        self.refreshed_at: Optional[datetime] = None
+        self.last_refresh_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.refresh_count = 0
+
+    def refreshed_at_iso(self) -> Optional[str]:
+        return self.refreshed_at.isoformat() if self.refreshed_at else None
+
+    async def refresh(self):
+        """REFRESH MATERIALIZED VIEW CONCURRENTLY (조회를 막지 않음)"""
+        from ..database.db import AsyncSessionLocal
+
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {ROLLUP_VIEW}"))
+                await session.commit()
+        except Exception as e:
+            self.available = False
+            self.last_error = str(e)
+            logger.warning(f"⚠️ {ROLLUP_VIEW} refresh failed, falling back to live aggregation: {e}")
+            return
+
+        self.available = True
+        self.last_error = None
+        self.refreshed_at = datetime.utcnow()
+        self.last_refresh_ms = (time.perf_counter() - started) * 1000
+        self.refresh_count += 1
+
+    def start(self):
+        """periodic_scheduler에 갱신 작업 등록 (설정이 꺼져 있거나 PostgreSQL이 아니면 무시)"""
+        if not settings.admin_user_rollup_view or "postgresql" not in settings.database_url:
+            return
+        from .periodic_scheduler import periodic_scheduler
+
+        periodic_scheduler.register(
+            "admin_user_rollups", "all", interval=settings.admin_user_rollup_refresh_seconds,
+            func=self.refresh, owner=self, first_delay=0,
+        )
+        logger.info(f"User rollup view refresh scheduled every {settings.admin_user_rollup_refresh_seconds}s")
+
+    def stop(self):
+        from .periodic_scheduler import periodic_scheduler
+
+        periodic_scheduler.unregister("admin_user_rollups", "all", owner=self)
+        self.available = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.admin_user_rollup_view,
+            "available": self.available,
+            "refreshed_at": self.refreshed_at_iso(),
+            "last_refresh_ms": round(self.last_refresh_ms, 1) if self.last_refresh_ms is not None else None,
+            "refresh_count": self.refresh_count,
+            "last_error": self.last_error,
+        }
+
+
+# 싱글톤 인스턴스
+user_rollups = UserRollupView()
@@ -3,24 +3,27 @@ Integrated AI Service (통합 AI 서비스)
 
 Gemini 2.0 Flash Thinking / DeepSeek-V3 API + 비용 최적화 통합 서비스
 - Prompt Caching (90% 비용 절감)
-- Response Caching (중복 호출 제거)
+- Response Caching (중복 호출 제거, 동시 동일 요청은 하나의 호출 공유)
 - Smart Sampling (API 호출 50~70% 감소)
 - Cost Tracking (실시간 비용 모니터링)
 """
 
+import asyncio
 import logging
 import hashlib
 import json
-import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+import httpx
+
 from .prompt_cache import PromptCacheManager
 from .response_cache import ResponseCacheManager
 from .smart_sampling import SamplingStrategy, get_global_sampling_manager
 from .cost_tracker import CostTracker
 from .event_driven_optimizer import EventDrivenOptimizer, MarketEvent, EventType, EventPriority
 from src.config import settings
+from src.utils.http_client import request_with_retry
 import threading
 
 logger = logging.getLogger(__name__)
@@ -110,6 +113,9 @@ class IntegratedAIService:
         self.cost_tracker = CostTracker(redis_client)
         self.event_optimizer = EventDrivenOptimizer(redis_client)
 
+        # 진행 중인 API 호출 (캐시 키 → Future, 동시 동일 요청 합치기)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         provider_name = "Gemini 2.0 Flash Thinking" if self.ai_provider == "gemini" else "DeepSeek-V3"
         logger.info(f"IntegratedAIService initialized with {provider_name} + event-driven cost optimization")
 
@@ -147,6 +153,9 @@ class IntegratedAIService:
                 "sampled": bool
             }
         """
+        # 캐시 키용 쿼리 (응답 타입별 규칙으로 컨텍스트 양자화)
+        query_data = self.response_cache.build_query(response_type, prompt, context, agent_type)
+
         # 1. 스마트 샘플링 체크
         sampled = True
         skip_reason = None
@@ -163,7 +172,8 @@ class IntegratedAIService:
                 # 이전 응답 재사용 (캐시에서)
                 cached_response = await self.response_cache.get_cached_response(
                     response_type=response_type,
-                    query_data={"prompt": prompt, "context": context}
+                    query_data=query_data,
+                    agent_type=agent_type,
                 )
 
                 if cached_response:
@@ -186,11 +196,13 @@ class IntegratedAIService:
 
         # 2. 응답 캐시 조회
         cache_hit = False
+        cacheable = enable_caching and self.response_cache.should_cache(response_type, context)
 
-        if enable_caching and self.response_cache.should_cache(response_type, context):
+        if cacheable:
             cached_response = await self.response_cache.get_cached_response(
                 response_type=response_type,
-                query_data={"prompt": prompt, "context": context}
+                query_data=query_data,
+                agent_type=agent_type,
             )
 
             if cached_response:
@@ -204,6 +216,67 @@ class IntegratedAIService:
                     "sampled": True,
                 }
 
+        if not cacheable:
+            return await self._call_provider(
+                agent_type, prompt, query_data, system_prompt, response_type,
+                temperature, max_tokens, enable_caching,
+            )
+
+        # 2-1. 같은 쿼리의 호출이 진행 중이면 그 결과를 공유 (single-flight)
+        cache_key = self.response_cache.get_cache_key(response_type, query_data)
+        pending = self._inflight.get(cache_key)
+
+        if pending is not None:
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # 선행 호출이 취소됨 → 직접 호출
+                return await self._call_provider(
+                    agent_type, prompt, query_data, system_prompt, response_type,
+                    temperature, max_tokens, enable_caching,
+                )
+
+            if "error" in result:
+                return result
+
+            self.response_cache.record_saved_call(agent_type, response_type, result, "coalesced")
+            logger.info(f"🔗 Joined in-flight AI call for {agent_type}")
+            return {
+                "response": result["response"],
+                "cost_info": {"cost_usd": 0.0, "total_cost_usd": 0.0},
+                "cache_hit": True,
+                "sampled": True,
+                "coalesced": True,
+            }
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._call_provider(
+                agent_type, prompt, query_data, system_prompt, response_type,
+                temperature, max_tokens, enable_caching,
+            )
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(cache_key, None)
+
+    async def _call_provider(
+        self,
+        agent_type: str,
+        prompt: str,
+        query_data: Dict[str, Any],
+        system_prompt: Optional[str],
+        response_type: str,
+        temperature: float,
+        max_tokens: int,
+        enable_caching: bool,
+    ) -> Dict[str, Any]:
+        """프롬프트 캐시 조회 → AI API 호출 → 비용 추적 → 응답 캐싱"""
         # 3. 프롬프트 캐시 조회 (시스템 프롬프트)
         if system_prompt and enable_caching:
             cached_system = await self.prompt_cache.get_cached_prompt(
@@ -249,7 +322,7 @@ class IntegratedAIService:
             if enable_caching:
                 await self.response_cache.set_cached_response(
                     response_type=response_type,
-                    query_data={"prompt": prompt, "context": context},
+                    query_data=query_data,
                     response={"response": response_text, "cost_info": cost_info}
                 )
 
@@ -342,7 +415,8 @@ class IntegratedAIService:
             # 캐시된 응답 재사용
             cached_response = await self.response_cache.get_cached_response(
                 response_type=response_type,
-                query_data={"prompt": prompt, "context": context}
+                query_data=self.response_cache.build_query(response_type, prompt, context, agent_type),
+                agent_type=agent_type,
             )
 
             if cached_response:
@@ -529,11 +603,15 @@ Provide a comprehensive analysis of these events and their combined implications
         }
 
         try:
-            response = requests.post(
+            # 공유 커넥션 풀 + 재시도 예산 (이벤트 루프를 블로킹하지 않음)
+            response = await request_with_retry(
+                "gemini",
+                "POST",
                 url,
+                max_retries=1,
                 headers=headers,
                 json=payload,
-                timeout=60,  # Gemini Deep Think는 더 긴 타임아웃 필요
+                timeout=httpx.Timeout(60.0, connect=5.0),  # Gemini Deep Think는 더 긴 타임아웃 필요
             )
             response.raise_for_status()
 
@@ -602,11 +680,14 @@ Provide a comprehensive analysis of these events and their combined implications
         }
 
         try:
-            response = requests.post(
+            response = await request_with_retry(
+                "deepseek",
+                "POST",
                 f"{self.DEEPSEEK_BASE_URL}/chat/completions",
+                max_retries=1,
                 headers=headers,
                 json=payload,
-                timeout=30,
+                timeout=httpx.Timeout(30.0, connect=5.0),
             )
             response.raise_for_status()
 
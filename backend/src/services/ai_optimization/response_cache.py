@@ -2,13 +2,20 @@
 Response Cache Manager (응답 캐싱 매니저)
 
 AI API 응답을 캐싱하여 동일한 쿼리에 대한 중복 호출 방지
+
+- 컨텍스트 양자화: 가격/지표 값을 버킷으로 묶어 거의 같은 쿼리가 캐시를 공유
+- 2단계 캐시: 프로세스 내 LRU → Redis (Redis 없이도 LRU로 동작)
+- agent_type별 히트율/절감 비용 통계
 """
 
 import hashlib
 import json
 import logging
+import math
 import re
-from typing import Optional, Dict, Any, List
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,111 @@ VALID_RESPONSE_TYPES = {
 }
 
 
+# 응답 타입별 컨텍스트 양자화 규칙 (필드 → (방식, 파라미터))
+# - ("relative", p): 상대 버킷 (가격 등, p=0.002 → 0.2% 단위)
+# - ("step", s): 절대 버킷 (s 단위로 내림)
+# - ("round", n): 소수점 n자리 반올림
+# 규칙이 있는 응답 타입은 양자화된 컨텍스트가 쿼리를 대표하므로
+# 원시 값이 들어간 프롬프트 문자열은 캐시 키에서 제외합니다.
+# 따라서 이 타입을 호출하는 에이전트는 판단에 쓰이는 프롬프트 입력을 모두 컨텍스트에 넣어야 합니다.
+DEFAULT_QUANTIZATION: Dict[str, Dict[str, Tuple[str, float]]] = {
+    "market_analysis": {
+        "price": ("relative", 0.002),
+        "adx": ("step", 2.0),
+        "atr": ("relative", 0.05),
+        "volatility": ("step", 0.1),
+        "bb_width": ("step", 0.1),
+        "ema_20": ("relative", 0.002),
+        "ema_50": ("relative", 0.002),
+        "upper_bb": ("relative", 0.002),
+        "lower_bb": ("relative", 0.002),
+        "current_volume": ("relative", 0.05),
+        "avg_volume": ("relative", 0.05),
+        "rule_based_confidence": ("step", 0.05),
+    },
+    "signal_validation": {
+        "confidence": ("step", 0.05),
+        "price": ("relative", 0.002),
+        "volatility": ("step", 0.1),
+        "trend_strength": ("step", 0.05),
+        "rule_based_score": ("step", 0.05),
+    },
+    "portfolio_optimization": {
+        "portfolio_sharpe": ("round", 1),
+        "total_return": ("round", 1),
+        "total_risk": ("round", 1),
+        "diversification_ratio": ("round", 1),
+        "average_correlation": ("step", 0.05),
+        "max_correlation": ("step", 0.05),
+        "bot_returns": ("round", 1),
+        "bot_sharpes": ("round", 1),
+        "bot_win_rates": ("round", 0),
+        "bot_volatilities": ("round", 1),
+        "risk_contributions": ("round", 0),
+    },
+}
+
+
+def quantize_value(value: Any, rule: Tuple[str, float]) -> Any:
+    """단일 값 양자화 (숫자가 아니면 그대로 반환, 리스트/튜플은 원소별 양자화)"""
+    if isinstance(value, (list, tuple)):
+        return [quantize_value(v, rule) for v in value]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if not math.isfinite(value):
+        return value
+
+    method, param = rule
+    if method == "round":
+        return round(float(value), int(param))
+    if method == "step":
+        return math.floor(value / param) * param if param > 0 else value
+    if method == "relative":
+        if value <= 0 or param <= 0:
+            return value
+        # 로그 스케일 버킷 → 버킷 대표값
+        bucket = math.floor(math.log(value) / math.log1p(param))
+        return round((1 + param) ** bucket, 8)
+    raise ValueError(f"Unknown quantization method: {method}")
+
+
+class _LocalLRU:
+    """프로세스 내 TTL LRU 캐시"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: int):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [k for k in self._data if k.startswith(prefix)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class ResponseCacheManager:
     """
     응답 캐싱 매니저
@@ -41,8 +153,12 @@ class ResponseCacheManager:
     - 월 $500~$1,000 절감 가능
     """
 
-    def __init__(self, redis_client=None):
+    def __init__(self, redis_client=None, local_max_size: int = 1024):
         self.redis_client = redis_client
+        self.local_cache = _LocalLRU(local_max_size)
+        self.quantization: Dict[str, Dict[str, Tuple[str, float]]] = {
+            k: dict(v) for k, v in DEFAULT_QUANTIZATION.items()
+        }
 
         # 캐싱 전략 (응답 타입별 TTL)
         self.cache_ttl = {
@@ -61,9 +177,93 @@ class ResponseCacheManager:
             "api_calls_saved": 0,
             "cost_saved_usd": 0.0,
         }
+        # agent_type별 통계
+        self.agent_stats: Dict[str, Dict[str, float]] = {}
 
         logger.info("ResponseCacheManager initialized")
 
+    # ==================== 양자화 ====================
+
+    def configure_quantization(
+        self, response_type: str, rules: Optional[Dict[str, Tuple[str, float]]]
+    ):
+        """
+        응답 타입별 컨텍스트 양자화 규칙 설정
+
+        Args:
+            response_type: 응답 타입
+            rules: {필드: (방식, 파라미터)}, None이면 양자화 해제
+        """
+        if rules is None:
+            self.quantization.pop(response_type, None)
+            return
+        for rule in rules.values():
+            quantize_value(1.0, rule)  # 방식 검증
+        self.quantization[response_type] = dict(rules)
+
+    def quantize_context(self, response_type: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """규칙에 따라 컨텍스트 값 양자화"""
+        rules = self.quantization.get(response_type)
+        if not rules:
+            return context
+        return {
+            key: quantize_value(value, rules[key]) if key in rules else value
+            for key, value in context.items()
+        }
+
+    def build_query(
+        self,
+        response_type: str,
+        prompt: str,
+        context: Dict[str, Any],
+        agent_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        캐시 키용 쿼리 데이터
+
+        양자화 규칙이 있으면 에이전트 타입 + 양자화된 컨텍스트,
+        없으면 프롬프트 + 원본 컨텍스트
+        """
+        if response_type in self.quantization:
+            return {
+                "agent_type": agent_type,
+                "context": self.quantize_context(response_type, context),
+            }
+        return {"prompt": prompt, "context": context}
+
+    # ==================== 통계 ====================
+
+    def _agent_stats(self, agent_type: str) -> Dict[str, float]:
+        stats = self.agent_stats.get(agent_type)
+        if stats is None:
+            stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "coalesced": 0,
+                     "cost_saved_usd": 0.0}
+            self.agent_stats[agent_type] = stats
+        return stats
+
+    def record_saved_call(
+        self, agent_type: str, response_type: str, response: Optional[Dict[str, Any]],
+        kind: str,
+    ):
+        """
+        API 호출 절감 기록
+
+        Args:
+            kind: "local_hits" | "redis_hits" | "coalesced"
+        """
+        cost = None
+        if response:
+            cost = (response.get("cost_info") or {}).get("total_cost_usd")
+        if not cost:
+            cost = self._estimate_cost_per_call(response_type)
+
+        stats = self._agent_stats(agent_type)
+        stats[kind] += 1
+        stats["cost_saved_usd"] += cost
+
+        self.stats["api_calls_saved"] += 1
+        self.stats["cost_saved_usd"] += cost
+
     def get_cache_key(
         self, response_type: str, query_data: Dict[str, Any]
     ) -> str:
@@ -110,33 +310,38 @@ class ResponseCacheManager:
         return cache_key
 
     async def get_cached_response(
-        self, response_type: str, query_data: Dict[str, Any]
+        self, response_type: str, query_data: Dict[str, Any], agent_type: str = "general"
     ) -> Optional[Dict[str, Any]]:
         """
-        캐시된 응답 조회
+        캐시된 응답 조회 (LRU → Redis)
 
         Args:
             response_type: 응답 타입
             query_data: 쿼리 데이터
+            agent_type: 통계 집계용 에이전트 타입
 
         Returns:
             캐시된 응답 (없으면 None)
         """
+        cache_key = self.get_cache_key(response_type, query_data)
+
+        local = self.local_cache.get(cache_key)
+        if local is not None:
+            self.stats["cache_hits"] += 1
+            self.record_saved_call(agent_type, response_type, local, "local_hits")
+            logger.debug(f"Response cache HIT (local): {response_type}")
+            return local
+
         if not self.redis_client:
+            self.stats["cache_misses"] += 1
+            self._agent_stats(agent_type)["misses"] += 1
             return None
 
-        cache_key = self.get_cache_key(response_type, query_data)
-
         try:
             cached = await self.redis_client.get(cache_key)
 
             if cached:
                 self.stats["cache_hits"] += 1
-                self.stats["api_calls_saved"] += 1
-
-                # 비용 절감 계산 (응답 타입별 추정 비용)
-                cost_per_call = self._estimate_cost_per_call(response_type)
-                self.stats["cost_saved_usd"] += cost_per_call
 
                 logger.debug(f"Response cache HIT: {response_type}")
 
@@ -168,6 +373,13 @@ class ResponseCacheManager:
                         logger.warning(f"Cached response missing expected fields")
                         # Still return it, might be valid but different format
 
+                    self.record_saved_call(agent_type, response_type, parsed, "redis_hits")
+
+                    # 남은 TTL 동안 로컬 LRU에도 보관
+                    ttl = await self.redis_client.ttl(cache_key)
+                    if ttl and ttl > 0:
+                        self.local_cache.set(cache_key, parsed, ttl)
+
                     return parsed
 
                 except json.JSONDecodeError as e:
@@ -178,6 +390,7 @@ class ResponseCacheManager:
 
             else:
                 self.stats["cache_misses"] += 1
+                self._agent_stats(agent_type)["misses"] += 1
                 logger.debug(f"Response cache MISS: {response_type}")
                 return None
 
@@ -208,12 +421,14 @@ class ResponseCacheManager:
             response: 캐싱할 응답
             custom_ttl: 커스텀 TTL (초)
         """
-        if not self.redis_client:
-            return
-
         cache_key = self.get_cache_key(response_type, query_data)
         ttl = custom_ttl or self.cache_ttl.get(response_type, 300)
 
+        self.local_cache.set(cache_key, response, ttl)
+
+        if not self.redis_client:
+            return
+
         try:
             # JSON 직렬화
             response_json = json.dumps(response)
@@ -235,6 +450,11 @@ class ResponseCacheManager:
             response_type: 응답 타입
             query_data: 특정 쿼리 (None이면 타입 전체)
         """
+        if query_data:
+            self.local_cache.delete(self.get_cache_key(response_type, query_data))
+        else:
+            self.local_cache.delete_prefix(f"ai:response:{response_type}:")
+
         if not self.redis_client:
             return
 
@@ -366,12 +586,24 @@ class ResponseCacheManager:
             self.stats["cache_hits"] / total * 100 if total > 0 else 0
         )
 
+        by_agent = {}
+        for agent_type, stats in self.agent_stats.items():
+            hits = stats["local_hits"] + stats["redis_hits"] + stats["coalesced"]
+            lookups = hits + stats["misses"]
+            by_agent[agent_type] = {
+                **stats,
+                "hit_rate_percent": round(hits / lookups * 100, 2) if lookups else 0,
+                "cost_saved_usd": round(stats["cost_saved_usd"], 4),
+            }
+
         return {
             "cache_hits": self.stats["cache_hits"],
             "cache_misses": self.stats["cache_misses"],
             "hit_rate_percent": round(hit_rate, 2),
             "api_calls_saved": self.stats["api_calls_saved"],
             "cost_saved_usd": round(self.stats["cost_saved_usd"], 2),
+            "local_entries": len(self.local_cache),
+            "by_agent": by_agent,
         }
 
     async def warm_up_cache(
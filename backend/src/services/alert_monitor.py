@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.models import SystemAlert, User, Trade
 from ..database.db import AsyncSessionLocal
+from ..services.account_state_service import account_state_service
 from ..services.exchange_service import ExchangeService
 from ..websockets.ws_server import ws_manager
 
@@ -92,7 +93,7 @@ class AlertMonitor:
             client, exchange_name = await ExchangeService.get_user_exchange_client(
                 session, user_id
             )
-            balance = await client.fetch_balance()
+            balance = await account_state_service.get_balance(user_id, client)
 
             usdt_balance = balance.get("USDT", {})
             total = float(usdt_balance.get("total", 0))
@@ -129,7 +130,7 @@ class AlertMonitor:
             client, exchange_name = await ExchangeService.get_user_exchange_client(
                 session, user_id
             )
-            balance = await client.fetch_balance()
+            balance = await account_state_service.get_balance(user_id, client)
 
             usdt_balance = balance.get("USDT", {})
             total = float(usdt_balance.get("total", 0))
@@ -168,7 +169,7 @@ class AlertMonitor:
                 session, user_id
             )
             # 간단한 API 호출로 연결 테스트
-            await client.fetch_balance()
+            await account_state_service.get_balance(user_id, client, max_age=0)
 
         except Exception as e:
             # API 연결 실패
@@ -209,7 +210,7 @@ class AlertMonitor:
             client, exchange_name = await ExchangeService.get_user_exchange_client(
                 session, user_id
             )
-            balance = await client.fetch_balance()
+            balance = await account_state_service.get_balance(user_id, client)
             current_balance = float(balance.get("USDT", {}).get("total", 0))
 
             if current_balance > 0:
@@ -245,7 +246,7 @@ class AlertMonitor:
             client, exchange_name = await ExchangeService.get_user_exchange_client(
                 session, user_id
             )
-            positions = await client.fetch_positions()
+            positions = await account_state_service.get_positions(user_id, client)
 
             for pos in positions:
                 if pos.get("contracts", 0) == 0:
@@ -291,11 +292,11 @@ class AlertMonitor:
                     session, user_id
                 )
 
-                # 1회 API 호출로 잔고 조회
+                # 잔고 조회 (봇/WebSocket 모니터와 공유하는 스냅샷)
                 balance = None
                 positions = None
                 try:
-                    balance = await client.fetch_balance()
+                    balance = await account_state_service.get_balance(user_id, client)
                 except Exception as e:
                     logger.error(f"Failed to fetch balance for user {user_id}: {e}")
                     # API 연결 실패 알림
@@ -308,9 +309,9 @@ class AlertMonitor:
                     )
                     return
 
-                # 1회 API 호출로 포지션 조회
+                # 포지션 조회 (공유 스냅샷)
                 try:
-                    positions = await client.fetch_positions()
+                    positions = await account_state_service.get_positions(user_id, client)
                 except Exception as e:
                     logger.error(f"Failed to fetch positions for user {user_id}: {e}")
                     positions = []
@@ -5,6 +5,7 @@ from sqlalchemy import select
 from ..database.models import User, BotStatus
 from ..database.db import AsyncSessionLocal
 from .alert_monitor import alert_monitor
+from .periodic_scheduler import periodic_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -41,41 +42,35 @@ class AlertScheduler:
         except Exception as e:
             logger.error(f"Failed to check alerts for user {user_id}: {e}")
 
-    async def run(self):
-        """스케줄러 실행"""
-        self.running = True
-        logger.info("Alert scheduler started")
-
-        while self.running:
-            try:
-                # 활성 사용자 조회
-                self.active_users = await self.get_active_users()
-
-                # 각 사용자에 대해 알림 체크
-                if self.active_users:
-                    tasks = [
-                        self.check_user_alerts(user_id) for user_id in self.active_users
-                    ]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                    logger.info(
-                        f"Alert checks completed for {len(self.active_users)} users"
-                    )
-
-                # 다음 체크까지 대기
-                await asyncio.sleep(self.check_interval)
-
-            except Exception as e:
-                logger.error(f"Error in alert scheduler: {e}")
-                await asyncio.sleep(self.check_interval)
+    async def run_once(self):
+        """활성 사용자 전체 알림 체크 1회 (periodic_scheduler가 check_interval마다 호출)"""
+        # 활성 사용자 조회
+        self.active_users = await self.get_active_users()
+
+        # 각 사용자에 대해 알림 체크
+        if self.active_users:
+            tasks = [
+                self.check_user_alerts(user_id) for user_id in self.active_users
+            ]
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(
+                f"Alert checks completed for {len(self.active_users)} users"
+            )
 
     async def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (periodic_scheduler에 등록)"""
         if not self.running:
-            asyncio.create_task(self.run())
+            self.running = True
+            periodic_scheduler.register(
+                "alert_checks", "all", interval=self.check_interval,
+                func=self.run_once, owner=self, first_delay=0,
+            )
+            logger.info("Alert scheduler started")
 
     async def stop(self):
         """스케줄러 중지"""
         self.running = False
+        periodic_scheduler.unregister("alert_checks", "all", owner=self)
         logger.info("Alert scheduler stopped")
 
 
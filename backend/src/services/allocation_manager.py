@@ -29,6 +29,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.models import BotInstance, Trade
+from .account_state_service import account_state_service, usdt_balance
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,7 @@ class AllocationManager:
 
     주요 기능:
     1. 봇별 할당 잔고 계산 (총잔고 * allocation_percent / 100)
-    2. 캐싱으로 API Rate Limit 방지
+    2. 계좌 상태 스냅샷 공유로 API Rate Limit 방지 (account_state_service)
     3. 락으로 동시 주문 충돌 방지
     """
 
@@ -47,15 +48,18 @@ class AllocationManager:
         # 사용자별 락 (동시 주문 방지)
         self._locks: Dict[int, asyncio.Lock] = {}  # user_id -> Lock
 
-        # 잔고 캐시
+        # 마지막으로 조회한 잔고 (API 실패 시 stale 응답용)
         self._balance_cache: Dict[int, float] = {}  # user_id -> total_balance
-        self._cache_time: Dict[int, float] = {}  # user_id -> timestamp
+
+        # 봇별 할당 비율 캐시 (주문마다 SELECT 방지)
+        self._allocation_cache: Dict[int, Tuple[Optional[float], float]] = {}  # bot_id -> (percent, timestamp)
 
         # 봇별 사용 중인 금액 추적 (열린 포지션)
         self._used_amounts: Dict[int, float] = {}  # bot_instance_id -> used_amount
 
         # 캐시 TTL (초)
-        self.CACHE_TTL = 10  # 10초 캐시
+        self.CACHE_TTL = 10  # 잔고 스냅샷 허용 나이
+        self.ALLOCATION_TTL = 30  # 할당 비율 (수정/삭제 API에서 즉시 무효화)
 
     async def get_user_lock(self, user_id: int) -> asyncio.Lock:
         """사용자별 락 반환 (없으면 생성)"""
@@ -70,35 +74,23 @@ class AllocationManager:
         force_refresh: bool = False
     ) -> float:
         """
-        사용자 총 잔고 조회 (캐싱 적용)
+        사용자 총 잔고 조회 (공유 스냅샷, 최대 CACHE_TTL초 지난 값)
 
         Args:
             user_id: 사용자 ID
             bitget_client: Bitget REST 클라이언트
-            force_refresh: 캐시 무시하고 강제 조회
+            force_refresh: 스냅샷 무시하고 강제 조회
 
         Returns:
             총 USDT 잔고
         """
-        now = time.time()
-
-        # 캐시 확인 (force_refresh가 아닌 경우)
-        if not force_refresh:
-            if user_id in self._balance_cache:
-                cache_age = now - self._cache_time.get(user_id, 0)
-                if cache_age < self.CACHE_TTL:
-                    logger.debug(f"Balance cache hit for user {user_id}")
-                    return self._balance_cache[user_id]
-
-        # API 호출
         try:
-            balance = await bitget_client.fetch_balance()
-            usdt_balance = balance.get("USDT", {})
-            total = float(usdt_balance.get("total", 0))
+            balance = await account_state_service.get_balance(
+                user_id, bitget_client, max_age=0 if force_refresh else self.CACHE_TTL
+            )
+            total = usdt_balance(balance)["total"]
 
-            # 캐시 업데이트
             self._balance_cache[user_id] = total
-            self._cache_time[user_id] = now
 
             logger.debug(f"Fetched balance for user {user_id}: {total} USDT")
             return total
@@ -136,16 +128,9 @@ class AllocationManager:
         total = await self.get_total_balance(user_id, bitget_client)
 
         # 봇의 할당 비율 조회
-        result = await session.execute(
-            select(BotInstance.allocation_percent).where(
-                and_(
-                    BotInstance.id == bot_instance_id,
-                    BotInstance.user_id == user_id,
-                    BotInstance.is_active == True
-                )
-            )
+        allocation_percent = await self._get_allocation_percent(
+            user_id, bot_instance_id, session
         )
-        allocation_percent = result.scalar()
 
         if allocation_percent is None:
             logger.warning(f"Bot instance {bot_instance_id} not found for user {user_id}")
@@ -158,6 +143,31 @@ class AllocationManager:
         )
         return allocated
 
+    async def _get_allocation_percent(
+        self, user_id: int, bot_instance_id: int, session: AsyncSession
+    ) -> Optional[float]:
+        """봇 할당 비율 (ALLOCATION_TTL 동안 캐싱, 없거나 비활성이면 None)"""
+        cached = self._allocation_cache.get(bot_instance_id)
+        if cached is not None and time.time() - cached[1] < self.ALLOCATION_TTL:
+            return cached[0]
+
+        result = await session.execute(
+            select(BotInstance.allocation_percent).where(
+                and_(
+                    BotInstance.id == bot_instance_id,
+                    BotInstance.user_id == user_id,
+                    BotInstance.is_active == True
+                )
+            )
+        )
+        allocation_percent = result.scalar()
+        self._allocation_cache[bot_instance_id] = (allocation_percent, time.time())
+        return allocation_percent
+
+    def invalidate_allocation(self, bot_instance_id: int):
+        """봇 할당 비율 캐시 무효화 (봇 수정/삭제 시)"""
+        self._allocation_cache.pop(bot_instance_id, None)
+
     async def get_available_balance(
         self,
         user_id: int,
@@ -301,6 +311,7 @@ class AllocationManager:
         if bot_instance_id in self._used_amounts:
             del self._used_amounts[bot_instance_id]
             logger.debug(f"Bot {bot_instance_id}: Usage reset")
+        self.invalidate_allocation(bot_instance_id)
 
     def invalidate_cache(self, user_id: int):
         """
@@ -311,8 +322,7 @@ class AllocationManager:
         """
         if user_id in self._balance_cache:
             del self._balance_cache[user_id]
-        if user_id in self._cache_time:
-            del self._cache_time[user_id]
+        account_state_service.invalidate(user_id, "balance")
         logger.debug(f"Balance cache invalidated for user {user_id}")
 
     async def sync_used_amounts_from_positions(
@@ -334,8 +344,10 @@ class AllocationManager:
             session: DB 세션
         """
         try:
-            # Bitget에서 포지션 조회
-            positions = await bitget_client.get_positions(product_type="USDT-FUTURES")
+            # Bitget에서 포지션 조회 (봇 시작 시점 기준이므로 새로 조회)
+            positions = await account_state_service.get_positions(
+                user_id, bitget_client, max_age=0
+            )
 
             # 봇의 심볼 조회
             result = await session.execute(
@@ -0,0 +1,272 @@
+"""
+Bitget Private 주문 스트림
+
+사용자별 Private WebSocket(v2) "orders" 채널을 구독해 주문 상태 변경을
+리스너에 전달합니다. 그리드 봇처럼 주문이 많은 봇이 주문마다 REST로
+체결 여부를 폴링하지 않도록 체결 이벤트를 푸시로 받습니다.
+
+- 같은 사용자의 여러 봇이 하나의 연결을 공유 (acquire/release 참조 카운트)
+- 연결 끊김 시 지수 백오프로 재연결
+- (재)연결 후 구독이 완료되면 on_connect 콜백 호출 → 끊긴 동안 놓친
+  체결은 리스너가 REST로 한 번 대사(reconcile)
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import websockets
+
+from .trading_state_cache import trading_state_cache
+from ..utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+OrderListener = Callable[[dict], None]
+ConnectListener = Callable[[], None]
+
+
+def normalize_symbol(symbol: str) -> str:
+    """BTC/USDT:USDT, BTC-USDT, BTCUSDT_UMCBL → BTCUSDT"""
+    symbol = symbol.split(":")[0].split("_")[0]
+    return symbol.replace("/", "").replace("-", "").upper()
+
+
+def parse_order_update(raw: dict) -> dict:
+    """
+    v2 orders 채널 메시지를 공통 형식으로 변환
+
+    Returns:
+        {"order_id", "client_order_id", "symbol", "side", "status",
+         "avg_price", "filled_qty", "leverage", "margin_mode", "updated_at"}
+        status: live / partially_filled / filled / canceled
+    """
+    return {
+        "order_id": raw.get("orderId"),
+        "client_order_id": raw.get("clientOid"),
+        "symbol": normalize_symbol(raw.get("instId", "")),
+        "side": raw.get("side"),
+        "status": raw.get("status"),
+        "avg_price": float(raw.get("priceAvg") or raw.get("fillPrice") or 0),
+        "filled_qty": float(raw.get("accBaseVolume") or 0),
+        "leverage": raw.get("leverage"),
+        "margin_mode": raw.get("marginMode"),
+        "updated_at": int(raw.get("uTime") or raw.get("cTime") or 0),
+    }
+
+
+class BitgetOrderStream:
+    """사용자별 Bitget Private 주문 스트림"""
+
+    PRIVATE_URL = "wss://ws.bitget.com/v2/ws/private"
+    PING_INTERVAL = 25.0
+    LOGIN_TIMEOUT = 10.0
+    MAX_BACKOFF = 60.0
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        passphrase: str,
+        inst_type: str = "USDT-FUTURES",
+    ):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.passphrase = passphrase
+        self.inst_type = inst_type
+
+        self._listeners: Dict[int, Tuple[OrderListener, Optional[ConnectListener]]] = {}
+        self._tokens = itertools.count(1)
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.is_connected = False
+        self.connect_count = 0
+        self.message_count = 0
+
+    # ==================== 리스너 ====================
+
+    def add_listener(
+        self, on_order: OrderListener, on_connect: Optional[ConnectListener] = None
+    ) -> int:
+        """리스너 등록 (이미 연결되어 있으면 on_connect 즉시 호출)"""
+        token = next(self._tokens)
+        self._listeners[token] = (on_order, on_connect)
+        if self.is_connected and on_connect:
+            on_connect()
+        return token
+
+    def remove_listener(self, token: int):
+        self._listeners.pop(token, None)
+
+    def _emit_order(self, order: dict):
+        for on_order, _ in list(self._listeners.values()):
+            try:
+                on_order(order)
+            except Exception as e:
+                logger.error(f"Order listener error: {e}")
+
+    def _emit_connect(self):
+        for _, on_connect in list(self._listeners.values()):
+            if on_connect is None:
+                continue
+            try:
+                on_connect()
+            except Exception as e:
+                logger.error(f"Order stream connect listener error: {e}")
+
+    # ==================== 연결 ====================
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._running = False
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.is_connected = False
+
+    def _login_message(self) -> dict:
+        timestamp = str(int(time.time()))
+        message = timestamp + "GET" + "/user/verify"
+        sign = base64.b64encode(
+            hmac.new(
+                self.api_secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
+            ).digest()
+        ).decode()
+        return {
+            "op": "login",
+            "args": [
+                {
+                    "apiKey": self.api_key,
+                    "passphrase": self.passphrase,
+                    "timestamp": timestamp,
+                    "sign": sign,
+                }
+            ],
+        }
+
+    async def _run(self):
+        """연결 유지 루프 (끊기면 백오프 후 재연결)"""
+        backoff = 1.0
+
+        while self._running:
+            try:
+                async with websockets.connect(self.PRIVATE_URL) as ws:
+                    await self._authenticate(ws)
+                    await ws.send(json.dumps({
+                        "op": "subscribe",
+                        "args": [{"instType": self.inst_type, "channel": "orders", "instId": "default"}],
+                    }))
+
+                    backoff = 1.0
+                    await self._listen(ws)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Bitget order stream disconnected: {e}")
+            finally:
+                self.is_connected = False
+
+            if self._running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+
+    async def _authenticate(self, ws):
+        await ws.send(json.dumps(self._login_message()))
+
+        deadline = time.monotonic() + self.LOGIN_TIMEOUT
+        while True:
+            raw = await asyncio.wait_for(ws.recv(), timeout=max(0.1, deadline - time.monotonic()))
+            if raw == "pong":
+                continue
+            data = fast_json.loads(raw)
+            if data.get("event") == "login":
+                if str(data.get("code")) != "0":
+                    raise ConnectionError(f"login failed: {data.get('msg')}")
+                return
+            if data.get("event") == "error":
+                raise ConnectionError(f"login error: {data.get('msg')}")
+
+    async def _listen(self, ws):
+        while self._running:
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=self.PING_INTERVAL)
+            except asyncio.TimeoutError:
+                await ws.send("ping")
+                continue
+
+            if raw == "pong":
+                continue
+            self._handle_message(fast_json.loads(raw))
+
+    def _handle_message(self, data: dict):
+        event = data.get("event")
+
+        if event == "subscribe":
+            self.is_connected = True
+            self.connect_count += 1
+            logger.info(f"Bitget order stream subscribed (connect #{self.connect_count})")
+            self._emit_connect()
+            return
+
+        if event == "error":
+            raise ConnectionError(f"order stream error: {data.get('msg')}")
+
+        if data.get("arg", {}).get("channel") != "orders":
+            return
+
+        for raw in data.get("data", []):
+            self.message_count += 1
+            self._emit_order(parse_order_update(raw))
+
+
+# user_id → (stream, 참조 수)
+_streams: Dict[int, Tuple[BitgetOrderStream, int]] = {}
+
+
+def acquire_order_stream(
+    user_id: int, api_key: str, api_secret: str, passphrase: str
+) -> BitgetOrderStream:
+    """사용자 주문 스트림 획득 (없으면 생성 후 시작)"""
+    entry = _streams.get(user_id)
+    if entry is None:
+        stream = BitgetOrderStream(api_key, api_secret, passphrase)
+        # 주문 이벤트의 레버리지/마진 모드로 주문 경로 상태 캐시 갱신
+        stream.add_listener(lambda update: trading_state_cache.apply_order_update(user_id, update))
+        refs = 0
+    else:
+        stream, refs = entry
+
+    _streams[user_id] = (stream, refs + 1)
+    stream.start()
+    return stream
+
+
+async def release_order_stream(user_id: int):
+    """사용자 주문 스트림 반환 (마지막 사용자면 연결 종료)"""
+    entry = _streams.get(user_id)
+    if entry is None:
+        return
+
+    stream, refs = entry
+    if refs > 1:
+        _streams[user_id] = (stream, refs - 1)
+        return
+
+    del _streams[user_id]
+    await stream.stop()
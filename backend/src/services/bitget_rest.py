@@ -382,6 +382,43 @@ class BitgetRestClient:
         logger.info(f"Position for {symbol}: {result}")
         return result
 
+    async def get_symbol_account(
+        self, symbol: str, margin_coin: str = "USDT"
+    ) -> Dict[str, Any]:
+        """
+        심볼별 계좌 설정 조회 (레버리지, 마진 모드, 포지션 모드)
+
+        Args:
+            symbol: 거래쌍
+            margin_coin: 마진 코인
+
+        Returns:
+            계좌 정보 (crossedMarginLeverage, isolatedLongLever, marginMode, posMode 등)
+        """
+        endpoint = "/api/v2/mix/account/account"
+        params = {
+            "symbol": symbol,
+            "productType": "USDT-FUTURES",
+            "marginCoin": margin_coin,
+        }
+
+        return await self._request("GET", endpoint, params=params)
+
+    async def get_contract_config(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        계약 정보 조회 (최소 주문 수량, 수량/가격 정밀도)
+
+        Args:
+            symbol: 거래쌍
+
+        Returns:
+            계약 정보 리스트 (minTradeNum, volumePlace, pricePlace 등)
+        """
+        endpoint = "/api/v2/mix/market/contracts"
+        params = {"productType": "USDT-FUTURES", "symbol": symbol}
+
+        return await self._request("GET", endpoint, params=params, require_auth=False)
+
     # ==================== 주문 실행 ====================
 
     async def place_order(
@@ -13,6 +13,8 @@ from typing import Optional, Callable, Dict, Any
 from datetime import datetime
 import websockets
 
+from ..utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -318,7 +320,7 @@ class BitgetWebSocket:
                     continue
 
                 try:
-                    data = json.loads(message)
+                    data = fast_json.loads(message)
                     self.last_message_time = time.time()
                     self.message_count += 1
 
@@ -356,7 +358,7 @@ class BitgetWebSocket:
                     continue
 
                 try:
-                    data = json.loads(message)
+                    data = fast_json.loads(message)
                     self.last_message_time = time.time()
                     self.message_count += 1
 
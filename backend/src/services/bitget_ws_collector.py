@@ -11,6 +11,8 @@ from typing import Optional
 
 import websockets
 
+from ..utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,7 +123,7 @@ class BitgetWebSocketCollector:
                     break
 
                 try:
-                    data = json.loads(message)
+                    data = fast_json.loads(message)
 
                     # Pong 응답
                     if data.get("event") == "ping":
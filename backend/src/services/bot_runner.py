@@ -12,6 +12,7 @@
 import asyncio
 import logging
 import json
+import time
 from collections import deque
 from datetime import datetime
 from decimal import Decimal
@@ -34,7 +35,8 @@ from ..database.models import (
     RiskSettings,
 )
 from ..services.strategy_engine import run as run_strategy
-from ..services.strategy_loader import generate_signal_with_strategy
+from ..services.strategy_executor import strategy_executor
+from ..services.ccxt_price_collector import price_collector
 from ..services.equity_service import record_equity
 from ..services.trade_executor import (
     InvalidApiKeyError,
@@ -46,6 +48,11 @@ from ..services.bitget_rest import get_bitget_rest, OrderSide
 from ..services.allocation_manager import allocation_manager  # 다중 봇 시스템 (NEW)
 from ..services.bot_isolation_manager import bot_isolation_manager  # 다중 봇 시스템 (NEW)
 from ..services.bot_recovery_manager import bot_recovery_manager  # 다중 봇 시스템 (NEW)
+from ..services.trading_state_cache import trading_state_cache
+from ..services.account_state_service import account_state_service
+from ..services.periodic_scheduler import periodic_scheduler
+from ..services.candle_warm_start import candle_warm_store, bot_start_admission
+from ..services.persistence_queue import persistence_queue
 from ..utils.crypto_secrets import decrypt_secret
 from ..websockets.ws_server import broadcast_to_user
 from ..services.telegram import (
@@ -59,8 +66,15 @@ from ..services.telegram import (
 from ..agents.signal_validator import SignalValidatorAgent, ValidationResult
 from ..agents.risk_monitor import RiskMonitorAgent, RiskLevel
 from ..agents.market_regime import MarketRegimeAgent, MarketRegime, RegimeType
+from ..agents.portfolio_optimizer import PortfolioOptimizationAgent
 from ..agents.base import AgentTask, TaskPriority, AgentState
 
+# 공유 감성 갱신 (torch/transformers 미설치 시 비활성화)
+try:
+    from ..agents.sentiment_analyzer.refresher import sentiment_refresher
+except Exception:
+    sentiment_refresher = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,7 +111,7 @@ class BotRunner:
                 "candle_limit": 200
             },
             bitget_client=None,  # 실행 시점에 설정
-            candle_cache=None,   # 실행 시점에 설정
+            candle_cache=candle_warm_store,  # 봇들과 같은 캔들 저장소 공유
             redis_client=None    # Redis 연동 시 설정 필요
         )
 
@@ -120,14 +134,23 @@ class BotRunner:
             }
         )
 
+        # Portfolio Optimizer Agent - 청산 손익/에퀴티로 봇 간 공분산 점진 갱신
+        self.portfolio_optimizer = PortfolioOptimizationAgent(
+            agent_id="portfolio_optimizer_main",
+            name="Main Portfolio Optimizer",
+            config={"enable_ai": False},
+            session_factory=None,  # 실행 시점에 설정
+        )
+
         # 최근 신호 기록 (bot_instance_id → deque of signals)
         self._recent_signals: Dict[int, deque] = {}  # 최근 10개 신호 저장
 
         # 5분 캔들 가격 기록 (symbol → deque of prices)
         self._price_history: Dict[str, deque] = {}  # 최근 6개 캔들 (30분치)
 
-        # 주기적 에이전트 태스크
-        self._periodic_tasks: Dict[str, asyncio.Task] = {}  # 백그라운드 태스크 추적
+        # RiskEngine 알림 대기열 (bot_instance_id → 처리 전 알림, 봇 루프가 다음 tick에 처리)
+        self._risk_alerts: Dict[int, deque] = {}
+        self.risk_monitor.engine.subscribe(self._on_risk_alert)
 
     async def check_daily_loss_limit(
         self, session: AsyncSession, user_id: int
@@ -217,7 +240,7 @@ class BotRunner:
 
             # 2. Bitget에서 현재 오픈 포지션 수 조회
             try:
-                positions = await bitget_client.get_positions()
+                positions = await account_state_service.get_positions(user_id, bitget_client)
                 # 실제 사이즈가 있는 포지션만 카운트
                 current_positions = len(
                     [
@@ -537,10 +560,13 @@ class BotRunner:
             except Exception as e:
                 logger.error(f"Failed to start RiskMonitor Agent: {e}")
 
-        # 주기적 에이전트 태스크 시작 (한 번만)
-        await self._start_periodic_agents(bot_instance_id, user_id)
+        # Portfolio Optimizer Agent 시작 (한 번만)
+        await self._start_portfolio_optimizer(session_factory)
 
         try:
+            # 시작 허용 대기 (재시작 폭주 시 초기화 REST 호출 분산)
+            await bot_start_admission.admit()
+
             async with session_factory() as session:
                 # 1. 봇 인스턴스 설정 로드
                 try:
@@ -561,7 +587,7 @@ class BotRunner:
                         return  # GridBotRunner가 자체 루프 관리
                 except Exception as e:
                     logger.error(f"Failed to load bot instance {bot_instance_id}: {e}", exc_info=True)
-                    await self._update_bot_instance_error(session, bot_instance_id, str(e))
+                    await self._update_bot_instance_error(bot_instance_id, str(e))
                     return
 
                 # 2. 전략 로드 (AI 봇인 경우)
@@ -572,7 +598,7 @@ class BotRunner:
                         logger.info(f"Loaded strategy '{strategy.name}' for bot instance {bot_instance_id}")
                     except Exception as e:
                         logger.error(f"Failed to load strategy for bot instance {bot_instance_id}: {e}")
-                        await self._update_bot_instance_error(session, bot_instance_id, f"STRATEGY_LOAD_ERROR: {e}")
+                        await self._update_bot_instance_error(bot_instance_id, f"STRATEGY_LOAD_ERROR: {e}")
                         return
 
                 # 3. Bitget API 클라이언트 초기화
@@ -581,11 +607,11 @@ class BotRunner:
                     logger.info(f"Bitget API client initialized for bot instance {bot_instance_id}")
                 except InvalidApiKeyError as e:
                     logger.error(f"Invalid API key for user {user_id}: {e}")
-                    await self._update_bot_instance_error(session, bot_instance_id, "INVALID_API_KEY")
+                    await self._update_bot_instance_error(bot_instance_id, "INVALID_API_KEY")
                     return
                 except Exception as e:
                     logger.error(f"Failed to initialize Bitget client: {e}", exc_info=True)
-                    await self._update_bot_instance_error(session, bot_instance_id, f"CLIENT_INIT_ERROR: {e}")
+                    await self._update_bot_instance_error(bot_instance_id, f"CLIENT_INIT_ERROR: {e}")
                     return
 
                 # 4. AllocationManager에서 포지션 동기화
@@ -593,23 +619,30 @@ class BotRunner:
                     user_id, bot_instance_id, bitget_client, session
                 )
 
+                # 4.1. 주문 경로 상태 (레버리지/마진 모드/계약 정보) 미리 로드
+                await trading_state_cache.warm_up(bitget_client, user_id, bot_instance.symbol)
+
                 # 4.5. MarketRegimeAgent에 Bitget 클라이언트 설정 (캔들 데이터 조회용)
                 if self.market_regime.bitget_client is None:
                     self.market_regime.bitget_client = bitget_client
                     self.market_regime.symbol = bot_instance.symbol
+                    candle_warm_store.client = candle_warm_store.client or bitget_client
                     logger.info(f"✅ MarketRegimeAgent: Bitget client connected for {bot_instance.symbol}")
 
                 # 5. 캔들 버퍼 초기화
                 candle_buffer = deque(maxlen=200)
                 symbol = bot_instance.symbol  # 예: "BTCUSDT"
+                price_collector.add_symbol(symbol, owner=bot_instance_id)
+                timeframe = "5m"
 
                 try:
                     # 전략 파라미터에서 타임프레임 가져오기
                     strategy_params = json.loads(strategy.params) if strategy and strategy.params else {}
                     timeframe = strategy_params.get("timeframe", "5m")
 
-                    historical = await bitget_client.get_historical_candles(
-                        symbol=symbol, interval=timeframe, limit=200
+                    # 공유 저장소에서 조회 (로컬 웜스타트 + 키당 한 번 보충)
+                    historical = await candle_warm_store.get_candles(
+                        symbol, timeframe, limit=200, client=bitget_client
                     )
                     for candle in historical:
                         candle_buffer.append({
@@ -624,10 +657,15 @@ class BotRunner:
                 except Exception as e:
                     logger.warning(f"Failed to load historical candles for bot {bot_instance_id}: {e}")
 
+                # 5.5. 주기적 에이전트 작업 등록 (심볼/사용자 단위로 합쳐짐)
+                await self._start_periodic_agents(bot_instance_id, user_id, symbol, timeframe)
+
                 # 6. 기존 포지션 동기화 (봇 시작 시 Bitget에서 조회)
                 current_position = None
                 try:
-                    positions = await bitget_client.get_positions()
+                    positions = await account_state_service.get_positions(
+                        user_id, bitget_client
+                    )
                     for pos in positions:
                         pos_symbol = pos.get("symbol", "").replace("/", "").replace("-", "").upper()
                         if pos_symbol == symbol.replace("/", "").replace("-", "").upper():
@@ -709,89 +747,59 @@ class BotRunner:
                         candles = list(candle_buffer)
 
                         # === Risk Monitor (Day 4) - 포지션 보유 시 실시간 리스크 체크 ===
-                        if current_position:
-                            try:
-                                # 현재 포지션 데이터 구성
-                                entry_price = current_position.get("entry_price", price)
-                                position_size = current_position.get("size", 0)
-                                position_side = current_position.get("side", "long")
-
-                                # PnL 계산
-                                if position_side == "long":
-                                    unrealized_pnl = (price - entry_price) * position_size
-                                    unrealized_pnl_percent = ((price - entry_price) / entry_price) * 100 if entry_price > 0 else 0.0
-                                else:  # short
-                                    unrealized_pnl = (entry_price - price) * position_size
-                                    unrealized_pnl_percent = ((entry_price - price) / entry_price) * 100 if entry_price > 0 else 0.0
-
-                                # 청산가 계산 (간단한 추정)
-                                leverage = bot_instance.max_leverage
-                                if position_side == "long":
-                                    liquidation_price = entry_price * (1 - 0.9 / leverage)
-                                else:
-                                    liquidation_price = entry_price * (1 + 0.9 / leverage)
-
-                                distance_to_liquidation = abs((price - liquidation_price) / price) * 100
-
-                                # RiskMonitor에 포지션 제출
-                                risk_task = AgentTask(
-                                    task_id=f"risk_{bot_instance_id}_{datetime.utcnow().timestamp()}",
-                                    task_type="monitor_position",
-                                    priority=TaskPriority.HIGH,
-                                    params={
-                                        "position": {
-                                            "symbol": symbol,
-                                            "side": position_side,
-                                            "size": position_size,
-                                            "entry_price": entry_price,
-                                            "current_price": price,
-                                            "unrealized_pnl": unrealized_pnl,
-                                            "unrealized_pnl_percent": unrealized_pnl_percent,
-                                            "leverage": leverage,
-                                            "liquidation_price": liquidation_price,
-                                            "distance_to_liquidation": distance_to_liquidation
-                                        },
-                                        "bitget_client": bitget_client,
-                                        "auto_execute": True  # 자동 조치 활성화
-                                    },
-                                    timeout=1.0
+                        # RiskEngine이 이 심볼의 모든 봇 포지션을 tick 한 번에 평가하고,
+                        # 새 알림은 _on_risk_alert로 봇별 대기열에 쌓임
+                        try:
+                            risk_engine = self.risk_monitor.engine
+                            if current_position:
+                                risk_engine.upsert(
+                                    bot_instance_id, symbol,
+                                    side=current_position.get("side", "long"),
+                                    size=current_position.get("size", 0),
+                                    entry_price=current_position.get("entry_price", price),
+                                    leverage=bot_instance.max_leverage,
+                                    liquidation_price=current_position.get("liquidation_price"),
                                 )
+                            else:
+                                risk_engine.remove(bot_instance_id)
+                            risk_engine.on_price(symbol, price)
 
-                                await self.risk_monitor.submit_task(risk_task)
-                                await asyncio.sleep(0.05)  # 처리 대기
-
-                                # 리스크 알림 확인
-                                risk_alerts = risk_task.result
-                                if risk_alerts:
-                                    for alert in risk_alerts:
-                                        if alert.is_critical():
-                                            logger.error(
-                                                f"🚨 CRITICAL RISK: {alert.message}\n"
-                                                f"  Position: {symbol} {position_side}\n"
-                                                f"  Action: {alert.recommended_action.value}"
-                                            )
-                                            # 치명적 리스크 시 포지션 강제 청산
-                                            if alert.recommended_action.value in {"close_position", "emergency_shutdown"}:
-                                                logger.warning(f"🛑 Force closing position due to critical risk")
-                                                await self._close_instance_position(
-                                                    session, bitget_client, bot_instance, user_id,
-                                                    current_position, price, f"Risk alert: {alert.message}"
-                                                )
-                                                current_position = None
-                                                continue
-                                        else:
-                                            logger.warning(
-                                                f"⚠️ Risk Alert: {alert.message} "
-                                                f"(Action: {alert.recommended_action.value})"
+                            # 리스크 알림 확인
+                            risk_alerts = self._risk_alerts.pop(bot_instance_id, None)
+                            if risk_alerts and current_position:
+                                position_side = current_position.get("side", "long")
+                                for alert in risk_alerts:
+                                    if alert.is_critical():
+                                        logger.error(
+                                            f"🚨 CRITICAL RISK: {alert.message}\n"
+                                            f"  Position: {symbol} {position_side}\n"
+                                            f"  Action: {alert.recommended_action.value}"
+                                        )
+                                        # 치명적 리스크 시 포지션 강제 청산
+                                        if alert.recommended_action.value in {"close_position", "emergency_shutdown"}:
+                                            logger.warning(f"🛑 Force closing position due to critical risk")
+                                            await self._close_instance_position(
+                                                session, bitget_client, bot_instance, user_id,
+                                                current_position, price, f"Risk alert: {alert.message}"
                                             )
+                                            current_position = None
+                                            risk_engine.remove(bot_instance_id)
+                                            break
+                                    else:
+                                        logger.warning(
+                                            f"⚠️ Risk Alert: {alert.message} "
+                                            f"(Action: {alert.recommended_action.value})"
+                                        )
 
-                            except Exception as e:
-                                logger.error(f"Risk monitoring error: {e}")
+                        except Exception as e:
+                            logger.error(f"Risk monitoring error: {e}")
 
                         # 전략 실행
                         if strategy:
                             try:
-                                signal_result = generate_signal_with_strategy(
+                                signal_result = await strategy_executor.generate_signal(
+                                    pin=user_id,
+                                    task_key=f"bot:{bot_instance_id}",
                                     strategy_code=strategy.code,
                                     current_price=price,
                                     candles=candles,
@@ -815,6 +823,9 @@ class BotRunner:
                             signal_confidence = 0
                             signal_reason = "No strategy"
 
+                        # 신호 → 주문 ACK 지연 측정 기준
+                        signal_at = time.monotonic()
+
                         # === Signal Validator (Day 3) ===
                         if signal_action in {"buy", "sell", "close"} and signal_action != "hold":
                             # 1. 가격 변동률 계산 (최근 5분)
@@ -947,7 +958,8 @@ class BotRunner:
                         if signal_action == "close" and current_position:
                             await self._close_instance_position(
                                 session, bitget_client, bot_instance, user_id,
-                                current_position, price, signal_reason
+                                current_position, price, signal_reason,
+                                signal_at=signal_at,
                             )
                             current_position = None
 
@@ -973,7 +985,7 @@ class BotRunner:
                                 "BNBUSDT": 0.01,
                                 "ADAUSDT": 10.0,
                             }
-                            min_size = min_sizes.get(symbol, 0.1)
+                            min_size = trading_state_cache.min_size(user_id, symbol) or min_sizes.get(symbol, 0.1)
                             if add_size < min_size:
                                 add_size = min_size
 
@@ -991,11 +1003,14 @@ class BotRunner:
                                 continue
 
                             try:
-                                await bitget_client.set_leverage(
-                                    symbol=symbol, leverage=leverage, margin_coin="USDT"
+                                await trading_state_cache.ensure_leverage(
+                                    bitget_client, user_id, symbol, leverage
                                 )
                                 order_side = OrderSide.BUY if signal_action == "buy" else OrderSide.SELL
-                                await bitget_client.place_market_order(
+                                await self._place_market_order_timed(
+                                    bitget_client,
+                                    user_id,
+                                    signal_at,
                                     symbol=symbol,
                                     side=order_side,
                                     size=add_size,
@@ -1026,14 +1041,14 @@ class BotRunner:
                                 )
 
                                 if current_position.get("trade_id"):
-                                    result = await session.execute(
-                                        select(Trade).where(Trade.id == current_position["trade_id"])
+                                    await self._update_trade_durable(
+                                        current_position["trade_id"],
+                                        {
+                                            "qty": new_size,
+                                            "entry_price": Decimal(str(current_position.get("entry_price", price))),
+                                        },
+                                        "DCA",
                                     )
-                                    trade = result.scalar_one_or_none()
-                                    if trade:
-                                        trade.qty = Decimal(str(new_size))
-                                        trade.entry_price = Decimal(str(current_position.get("entry_price", price)))
-                                        await session.commit()
 
                             except Exception:
                                 allocation_manager.release_order_amount(bot_instance_id, add_position_value)
@@ -1072,7 +1087,7 @@ class BotRunner:
                                 "BNBUSDT": 0.01,
                                 "ADAUSDT": 10.0,
                             }
-                            min_size = min_sizes.get(symbol, 0.1)
+                            min_size = trading_state_cache.min_size(user_id, symbol) or min_sizes.get(symbol, 0.1)
                             if signal_size < min_size:
                                 signal_size = min_size
 
@@ -1085,14 +1100,17 @@ class BotRunner:
                                 continue
 
                             try:
-                                # 레버리지 설정
-                                await bitget_client.set_leverage(
-                                    symbol=symbol, leverage=leverage, margin_coin="USDT"
+                                # 레버리지 설정 (캐시된 값과 다를 때만 호출)
+                                await trading_state_cache.ensure_leverage(
+                                    bitget_client, user_id, symbol, leverage
                                 )
 
                                 # 주문 실행
                                 order_side = OrderSide.BUY if signal_action == "buy" else OrderSide.SELL
-                                order_result = await bitget_client.place_market_order(
+                                order_result = await self._place_market_order_timed(
+                                    bitget_client,
+                                    user_id,
+                                    signal_at,
                                     symbol=symbol,
                                     side=order_side,
                                     size=signal_size,
@@ -1109,7 +1127,7 @@ class BotRunner:
 
                                 # 거래 기록 (bot_instance_id 포함)
                                 trade_id = await self._record_instance_entry_trade(
-                                    session, user_id, bot_instance_id, symbol,
+                                    user_id, bot_instance_id, symbol,
                                     signal_action, price, signal_size, leverage,
                                     bot_instance.strategy_id
                                 )
@@ -1160,7 +1178,7 @@ class BotRunner:
 
                         if not should_retry or consecutive_errors >= max_consecutive_errors:
                             logger.critical(f"Bot {bot_instance_id} stopping: {error_msg}")
-                            await self._update_bot_instance_error(session, bot_instance_id, error_msg)
+                            await self._update_bot_instance_error(bot_instance_id, error_msg)
                             break
 
                         # 에러 유형에 따른 대기 시간
@@ -1173,8 +1191,7 @@ class BotRunner:
             # 복구 매니저 상태 정리
             bot_recovery_manager.cancel_recovery(bot_instance_id)
             try:
-                async with session_factory() as cleanup_session:
-                    await self._update_bot_instance_stopped(cleanup_session, bot_instance_id)
+                await self._update_bot_instance_stopped(bot_instance_id)
             except Exception as e:
                 logger.error(f"Failed to update bot instance status: {e}")
             raise
@@ -1202,6 +1219,14 @@ class BotRunner:
             # AllocationManager 사용량 리셋
             allocation_manager.reset_bot_usage(bot_instance_id)
 
+            # 주기 작업 소유 해제 (마지막 봇이면 작업 취소)
+            periodic_scheduler.unregister_owner(bot_instance_id)
+            price_collector.remove_owner(bot_instance_id)
+
+            # 리스크 엔진에서 포지션 제거
+            self.risk_monitor.engine.remove(bot_instance_id)
+            self._risk_alerts.pop(bot_instance_id, None)
+
             # BotIsolationManager 캐시 정리
             bot_isolation_manager.clear_bot_cache(bot_instance_id, user_id)
 
@@ -1300,44 +1325,26 @@ class BotRunner:
 
     async def _update_bot_instance_error(
         self,
-        session: AsyncSession,
         bot_instance_id: int,
         error_msg: str
     ):
         """봇 인스턴스 에러 상태 업데이트"""
-        try:
-            result = await session.execute(
-                select(BotInstance).where(BotInstance.id == bot_instance_id)
-            )
-            bot = result.scalar_one_or_none()
-            if bot:
-                bot.last_error = error_msg[:500]  # 최대 500자
-                bot.is_running = False
-                await session.commit()
-        except Exception as e:
-            logger.error(f"Failed to update bot instance error: {e}")
+        persistence_queue.update(
+            BotInstance,
+            bot_instance_id,
+            values={"last_error": error_msg[:500], "is_running": False},  # 최대 500자
+        )
 
-    async def _update_bot_instance_stopped(
-        self,
-        session: AsyncSession,
-        bot_instance_id: int
-    ):
+    async def _update_bot_instance_stopped(self, bot_instance_id: int):
         """봇 인스턴스 정지 상태 업데이트"""
-        try:
-            result = await session.execute(
-                select(BotInstance).where(BotInstance.id == bot_instance_id)
-            )
-            bot = result.scalar_one_or_none()
-            if bot:
-                bot.is_running = False
-                bot.last_stopped_at = datetime.utcnow()
-                await session.commit()
-        except Exception as e:
-            logger.error(f"Failed to update bot instance stopped status: {e}")
+        persistence_queue.update(
+            BotInstance,
+            bot_instance_id,
+            values={"is_running": False, "last_stopped_at": datetime.utcnow()},
+        )
 
     async def _record_instance_entry_trade(
         self,
-        session: AsyncSession,
         user_id: int,
         bot_instance_id: int,
         symbol: str,
@@ -1350,33 +1357,35 @@ class BotRunner:
         """
         봇 인스턴스 진입 거래 기록 (다중 봇 시스템)
 
+        주문 체결 직후 호출되며 커밋이 끝난 뒤 반환합니다 (다른 봇의 쓰기와 묶어서 기록).
+
         Returns:
             trade_id: 생성된 거래 ID
         """
-        trade = Trade(
-            user_id=user_id,
-            bot_instance_id=bot_instance_id,  # 다중 봇 시스템 (NEW)
-            trade_source=TradeSource.bot_instance,  # 다중 봇 시스템 (NEW)
-            symbol=symbol,
-            side=side.upper(),
-            qty=Decimal(str(qty)),
-            entry_price=Decimal(str(entry_price)),
-            exit_price=None,
-            pnl=None,
-            pnl_percent=None,
-            strategy_id=strategy_id,
-            leverage=leverage,
-            exit_reason=None,
+        trade_id = await persistence_queue.write(
+            Trade,
+            {
+                "user_id": user_id,
+                "bot_instance_id": bot_instance_id,  # 다중 봇 시스템 (NEW)
+                "trade_source": TradeSource.bot_instance,  # 다중 봇 시스템 (NEW)
+                "symbol": symbol,
+                "side": side.upper(),
+                "qty": qty,
+                "entry_price": Decimal(str(entry_price)),
+                "exit_price": None,
+                "pnl": None,
+                "pnl_percent": None,
+                "strategy_id": strategy_id,
+                "leverage": leverage,
+                "exit_reason": None,
+            },
         )
-        session.add(trade)
-        await session.commit()
-        await session.refresh(trade)
 
         logger.info(
-            f"📝 Bot {bot_instance_id} trade entry: ID={trade.id}, {symbol} {side.upper()} "
+            f"📝 Bot {bot_instance_id} trade entry: ID={trade_id}, {symbol} {side.upper()} "
             f"@ ${entry_price:.2f}, qty={qty}, leverage={leverage}x"
         )
-        return trade.id
+        return trade_id
 
     async def _close_instance_position(
         self,
@@ -1386,13 +1395,17 @@ class BotRunner:
         user_id: int,
         position: dict,
         exit_price: float,
-        reason: str
+        reason: str,
+        signal_at: Optional[float] = None,
     ):
-        """봇 인스턴스 포지션 청산"""
+        """봇 인스턴스 포지션 청산 (signal_at: 신호 시각, 지연 시간 기록용)"""
         try:
             close_side = OrderSide.SELL if position["side"] == "long" else OrderSide.BUY
 
-            await bitget_client.place_market_order(
+            await self._place_market_order_timed(
+                bitget_client,
+                user_id,
+                signal_at,
                 symbol=position["symbol"],
                 side=close_side,
                 size=position["size"],
@@ -1416,8 +1429,8 @@ class BotRunner:
             if position.get("trade_id"):
                 exit_tag = self._generate_exit_tag(reason, pnl_percent)
                 await self._update_trade_exit(
-                    session, position["trade_id"], exit_price, pnl_usdt, pnl_percent, reason,
-                    exit_tag=exit_tag
+                    position["trade_id"], exit_price, pnl_usdt, pnl_percent, reason,
+                    exit_tag=exit_tag, user_id=user_id, bot_instance_id=bot_instance.id,
                 )
 
             # BotInstance 통계 업데이트
@@ -1447,6 +1460,23 @@ class BotRunner:
         except Exception as e:
             logger.error(f"Failed to close position for bot {bot_instance.id}: {e}", exc_info=True)
 
+    async def _place_market_order_timed(
+        self, bitget_client, user_id: int, signal_at: Optional[float], **order_kwargs
+    ):
+        """시장가 주문 + 신호 → 주문 ACK 지연 시간 기록 (계좌 스냅샷 무효화)"""
+        sent_at = time.monotonic()
+        try:
+            result = await bitget_client.place_market_order(**order_kwargs)
+        finally:
+            account_state_service.invalidate(user_id)
+        acked_at = time.monotonic()
+
+        if signal_at is not None:
+            trading_state_cache.record_order_latency(
+                order_kwargs["symbol"], acked_at - signal_at, acked_at - sent_at
+            )
+        return result
+
     async def _update_bot_instance_stats(
         self,
         session: AsyncSession,
@@ -1454,21 +1484,17 @@ class BotRunner:
         pnl: float,
         is_win: bool
     ):
-        """봇 인스턴스 통계 업데이트"""
-        try:
-            result = await session.execute(
-                select(BotInstance).where(BotInstance.id == bot_instance_id)
-            )
-            bot = result.scalar_one_or_none()
-            if bot:
-                bot.total_trades += 1
-                if is_win:
-                    bot.winning_trades += 1
-                bot.total_pnl = float(bot.total_pnl or 0) + pnl
-                bot.last_trade_at = datetime.utcnow()
-                await session.commit()
-        except Exception as e:
-            logger.error(f"Failed to update bot instance stats: {e}")
+        """봇 인스턴스 통계 업데이트 (증가분으로 기록, 같은 봇의 연속 청산은 합쳐짐)"""
+        persistence_queue.update(
+            BotInstance,
+            bot_instance_id,
+            values={"last_trade_at": datetime.utcnow()},
+            increments={
+                "total_trades": 1,
+                "winning_trades": 1 if is_win else 0,
+                "total_pnl": pnl,
+            },
+        )
 
     async def _send_instance_trade_notification(
         self,
@@ -1572,19 +1598,18 @@ class BotRunner:
                 except Exception as e:
                     logger.error(f"❌ Failed to start RiskMonitor Agent: {e}", exc_info=True)
 
-            # 주기적 에이전트 태스크 시작 (한 번만)
-            # Note: Legacy bot은 user_id를 bot_instance_id로 사용
-            pseudo_bot_id = user_id * 1000  # user 1 -> 1000, user 2 -> 2000
-            try:
-                await self._start_periodic_agents(pseudo_bot_id, user_id)
-            except Exception as e:
-                logger.error(f"❌ Failed to start periodic agents: {e}", exc_info=True)
+            # Portfolio Optimizer Agent 시작
+            await self._start_portfolio_optimizer(session_factory)
+
 
         except Exception as e:
             logger.error(f"❌ Critical error in agent startup section: {e}", exc_info=True)
             # Continue with bot loop even if agents fail to start
 
         try:
+            # 시작 허용 대기 (재시작 폭주 시 초기화 REST 호출 분산)
+            await bot_start_admission.admit()
+
             async with session_factory() as session:
                 # 1. 전략 로드
                 try:
@@ -1670,20 +1695,33 @@ class BotRunner:
                     "/", ""
                 )  # "ETHUSDT"
                 timeframe = strategy_params.get("timeframe", "5m")
+                price_collector.add_symbol(symbol, owner=user_id * 1000)  # legacy pseudo_bot_id
 
                 if self.market_regime.bitget_client is None:
                     self.market_regime.bitget_client = bitget_client
                     self.market_regime.symbol = symbol
                     self.market_regime.timeframe = timeframe
+                    candle_warm_store.client = candle_warm_store.client or bitget_client
                     logger.info(f"✅ MarketRegimeAgent: Bitget client connected for {symbol} (legacy)")
 
+                # 2.55. 주기적 에이전트 작업 등록
+                # Note: Legacy bot은 user_id를 bot_instance_id로 사용
+                pseudo_bot_id = user_id * 1000  # user 1 -> 1000, user 2 -> 2000
+                try:
+                    await self._start_periodic_agents(pseudo_bot_id, user_id, symbol, timeframe)
+                except Exception as e:
+                    logger.error(f"❌ Failed to start periodic agents: {e}", exc_info=True)
+
+                # 2.6. 주문 경로 상태 (레버리지/마진 모드/계약 정보) 미리 로드
+                await trading_state_cache.warm_up(bitget_client, user_id, symbol)
+
                 # 3. 과거 캔들 데이터 로드 (CRITICAL: 전략 정확도 향상)
                 candle_buffer = deque(maxlen=200)
 
                 try:
-                    # Bitget API에서 과거 200개 캔들 가져오기
-                    historical = await bitget_client.get_historical_candles(
-                        symbol=symbol, interval=timeframe, limit=200
+                    # 과거 200개 캔들 (공유 저장소: 로컬 웜스타트 + 키당 한 번 보충)
+                    historical = await candle_warm_store.get_candles(
+                        symbol, timeframe, limit=200, client=bitget_client
                     )
 
                     # 캔들 버퍼에 추가
@@ -1714,7 +1752,9 @@ class BotRunner:
                 # 4. 기존 포지션 동기화 (봇 시작 시 Bitget에서 조회)
                 current_position = None
                 try:
-                    positions = await bitget_client.get_positions()
+                    positions = await account_state_service.get_positions(
+                        user_id, bitget_client
+                    )
                     for pos in positions:
                         pos_symbol = pos.get("symbol", "").replace("/", "").replace("-", "").upper()
                         if pos_symbol == symbol.replace("/", "").replace("-", "").upper():
@@ -1835,7 +1875,9 @@ class BotRunner:
                         # 새로운 전략 로더 사용 (포지션 정보 포함)
                         try:
                             # 실제 모드: 현재 포지션 상태를 전략에 전달
-                            signal_result = generate_signal_with_strategy(
+                            signal_result = await strategy_executor.generate_signal(
+                                pin=user_id,
+                                task_key=f"user:{user_id}",
                                 strategy_code=strategy.code,
                                 current_price=price,
                                 candles=candles,
@@ -1900,7 +1942,7 @@ class BotRunner:
                                             "BNBUSDT": 0.01,
                                             "ADAUSDT": 10.0,
                                         }
-                                        min_size = min_sizes.get(symbol, 0.1)
+                                        min_size = trading_state_cache.min_size(user_id, symbol) or min_sizes.get(symbol, 0.1)
                                         if signal_size < min_size:
                                             logger.warning(
                                                 f"⚠️ Calculated size {signal_size:.6f} too small, using minimum {min_size}"
@@ -1949,6 +1991,9 @@ class BotRunner:
                             signal_action = "hold"
                             signal_size = 0.01  # Bitget minimum: 0.01 BTC
 
+                        # 신호 → 주문 ACK 지연 측정 기준
+                        signal_at = time.monotonic()
+
                         # 포지션 청산 처리
                         if signal_action == "close" and current_position:
                             try:
@@ -1962,7 +2007,10 @@ class BotRunner:
                                     f"Closing position for user {user_id}: {current_position['side']}"
                                 )
 
-                                order_result = await bitget_client.place_market_order(
+                                order_result = await self._place_market_order_timed(
+                                    bitget_client,
+                                    user_id,
+                                    signal_at,
                                     symbol=symbol,
                                     side=close_side,
                                     size=current_position["size"],
@@ -1996,7 +2044,6 @@ class BotRunner:
                                     # exit_tag 생성 (청산 사유 기반)
                                     exit_tag = self._generate_exit_tag(signal_reason, pnl_percent)
                                     await self._update_trade_exit(
-                                        session,
                                         trade_id,
                                         exit_price,
                                         pnl_usdt,
@@ -2118,18 +2165,19 @@ class BotRunner:
                                 "BNBUSDT": 0.01,
                                 "ADAUSDT": 10.0,
                             }
-                            min_size = min_sizes.get(symbol, 0.1)
+                            min_size = trading_state_cache.min_size(user_id, symbol) or min_sizes.get(symbol, 0.1)
                             if add_size < min_size:
                                 add_size = min_size
 
                             try:
-                                await bitget_client.set_leverage(
-                                    symbol=symbol,
-                                    leverage=leverage,
-                                    margin_coin="USDT",
+                                await trading_state_cache.ensure_leverage(
+                                    bitget_client, user_id, symbol, leverage
                                 )
                                 order_side = OrderSide.BUY if signal_action == "buy" else OrderSide.SELL
-                                await bitget_client.place_market_order(
+                                await self._place_market_order_timed(
+                                    bitget_client,
+                                    user_id,
+                                    signal_at,
                                     symbol=symbol,
                                     side=order_side,
                                     size=add_size,
@@ -2148,14 +2196,14 @@ class BotRunner:
                                 current_position["size"] = new_size
 
                                 if current_position.get("trade_id"):
-                                    result = await session.execute(
-                                        select(Trade).where(Trade.id == current_position["trade_id"])
+                                    await self._update_trade_durable(
+                                        current_position["trade_id"],
+                                        {
+                                            "qty": new_size,
+                                            "entry_price": Decimal(str(current_position.get("entry_price", price))),
+                                        },
+                                        "DCA",
                                     )
-                                    trade = result.scalar_one_or_none()
-                                    if trade:
-                                        trade.qty = Decimal(str(new_size))
-                                        trade.entry_price = Decimal(str(current_position.get("entry_price", price)))
-                                        await session.commit()
 
                             except Exception:
                                 continue
@@ -2301,21 +2349,22 @@ class BotRunner:
                                     f"Executing {signal_action} order for user {user_id} at {price} (size: {signal_size}, confidence: {signal_confidence:.2f})"
                                 )
 
-                                # 주문 전에 레버리지 설정 (Bitget 요구사항)
+                                # 주문 전에 레버리지 설정 (Bitget 요구사항, 캐시된 값과 다를 때만 호출)
                                 try:
-                                    await bitget_client.set_leverage(
-                                        symbol=symbol,
-                                        leverage=allowed_leverage,
-                                        margin_coin="USDT",
-                                    )
-                                    logger.info(
-                                        f"Leverage set to {allowed_leverage}x for {symbol}"
-                                    )
+                                    if await trading_state_cache.ensure_leverage(
+                                        bitget_client, user_id, symbol, allowed_leverage
+                                    ):
+                                        logger.info(
+                                            f"Leverage set to {allowed_leverage}x for {symbol}"
+                                        )
                                 except Exception as lev_err:
                                     logger.warning(f"Failed to set leverage: {lev_err}")
 
                                 # Bitget 시장가 주문 실행
-                                order_result = await bitget_client.place_market_order(
+                                order_result = await self._place_market_order_timed(
+                                    bitget_client,
+                                    user_id,
+                                    signal_at,
                                     symbol=symbol,
                                     side=order_side,
                                     size=signal_size,  # 전략에서 제공한 수량 사용
@@ -2413,6 +2462,9 @@ class BotRunner:
                         # 자산 기록 (에러 격리)
                         try:
                             await record_equity(session, user_id, value=price)
+                            await self._submit_portfolio_event(
+                                "record_equity", {"user_id": user_id, "value": price}
+                            )
                         except Exception as e:
                             logger.error(
                                 f"Failed to record equity for user {user_id}: {e}"
@@ -2505,6 +2557,8 @@ class BotRunner:
             )
             if user_id in self.tasks:
                 del self.tasks[user_id]
+            periodic_scheduler.unregister_owner(user_id * 1000)  # legacy pseudo_bot_id
+            price_collector.remove_owner(user_id * 1000)
             # 주의: DB 상태는 여기서 업데이트하지 않음!
             # - 사용자가 stop_bot 호출 시: CancelledError 핸들러에서 DB 업데이트
             # - 에러로 종료 시: DB는 is_running=True 유지하여 새로고침 시 자동 재시작
@@ -2554,73 +2608,117 @@ class BotRunner:
             order_tag: 주문 태그 (예: "main_entry", "dca_1")
 
         Returns:
-            trade_id: 생성된 거래 ID (청산 시 업데이트용)
+            trade_id: 생성된 거래 ID (청산 시 업데이트용, 커밋 후 반환)
         """
-        trade = Trade(
-            user_id=user_id,
-            symbol=symbol,
-            side=side.upper(),
-            qty=Decimal(str(qty)),
-            entry_price=Decimal(str(entry_price)),
-            exit_price=None,  # 아직 청산 안됨
-            pnl=None,  # 아직 계산 안됨
-            pnl_percent=None,
-            strategy_id=strategy_id,
-            leverage=leverage,
-            exit_reason=None,  # 아직 청산 안됨
-            enter_tag=enter_tag,  # 시그널 태그 (차트 마커용)
-            order_tag=order_tag,  # 주문 태그
+        trade_id = await persistence_queue.write(
+            Trade,
+            {
+                "user_id": user_id,
+                "symbol": symbol,
+                "side": side.upper(),
+                "qty": qty,
+                "entry_price": Decimal(str(entry_price)),
+                "exit_price": None,  # 아직 청산 안됨
+                "pnl": None,  # 아직 계산 안됨
+                "pnl_percent": None,
+                "strategy_id": strategy_id,
+                "leverage": leverage,
+                "exit_reason": None,  # 아직 청산 안됨
+                "enter_tag": enter_tag,  # 시그널 태그 (차트 마커용)
+                "order_tag": order_tag,  # 주문 태그
+            },
         )
-        session.add(trade)
-        await session.commit()
-        await session.refresh(trade)
 
         logger.info(
-            f"📝 Trade entry recorded: ID={trade.id}, {symbol} {side.upper()} "
+            f"📝 Trade entry recorded: ID={trade_id}, {symbol} {side.upper()} "
             f"@ ${entry_price:.2f}, qty={qty}, leverage={leverage}x, tag={enter_tag}"
         )
-        return trade.id
+        return trade_id
 
     async def _update_trade_exit(
         self,
-        session: AsyncSession,
         trade_id: int,
         exit_price: float,
         pnl: float,
         pnl_percent: float,
         exit_reason: str,
         exit_tag: str | None = None,
-    ):
+        user_id: Optional[int] = None,
+        bot_instance_id: Optional[int] = None,
+    ) -> bool:
         """
-        청산 시 거래 기록 업데이트
+        청산 시 거래 기록 업데이트 (커밋까지 대기)
 
         Args:
             exit_tag: 청산 시그널 태그 (예: "tp_hit", "sl_triggered", "signal_reverse")
+            user_id, bot_instance_id: 봇 인스턴스 거래면 포트폴리오 공분산에 청산 손익 반영
+
+        Returns:
+            기록 성공 여부 (실패 시 CRITICAL 로그로 청산 값을 남김)
         """
-        try:
-            result = await session.execute(
-                select(Trade).where(Trade.id == trade_id)
+        recorded = await self._update_trade_durable(
+            trade_id,
+            {
+                "exit_price": Decimal(str(exit_price)),
+                "pnl": Decimal(str(round(pnl, 8))),
+                "pnl_percent": round(pnl_percent, 2),
+                # exit_reason은 반드시 ExitReason enum으로 변환
+                "exit_reason": self._map_to_exit_reason(exit_reason, pnl_percent),
+                "exit_tag": exit_tag,  # 청산 시그널 태그 (차트 마커용)
+            },
+            "exit",
+        )
+        if not recorded:
+            return False
+
+        if bot_instance_id is not None:
+            await self._submit_portfolio_event(
+                "record_trade",
+                {"user_id": user_id, "bot_instance_id": bot_instance_id, "pnl": pnl},
             )
-            trade = result.scalars().first()
 
-            if trade:
-                trade.exit_price = Decimal(str(exit_price))
-                trade.pnl = Decimal(str(round(pnl, 8)))
-                trade.pnl_percent = round(pnl_percent, 2)
-                # exit_reason은 반드시 ExitReason enum으로 변환
-                trade.exit_reason = self._map_to_exit_reason(exit_reason, pnl_percent)
-                trade.exit_tag = exit_tag  # 청산 시그널 태그 (차트 마커용)
-                await session.commit()
+        logger.info(
+            f"📝 Trade exit updated: ID={trade_id}, "
+            f"Exit @ ${exit_price:.2f}, PnL: ${pnl:.2f} ({pnl_percent:.2f}%), tag={exit_tag}"
+        )
+        return True
 
-                logger.info(
-                    f"📝 Trade exit updated: ID={trade_id}, "
-                    f"Exit @ ${exit_price:.2f}, PnL: ${pnl:.2f} ({pnl_percent:.2f}%), tag={exit_tag}"
-                )
-            else:
-                logger.warning(f"Trade {trade_id} not found for exit update")
+    async def _start_portfolio_optimizer(self, session_factory):
+        """Portfolio Optimizer Agent 시작 (한 번만, 이력 로드용 세션 팩토리 설정)"""
+        if self.portfolio_optimizer.session_factory is None:
+            self.portfolio_optimizer.session_factory = session_factory
+        if self.portfolio_optimizer.state != AgentState.RUNNING:
+            try:
+                await self.portfolio_optimizer.start()
+                logger.info("✅ PortfolioOptimizer Agent started")
+            except Exception as e:
+                logger.error(f"Failed to start PortfolioOptimizer Agent: {e}")
 
+    async def _submit_portfolio_event(self, task_type: str, params: dict):
+        """청산 손익/에퀴티를 포트폴리오 공분산에 반영 (결과를 기다리지 않음)"""
+        if self.portfolio_optimizer.state != AgentState.RUNNING:
+            return
+        await self.portfolio_optimizer.submit_task(
+            AgentTask(
+                task_id=f"{task_type}_{params['user_id']}_{datetime.utcnow().timestamp()}",
+                task_type=task_type,
+                priority=TaskPriority.LOW,
+                params={**params, "timestamp": datetime.utcnow()},
+            )
+        )
+
+    async def _update_trade_durable(self, trade_id: int, values: dict, what: str) -> bool:
+        """
+        거래 기록 갱신을 커밋까지 대기
+
+        재시도 후에도 실패하면 수동 복구할 수 있도록 갱신 값을 CRITICAL 로그로 남깁니다.
+        """
+        try:
+            await persistence_queue.update_durable(Trade, trade_id, values=values)
+            return True
         except Exception as e:
-            logger.error(f"Failed to update trade exit: {e}", exc_info=True)
+            logger.critical(f"❌ Trade {what} update lost: ID={trade_id}, values={values}, error={e}")
+            return False
 
     def _generate_exit_tag(self, exit_reason: str, pnl_percent: float) -> str:
         """
@@ -2771,93 +2869,85 @@ class BotRunner:
 
         self._recent_signals[bot_instance_id].append(signal_action)
 
+    def _on_risk_alert(self, bot_instance_id: int, alert):
+        """RiskEngine 알림 수신 (다른 봇의 tick에서 발생해도 해당 봇 대기열에 보관)"""
+        self._risk_alerts.setdefault(bot_instance_id, deque(maxlen=10)).append(alert)
+
     # === Periodic Agent Tasks (주기적 에이전트 실행) ===
 
-    async def _start_periodic_agents(self, bot_instance_id: int, user_id: int):
+    async def _start_periodic_agents(
+        self, bot_instance_id: int, user_id: int, symbol: str, timeframe: str = "5m"
+    ):
         """
-        주기적 에이전트 태스크 시작 (선물거래 최적화)
+        주기적 에이전트 작업 등록 (선물거래 최적화)
 
         - MarketRegimeAgent: 10분마다 시장 환경 분석 (트렌드는 단기적으로 안정적)
         - RiskMonitorAgent: 2분마다 리스크 체크 (레버리지 청산 위험 모니터링)
+        - 감성 갱신: 15분마다 전략이 등록한 코인의 뉴스 감성 갱신 (전체 봇 공유)
 
-        각 태스크는 봇이 실행 중일 때만 동작하고, 봇 종료 시 자동으로 정지됩니다.
+        작업은 periodic_scheduler에 (에이전트, 심볼) / (에이전트, 사용자) 키로 등록되어
+        같은 심볼/사용자의 봇끼리 하나로 합쳐집니다. 봇 종료 시 소유자 해제되고,
+        마지막 봇이 종료되면 작업이 취소됩니다. 시장 환경 작업은 공유 에이전트의
+        현재 심볼이 아닌 봇 자신의 심볼로 등록됩니다 (심볼별로 따로 분석).
         """
-        # 이미 실행 중이면 중복 시작 방지
-        if "market_regime_periodic" in self._periodic_tasks:
-            logger.debug("Periodic agents already running")
-            return
-
-        # MarketRegime 주기적 실행 (10분마다)
-        market_task = asyncio.create_task(
-            self._periodic_market_regime_analysis(bot_instance_id)
+        periodic_scheduler.register(
+            "market_regime", symbol, interval=600,
+            func=lambda: self._run_market_regime_analysis(symbol, timeframe),
+            owner=bot_instance_id,
         )
-        self._periodic_tasks["market_regime_periodic"] = market_task
-        logger.info("✅ Started MarketRegime periodic task (10분 주기)")
-
-        # RiskMonitor 주기적 실행 (2분마다)
-        risk_task = asyncio.create_task(
-            self._periodic_risk_monitoring(bot_instance_id, user_id)
+        periodic_scheduler.register(
+            "risk_monitor", user_id, interval=120,
+            func=lambda: self._run_risk_check(user_id), owner=bot_instance_id,
         )
-        self._periodic_tasks["risk_monitor_periodic"] = risk_task
-        logger.info("✅ Started RiskMonitor periodic task (2분 주기)")
+        if sentiment_refresher is not None:
+            periodic_scheduler.register(
+                "sentiment", "news", interval=sentiment_refresher.interval,
+                func=sentiment_refresher.refresh, owner=bot_instance_id,
+            )
 
-    async def _periodic_market_regime_analysis(self, bot_instance_id: int):
+    async def _run_market_regime_analysis(self, symbol: str, timeframe: str = "5m"):
         """
-        MarketRegimeAgent 주기적 실행 (10분마다)
+        MarketRegimeAgent 1회 실행 (periodic_scheduler가 10분마다 호출)
 
         시장 환경을 분석하여 Redis에 저장합니다.
         다른 컴포넌트(SignalValidator 등)에서 참조 가능합니다.
 
         Note: bitget_client가 설정되어 있으면 자동으로 캔들 데이터를 가져옵니다.
         """
-        while bot_instance_id in self.instance_tasks:
-            try:
-                # MarketRegimeAgent에 설정된 심볼과 타임프레임 사용
-                symbol = self.market_regime.symbol or "BTCUSDT"
-                timeframe = self.market_regime.timeframe or "5m"
-
-                # 시장 환경 분석 태스크 생성
-                # Note: bitget_client가 MarketRegimeAgent에 설정되어 있으면
-                #       _fetch_candles()에서 자동으로 캔들 데이터를 가져옴
-                regime_task = AgentTask(
-                    task_id=f"periodic_regime_{datetime.utcnow().timestamp()}",
-                    task_type="analyze_market",
-                    priority=TaskPriority.NORMAL,
-                    params={
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        "force_refresh": True  # 주기적 분석은 항상 최신 데이터 사용
-                    },
-                    timeout=10.0  # 타임아웃 증가 (API 호출 포함)
-                )
-
-                # 에이전트에 태스크 제출
-                await self.market_regime.submit_task(regime_task)
-                await asyncio.sleep(0.5)  # 처리 대기 (API 호출 포함)
-
-                # 결과 로깅
-                if regime_task.result:
-                    regime = regime_task.result
-                    logger.info(
-                        f"📊 Periodic Market Analysis: {symbol} -> "
-                        f"regime={regime.regime_type.value}, "
-                        f"volatility={regime.volatility:.2f}%, "
-                        f"confidence={regime.confidence:.2f}"
-                    )
-                else:
-                    logger.warning(f"Periodic Market Analysis: No result for {symbol}")
-
-            except Exception as e:
-                logger.error(f"Periodic market regime analysis error: {e}", exc_info=True)
+        # 시장 환경 분석 태스크 생성
+        # Note: bitget_client가 MarketRegimeAgent에 설정되어 있으면
+        #       _fetch_candles()에서 자동으로 캔들 데이터를 가져옴
+        regime_task = AgentTask(
+            task_id=f"periodic_regime_{datetime.utcnow().timestamp()}",
+            task_type="analyze_market",
+            priority=TaskPriority.NORMAL,
+            params={
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "force_refresh": False  # candle_warm_store가 1분 이내 데이터로 보충
+            },
+            timeout=10.0  # 타임아웃 증가 (API 호출 포함)
+        )
 
-            # 10분 대기
-            await asyncio.sleep(600)
+        # 에이전트에 태스크 제출
+        await self.market_regime.submit_task(regime_task)
+        await asyncio.sleep(0.5)  # 처리 대기 (API 호출 포함)
 
-        logger.info("Periodic MarketRegime analysis stopped (bot stopped)")
+        # 결과 로깅
+        if regime_task.result:
+            regime = regime_task.result
+            logger.info(
+                f"📊 Periodic Market Analysis: {symbol} -> "
+                f"regime={regime.regime_type.value}, "
+                f"volatility={regime.volatility:.2f}%, "
+                f"confidence={regime.confidence:.2f}"
+            )
+        else:
+            logger.warning(f"Periodic Market Analysis: No result for {symbol}")
 
-    async def _periodic_risk_monitoring(self, bot_instance_id: int, user_id: int):
+    async def _run_risk_check(self, user_id: int):
         """
-        RiskMonitorAgent 주기적 실행 (2분마다)
+        RiskMonitorAgent 1회 실행 (periodic_scheduler가 사용자별 2분마다 호출)
 
         선물거래 리스크를 지속적으로 감시합니다:
         - 일일 손익 체크
@@ -2865,43 +2955,32 @@ class BotRunner:
         - 연속 손실 체크
         - 청산가 접근 경고 (레버리지 거래 위험 관리)
         """
-        while bot_instance_id in self.instance_tasks:
-            try:
-                # TODO: 실제 계좌 데이터 수집
-                # 현재는 placeholder로 동작
-
-                risk_task = AgentTask(
-                    task_id=f"periodic_risk_{datetime.utcnow().timestamp()}",
-                    task_type="check_risk",
-                    priority=TaskPriority.HIGH,
-                    params={
-                        "user_id": user_id,
-                        "bot_instance_id": bot_instance_id,
-                        "daily_pnl": 0.0,  # TODO: DB에서 조회
-                        "position_size": 0.0,  # TODO: 거래소에서 조회
-                        "consecutive_losses": 0,  # TODO: DB에서 조회
-                        "auto_execute": False  # 조회만 (조치 안 함)
-                    },
-                    timeout=2.0
-                )
-
-                # 에이전트에 태스크 제출
-                await self.risk_monitor.submit_task(risk_task)
-                await asyncio.sleep(0.1)  # 처리 대기
-
-                # 결과 확인 (경고가 있으면 로깅)
-                if risk_task.result:
-                    alerts = risk_task.result
-                    if alerts:
-                        for alert in alerts:
-                            logger.warning(
-                                f"⚠️ Periodic Risk Alert: {alert.severity.value} - {alert.message}"
-                            )
-
-            except Exception as e:
-                logger.error(f"Periodic risk monitoring error: {e}")
+        # TODO: 실제 계좌 데이터 수집
+        # 현재는 placeholder로 동작
+
+        risk_task = AgentTask(
+            task_id=f"periodic_risk_{datetime.utcnow().timestamp()}",
+            task_type="check_risk",
+            priority=TaskPriority.HIGH,
+            params={
+                "user_id": user_id,
+                "daily_pnl": 0.0,  # TODO: DB에서 조회
+                "position_size": 0.0,  # TODO: 거래소에서 조회
+                "consecutive_losses": 0,  # TODO: DB에서 조회
+                "auto_execute": False  # 조회만 (조치 안 함)
+            },
+            timeout=2.0
+        )
 
-            # 2분 대기
-            await asyncio.sleep(120)
+        # 에이전트에 태스크 제출
+        await self.risk_monitor.submit_task(risk_task)
+        await asyncio.sleep(0.1)  # 처리 대기
 
-        logger.info("Periodic RiskMonitor checks stopped (bot stopped)")
+        # 결과 확인 (경고가 있으면 로깅)
+        if risk_task.result:
+            alerts = risk_task.result
+            if alerts:
+                for alert in alerts:
+                    logger.warning(
+                        f"⚠️ Periodic Risk Alert: {alert.severity.value} - {alert.message}"
+                    )
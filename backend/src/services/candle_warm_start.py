@@ -0,0 +1,292 @@
+"""
+캔들 웜스타트 저장소 (Candle Warm-Start Store)
+
+서버 시작/배포 직후 수백 개 봇이 동시에 get_historical_candles(limit=200)를
+호출해 거래소 Rate Limit에 걸리는 문제를 막습니다.
+
+- (심볼, 타임프레임)별 최근 캔들을 한 곳에 보관하고 모든 봇이 공유
+- 시작 시 로컬 저장소에서 먼저 로드 (웜스타트 스냅샷 → 없으면 캔들 캐시 CSV 끝부분)
+- 부족한 최신 캔들만 키당 요청 한 번으로 보충 (동시 요청은 하나로 합침)
+- 보충 후 스냅샷을 디스크에 저장해 재시작 시 재사용
+- 봇 시작은 StartAdmission(토큰 버킷)을 거쳐 초당 시작 수를 제한
+
+MarketRegimeAgent의 candle_cache 인터페이스(get_candles(symbol, timeframe, limit))와 호환됩니다.
+
+사용 예시:
+    from services.candle_warm_start import candle_warm_store, bot_start_admission
+
+    await candle_warm_store.preload([("BTCUSDT", "5m"), ("ETHUSDT", "1h")])
+    await bot_start_admission.admit()
+    candles = await candle_warm_store.get_candles("BTCUSDT", "5m", limit=200, client=client)
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CandleKey = Tuple[str, str]
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "6h": 6 * 60 * 60_000,
+    "12h": 12 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "candle_cache"
+
+
+def _timeframe_ms(timeframe: str) -> int:
+    return TIMEFRAME_MS.get(timeframe.lower(), TIMEFRAME_MS["5m"])
+
+
+def _normalize_key(symbol: str, timeframe: str) -> CandleKey:
+    return symbol.replace("/", "").replace("-", "").upper(), timeframe
+
+
+class CandleWarmStartStore:
+    """
+    (심볼, 타임프레임)별 공유 캔들 저장소
+
+    캔들 형식은 BitgetRestClient.get_historical_candles와 같습니다
+    ({"timestamp", "open", "high", "low", "close", "volume"}, 오래된 것부터).
+    """
+
+    KEEP_BARS = 500  # 키당 보관 캔들 수
+    MAX_FETCH = 1000  # Bitget 요청당 최대 개수
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_age: float = 60.0):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.snapshot_dir = self.cache_dir / "warm_start"
+        self.max_age = max_age  # 이 시간(초) 안에 보충했으면 API 호출 없음
+        self.client = None  # 기본 조회 클라이언트 (get_candles에 client 미지정 시)
+
+        self._bars: Dict[CandleKey, List[Dict[str, Any]]] = {}
+        self._refreshed_at: Dict[CandleKey, float] = {}
+        self._inflight: Dict[CandleKey, asyncio.Future] = {}
+        self.stats = {
+            "disk_loads": 0,
+            "hits": 0,
+            "top_ups": 0,
+            "full_fetches": 0,
+            "coalesced": 0,
+            "fetch_errors": 0,
+        }
+
+    # ==================== 로컬 로드 ====================
+
+    async def preload(self, keys: Iterable[CandleKey]):
+        """여러 키를 로컬 저장소에서 로드 (API 호출 없음)"""
+        pending = [
+            _normalize_key(symbol, timeframe)
+            for symbol, timeframe in set(keys)
+        ]
+        pending = [key for key in pending if key not in self._bars]
+        if not pending:
+            return
+
+        loaded = await asyncio.gather(
+            *[asyncio.to_thread(self._load_local, key) for key in pending],
+            return_exceptions=True,
+        )
+        for key, bars in zip(pending, loaded):
+            if isinstance(bars, Exception):
+                logger.warning(f"Warm-start load failed for {key}: {bars}")
+                continue
+            if bars:
+                self._bars[key] = bars
+                self.stats["disk_loads"] += 1
+
+        logger.info(
+            f"Candle warm-start preloaded {sum(1 for k in pending if k in self._bars)}/"
+            f"{len(pending)} symbol/timeframe pairs from disk"
+        )
+
+    def _snapshot_file(self, key: CandleKey) -> Path:
+        return self.snapshot_dir / f"{key[0]}_{key[1]}.json"
+
+    def _load_local(self, key: CandleKey) -> List[Dict[str, Any]]:
+        """웜스타트 스냅샷, 없으면 캔들 캐시 CSV의 마지막 KEEP_BARS개"""
+        snapshot = self._snapshot_file(key)
+        if snapshot.exists():
+            with open(snapshot, "r") as f:
+                return json.load(f)
+
+        # CandleCacheManager 파일 (일봉은 "1d"/"1D" 표기 혼용)
+        candidates = [key[1], "1D", "1d"] if key[1].lower() == "1d" else [key[1]]
+        csv_file = next(
+            (f for f in (self.cache_dir / f"{key[0]}_{tf}.csv" for tf in candidates) if f.exists()),
+            None,
+        )
+        if csv_file is None:
+            return []
+
+        with open(csv_file, "r", newline="") as f:
+            tail = deque(csv.DictReader(f), maxlen=self.KEEP_BARS)
+        return [
+            {
+                "timestamp": int(row["timestamp"]),
+                "open": float(row["open"]),
+                "high": float(row["high"]),
+                "low": float(row["low"]),
+                "close": float(row["close"]),
+                "volume": float(row["volume"]),
+            }
+            for row in tail
+        ]
+
+    def _save_snapshot(self, key: CandleKey, bars: List[Dict[str, Any]]):
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._snapshot_file(key).with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(bars, f)
+        tmp.replace(self._snapshot_file(key))
+
+    # ==================== 조회 ====================
+
+    async def get_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 200,
+        client=None,
+        max_age: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        최근 캔들 조회 (max_age 안에 보충했으면 API 호출 없음)
+
+        Args:
+            symbol: 심볼 (BTCUSDT, BTC/USDT 모두 가능)
+            timeframe: 타임프레임 (5m, 1h 등)
+            limit: 반환 개수
+            client: 보충용 클라이언트 (get_historical_candles, 없으면 self.client)
+            max_age: 허용 나이 (초, 기본 self.max_age)
+        """
+        key = _normalize_key(symbol, timeframe)
+        max_age = self.max_age if max_age is None else max_age
+
+        refreshed = self._refreshed_at.get(key)
+        if refreshed is not None and time.monotonic() - refreshed <= max_age:
+            self.stats["hits"] += 1
+            return self._bars[key][-limit:]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            await asyncio.shield(pending)
+            return self._bars.get(key, [])[-limit:]
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            if key not in self._bars:
+                await self.preload([key])
+            client = client or self.client
+            if client is not None:
+                await self._top_up(key, client, limit)
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(None)
+        return self._bars.get(key, [])[-limit:]
+
+    async def _top_up(self, key: CandleKey, client, limit: int):
+        """마지막 캔들 이후만 요청 (로컬 데이터가 없거나 너무 오래됐으면 전체)"""
+        symbol, timeframe = key
+        bars = self._bars.get(key, [])
+        want = max(limit, 200)
+
+        if bars:
+            missing = (int(time.time() * 1000) - bars[-1]["timestamp"]) // _timeframe_ms(timeframe) + 2
+        else:
+            missing = want
+        full = missing >= want
+        count = min(want if full else missing, self.MAX_FETCH)
+
+        try:
+            fresh = await client.get_historical_candles(symbol=symbol, interval=timeframe, limit=count)
+        except Exception as e:
+            self.stats["fetch_errors"] += 1
+            logger.warning(f"Candle top-up failed for {symbol} {timeframe}: {e}")
+            return
+
+        self.stats["full_fetches" if full else "top_ups"] += 1
+        merged = {} if full else {bar["timestamp"]: bar for bar in bars}
+        for bar in fresh:
+            merged[int(bar["timestamp"])] = bar
+        self._bars[key] = [merged[ts] for ts in sorted(merged)][-self.KEEP_BARS:]
+        self._refreshed_at[key] = time.monotonic()
+
+        try:
+            await asyncio.to_thread(self._save_snapshot, key, self._bars[key])
+        except Exception as e:
+            logger.warning(f"Failed to save warm-start snapshot for {symbol} {timeframe}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "keys": len(self._bars)}
+
+
+class StartAdmission:
+    """
+    봇 시작 허용 큐 (토큰 버킷)
+
+    봇 시작 시 초기화 단계의 REST 호출(클라이언트, 포지션, 레버리지, 캔들)이
+    한꺼번에 몰리지 않도록 초당 시작 수를 rate로 제한합니다.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        self.stats = {"admitted": 0, "delayed": 0, "max_wait": 0.0}
+
+    async def admit(self):
+        """토큰이 생길 때까지 대기 (도착 순서대로)"""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._tokens = 1.0
+                    self._updated = time.monotonic()
+                self._tokens -= 1
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.stats["admitted"] += 1
+        if waited > 0.001:
+            self.stats["delayed"] += 1
+        self.stats["max_wait"] = max(self.stats["max_wait"], waited)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "max_wait": round(self.stats["max_wait"], 3),
+            "waiting": self.waiting,
+            "rate": self.rate,
+        }
+
+
+# 싱글톤 인스턴스
+candle_warm_store = CandleWarmStartStore()
+bot_start_admission = StartAdmission()
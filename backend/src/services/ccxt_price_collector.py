@@ -1,140 +1,323 @@
 """
 CCXT Pro를 사용한 실시간 가격 수집기
 Bitget WebSocket 문제 해결을 위한 안정적인 대체 방안
+
+- 수집 심볼은 실행 중인 봇과 열려 있는 차트에서 결정 (고정 목록 없음)
+- 봇 시작/종료 시 심볼 등록/해제, 차트는 캔들 조회 후 chart_ttl 동안 유지
+- 전체 심볼을 fetch_tickers 한 번으로 조회 (심볼 수와 무관하게 요청 1회)
+- 심볼별 틱 지연 (거래소 타임스탬프 → 큐 게시) 통계
+
+사용 예시:
+    from services.ccxt_price_collector import price_collector
+
+    price_collector.add_symbol("SOLUSDT", owner=bot_instance_id)  # 봇 시작
+    price_collector.remove_owner(bot_instance_id)                 # 봇 종료
+    price_collector.touch_chart("BTCUSDT")                        # 차트 조회
 """
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
 
-async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio.Queue = None):
-    """
-    CCXT를 사용한 실시간 가격 수집 (WebSocket 대체)
+def to_simple_symbol(symbol: str) -> str:
+    """BTC/USDT:USDT, BTC/USDT, BTC-USDT -> BTCUSDT"""
+    return symbol.split(":")[0].replace("/", "").replace("-", "").upper()
+
+
+def to_ccxt_symbol(symbol: str) -> Optional[str]:
+    """BTCUSDT -> BTC/USDT:USDT (USDT-M 선물만 지원)"""
+    simple = to_simple_symbol(symbol)
+    if not simple.endswith("USDT") or simple == "USDT":
+        return None
+    return f"{simple[:-4]}/USDT:USDT"
 
-    Bitget WebSocket 직접 연결이 실패하는 경우 CCXT를 사용하여
-    안정적으로 시장 데이터를 수집합니다.
 
-    Args:
-        market_queue: 봇 실행을 위한 큐
-        chart_queue: 차트 서비스를 위한 별도 큐 (선택사항)
+@dataclass
+class SymbolTickStats:
+    """심볼별 틱 통계"""
+    ticks: int = 0
+    last_price: float = 0.0
+    last_tick_at: float = 0.0
+    last_latency_ms: float = 0.0
+    latency_total_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def record(self, price: float, latency_ms: float):
+        self.ticks += 1
+        self.last_price = price
+        self.last_tick_at = time.time()
+        self.last_latency_ms = latency_ms
+        self.latency_total_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "last_price": self.last_price,
+            "age_s": round(time.time() - self.last_tick_at, 1) if self.ticks else None,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "avg_latency_ms": round(self.latency_total_ms / self.ticks, 1) if self.ticks else 0,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
+class CCXTPriceCollector:
+    """
+    봇/차트 심볼 기반 가격 수집기
+
+    심볼 등록은 소유자(봇 ID)별로 관리되어, 같은 심볼의 마지막 봇이 종료될 때만 수집에서 빠집니다.
     """
-    try:
-        import ccxt.async_support as ccxt
-    except ImportError:
-        logger.error("ccxt library not installed. Install with: pip install ccxt")
-        return
-
-    exchange = None
-
-    try:
-        # Bitget exchange 초기화
-        exchange = ccxt.bitget({
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'swap',  # USDT-M futures
-            }
-        })
-
-        # 주요 심볼 목록 (프론트엔드의 Trading.jsx와 일치)
-        symbols = [
-            'BTC/USDT:USDT',
-            'ETH/USDT:USDT',
-            'BNB/USDT:USDT',
-            'SOL/USDT:USDT',
-            'ADA/USDT:USDT',
-        ]
-
-        logger.info("🚀 CCXT price collector started")
-        logger.info(f"📡 Watching symbols: {symbols}")
-
-        iteration = 0
-
-        while True:
+
+    def __init__(self, interval: float = 5.0, chart_ttl: float = 300.0):
+        self.interval = interval
+        self.chart_ttl = chart_ttl
+        self._owners: Dict[str, Set[Hashable]] = {}  # BTCUSDT -> {bot_instance_id, ...}
+        self._chart_seen: Dict[str, float] = {}  # BTCUSDT -> 마지막 차트 조회 시각
+        self._changed = asyncio.Event()
+        self._stats: Dict[str, SymbolTickStats] = {}
+        self.polls = 0
+        self.bulk_errors = 0
+        self.last_fetch_ms = 0.0
+
+    # ==================== 심볼 등록 ====================
+
+    def add_symbol(self, symbol: str, owner: Hashable):
+        """봇 심볼 등록 (새 심볼이면 다음 주기를 기다리지 않고 바로 수집)"""
+        simple = to_simple_symbol(symbol)
+        if to_ccxt_symbol(simple) is None:
+            logger.warning(f"Unsupported symbol for price collector: {symbol}")
+            return
+        owners = self._owners.setdefault(simple, set())
+        if not owners:
+            logger.info(f"📡 Price collector: +{simple}")
+            self._changed.set()
+        owners.add(owner)
+
+    def remove_owner(self, owner: Hashable):
+        """봇 종료 시 해당 봇의 모든 심볼 해제"""
+        for simple in list(self._owners):
+            owners = self._owners[simple]
+            owners.discard(owner)
+            if not owners:
+                del self._owners[simple]
+                logger.info(f"📡 Price collector: -{simple}")
+
+    def touch_chart(self, symbol: str):
+        """차트 조회 기록 (chart_ttl 동안 수집 유지)"""
+        simple = to_simple_symbol(symbol)
+        if to_ccxt_symbol(simple) is None:
+            return
+        if simple not in self._owners and simple not in self._chart_seen:
+            self._changed.set()
+        self._chart_seen[simple] = time.monotonic()
+
+    def symbols(self) -> List[str]:
+        """현재 수집 대상 (봇 심볼 + 만료되지 않은 차트 심볼)"""
+        now = time.monotonic()
+        for simple, seen in list(self._chart_seen.items()):
+            if now - seen > self.chart_ttl:
+                del self._chart_seen[simple]
+        return sorted(set(self._owners) | set(self._chart_seen))
+
+    async def seed_from_running_bots(self):
+        """DB에서 실행 중인 봇 심볼 등록 (bootstrap 전 첫 수집용)"""
+        from sqlalchemy import select
+
+        from ..database.db import AsyncSessionLocal
+        from ..database.models import BotInstance
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(BotInstance.id, BotInstance.symbol).where(BotInstance.is_running.is_(True))
+            )
+            for bot_id, symbol in result.all():
+                if symbol:
+                    self.add_symbol(symbol, owner=bot_id)
+
+    # ==================== 수집 ====================
+
+    async def fetch_tickers(self, exchange, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        심볼 목록 시세 조회 (BTCUSDT -> ticker)
+
+        fetch_tickers 한 번으로 조회하고, 실패하면 (잘못된 심볼 등) 심볼별 동시 조회로 대체합니다.
+        """
+        ccxt_symbols = {to_ccxt_symbol(s): s for s in symbols}
+        started = time.perf_counter()
+        try:
+            if not exchange.has.get("fetchTickers"):
+                raise NotImplementedError("fetchTickers not supported")
+            tickers = await exchange.fetch_tickers(list(ccxt_symbols))
+        except Exception as e:
+            self.bulk_errors += 1
+            logger.warning(f"Bulk ticker fetch failed, falling back to per-symbol: {e}")
+            results = await asyncio.gather(
+                *(exchange.fetch_ticker(s) for s in ccxt_symbols), return_exceptions=True
+            )
+            tickers = {}
+            for ccxt_symbol, ticker in zip(ccxt_symbols, results):
+                if isinstance(ticker, Exception):
+                    logger.warning(f"Error fetching ticker for {ccxt_symbol}: {ticker}")
+                else:
+                    tickers[ccxt_symbol] = ticker
+        self.last_fetch_ms = (time.perf_counter() - started) * 1000
+        self.polls += 1
+
+        return {
+            ccxt_symbols[ccxt_symbol]: ticker
+            for ccxt_symbol, ticker in tickers.items()
+            if ccxt_symbol in ccxt_symbols
+        }
+
+    def publish(
+        self,
+        simple_symbol: str,
+        ticker: Dict[str, Any],
+        market_queue: asyncio.Queue,
+        chart_queue: Optional[asyncio.Queue] = None,
+    ) -> Dict[str, Any]:
+        """시세를 봇/차트 큐에 게시하고 지연 기록"""
+        now = datetime.now(timezone.utc).timestamp()
+        last = float(ticker.get("last") or 0)
+        market_data = {
+            "symbol": simple_symbol,
+            "price": last,
+            "volume": float(ticker.get("baseVolume") or 0),
+            "timestamp": now,
+            "high": float(ticker.get("high") or last),
+            "low": float(ticker.get("low") or last),
+            "open": float(ticker.get("open") or last),
+            "close": last,  # current price as close
+            "time": int(now),
+        }
+
+        for queue in (market_queue, chart_queue):
+            if queue is None:
+                continue
             try:
-                for symbol in symbols:
-                    try:
-                        # Fetch ticker (REST API, but reliable)
-                        ticker = await exchange.fetch_ticker(symbol)
-
-                        # Convert symbol: BTC/USDT:USDT -> BTCUSDT
-                        simple_symbol = symbol.split('/')[0] + 'USDT'
-
-                        # Current timestamp
-                        now = datetime.now(timezone.utc).timestamp()
-
-                        market_data = {
-                            "symbol": simple_symbol,
-                            "price": float(ticker.get('last', 0)),
-                            "volume": float(ticker.get('baseVolume', 0)),
-                            "timestamp": now,
-                            "high": float(ticker.get('high', ticker.get('last', 0))),
-                            "low": float(ticker.get('low', ticker.get('last', 0))),
-                            "open": float(ticker.get('open', ticker.get('last', 0))),
-                            "close": float(ticker.get('last', 0)),  # current price as close
-                            "time": int(now),
-                        }
-
-                        # Put to market queue (for bot)
-                        try:
-                            market_queue.put_nowait(market_data)
-                        except asyncio.QueueFull:
-                            # Queue full - remove old data and add new
-                            try:
-                                market_queue.get_nowait()
-                                market_queue.put_nowait(market_data)
-                            except:
-                                pass
+                queue.put_nowait(market_data)
+            except asyncio.QueueFull:
+                # Queue full - remove old data and add new
+                try:
+                    queue.get_nowait()
+                    queue.put_nowait(market_data)
+                except Exception:
+                    pass
+
+        exchange_ts = ticker.get("timestamp")
+        latency_ms = max(now * 1000 - exchange_ts, 0.0) if exchange_ts else self.last_fetch_ms
+        stats = self._stats.get(simple_symbol)
+        if stats is None:
+            stats = self._stats[simple_symbol] = SymbolTickStats()
+        stats.record(last, latency_ms)
+        return market_data
+
+    async def _wait_next(self):
+        """다음 주기까지 대기 (새 심볼이 등록되면 바로 깨어남)"""
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=self.interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self, market_queue: asyncio.Queue, chart_queue: Optional[asyncio.Queue] = None):
+        """
+        CCXT를 사용한 실시간 가격 수집 (WebSocket 대체)
+
+        Args:
+            market_queue: 봇 실행을 위한 큐
+            chart_queue: 차트 서비스를 위한 별도 큐 (선택사항)
+        """
+        try:
+            import ccxt.async_support as ccxt
+        except ImportError:
+            logger.error("ccxt library not installed. Install with: pip install ccxt")
+            return
+
+        exchange = None
+
+        try:
+            # Bitget exchange 초기화
+            exchange = ccxt.bitget({
+                'enableRateLimit': True,
+                'options': {
+                    'defaultType': 'swap',  # USDT-M futures
+                }
+            })
+
+            try:
+                await self.seed_from_running_bots()
+            except Exception as e:
+                logger.warning(f"Failed to seed price collector from running bots: {e}")
+
+            logger.info("🚀 CCXT price collector started")
+            logger.info(f"📡 Watching symbols: {self.symbols()}")
 
-                        # Put to chart queue (for chart service) if provided
-                        if chart_queue:
+            while True:
+                try:
+                    symbols = self.symbols()
+                    if symbols:
+                        tickers = await self.fetch_tickers(exchange, symbols)
+                        for simple_symbol, ticker in tickers.items():
+                            market_data = self.publish(simple_symbol, ticker, market_queue, chart_queue)
+
+                            # Update price alert service for annotation alerts
                             try:
-                                chart_queue.put_nowait(market_data)
-                            except asyncio.QueueFull:
-                                try:
-                                    chart_queue.get_nowait()
-                                    chart_queue.put_nowait(market_data)
-                                except:
-                                    pass
-
-                        # Update price alert service for annotation alerts
-                        try:
-                            from .price_alert_service import price_alert_service
-                            await price_alert_service.update_price(
-                                simple_symbol, market_data['price']
-                            )
-                        except Exception as alert_err:
-                            # Non-critical - don't break the collector
-                            pass
+                                from .price_alert_service import price_alert_service
+                                await price_alert_service.update_price(
+                                    simple_symbol, market_data['price']
+                                )
+                            except Exception:
+                                # Non-critical - don't break the collector
+                                pass
 
-                        # Log every 10th iteration to reduce noise
-                        if iteration % 10 == 0:
+                        # Log every 10th poll to reduce noise
+                        if self.polls % 10 == 1:
                             logger.info(
-                                f"✅ Market data: {simple_symbol} @ ${market_data['price']:,.2f}"
+                                f"✅ Market data: {len(tickers)}/{len(symbols)} symbols "
+                                f"in {self.last_fetch_ms:.0f}ms"
                             )
 
-                    except Exception as e:
-                        logger.warning(f"Error fetching ticker for {symbol}: {e}")
-                        continue
+                    # Fetch every 5 seconds (reasonable for trading bot)
+                    await self._wait_next()
 
-                iteration += 1
+                except Exception as e:
+                    logger.error(f"CCXT collector loop error: {e}")
+                    await asyncio.sleep(10)
 
-                # Fetch every 5 seconds (reasonable for trading bot)
-                await asyncio.sleep(5)
+        except Exception as e:
+            logger.error(f"CCXT price collector initialization error: {e}", exc_info=True)
 
-            except Exception as e:
-                logger.error(f"CCXT collector loop error: {e}")
-                await asyncio.sleep(10)
+        finally:
+            if exchange:
+                try:
+                    await exchange.close()
+                    logger.info("CCXT exchange connection closed")
+                except Exception:
+                    pass
 
-    except Exception as e:
-        logger.error(f"CCXT price collector initialization error: {e}", exc_info=True)
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "interval_s": self.interval,
+            "polls": self.polls,
+            "bulk_errors": self.bulk_errors,
+            "last_fetch_ms": round(self.last_fetch_ms, 1),
+            "bot_symbols": {s: len(owners) for s, owners in self._owners.items()},
+            "chart_symbols": sorted(self._chart_seen),
+            "symbols": {s: stats.to_dict() for s, stats in self._stats.items()},
+        }
 
-    finally:
-        if exchange:
-            try:
-                await exchange.close()
-                logger.info("CCXT exchange connection closed")
-            except:
-                pass
+
+# 싱글톤 인스턴스
+price_collector = CCXTPriceCollector()
+
+
+async def ccxt_price_collector(market_queue: asyncio.Queue, chart_queue: asyncio.Queue = None):
+    """price_collector 실행 (lifespan에서 태스크로 시작)"""
+    await price_collector.run(market_queue, chart_queue)
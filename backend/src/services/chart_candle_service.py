@@ -0,0 +1,420 @@
+"""
+Multi-timeframe chart candle service
+
+Serves chart candles for every timeframe from memory instead of building a
+new ccxt exchange per request.
+
+- Live ticks update the forming 1m bar in place
+- Closed 1m bars are rolled up incrementally into 5m / 15m / 1h / 4h / 1d bars
+- Each (symbol, timeframe) is backfilled once, from the file candle cache when it
+  is fresh enough, otherwise from a single shared ccxt client
+- Symbols without live ticks are topped up from the shared client at most once
+  per bar interval
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Supported timeframes (seconds), smallest first
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "1d": 24 * 60 * 60,
+}
+
+# CandleCacheManager uses "1D" for daily candles
+_CACHE_TIMEFRAME = {"1d": "1D"}
+
+
+class Bar:
+    """Mutable OHLCV bar"""
+
+    __slots__ = ("time", "open", "high", "low", "close", "volume", "tick_count")
+
+    def __init__(self, time_: int, open_: float, high: float, low: float, close: float,
+                 volume: float = 0.0, tick_count: int = 0):
+        self.time = time_
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.tick_count = tick_count
+
+    def merge(self, other: "Bar"):
+        """Fold a later bar of the same bucket into this one"""
+        self.high = max(self.high, other.high)
+        self.low = min(self.low, other.low)
+        self.close = other.close
+        self.volume += other.volume
+        self.tick_count += other.tick_count
+
+    def copy(self, time_: Optional[int] = None) -> "Bar":
+        return Bar(
+            self.time if time_ is None else time_,
+            self.open, self.high, self.low, self.close, self.volume, self.tick_count,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "time": self.time,
+            "open": float(self.open),
+            "high": float(self.high),
+            "low": float(self.low),
+            "close": float(self.close),
+            "volume": float(self.volume),
+            "tick_count": self.tick_count,
+        }
+
+
+class _Series:
+    """Ring buffer of closed bars plus the partially built (rolled-up) bar"""
+
+    def __init__(self, seconds: int, max_bars: int):
+        self.seconds = seconds
+        self.closed: Deque[Bar] = deque(maxlen=max_bars)
+        self.partial: Optional[Bar] = None  # rolled up from closed 1m bars
+        self.backfilled = False
+        self.retry_at = 0.0  # earliest time for the next backfill / top-up
+
+    def bucket(self, ts: int) -> int:
+        return ts - ts % self.seconds
+
+    def push_closed(self, bar: Bar):
+        """Append a closed bar (bars at or before the last closed bar are dropped)"""
+        if self.closed and bar.time <= self.closed[-1].time:
+            return
+        self.closed.append(bar)
+
+    def seal_before(self, ts: int):
+        """Close the rolled-up bar once time has moved into a later bucket"""
+        if self.partial is not None and self.partial.time != self.bucket(ts):
+            self.push_closed(self.partial)
+            self.partial = None
+
+    def roll_up(self, minute: Bar):
+        """Incrementally fold a closed 1m bar into this timeframe"""
+        bucket = self.bucket(minute.time)
+
+        if self.partial is not None and self.partial.time != bucket:
+            self.push_closed(self.partial)
+            self.partial = None
+
+        if self.partial is None:
+            self.partial = minute.copy(bucket)
+        else:
+            self.partial.merge(minute)
+
+    def merge_history(self, bars: List[Bar]):
+        """
+        Prepend backfilled bars
+
+        The first live bar usually started mid-bucket, so the exchange bar wins for
+        any bucket both sources cover.
+        """
+        oldest_live = self.closed[0].time if self.closed else None
+        if self.partial is not None:
+            oldest_live = min(oldest_live or self.partial.time, self.partial.time)
+
+        history = [b for b in bars if oldest_live is None or b.time <= oldest_live]
+        newest_history = history[-1].time if history else None
+        live = [b for b in self.closed if newest_history is None or b.time > newest_history]
+
+        combined = history + live
+        self.closed.clear()
+        self.closed.extend(combined[-self.closed.maxlen:])
+
+    def latest_time(self) -> Optional[int]:
+        if self.partial is not None:
+            return self.partial.time
+        return self.closed[-1].time if self.closed else None
+
+
+class ChartCandleService:
+    """In-memory multi-timeframe candle store shared by all chart requests"""
+
+    def __init__(self, max_bars: int = 500):
+        self.max_bars = max_bars
+
+        # symbol -> timeframe -> series
+        self._series: Dict[str, Dict[str, _Series]] = {}
+        # symbol -> forming 1m bar (updated in place on each tick)
+        self._forming: Dict[str, Bar] = {}
+
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._exchange = None
+        self._exchange_lock = asyncio.Lock()
+
+        self.stats = {"ticks": 0, "served": 0, "backfills": 0, "top_ups": 0}
+
+    # ==================== Live updates ====================
+
+    def _symbol_series(self, symbol: str) -> Dict[str, _Series]:
+        series = self._series.get(symbol)
+        if series is None:
+            series = {tf: _Series(sec, self.max_bars) for tf, sec in TIMEFRAME_SECONDS.items()}
+            self._series[symbol] = series
+        return series
+
+    def process_tick(self, symbol: str, price: float, volume: float = 0.0,
+                     timestamp: Optional[float] = None):
+        """Update the forming 1m bar in place; roll it up when the minute closes"""
+        ts = int(timestamp if timestamp is not None else time.time())
+        minute = ts - ts % 60
+        forming = self._forming.get(symbol)
+        self.stats["ticks"] += 1
+
+        if forming is not None and forming.time == minute:
+            forming.high = max(forming.high, price)
+            forming.low = min(forming.low, price)
+            forming.close = price
+            forming.volume += volume
+            forming.tick_count += 1
+            return
+
+        if forming is not None and forming.time > minute:
+            return  # stale tick
+
+        if forming is not None:
+            self._close_minute(symbol, forming, minute)
+
+        self._forming[symbol] = Bar(minute, price, price, price, price, volume, 1)
+
+    def _close_minute(self, symbol: str, bar: Bar, next_minute: int):
+        series = self._symbol_series(symbol)
+        series["1m"].push_closed(bar)
+        for tf, s in series.items():
+            if tf != "1m":
+                s.roll_up(bar)
+                s.seal_before(next_minute)
+
+    # ==================== Queries ====================
+
+    async def get_candles(self, symbol: str, timeframe: str = "1m", limit: int = 100,
+                          include_current: bool = True) -> List[dict]:
+        """
+        Candles for a symbol/timeframe, oldest first
+
+        Raises:
+            ValueError: Unsupported timeframe
+        """
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+        symbol = symbol.upper()
+        series = self._symbol_series(symbol)[timeframe]
+
+        if not series.backfilled or self._needs_top_up(symbol, series):
+            await self._fill(symbol, timeframe, series)
+
+        bars = list(series.closed)
+        current = self._current_bar(symbol, timeframe, series)
+        if current is not None:
+            # A rolled-up partial bar that has been superseded is already closed
+            if bars and bars[-1].time >= current.time:
+                current = None
+
+        limit = max(1, limit)
+        if include_current and current is not None:
+            result = [b.to_dict() for b in bars[-(limit - 1):]] if limit > 1 else []
+            result.append(current.to_dict())
+        else:
+            result = [b.to_dict() for b in bars[-limit:]]
+
+        self.stats["served"] += 1
+        return result
+
+    def _current_bar(self, symbol: str, timeframe: str, series: _Series) -> Optional[Bar]:
+        """Forming bar = rolled-up closed minutes + the forming 1m bar"""
+        forming = self._forming.get(symbol)
+
+        if timeframe == "1m":
+            return forming.copy() if forming is not None else None
+
+        partial = series.partial
+        if forming is None:
+            return partial.copy() if partial is not None else None
+
+        bucket = series.bucket(forming.time)
+        if partial is None or partial.time != bucket:
+            return forming.copy(bucket)
+
+        current = partial.copy()
+        current.merge(forming)
+        return current
+
+    def _needs_top_up(self, symbol: str, series: _Series) -> bool:
+        """Symbols without live ticks are refreshed from REST at most once per bar"""
+        if symbol in self._forming:
+            return False
+        if time.time() < series.retry_at:
+            return False
+        latest = series.latest_time()
+        return latest is None or time.time() >= latest + 2 * series.seconds
+
+    # ==================== Backfill ====================
+
+    async def _fill(self, symbol: str, timeframe: str, series: _Series):
+        """Backfill once (single-flight per symbol/timeframe)"""
+        key = (symbol, timeframe)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            if series.backfilled and not self._needs_top_up(symbol, series):
+                return
+            if time.time() < series.retry_at:
+                return
+
+            top_up = series.backfilled
+            bars: List[Bar] = []
+            if not top_up:
+                bars = await self._load_from_cache(symbol, timeframe)
+            if not bars:
+                bars = await self._fetch_from_exchange(symbol, timeframe)
+
+            # Retry failed backfills / top-ups no more than once per bar interval (min 30s)
+            series.retry_at = time.time() + max(30, series.seconds)
+            if not bars:
+                return
+
+            if top_up:
+                for bar in bars:
+                    series.push_closed(bar)
+                self.stats["top_ups"] += 1
+            else:
+                series.merge_history(bars)
+                series.backfilled = True
+                self.stats["backfills"] += 1
+                logger.info(f"Chart candles backfilled: {symbol} {timeframe} ({len(bars)} bars)")
+
+    async def _load_from_cache(self, symbol: str, timeframe: str) -> List[Bar]:
+        """Closed bars from the file candle cache, if it reaches the recent past"""
+        from .candle_cache import get_candle_cache
+
+        seconds = TIMEFRAME_SECONDS[timeframe]
+        now = time.time()
+        start = datetime.utcfromtimestamp(now - seconds * self.max_bars)
+        end = datetime.utcfromtimestamp(now) + timedelta(days=1)
+
+        try:
+            rows = await get_candle_cache().get_candles(
+                symbol,
+                _CACHE_TIMEFRAME.get(timeframe, timeframe),
+                start.strftime("%Y-%m-%d"),
+                end.strftime("%Y-%m-%d"),
+                cache_only=True,
+            )
+        except Exception as e:
+            logger.debug(f"Candle cache unavailable for {symbol} {timeframe}: {e}")
+            return []
+
+        bars = [self._bar_from_row(r) for r in rows if "timestamp" in r]
+        if not bars or bars[-1].time < now - 3 * seconds:
+            return []  # stale cache would leave a gap before live data
+        return self._closed_only(bars[-self.max_bars:], seconds, now)
+
+    async def _fetch_from_exchange(self, symbol: str, timeframe: str) -> List[Bar]:
+        """Closed bars from the shared ccxt client"""
+        try:
+            exchange = await self._get_exchange()
+            ohlcv = await exchange.fetch_ohlcv(
+                self._exchange_symbol(symbol), timeframe=timeframe, limit=self.max_bars
+            )
+        except Exception as e:
+            logger.warning(f"Chart candle fetch failed for {symbol} {timeframe}: {e}")
+            return []
+
+        bars = [
+            Bar(int(c[0] / 1000), float(c[1]), float(c[2]), float(c[3]), float(c[4]),
+                float(c[5]) if len(c) > 5 and c[5] is not None else 0.0, 1)
+            for c in ohlcv
+        ]
+        return self._closed_only(bars, TIMEFRAME_SECONDS[timeframe], time.time())
+
+    @staticmethod
+    def _closed_only(bars: List[Bar], seconds: int, now: float) -> List[Bar]:
+        """The exchange's last bar may still be forming; live ticks own that one"""
+        return [b for b in bars if b.time + seconds <= now]
+
+    @staticmethod
+    def _bar_from_row(row: dict) -> Bar:
+        return Bar(
+            int(row["timestamp"] / 1000),
+            float(row["open"]), float(row["high"]), float(row["low"]), float(row["close"]),
+            float(row.get("volume", 0.0)), 1,
+        )
+
+    @staticmethod
+    def _exchange_symbol(symbol: str) -> str:
+        """BTCUSDT -> BTC/USDT:USDT"""
+        if symbol.endswith("USDT"):
+            return f"{symbol[:-4]}/USDT:USDT"
+        return symbol
+
+    async def _get_exchange(self):
+        """Shared public Bitget client (markets loaded once)"""
+        if self._exchange is not None:
+            return self._exchange
+
+        async with self._exchange_lock:
+            if self._exchange is None:
+                import ccxt.async_support as ccxt
+
+                exchange = ccxt.bitget(
+                    {"enableRateLimit": True, "options": {"defaultType": "swap"}}
+                )
+                await exchange.load_markets()
+                self._exchange = exchange
+        return self._exchange
+
+    async def close(self):
+        if self._exchange is not None:
+            try:
+                await self._exchange.close()
+            except Exception as e:
+                logger.warning(f"Error closing chart candle exchange client: {e}")
+            self._exchange = None
+
+    def get_status(self) -> dict:
+        return {
+            "symbols": list(self._series.keys()),
+            "live_symbols": list(self._forming.keys()),
+            "backfilled": {
+                symbol: [tf for tf, s in series.items() if s.backfilled]
+                for symbol, series in self._series.items()
+            },
+            **self.stats,
+        }
+
+
+# Global singleton instance
+_chart_candle_service: Optional[ChartCandleService] = None
+
+
+def get_chart_candle_service() -> ChartCandleService:
+    """Get or create the global chart candle service"""
+    global _chart_candle_service
+
+    if _chart_candle_service is None:
+        _chart_candle_service = ChartCandleService()
+    return _chart_candle_service
+
+
+async def close_chart_candle_service():
+    """Close the shared exchange client (application shutdown)"""
+    global _chart_candle_service
+
+    if _chart_candle_service is not None:
+        await _chart_candle_service.close()
+        _chart_candle_service = None
@@ -10,7 +10,8 @@ import logging
 from typing import Dict, List, Optional
 
 from .candle_generator import CandleGenerator, get_candle_generator
-from ..websockets.ws_server import broadcast_to_user, broadcast_to_all
+from .chart_candle_service import get_chart_candle_service
+from ..websockets.broadcast_hub import broadcast_hub
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,12 @@ class ChartDataService:
         """
         self.market_queue = market_queue
         self.candle_generator = get_candle_generator(candle_interval)
+        self.timeframe = (
+            f"{candle_interval // 3600}h" if candle_interval % 3600 == 0
+            else f"{candle_interval // 60}m" if candle_interval % 60 == 0
+            else f"{candle_interval}s"
+        )
+        self.chart_candles = get_chart_candle_service()
         self.is_running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -96,11 +103,17 @@ class ChartDataService:
                     timestamp=timestamp
                 )
 
+                # Multi-timeframe chart buffers (ticker volume is a rolling 24h figure,
+                # not per-tick volume, so it is not accumulated into bars)
+                self.chart_candles.process_tick(
+                    symbol=symbol, price=float(price), timestamp=timestamp
+                )
+
                 if completed_candle:
                     logger.info(f"✅ Candle completed for {symbol}: {completed_candle.to_dict()}")
 
                 # Broadcast updates to frontend
-                await self._broadcast_updates(symbol, completed_candle)
+                await self._broadcast_updates(symbol, completed_candle, float(price), timestamp)
 
             except asyncio.CancelledError:
                 logger.info("Tick processing cancelled")
@@ -111,50 +124,52 @@ class ChartDataService:
                 # Continue processing despite errors
                 await asyncio.sleep(0.1)
 
-    async def _broadcast_updates(self, symbol: str, completed_candle: Optional[dict]):
+    async def _broadcast_updates(
+        self, symbol: str, completed_candle: Optional[dict], price: float, timestamp
+    ):
         """
-        Broadcast candle updates to connected frontend clients
+        Publish tick/candle updates to subscribed frontend clients
+
+        price:{symbol} and chart:{symbol}:{timeframe} topics on broadcast_hub.
+        Publishing only enqueues on each subscriber's send queue, so a slow
+        browser never delays the tick loop.
 
         Args:
             symbol: Trading pair symbol
             completed_candle: Completed candle if any (from Candle object)
+            price: Tick price
+            timestamp: Tick timestamp
         """
         try:
-            # Get current candle
-            current_candle = self.candle_generator.get_current_candle(symbol)
+            broadcast_hub.publish(f"price:{symbol}", {
+                "type": "price_update",
+                "symbol": symbol,
+                "price": price,
+                "timestamp": timestamp,
+            })
+
+            chart_topic = f"chart:{symbol}:{self.timeframe}"
+            if not broadcast_hub.has_subscribers(chart_topic):
+                return
 
             # Prepare update message
             update = {
                 "type": "candle_update",
                 "symbol": symbol,
-                "current_candle": current_candle
+                "timeframe": self.timeframe,
+                "current_candle": self.candle_generator.get_current_candle(symbol)
             }
 
-            # Include completed candle if available
+            # Completed candles must not be conflated away by the next tick
             if completed_candle:
                 update["completed_candle"] = completed_candle.to_dict()
-
-            # Broadcast to all connected users
-            # TODO: Make this user-specific based on their active trading pairs
-            await self._broadcast_to_all_users(update)
+                broadcast_hub.publish(chart_topic, update, conflate_key=None)
+            else:
+                broadcast_hub.publish(chart_topic, update)
 
         except Exception as e:
             logger.error(f"Error broadcasting updates: {e}", exc_info=True)
 
-    async def _broadcast_to_all_users(self, message: dict):
-        """
-        Broadcast message to all connected users
-
-        Note: In production, filter by user's active symbols
-        """
-        try:
-            # Broadcast to all connected WebSocket clients
-            await broadcast_to_all(message)
-            logger.info(f"📡 Broadcasted: {message.get('type')} for {message.get('symbol')} - candle: {message.get('current_candle')}")
-
-        except Exception as e:
-            logger.error(f"Broadcast error: {e}", exc_info=True)
-
     def get_candles(self, symbol: str, limit: int = 100,
                    include_current: bool = True) -> List[dict]:
         """
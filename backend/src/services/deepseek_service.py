@@ -9,9 +9,12 @@ DeepSeek AI 서비스
 
 import logging
 import os
-import requests
 from typing import Dict, List, Any, Optional
+
+import httpx
+
 from src.config import settings
+from src.utils.http_client import request_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,7 @@ class DeepSeekAIService:
         self.base_url = "https://api.deepseek.com/v1"
         self.model = self.MODEL_VERSION
 
-    def _make_request(
+    async def _make_request(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
@@ -82,13 +85,16 @@ class DeepSeekAIService:
         }
 
         try:
-            # timeout=(connect_timeout, read_timeout)
             # connect: 5초 (연결 설정), read: 30초 (응답 대기)
-            response = requests.post(
+            # 공유 커넥션 풀 + 재시도 예산 (이벤트 루프를 블로킹하지 않음)
+            response = await request_with_retry(
+                "deepseek",
+                "POST",
                 f"{self.base_url}/chat/completions",
+                max_retries=1,
                 headers=headers,
                 json=payload,
-                timeout=(5, 30),
+                timeout=httpx.Timeout(30.0, connect=5.0),
             )
             response.raise_for_status()
 
@@ -102,7 +108,7 @@ class DeepSeekAIService:
             logger.error(f"DeepSeek API error: {str(e)}")
             raise
 
-    def generate_trading_strategies(self) -> List[Dict[str, Any]]:
+    async def generate_trading_strategies(self) -> List[Dict[str, Any]]:
         """기본 거래 전략 3개 생성"""
 
         system_prompt = """You are an expert cryptocurrency trading strategist. 
@@ -154,7 +160,7 @@ Return ONLY the JSON array, no additional text."""
 
         try:
             # generate_trading_strategies는 시스템 초기화 시 호출되므로 rate limit 제외
-            response = self._make_request(
+            response = await self._make_request(
                 messages, temperature=0.8, max_tokens=2000, require_user_id=False
             )
 
@@ -240,7 +246,7 @@ Return ONLY the JSON array, no additional text."""
             },
         ]
 
-    def get_trading_signal(
+    async def get_trading_signal(
         self,
         symbol: str,
         current_price: float,
@@ -338,7 +344,7 @@ Respond with JSON only:"""
         ]
 
         try:
-            response = self._make_request(
+            response = await self._make_request(
                 messages,
                 temperature=0.3,
                 max_tokens=200,
@@ -404,7 +410,7 @@ Respond with JSON only:"""
             "ai_powered": True,
         }
 
-    def analyze_market(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> str:
+    async def analyze_market(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> str:
         """시장 분석"""
 
         system_prompt = """You are an expert cryptocurrency market analyst.
@@ -433,7 +439,7 @@ Keep the response concise and in Korean."""
 
         try:
             # analyze_market은 내부 분석용으로 rate limit 제외
-            response = self._make_request(
+            response = await self._make_request(
                 messages, temperature=0.7, max_tokens=1000, require_user_id=False
             )
             return response or "시장 분석을 수행할 수 없습니다."
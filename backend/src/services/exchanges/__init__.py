@@ -24,6 +24,9 @@ from .okx_ws import OKXWebSocket
 from .bybit_ws import BybitWebSocket
 from .gateio_ws import GateioWebSocket
 
+# 통합 시세 피드 (거래소당 연결 하나)
+from .feed_manager import FeedGap, FeedManager, FeedRecord, FeedSubscription, feed_manager
+
 __all__ = [
     # REST API 클라이언트
     "BaseExchange",
@@ -42,4 +45,10 @@ __all__ = [
     "OKXWebSocket",
     "BybitWebSocket",
     "GateioWebSocket",
+    # 통합 시세 피드
+    "FeedGap",
+    "FeedManager",
+    "FeedRecord",
+    "FeedSubscription",
+    "feed_manager",
 ]
@@ -5,11 +5,30 @@
 새로운 거래소를 추가할 때는 이 BaseExchange를 상속받아 구현하면 됩니다.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 
 
+def load_ccxt(module_name: str) -> Any:
+    """
+    ccxt.async_support 지연 로드
+
+    첫 클라이언트 생성 시 로드해 거래소 모듈의 `ccxt` 속성으로 캐시합니다 (cold start 단축).
+    이후에는 일반 모듈 속성이므로 `patch("...binance.ccxt.binance")`처럼 교체할 수 있습니다.
+
+    Args:
+        module_name: 거래소 모듈 이름 (__name__)
+    """
+    module = sys.modules[module_name]
+    ccxt = module.__dict__.get("ccxt")
+    if ccxt is None:
+        import ccxt.async_support as ccxt
+        module.ccxt = ccxt
+    return ccxt
+
+
 class BaseExchange(ABC):
     """거래소 기본 추상 클래스"""
 
@@ -15,6 +15,8 @@ from typing import Dict, Callable, Optional, Any, List
 import logging
 from urllib.parse import urlencode
 
+from ...utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -210,7 +212,7 @@ class BinanceWebSocket:
     async def _handle_message(self, message: str):
         """메시지 처리"""
         try:
-            data = json.loads(message)
+            data = fast_json.loads(message)
 
             # 구독 응답
             if 'result' in data and data.get('result') is None:
@@ -14,6 +14,8 @@ import base64
 from typing import Dict, Callable, Optional, Any
 import logging
 
+from ...utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,7 +215,7 @@ class BitgetWebSocket:
                 logger.debug("Received pong from Bitget")
                 return
 
-            data = json.loads(message)
+            data = fast_json.loads(message)
 
             # 인증 응답
             if data.get('event') == 'login':
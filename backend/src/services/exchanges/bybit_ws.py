@@ -14,6 +14,8 @@ import time
 from typing import Dict, Callable, Optional, List
 import logging
 
+from ...utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -214,7 +216,7 @@ class BybitWebSocket:
     async def _handle_message(self, message: str):
         """메시지 처리"""
         try:
-            data = json.loads(message)
+            data = fast_json.loads(message)
 
             # Pong 응답
             if data.get('op') == 'pong':
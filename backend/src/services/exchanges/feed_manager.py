@@ -0,0 +1,872 @@
+"""
+거래소 통합 시세 피드 (Feed Manager)
+
+거래소별 WebSocket 클라이언트(BinanceWebSocket 등)는 각자 연결, 콜백 dict, 재연결 루프와
+메시지 형식을 가지고 있어 시세 경로에 연결하기 어렵습니다.
+FeedManager는 거래소당 연결 하나를 소유하고 모든 구독을 그 위에 합칩니다.
+
+- 구독은 (종류, 심볼, 인자) 스트림 키별 참조 카운트: 첫 구독자만 거래소에 구독 요청, 마지막 해제 시 구독 해제
+- ticker / candle / trade / orderbook 메시지를 거래소와 무관한 FeedRecord 하나로 정규화
+- 연결이 끊기면 백오프 후 재연결하고 살아 있는 스트림을 모두 다시 구독
+- 끊김 감지: 재연결 구간, 시퀀스 번호 건너뜀, 캔들 누락 시 구독자의 on_gap 호출 (REST로 보충)
+
+사용 예시:
+    from services.exchanges.feed_manager import feed_manager
+
+    def on_tick(record):
+        print(record.symbol, record.price)
+
+    sub = await feed_manager.subscribe("binance", "ticker", "BTCUSDT", on_tick)
+    ...
+    await feed_manager.unsubscribe(sub)
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("ticker", "candle", "trade", "orderbook")
+
+# (종류, 심볼, 인자) - 인자는 캔들 타임프레임 또는 호가 깊이 ("" = 기본값)
+StreamKey = Tuple[str, str, str]
+
+_TIMEFRAME_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def simple_symbol(symbol: str) -> str:
+    """BTC/USDT:USDT, BTC-USDT-SWAP, BTC_USDT -> BTCUSDT"""
+    symbol = symbol.split(":")[0].upper().replace("-SWAP", "")
+    return symbol.replace("/", "").replace("-", "").replace("_", "")
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """1m -> 60000, 4h -> 14400000 (알 수 없으면 0)"""
+    try:
+        return int(timeframe[:-1]) * _TIMEFRAME_MS[timeframe[-1].lower()]
+    except (ValueError, KeyError, IndexError):
+        return 0
+
+
+@dataclass(slots=True)
+class FeedRecord:
+    """
+    정규화된 시장 데이터 한 건 (거래소 공통)
+
+    - ticker: price=최근가, size=24h 거래량, high/low=24h
+    - candle: open/high/low/price(=close), size=거래량, interval, closed
+    - trade: price, size=체결 수량, side
+    - orderbook: bids/asks [[가격, 수량], ...], price=최우선 매수호가
+    """
+    exchange: str
+    kind: str
+    symbol: str  # BTCUSDT
+    ts: int  # 거래소 타임스탬프 (ms)
+    price: float = 0.0
+    size: float = 0.0
+    open: float = 0.0
+    high: float = 0.0
+    low: float = 0.0
+    side: Optional[str] = None
+    interval: Optional[str] = None
+    closed: bool = False
+    bids: Optional[List[List[float]]] = None
+    asks: Optional[List[List[float]]] = None
+    seq: Optional[int] = None
+    prev_seq: Optional[int] = None  # 직전 메시지의 seq (거래소가 제공할 때만)
+
+
+@dataclass
+class FeedGap:
+    """데이터 누락 구간 (구독자가 REST로 보충)"""
+    exchange: str
+    key: StreamKey
+    reason: str  # "reconnect" | "sequence" | "candle"
+    since_ms: int
+    until_ms: int
+
+
+@dataclass
+class FeedSubscription:
+    """subscribe() 반환값 (unsubscribe()에 전달)"""
+    exchange: str
+    key: StreamKey
+    callback: Callable[[FeedRecord], Any]
+    on_gap: Optional[Callable[[FeedGap], Any]] = None
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _levels(levels) -> List[List[float]]:
+    """[[p, q, ...], ...] 또는 [{"p": .., "s": ..}, ...] -> [[p, q], ...]"""
+    result = []
+    for level in levels or []:
+        if isinstance(level, dict):
+            result.append([float(level.get("p", 0)), float(level.get("s", 0))])
+        else:
+            result.append([float(level[0]), float(level[1])])
+    return result
+
+
+# ==================== 거래소 프로토콜 ====================
+
+
+class FeedProtocol:
+    """
+    거래소 하나의 구독 메시지 형식과 정규화
+
+    topic(): 스트림 키 -> 거래소 토픽 문자열 (메시지 라우팅 키로도 사용)
+    parse(): 원본 메시지 -> [(스트림 키, FeedRecord), ...]
+    """
+
+    name = ""
+    url = ""
+    ping_interval: Optional[float] = None  # 애플리케이션 레벨 ping 주기 (None = WebSocket ping만)
+
+    def __init__(self):
+        self._keys: Dict[str, StreamKey] = {}
+
+    def topic(self, key: StreamKey) -> str:
+        raise NotImplementedError
+
+    def register(self, key: StreamKey) -> str:
+        topic = self.topic(key)
+        self._keys[topic] = key
+        return topic
+
+    def forget(self, key: StreamKey):
+        self._keys.pop(self.topic(key), None)
+
+    def subscribe_messages(self, keys: List[StreamKey]) -> List[str]:
+        raise NotImplementedError
+
+    def unsubscribe_messages(self, keys: List[StreamKey]) -> List[str]:
+        raise NotImplementedError
+
+    def ping_message(self) -> Optional[str]:
+        return None
+
+    def parse(self, raw: str) -> List[Tuple[StreamKey, FeedRecord]]:
+        raise NotImplementedError
+
+    def _record(self, key: StreamKey, **fields) -> Tuple[StreamKey, FeedRecord]:
+        kind, symbol, arg = key
+        if kind == "candle":
+            fields.setdefault("interval", arg or "1m")
+        return key, FeedRecord(exchange=self.name, kind=kind, symbol=symbol, **fields)
+
+
+class BinanceFeedProtocol(FeedProtocol):
+    """Binance USDT-M 선물 (combined stream)"""
+
+    name = "binance"
+    url = "wss://fstream.binance.com/stream"
+
+    def topic(self, key: StreamKey) -> str:
+        kind, symbol, arg = key
+        base = symbol.lower()
+        if kind == "ticker":
+            return f"{base}@miniTicker"
+        if kind == "candle":
+            return f"{base}@kline_{arg or '1m'}"
+        if kind == "trade":
+            return f"{base}@aggTrade"
+        return f"{base}@depth{arg or '20'}@100ms"
+
+    def _message(self, method: str, keys: List[StreamKey]) -> List[str]:
+        params = [self.topic(key) for key in keys]
+        return [json.dumps({"method": method, "params": params, "id": _now_ms()})]
+
+    def subscribe_messages(self, keys):
+        return self._message("SUBSCRIBE", keys)
+
+    def unsubscribe_messages(self, keys):
+        return self._message("UNSUBSCRIBE", keys)
+
+    def parse(self, raw):
+        message = fast_json.loads(raw)
+        key = self._keys.get(message.get("stream"))
+        data = message.get("data")
+        if key is None or not data:
+            return []
+
+        kind = key[0]
+        if kind == "ticker":
+            return [self._record(
+                key, ts=data.get("E", 0), price=float(data["c"]), size=float(data.get("v", 0)),
+                open=float(data.get("o", 0)), high=float(data.get("h", 0)), low=float(data.get("l", 0)),
+            )]
+        if kind == "candle":
+            k = data["k"]
+            return [self._record(
+                key, ts=k["t"], price=float(k["c"]), size=float(k["v"]), open=float(k["o"]),
+                high=float(k["h"]), low=float(k["l"]), closed=k.get("x", False),
+            )]
+        if kind == "trade":
+            trade_id = data.get("a")
+            return [self._record(
+                key, ts=data.get("T", 0), price=float(data["p"]), size=float(data["q"]),
+                side="sell" if data.get("m") else "buy",  # m=True: 매수자가 maker
+                seq=trade_id, prev_seq=trade_id - 1 if trade_id is not None else None,
+            )]
+        bids = _levels(data.get("b"))
+        return [self._record(
+            key, ts=data.get("E", 0), price=bids[0][0] if bids else 0.0,
+            bids=bids, asks=_levels(data.get("a")), seq=data.get("u"), prev_seq=data.get("pu"),
+        )]
+
+
+class OKXFeedProtocol(FeedProtocol):
+    """OKX USDT 무기한 (public)"""
+
+    name = "okx"
+    url = "wss://ws.okx.com:8443/ws/v5/public"
+    ping_interval = 20.0
+
+    @staticmethod
+    def inst_id(symbol: str) -> str:
+        return f"{symbol[:-4]}-USDT-SWAP" if symbol.endswith("USDT") else symbol
+
+    @staticmethod
+    def channel(key: StreamKey) -> str:
+        kind, _, arg = key
+        if kind == "ticker":
+            return "tickers"
+        if kind == "candle":
+            tf = arg or "1m"
+            return f"candle{tf if tf.endswith('m') else tf.upper()}"  # 1h -> 1H
+        if kind == "trade":
+            return "trades"
+        return f"books{arg or '5'}"
+
+    def topic(self, key):
+        return f"{self.channel(key)}:{self.inst_id(key[1])}"
+
+    def _message(self, op: str, keys: List[StreamKey]) -> List[str]:
+        args = [{"channel": self.channel(key), "instId": self.inst_id(key[1])} for key in keys]
+        return [json.dumps({"op": op, "args": args})]
+
+    def subscribe_messages(self, keys):
+        return self._message("subscribe", keys)
+
+    def unsubscribe_messages(self, keys):
+        return self._message("unsubscribe", keys)
+
+    def ping_message(self):
+        return "ping"
+
+    def parse(self, raw):
+        if raw == "pong":
+            return []
+        message = fast_json.loads(raw)
+        arg = message.get("arg") or {}
+        key = self._keys.get(f"{arg.get('channel')}:{arg.get('instId')}")
+        if key is None or "data" not in message:
+            return []
+
+        kind = key[0]
+        records = []
+        for item in message["data"]:
+            if kind == "ticker":
+                records.append(self._record(
+                    key, ts=int(item["ts"]), price=float(item["last"]),
+                    size=float(item.get("vol24h", 0)), open=float(item.get("open24h", 0)),
+                    high=float(item.get("high24h", 0)), low=float(item.get("low24h", 0)),
+                ))
+            elif kind == "candle":
+                records.append(self._record(
+                    key, ts=int(item[0]), open=float(item[1]), high=float(item[2]),
+                    low=float(item[3]), price=float(item[4]), size=float(item[5]),
+                    closed=len(item) > 8 and item[8] == "1",
+                ))
+            elif kind == "trade":
+                records.append(self._record(
+                    key, ts=int(item["ts"]), price=float(item["px"]), size=float(item["sz"]),
+                    side=item.get("side"),
+                ))
+            else:
+                bids = _levels(item.get("bids"))
+                prev_seq = item.get("prevSeqId")
+                records.append(self._record(
+                    key, ts=int(item["ts"]), price=bids[0][0] if bids else 0.0,
+                    bids=bids, asks=_levels(item.get("asks")), seq=item.get("seqId"),
+                    prev_seq=prev_seq if prev_seq not in (None, -1) else None,
+                ))
+        return records
+
+
+class BybitFeedProtocol(FeedProtocol):
+    """Bybit USDT 무기한 (v5 linear)"""
+
+    name = "bybit"
+    url = "wss://stream.bybit.com/v5/public/linear"
+    ping_interval = 20.0
+
+    _TF = {"1m": "1", "3m": "3", "5m": "5", "15m": "15", "30m": "30", "1h": "60",
+           "2h": "120", "4h": "240", "6h": "360", "12h": "720", "1d": "D", "1w": "W"}
+
+    def topic(self, key):
+        kind, symbol, arg = key
+        if kind == "ticker":
+            return f"tickers.{symbol}"
+        if kind == "candle":
+            return f"kline.{self._TF.get(arg or '1m', arg)}.{symbol}"
+        if kind == "trade":
+            return f"publicTrade.{symbol}"
+        return f"orderbook.{arg or '50'}.{symbol}"
+
+    def subscribe_messages(self, keys):
+        return [json.dumps({"op": "subscribe", "args": [self.topic(key) for key in keys]})]
+
+    def unsubscribe_messages(self, keys):
+        return [json.dumps({"op": "unsubscribe", "args": [self.topic(key) for key in keys]})]
+
+    def ping_message(self):
+        return json.dumps({"op": "ping"})
+
+    def parse(self, raw):
+        message = fast_json.loads(raw)
+        key = self._keys.get(message.get("topic"))
+        data = message.get("data")
+        if key is None or data is None:
+            return []
+
+        kind = key[0]
+        ts = int(message.get("ts", 0))
+        if kind == "ticker":
+            # delta 메시지는 바뀐 필드만 포함
+            if "lastPrice" not in data:
+                return []
+            return [self._record(
+                key, ts=ts, price=float(data["lastPrice"]), size=float(data.get("volume24h", 0)),
+                high=float(data.get("highPrice24h", 0)), low=float(data.get("lowPrice24h", 0)),
+            )]
+        if kind == "candle":
+            return [
+                self._record(
+                    key, ts=int(item["start"]), open=float(item["open"]), high=float(item["high"]),
+                    low=float(item["low"]), price=float(item["close"]), size=float(item["volume"]),
+                    closed=bool(item.get("confirm")),
+                )
+                for item in data
+            ]
+        if kind == "trade":
+            return [
+                self._record(
+                    key, ts=int(item["T"]), price=float(item["p"]), size=float(item["v"]),
+                    side=item.get("S", "Buy").lower(),
+                )
+                for item in data
+            ]
+        bids = _levels(data.get("b"))
+        update_id = data.get("u")
+        is_delta = message.get("type") == "delta" and update_id is not None
+        return [self._record(
+            key, ts=ts, price=bids[0][0] if bids else 0.0, bids=bids, asks=_levels(data.get("a")),
+            seq=update_id, prev_seq=update_id - 1 if is_delta else None,
+        )]
+
+
+class GateioFeedProtocol(FeedProtocol):
+    """Gate.io USDT 무기한"""
+
+    name = "gateio"
+    url = "wss://fx-ws.gateio.ws/v4/ws/usdt"
+    ping_interval = 15.0
+
+    _CHANNELS = {
+        "ticker": "futures.tickers",
+        "candle": "futures.candlesticks",
+        "trade": "futures.trades",
+        "orderbook": "futures.order_book",
+    }
+
+    @staticmethod
+    def contract(symbol: str) -> str:
+        return f"{symbol[:-4]}_USDT" if symbol.endswith("USDT") else symbol
+
+    def _payload(self, key: StreamKey) -> List[str]:
+        kind, symbol, arg = key
+        contract = self.contract(symbol)
+        if kind == "candle":
+            return [f"{arg or '1m'}_{contract}"]
+        if kind == "orderbook":
+            return [contract, arg or "20", "0"]
+        return [contract]
+
+    def topic(self, key):
+        return f"{self._CHANNELS[key[0]]}:{self._payload(key)[0]}"
+
+    def _messages(self, event: str, keys: List[StreamKey]) -> List[str]:
+        return [
+            json.dumps({
+                "time": int(time.time()),
+                "channel": self._CHANNELS[key[0]],
+                "event": event,
+                "payload": self._payload(key),
+            })
+            for key in keys
+        ]
+
+    def subscribe_messages(self, keys):
+        return self._messages("subscribe", keys)
+
+    def unsubscribe_messages(self, keys):
+        return self._messages("unsubscribe", keys)
+
+    def ping_message(self):
+        return json.dumps({"time": int(time.time()), "channel": "futures.ping"})
+
+    def parse(self, raw):
+        message = fast_json.loads(raw)
+        if message.get("event") not in ("update", "all"):
+            return []
+        channel = message.get("channel")
+        result = message.get("result")
+        items = result if isinstance(result, list) else [result]
+
+        records = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            route = item.get("n") if channel == "futures.candlesticks" else item.get("contract")
+            key = self._keys.get(f"{channel}:{route}")
+            if key is None:
+                continue
+            kind = key[0]
+            if kind == "ticker":
+                records.append(self._record(
+                    key, ts=int(message.get("time_ms") or _now_ms()), price=float(item["last"]),
+                    size=float(item.get("volume_24h", 0)), high=float(item.get("high_24h", 0)),
+                    low=float(item.get("low_24h", 0)),
+                ))
+            elif kind == "candle":
+                records.append(self._record(
+                    key, ts=int(item["t"]) * 1000, open=float(item["o"]), high=float(item["h"]),
+                    low=float(item["l"]), price=float(item["c"]), size=float(item.get("v", 0)),
+                ))
+            elif kind == "trade":
+                size = float(item.get("size", 0))
+                records.append(self._record(
+                    key, ts=int(item.get("create_time_ms") or item.get("create_time", 0) * 1000),
+                    price=float(item["price"]), size=abs(size), side="buy" if size > 0 else "sell",
+                ))
+            else:
+                bids = _levels(item.get("bids"))
+                records.append(self._record(
+                    key, ts=int(item.get("t", 0)), price=bids[0][0] if bids else 0.0,
+                    bids=bids, asks=_levels(item.get("asks")),
+                ))
+        return records
+
+
+class BitgetFeedProtocol(FeedProtocol):
+    """Bitget USDT-M 선물 (v2 public)"""
+
+    name = "bitget"
+    url = "wss://ws.bitget.com/v2/ws/public"
+    ping_interval = 30.0
+
+    @staticmethod
+    def channel(key: StreamKey) -> str:
+        kind, _, arg = key
+        if kind == "ticker":
+            return "ticker"
+        if kind == "candle":
+            tf = arg or "1m"
+            return f"candle{tf if tf.endswith('m') else tf.upper()}"  # 1h -> 1H
+        if kind == "trade":
+            return "trade"
+        return f"books{arg or '5'}"
+
+    def topic(self, key):
+        return f"{self.channel(key)}:{key[1]}"
+
+    def _message(self, op: str, keys: List[StreamKey]) -> List[str]:
+        args = [
+            {"instType": "USDT-FUTURES", "channel": self.channel(key), "instId": key[1]}
+            for key in keys
+        ]
+        return [json.dumps({"op": op, "args": args})]
+
+    def subscribe_messages(self, keys):
+        return self._message("subscribe", keys)
+
+    def unsubscribe_messages(self, keys):
+        return self._message("unsubscribe", keys)
+
+    def ping_message(self):
+        return "ping"
+
+    def parse(self, raw):
+        if raw == "pong":
+            return []
+        message = fast_json.loads(raw)
+        arg = message.get("arg") or {}
+        key = self._keys.get(f"{arg.get('channel')}:{arg.get('instId')}")
+        if key is None or "data" not in message:
+            return []
+
+        kind = key[0]
+        records = []
+        for item in message["data"]:
+            if kind == "ticker":
+                records.append(self._record(
+                    key, ts=int(item.get("ts", 0)), price=float(item["lastPr"]),
+                    size=float(item.get("baseVolume", 0)), open=float(item.get("open24h", 0)),
+                    high=float(item.get("high24h", 0)), low=float(item.get("low24h", 0)),
+                ))
+            elif kind == "candle":
+                records.append(self._record(
+                    key, ts=int(item[0]), open=float(item[1]), high=float(item[2]),
+                    low=float(item[3]), price=float(item[4]), size=float(item[5]),
+                ))
+            elif kind == "trade":
+                records.append(self._record(
+                    key, ts=int(item["ts"]), price=float(item["price"]), size=float(item["size"]),
+                    side=item.get("side"),
+                ))
+            else:
+                bids = _levels(item.get("bids"))
+                records.append(self._record(
+                    key, ts=int(item.get("ts", 0)), price=bids[0][0] if bids else 0.0,
+                    bids=bids, asks=_levels(item.get("asks")), seq=item.get("seq"),
+                ))
+        return records
+
+
+PROTOCOLS: Dict[str, type] = {
+    "binance": BinanceFeedProtocol,
+    "okx": OKXFeedProtocol,
+    "bybit": BybitFeedProtocol,
+    "gateio": GateioFeedProtocol,
+    "bitget": BitgetFeedProtocol,
+}
+
+
+# ==================== 연결 ====================
+
+
+@dataclass
+class FeedStats:
+    """거래소 연결 통계"""
+    connects: int = 0
+    reconnects: int = 0
+    messages: int = 0
+    records: int = 0
+    parse_errors: int = 0
+    callback_errors: int = 0
+    gaps: Dict[str, int] = field(default_factory=dict)
+    last_message_at: float = 0.0
+
+
+class ExchangeFeed:
+    """
+    거래소 하나의 WebSocket 연결
+
+    구독이 생기면 연결 태스크를 시작하고, 모든 구독이 해제되면 연결을 닫습니다.
+    """
+
+    def __init__(
+        self,
+        protocol: FeedProtocol,
+        connect: Callable,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self.protocol = protocol
+        self._connect = connect
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._subs: Dict[StreamKey, List[FeedSubscription]] = {}
+        self._subs_lock = asyncio.Lock()
+        self._last_seq: Dict[StreamKey, Any] = {}
+        self._last_ts: Dict[StreamKey, int] = {}
+        self._disconnected_at: Optional[int] = None
+        self._callback_tasks: set = set()  # 비동기 콜백 태스크 (참조 유지)
+        self.stats = FeedStats()
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None
+
+    # ---------- 구독 ----------
+
+    # add/remove는 구독 메시지 전송을 기다리므로 피드별 잠금으로 직렬화
+    # (해제 중인 스트림을 동시에 다시 구독하면 forget이 새 구독의 라우팅을 지우는 문제 방지)
+
+    async def add(self, sub: FeedSubscription):
+        async with self._subs_lock:
+            subs = self._subs.get(sub.key)
+            if subs is None:
+                subs = self._subs[sub.key] = []
+                self.protocol.register(sub.key)
+                if self.connected:
+                    await self._send_all(self.protocol.subscribe_messages([sub.key]))
+            subs.append(sub)
+
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+
+    async def remove(self, sub: FeedSubscription):
+        async with self._subs_lock:
+            subs = self._subs.get(sub.key)
+            if not subs or sub not in subs:
+                return
+            subs.remove(sub)
+            if subs:
+                return
+
+            del self._subs[sub.key]
+            self._last_seq.pop(sub.key, None)
+            self._last_ts.pop(sub.key, None)
+            if self.connected:
+                await self._send_all(self.protocol.unsubscribe_messages([sub.key]))
+            self.protocol.forget(sub.key)
+
+            if not self._subs:
+                await self.close()
+
+    # ---------- 연결 루프 ----------
+
+    async def _run(self):
+        backoff = self.min_backoff
+        while self._subs:
+            try:
+                async with self._connect(self.protocol.url) as ws:
+                    self.ws = ws
+                    backoff = self.min_backoff
+                    self.stats.connects += 1
+                    await self._on_connected()
+
+                    ping_task = None
+                    if self.protocol.ping_interval and self.protocol.ping_message():
+                        ping_task = asyncio.create_task(self._ping_loop(ws))
+                    try:
+                        async for raw in ws:
+                            self._dispatch(raw)
+                    finally:
+                        if ping_task:
+                            ping_task.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"{self.protocol.name} feed connection error: {e}")
+            finally:
+                self.ws = None
+
+            if not self._subs:
+                break
+            self._disconnected_at = _now_ms()
+            self.stats.reconnects += 1
+            delay = backoff + random.uniform(0, backoff / 2)
+            logger.warning(f"{self.protocol.name} feed disconnected, reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _on_connected(self):
+        """연결 직후 살아 있는 스트림 전부 재구독, 재연결이면 끊긴 구간을 구독자에게 알림"""
+        keys = list(self._subs)
+        if keys:
+            await self._send_all(self.protocol.subscribe_messages(keys))
+        logger.info(f"📡 {self.protocol.name} feed connected ({len(keys)} streams)")
+
+        if self._disconnected_at is not None:
+            since, until = self._disconnected_at, _now_ms()
+            self._disconnected_at = None
+            for key in keys:
+                # 재연결 후 첫 메시지는 새 스냅샷이므로 시퀀스 비교를 다시 시작
+                self._last_seq.pop(key, None)
+                self._gap(key, "reconnect", self._last_ts.get(key, since), until)
+
+    async def _send_all(self, messages: List[str]):
+        try:
+            for message in messages:
+                await self.ws.send(message)
+        except Exception as e:
+            # 연결 루프가 재연결 후 다시 구독함
+            logger.warning(f"{self.protocol.name} feed send failed: {e}")
+
+    async def _ping_loop(self, ws):
+        while True:
+            await asyncio.sleep(self.protocol.ping_interval)
+            try:
+                await ws.send(self.protocol.ping_message())
+            except Exception:
+                return
+
+    # ---------- 메시지 처리 ----------
+
+    def _dispatch(self, raw):
+        self.stats.messages += 1
+        self.stats.last_message_at = time.time()
+        try:
+            records = self.protocol.parse(raw)
+        except Exception as e:
+            self.stats.parse_errors += 1
+            logger.debug(f"{self.protocol.name} feed parse error: {e}")
+            return
+
+        for key, record in records:
+            subs = self._subs.get(key)
+            if not subs:
+                continue
+            self.stats.records += 1
+            self._check_gap(key, record)
+            for sub in list(subs):
+                self._call(sub.callback, record)
+
+    def _check_gap(self, key: StreamKey, record: FeedRecord):
+        last_seq = self._last_seq.get(key)
+        if record.prev_seq is not None and last_seq is not None and record.prev_seq != last_seq:
+            self._gap(key, "sequence", self._last_ts.get(key, record.ts), record.ts)
+        if record.seq is not None:
+            self._last_seq[key] = record.seq
+
+        last_ts = self._last_ts.get(key)
+        if record.kind == "candle" and last_ts is not None:
+            step = timeframe_ms(record.interval or "")
+            if step and record.ts - last_ts > step:
+                self._gap(key, "candle", last_ts + step, record.ts)
+        if last_ts is None or record.ts >= last_ts:
+            self._last_ts[key] = record.ts
+
+    def _gap(self, key: StreamKey, reason: str, since_ms: int, until_ms: int):
+        self.stats.gaps[reason] = self.stats.gaps.get(reason, 0) + 1
+        gap = FeedGap(self.protocol.name, key, reason, since_ms, until_ms)
+        logger.info(f"{self.protocol.name} feed gap ({reason}) on {key}: {until_ms - since_ms}ms")
+        for sub in list(self._subs.get(key, [])):
+            if sub.on_gap is not None:
+                self._call(sub.on_gap, gap)
+
+    def _call(self, callback: Callable, arg: Any):
+        try:
+            result = callback(arg)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_done)
+        except Exception as e:
+            self.stats.callback_errors += 1
+            logger.error(f"{self.protocol.name} feed callback error: {e}")
+
+    def _callback_done(self, task: asyncio.Future):
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.callback_errors += 1
+            logger.error(f"{self.protocol.name} feed callback error: {task.exception()}")
+
+    async def close(self):
+        task, self._task = self._task, None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self.ws = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "streams": {"|".join(filter(None, key)): len(subs) for key, subs in self._subs.items()},
+            "connects": self.stats.connects,
+            "reconnects": self.stats.reconnects,
+            "messages": self.stats.messages,
+            "records": self.stats.records,
+            "parse_errors": self.stats.parse_errors,
+            "callback_errors": self.stats.callback_errors,
+            "gaps": dict(self.stats.gaps),
+            "last_message_age_s": (
+                round(time.time() - self.stats.last_message_at, 1) if self.stats.last_message_at else None
+            ),
+        }
+
+
+class FeedManager:
+    """거래소별 ExchangeFeed 보관 + 구독 API"""
+
+    def __init__(self, connect: Optional[Callable] = None, min_backoff: float = 1.0):
+        self._connect = connect
+        self.min_backoff = min_backoff
+        self._feeds: Dict[str, ExchangeFeed] = {}
+
+    @staticmethod
+    def supports(exchange: str) -> bool:
+        return (exchange or "").lower() in PROTOCOLS
+
+    def _connector(self) -> Callable:
+        if self._connect is None:
+            import websockets
+
+            self._connect = lambda url: websockets.connect(
+                url, ping_interval=20, ping_timeout=10, max_size=2 ** 22
+            )
+        return self._connect
+
+    def _feed(self, exchange: str) -> ExchangeFeed:
+        feed = self._feeds.get(exchange)
+        if feed is None:
+            feed = self._feeds[exchange] = ExchangeFeed(
+                PROTOCOLS[exchange](), self._connector(), min_backoff=self.min_backoff
+            )
+        return feed
+
+    async def subscribe(
+        self,
+        exchange: str,
+        kind: str,
+        symbol: str,
+        callback: Callable[[FeedRecord], Any],
+        arg: str = "",
+        on_gap: Optional[Callable[[FeedGap], Any]] = None,
+    ) -> FeedSubscription:
+        """
+        스트림 구독 (같은 스트림의 구독자는 거래소 구독 하나를 공유)
+
+        Args:
+            exchange: binance, okx, bybit, gateio, bitget
+            kind: ticker, candle, trade, orderbook
+            symbol: BTCUSDT, BTC/USDT, BTC/USDT:USDT 모두 가능
+            callback: FeedRecord를 받는 함수 (코루틴 함수면 태스크로 실행)
+            arg: 캔들 타임프레임 (예: "5m") 또는 호가 깊이
+            on_gap: 데이터 누락 시 FeedGap을 받는 함수
+        """
+        exchange = exchange.lower()
+        if exchange not in PROTOCOLS:
+            raise ValueError(f"Unsupported feed exchange: {exchange}")
+        if kind not in KINDS:
+            raise ValueError(f"Unsupported feed kind: {kind}")
+
+        sub = FeedSubscription(exchange, (kind, simple_symbol(symbol), arg or ""), callback, on_gap)
+        await self._feed(exchange).add(sub)
+        return sub
+
+    async def unsubscribe(self, sub: FeedSubscription):
+        feed = self._feeds.get(sub.exchange)
+        if feed is not None:
+            await feed.remove(sub)
+
+    async def close(self):
+        """모든 연결 종료 (lifespan 종료 시)"""
+        for feed in self._feeds.values():
+            await feed.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {name: feed.get_stats() for name, feed in self._feeds.items()}
+
+
+# 싱글톤 인스턴스
+feed_manager = FeedManager()
@@ -4,15 +4,21 @@ OKX 거래소 REST API 클라이언트
 CCXT를 사용한 OKX USDT-M 선물 거래 구현
 """
 
-import ccxt.async_support as ccxt
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
-from .base import BaseExchange
+from .base import BaseExchange, load_ccxt
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    # ccxt는 첫 사용 시 로드 (cold start 단축)
+    if name == "ccxt":
+        return load_ccxt(__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class OKXExchange(BaseExchange):
     """OKX 거래소 클라이언트"""
 
@@ -27,6 +33,8 @@ class OKXExchange(BaseExchange):
         """
         super().__init__(api_key, secret_key, passphrase)
 
+        ccxt = load_ccxt(__name__)
+
         self.exchange = ccxt.okx({
             'apiKey': api_key,
             'secret': secret_key,
@@ -15,6 +15,8 @@ import time
 from typing import Dict, Callable, Optional, List
 import logging
 
+from ...utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -237,7 +239,7 @@ class OKXWebSocket:
                 logger.debug("Received pong from OKX")
                 return
 
-            data = json.loads(message)
+            data = fast_json.loads(message)
 
             # 이벤트 응답 (login, subscribe, error)
             if 'event' in data:
@@ -13,6 +13,11 @@
 지원 모드:
 - ARITHMETIC: 등차 그리드 (균등 가격 간격)
 - GEOMETRIC: 등비 그리드 (균등 비율 간격)
+
+체결 감지:
+- Private 주문 스트림(orders 채널)의 체결 이벤트로 해당 그리드만 갱신
+- 스트림 (재)연결 시에만 전체 그리드를 REST로 한 번 대사
+- 스트림이 끊긴 동안은 미체결 목록에서 사라진 그리드 주문만 주문 이력으로 REST 확인
 """
 
 import asyncio
@@ -38,6 +43,11 @@ from ..database.models import (
     ApiKey,
 )
 from ..services.bitget_rest import get_bitget_rest, OrderSide
+from ..services.bitget_order_stream import (
+    acquire_order_stream,
+    normalize_symbol,
+    release_order_stream,
+)
 from ..services.allocation_manager import allocation_manager
 from ..utils.crypto_secrets import decrypt_secret
 from ..services.trade_executor import InvalidApiKeyError
@@ -46,6 +56,46 @@ from ..services.telegram import get_telegram_notifier, TradeResult
 logger = logging.getLogger(__name__)
 
 
+class GridLevelIndex:
+    """
+    그리드 레벨 인덱스
+
+    - 거래소 주문 ID → 그리드 주문 매핑: 체결 이벤트를 O(1)로 그리드에 연결
+    - 그리드 번호 → 그리드 주문: 매도 가격(한 단계 위 그리드) O(1) 조회
+    """
+
+    def __init__(self, grid_orders: List[GridOrder]):
+        self._by_index: Dict[int, GridOrder] = {o.grid_index: o for o in grid_orders}
+        self._by_order_id: Dict[str, GridOrder] = {}
+
+        for order in grid_orders:
+            if order.buy_order_id:
+                self._by_order_id[order.buy_order_id] = order
+            if order.sell_order_id:
+                self._by_order_id[order.sell_order_id] = order
+
+    def track(self, order_id: Optional[str], order: GridOrder):
+        """새로 발주한 주문 ID 등록"""
+        if order_id:
+            self._by_order_id[order_id] = order
+
+    def find(self, order_id: Optional[str]) -> Optional[GridOrder]:
+        """주문 ID로 그리드 조회 (현재 그리드의 활성 주문일 때만)"""
+        order = self._by_order_id.get(order_id) if order_id else None
+        if order is None:
+            return None
+        if order_id not in (order.buy_order_id, order.sell_order_id):
+            # 사이클이 재시작되어 더 이상 유효하지 않은 주문 ID
+            del self._by_order_id[order_id]
+            return None
+        return order
+
+    def next_price(self, grid_index: int) -> Optional[float]:
+        """한 단계 위 그리드 가격"""
+        order = self._by_index.get(grid_index + 1)
+        return float(order.grid_price) if order is not None else None
+
+
 class GridBotRunner:
     """
     그리드 봇 실행 관리자
@@ -57,10 +107,15 @@ class GridBotRunner:
     4. 수익 계산 및 기록
     """
 
+    # 주문 스트림이 끊겼을 때 미체결 주문 REST 대사 주기 (초)
+    FALLBACK_POLL_INTERVAL = 5.0
+
     def __init__(self, market_queue: asyncio.Queue):
+        # 공유 market_queue는 소비하지 않음 (다른 봇의 틱을 가져가거나 순서를 바꾸지 않도록)
         self.market_queue = market_queue
         self.tasks: Dict[int, asyncio.Task] = {}  # bot_instance_id -> Task
         self._stop_flags: Dict[int, bool] = {}  # Graceful shutdown flags
+        self._indexes: Dict[int, GridLevelIndex] = {}  # bot_instance_id -> 그리드 인덱스
 
     def is_running(self, bot_instance_id: int) -> bool:
         """봇이 실행 중인지 확인"""
@@ -184,7 +239,8 @@ class GridBotRunner:
 
                 # 2. Bitget 클라이언트 초기화
                 try:
-                    bitget_client = await self._init_bitget_client(session, user_id)
+                    credentials = await self._load_api_credentials(session, user_id)
+                    bitget_client = get_bitget_rest(*credentials)
                 except InvalidApiKeyError as e:
                     logger.error(f"Invalid API key for user {user_id}: {e}")
                     await self._update_bot_error(
@@ -204,6 +260,8 @@ class GridBotRunner:
                 grid_orders = await self._initialize_grid_orders(
                     session, grid_config.id, grid_prices
                 )
+                index = GridLevelIndex(grid_orders)
+                self._indexes[bot_instance_id] = index
 
                 # 5. 현재 가격 조회 및 초기 주문 설정
                 symbol = bot_instance.symbol
@@ -219,82 +277,93 @@ class GridBotRunner:
                         current_price,
                     )
 
-                # 6. 체결 모니터링 루프
-                # market_queue에서 가격 수신, 타임아웃 시 REST 폴백
-                queue_timeout = 5.0  # 5초 타임아웃
+                # 6. 체결 모니터링 루프 (Private 주문 스트림 이벤트 기반)
+                events: asyncio.Queue = asyncio.Queue()
+                bot_symbol = normalize_symbol(symbol)
+
+                def on_order(update: dict):
+                    if update["symbol"] == bot_symbol and update["status"] == "filled":
+                        events.put_nowait(("fill", update))
+
+                def on_connect():
+                    events.put_nowait(("reconcile", None))
+
+                stream = acquire_order_stream(user_id, *credentials)
+                listener = stream.add_listener(on_order, on_connect)
+
                 consecutive_errors = 0
                 max_errors = 10
-                last_check_time = datetime.utcnow()
-                check_interval_seconds = 3  # 최소 체결 확인 간격
 
                 logger.info(
-                    f"Grid bot {bot_instance_id}: Starting price monitoring loop (queue + REST fallback)"
+                    f"Grid bot {bot_instance_id}: Monitoring fills via private order stream"
                 )
 
-                while not self._stop_flags.get(bot_instance_id, False):
-                    try:
-                        # market_queue에서 가격 데이터 수신 시도
+                try:
+                    while not self._stop_flags.get(bot_instance_id, False):
                         try:
-                            market_data = await asyncio.wait_for(
-                                self.market_queue.get(), timeout=queue_timeout
-                            )
-                            # 심볼 매칭 확인
-                            market_symbol = market_data.get("symbol", "")
-                            if market_symbol == symbol or symbol in market_symbol:
-                                current_price = float(market_data.get("price", 0))
-                                logger.debug(
-                                    f"Grid bot {bot_instance_id}: Price from queue: ${current_price:.2f}"
+                            try:
+                                kind, update = await asyncio.wait_for(
+                                    events.get(), timeout=self.FALLBACK_POLL_INTERVAL
                                 )
-                            else:
-                                # 다른 심볼 데이터는 다시 큐에 넣음 (다른 봇용)
-                                # 단, 큐가 가득 차면 버림
-                                try:
-                                    self.market_queue.put_nowait(market_data)
-                                except asyncio.QueueFull:
-                                    pass
-                                continue
-                        except asyncio.TimeoutError:
-                            # 타임아웃 시 REST API 폴백
-                            current_price = await self._get_current_price(
-                                bitget_client, symbol
-                            )
-                            if current_price:
-                                logger.debug(
-                                    f"Grid bot {bot_instance_id}: Price from REST: ${current_price:.2f}"
+                            except asyncio.TimeoutError:
+                                if stream.is_connected:
+                                    continue
+                                # 스트림 끊김: 미체결 목록에서 사라진 그리드 주문을 REST로 대사
+                                # (현재가 교차만 보면 폴링 사이에 닿았다 되돌아간 체결을 놓침)
+                                await self._reconcile_open_orders(
+                                    session,
+                                    bitget_client,
+                                    bot_instance,
+                                    grid_config,
+                                    grid_orders,
                                 )
+                                consecutive_errors = 0
+                                continue
 
-                        # 최소 간격 체크 (너무 자주 체결 확인하지 않도록)
-                        now = datetime.utcnow()
-                        elapsed = (now - last_check_time).total_seconds()
-                        if elapsed < check_interval_seconds:
-                            continue
-
-                        if current_price and current_price > 0:
-                            # 체결 확인 및 주문 갱신
-                            await self._check_and_update_orders(
-                                session,
-                                bitget_client,
-                                bot_instance,
-                                grid_config,
-                                grid_orders,
-                                current_price,
-                            )
-                            last_check_time = now
-
-                        consecutive_errors = 0
-
-                    except Exception as e:
-                        consecutive_errors += 1
-                        logger.error(
-                            f"Grid bot {bot_instance_id} error ({consecutive_errors}/{max_errors}): {e}",
-                            exc_info=True,
-                        )
-                        if consecutive_errors >= max_errors:
-                            await self._update_bot_error(
-                                session, bot_instance_id, "TOO_MANY_ERRORS"
+                            if kind == "reconcile":
+                                # (재)연결 시 놓친 체결을 전체 그리드 REST 조회로 대사
+                                logger.info(
+                                    f"Grid bot {bot_instance_id}: Reconciling grid orders via REST"
+                                )
+                                await self._check_and_update_orders(
+                                    session,
+                                    bitget_client,
+                                    bot_instance,
+                                    grid_config,
+                                    grid_orders,
+                                )
+                            else:
+                                order = index.find(update["order_id"])
+                                if order is not None:
+                                    await self._apply_fill(
+                                        session,
+                                        bitget_client,
+                                        bot_instance,
+                                        grid_config,
+                                        grid_orders,
+                                        order,
+                                        update["avg_price"],
+                                        update["filled_qty"],
+                                    )
+                                    await session.commit()
+
+                            consecutive_errors = 0
+
+                        except Exception as e:
+                            consecutive_errors += 1
+                            logger.error(
+                                f"Grid bot {bot_instance_id} error ({consecutive_errors}/{max_errors}): {e}",
+                                exc_info=True,
                             )
-                            break
-                        await asyncio.sleep(queue_timeout)
+                            if consecutive_errors >= max_errors:
+                                await self._update_bot_error(
+                                    session, bot_instance_id, "TOO_MANY_ERRORS"
+                                )
+                                break
+                            await asyncio.sleep(self.FALLBACK_POLL_INTERVAL)
+                finally:
+                    stream.remove_listener(listener)
+                    await release_order_stream(user_id)
 
         except asyncio.CancelledError:
             logger.info(f"Grid bot {bot_instance_id} cancelled")
@@ -316,6 +385,7 @@ class GridBotRunner:
                 del self.tasks[bot_instance_id]
             if bot_instance_id in self._stop_flags:
                 del self._stop_flags[bot_instance_id]
+            self._indexes.pop(bot_instance_id, None)
             logger.info(f"Grid bot {bot_instance_id} loop ended")
 
     # ============================================================
@@ -362,6 +432,7 @@ class GridBotRunner:
                     if order_id:
                         order.buy_order_id = order_id
                         order.status = GridOrderStatus.BUY_PLACED
+                        self._track_order(bot_instance.id, order_id, order)
                         placed_count += 1
 
                         logger.info(
@@ -386,113 +457,193 @@ class GridBotRunner:
         bot_instance: BotInstance,
         grid_config: GridBotConfig,
         grid_orders: List[GridOrder],
-        current_price: float,
     ):
-        """체결 확인 및 주문 갱신"""
+        """전체 그리드 REST 체결 확인 및 주문 갱신 (주문 스트림 (재)연결 시)"""
         symbol = bot_instance.symbol
-        per_grid = self.calculate_per_grid_amount(
-            float(grid_config.total_investment),
-            grid_config.grid_count,
-            bot_instance.max_leverage,
-        )
 
         for order in grid_orders:
             try:
-                # 1. 매수 주문 체결 확인
-                if order.status == GridOrderStatus.BUY_PLACED and order.buy_order_id:
-                    filled = await self._check_order_filled(
-                        bitget_client, order.buy_order_id, symbol
+                order_id = self._active_order_id(order)
+                if order_id is None:
+                    continue
+
+                filled = await self._check_order_filled(bitget_client, order_id, symbol)
+                if filled:
+                    filled_price, filled_qty = filled
+                    await self._apply_fill(
+                        session,
+                        bitget_client,
+                        bot_instance,
+                        grid_config,
+                        grid_orders,
+                        order,
+                        filled_price,
+                        filled_qty,
                     )
 
-                    if filled:
-                        filled_price, filled_qty = filled
-                        order.buy_filled_price = Decimal(str(filled_price))
-                        order.buy_filled_qty = Decimal(str(filled_qty))
-                        order.buy_filled_at = datetime.utcnow()
-                        order.status = GridOrderStatus.BUY_FILLED
+            except Exception as e:
+                logger.error(f"Error processing grid {order.grid_index}: {e}")
 
-                        logger.info(
-                            f"Grid {order.grid_index}: Buy FILLED at ${filled_price:.2f}, qty={filled_qty:.6f}"
-                        )
+        await session.commit()
 
-                        # WebSocket 알림 (NEW)
-                        await self._notify_grid_order_update(
-                            bot_instance.user_id,
-                            bot_instance.id,
-                            order.grid_index,
-                            "buy_filled",
-                            filled_price,
-                            filled_qty,
-                        )
+    async def _reconcile_open_orders(
+        self,
+        session: AsyncSession,
+        bitget_client,
+        bot_instance: BotInstance,
+        grid_config: GridBotConfig,
+        grid_orders: List[GridOrder],
+    ):
+        """
+        미체결 주문 목록 기준 REST 대사 (주문 스트림 끊김 시)
 
-                        # 매도 주문 설정 (한 단계 위 가격)
-                        sell_price = self._get_next_sell_price(
-                            grid_orders, order.grid_index
-                        )
-                        if sell_price:
-                            await self._place_sell_order(
-                                session,
-                                bitget_client,
-                                bot_instance,
-                                order,
-                                sell_price,
-                                filled_qty,
-                            )
+        미체결 목록에서 사라진 그리드 주문만 주문 이력에서 체결 여부를 확인합니다.
+        """
+        symbol = bot_instance.symbol
+        open_ids = {
+            o.get("orderId") for o in await bitget_client.get_open_orders(symbol=symbol)
+        }
+        gone = [
+            order for order in grid_orders
+            if (order_id := self._active_order_id(order)) and order_id not in open_ids
+        ]
+        if not gone:
+            return
 
-                # 2. 매도 주문 체결 확인
-                elif (
-                    order.status == GridOrderStatus.SELL_PLACED and order.sell_order_id
-                ):
-                    filled = await self._check_order_filled(
-                        bitget_client, order.sell_order_id, symbol
-                    )
+        history = {
+            o.get("orderId"): o for o in await bitget_client.get_order_history(symbol)
+        }
+        for order in gone:
+            order_id = self._active_order_id(order)
+            info = history.get(order_id)
+            if info is None or info.get("state") != "filled":
+                # 취소됐거나 아직 이력에 없음: 다음 대사 때 다시 확인
+                logger.debug(f"Grid {order.grid_index}: order {order_id} not filled yet")
+                continue
+            try:
+                await self._apply_fill(
+                    session,
+                    bitget_client,
+                    bot_instance,
+                    grid_config,
+                    grid_orders,
+                    order,
+                    float(info.get("priceAvg") or order.grid_price),
+                    float(info.get("baseVolume") or 0),
+                )
+            except Exception as e:
+                logger.error(f"Error processing grid {order.grid_index}: {e}")
 
-                    if filled:
-                        filled_price, filled_qty = filled
-                        order.sell_filled_price = Decimal(str(filled_price))
-                        order.sell_filled_qty = Decimal(str(filled_qty))
-                        order.sell_filled_at = datetime.utcnow()
+        await session.commit()
 
-                        # 수익 계산
-                        buy_price = float(order.buy_filled_price or order.grid_price)
-                        profit = (filled_price - buy_price) * filled_qty
-                        order.profit = Decimal(str(profit))
-                        order.status = GridOrderStatus.SELL_FILLED
+    @staticmethod
+    def _active_order_id(order: GridOrder) -> Optional[str]:
+        """체결 대기 중인 거래소 주문 ID (없으면 None)"""
+        if order.status == GridOrderStatus.BUY_PLACED:
+            return order.buy_order_id
+        if order.status == GridOrderStatus.SELL_PLACED:
+            return order.sell_order_id
+        return None
 
-                        logger.info(
-                            f"Grid {order.grid_index}: Sell FILLED at ${filled_price:.2f}, "
-                            f"profit=${profit:.4f}"
-                        )
+    async def _apply_fill(
+        self,
+        session: AsyncSession,
+        bitget_client,
+        bot_instance: BotInstance,
+        grid_config: GridBotConfig,
+        grid_orders: List[GridOrder],
+        order: GridOrder,
+        filled_price: float,
+        filled_qty: float,
+    ):
+        """그리드 주문 체결 처리 (매수 체결 → 매도 설정, 매도 체결 → 수익 기록 후 사이클 재시작)"""
+        # 1. 매수 주문 체결
+        if order.status == GridOrderStatus.BUY_PLACED:
+            order.buy_filled_price = Decimal(str(filled_price))
+            order.buy_filled_qty = Decimal(str(filled_qty))
+            order.buy_filled_at = datetime.utcnow()
+            order.status = GridOrderStatus.BUY_FILLED
+
+            logger.info(
+                f"Grid {order.grid_index}: Buy FILLED at ${filled_price:.2f}, qty={filled_qty:.6f}"
+            )
 
-                        # WebSocket 알림 - 사이클 완료 (NEW)
-                        await self._notify_grid_cycle_complete(
-                            bot_instance.user_id,
-                            bot_instance.id,
-                            order.grid_index,
-                            profit,
-                            buy_price,
-                            filled_price,
-                            filled_qty,
-                        )
+            # WebSocket 알림 (NEW)
+            await self._notify_grid_order_update(
+                bot_instance.user_id,
+                bot_instance.id,
+                order.grid_index,
+                "buy_filled",
+                filled_price,
+                filled_qty,
+            )
 
-                        # 거래 기록
-                        await self._record_grid_trade(
-                            session, bot_instance, order, profit
-                        )
+            # 매도 주문 설정 (한 단계 위 가격)
+            index = self._indexes.get(bot_instance.id)
+            if index is not None:
+                sell_price = index.next_price(order.grid_index)
+            else:
+                sell_price = self._get_next_sell_price(grid_orders, order.grid_index)
+            if sell_price:
+                await self._place_sell_order(
+                    session,
+                    bitget_client,
+                    bot_instance,
+                    order,
+                    sell_price,
+                    filled_qty,
+                )
 
-                        # 사이클 재시작: 같은 가격에 매수 주문 재설정
-                        await self._restart_grid_cycle(
-                            session, bitget_client, bot_instance, order, per_grid
-                        )
+        # 2. 매도 주문 체결
+        elif order.status == GridOrderStatus.SELL_PLACED:
+            order.sell_filled_price = Decimal(str(filled_price))
+            order.sell_filled_qty = Decimal(str(filled_qty))
+            order.sell_filled_at = datetime.utcnow()
+
+            # 수익 계산
+            buy_price = float(order.buy_filled_price or order.grid_price)
+            profit = (filled_price - buy_price) * filled_qty
+            order.profit = Decimal(str(profit))
+            order.status = GridOrderStatus.SELL_FILLED
+
+            logger.info(
+                f"Grid {order.grid_index}: Sell FILLED at ${filled_price:.2f}, "
+                f"profit=${profit:.4f}"
+            )
 
-                        # 텔레그램 알림
-                        if bot_instance.telegram_notify:
-                            await self._notify_grid_profit(bot_instance, order, profit)
+            # WebSocket 알림 - 사이클 완료 (NEW)
+            await self._notify_grid_cycle_complete(
+                bot_instance.user_id,
+                bot_instance.id,
+                order.grid_index,
+                profit,
+                buy_price,
+                filled_price,
+                filled_qty,
+            )
 
-            except Exception as e:
-                logger.error(f"Error processing grid {order.grid_index}: {e}")
+            # 거래 기록
+            await self._record_grid_trade(session, bot_instance, order, profit)
 
-        await session.commit()
+            # 사이클 재시작: 같은 가격에 매수 주문 재설정
+            per_grid = self.calculate_per_grid_amount(
+                float(grid_config.total_investment),
+                grid_config.grid_count,
+                bot_instance.max_leverage,
+            )
+            await self._restart_grid_cycle(
+                session, bitget_client, bot_instance, order, per_grid
+            )
+
+            # 텔레그램 알림
+            if bot_instance.telegram_notify:
+                await self._notify_grid_profit(bot_instance, order, profit)
+
+    def _track_order(self, bot_instance_id: int, order_id: Optional[str], order: GridOrder):
+        """발주한 주문 ID를 그리드 인덱스에 등록 (체결 이벤트 매칭용)"""
+        index = self._indexes.get(bot_instance_id)
+        if index is not None:
+            index.track(order_id, order)
 
     async def _place_sell_order(
         self,
@@ -517,6 +668,7 @@ class GridBotRunner:
             if order_id:
                 order.sell_order_id = order_id
                 order.status = GridOrderStatus.SELL_PLACED
+                self._track_order(bot_instance.id, order_id, order)
 
                 logger.info(
                     f"Grid {order.grid_index}: Sell order placed at ${sell_price:.2f}, "
@@ -559,6 +711,7 @@ class GridBotRunner:
                 order.sell_filled_qty = None
                 order.sell_filled_at = None
                 order.status = GridOrderStatus.BUY_PLACED
+                self._track_order(bot_instance.id, order_id, order)
 
                 logger.info(
                     f"Grid {order.grid_index}: Cycle restarted with buy order at ${grid_price:.2f}"
@@ -672,6 +825,12 @@ class GridBotRunner:
 
     async def _init_bitget_client(self, session: AsyncSession, user_id: int):
         """Bitget 클라이언트 초기화"""
+        return get_bitget_rest(*await self._load_api_credentials(session, user_id))
+
+    async def _load_api_credentials(
+        self, session: AsyncSession, user_id: int
+    ) -> Tuple[str, str, str]:
+        """복호화된 API 자격 증명 (api_key, api_secret, passphrase)"""
         result = await session.execute(select(ApiKey).where(ApiKey.user_id == user_id))
         api_key_obj = result.scalars().first()
 
@@ -686,7 +845,7 @@ class GridBotRunner:
             else ""
         )
 
-        return get_bitget_rest(api_key, api_secret, passphrase)
+        return api_key, api_secret, passphrase
 
     async def _update_bot_error(
         self, session: AsyncSession, bot_instance_id: int, error_msg: str
@@ -0,0 +1,221 @@
+"""
+BotLog 보관 주기 작업 (Log Retention)
+
+BOT_LOG_RETENTION_DAYS보다 오래된 bot_logs 행을 하루 단위 gzip NDJSON 파일로 보관한 뒤 삭제합니다.
+
+- 파일: {BOT_LOG_ARCHIVE_DIR}/bot_logs/YYYY/bot_logs-YYYY-MM-DD.partN.ndjson.gz
+  (같은 날짜를 다시 보관하면 새 part 파일, 기존 파일은 덮어쓰지 않음)
+- 임시 파일에 쓰고 rename한 뒤에만 DB 행 삭제 (중간에 실패해도 행이 사라지지 않음)
+- 삭제는 보관한 최대 id 이하만 (보관 중에 늦게 들어온 행은 다음 실행에서 처리)
+- PostgreSQL에서 bot_logs가 일 단위 파티션(bot_logs_pYYYYMMDD)으로 나뉘어 있으면
+  DELETE 대신 파티션 DETACH + DROP (대량 삭제/VACUUM 비용 없음)
+- periodic_scheduler에서 1시간마다 실행, 한 번에 최대 max_days_per_run일만 처리
+
+사용 예시:
+    from services.log_retention import bot_log_retention
+
+    bot_log_retention.start()          # 설정이 0이면 아무것도 하지 않음
+    await bot_log_retention.run_once() # 수동 실행
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, func, select, text
+
+from ..config import settings
+from ..database.models import BotLog
+from ..utils import fast_json
+from .admin_log_history import fetch_page
+
+logger = logging.getLogger(__name__)
+
+
+def _archive_row(row) -> Dict[str, Any]:
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "event_type": row.event_type,
+        "message": row.message,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+class BotLogRetention:
+    """오래된 BotLog 일 단위 보관 + 삭제"""
+
+    def __init__(
+        self,
+        retention_days: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        batch_size: int = 5000,
+        max_days_per_run: int = 7,
+        session_factory=None,
+    ):
+        self.retention_days = settings.bot_log_retention_days if retention_days is None else retention_days
+        self.archive_dir = Path(archive_dir or settings.bot_log_archive_dir) / "bot_logs"
+        self.batch_size = batch_size
+        self.max_days_per_run = max_days_per_run
+        self._session_factory = session_factory
+        self._lock = asyncio.Lock()
+
+        # 통계
+        self.archived_days = 0
+        self.archived_rows = 0
+        self.dropped_partitions = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            from ..database.db import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    def _archive_path(self, day: datetime) -> Path:
+        folder = self.archive_dir / f"{day:%Y}"
+        part = 0
+        while True:
+            path = folder / f"bot_logs-{day:%Y-%m-%d}.part{part}.ndjson.gz"
+            if not path.exists():
+                return path
+            part += 1
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """보관 기간이 지난 날짜를 오래된 순으로 처리, 보관한 행 수 반환"""
+        if self.retention_days <= 0:
+            return 0
+
+        async with self._lock:
+            cutoff = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+            cutoff -= timedelta(days=self.retention_days)
+            archived = 0
+            try:
+                for _ in range(self.max_days_per_run):
+                    async with self.session_factory() as session:
+                        oldest = (await session.execute(
+                            select(func.min(BotLog.created_at)).where(BotLog.created_at < cutoff)
+                        )).scalar()
+                    if oldest is None:
+                        break
+                    archived += await self.archive_day(oldest.replace(hour=0, minute=0, second=0, microsecond=0))
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"❌ Bot log retention failed: {e}", exc_info=True)
+            self.last_run_at = datetime.utcnow()
+            return archived
+
+    async def archive_day(self, day: datetime) -> int:
+        """하루치 로그를 gzip NDJSON으로 쓰고 DB에서 제거, 보관한 행 수 반환"""
+        next_day = day + timedelta(days=1)
+        query = select(
+            BotLog.id, BotLog.user_id, BotLog.event_type, BotLog.message, BotLog.created_at
+        ).where(BotLog.created_at >= day, BotLog.created_at < next_day)
+
+        path = self._archive_path(day)
+        tmp_path = path.with_name(path.name + ".tmp")
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        archive = await asyncio.to_thread(gzip.open, tmp_path, "wb")
+
+        count, max_id, cursor = 0, None, None
+        try:
+            while True:
+                async with self.session_factory() as session:
+                    rows, cursor = await fetch_page(
+                        session, query, BotLog, self.batch_size, cursor, descending=False
+                    )
+                if rows:
+                    data = b"".join(fast_json.dumps_bytes(_archive_row(row)) + b"\n" for row in rows)
+                    await asyncio.to_thread(archive.write, data)
+                    count += len(rows)
+                    max_id = max([max_id or 0] + [row.id for row in rows])
+                if cursor is None:
+                    break
+        except BaseException:
+            await asyncio.to_thread(archive.close)
+            await asyncio.to_thread(tmp_path.unlink, True)
+            raise
+        await asyncio.to_thread(archive.close)
+
+        if count == 0:
+            await asyncio.to_thread(tmp_path.unlink, True)
+            return 0
+        await asyncio.to_thread(os.replace, tmp_path, path)
+
+        await self._remove_day(day, next_day, max_id)
+        self.archived_days += 1
+        self.archived_rows += count
+        logger.info(f"🗄️ Archived {count} bot logs for {day:%Y-%m-%d} -> {path}")
+        return count
+
+    async def _remove_day(self, day: datetime, next_day: datetime, max_id: int):
+        async with self.session_factory() as session:
+            partition = await self._partition_for(session, day)
+            if partition:
+                # 보관 후 늦게 들어온 행이 있으면 파티션을 버리지 않고 보관한 행만 삭제
+                late = (await session.execute(
+                    select(func.count()).select_from(BotLog).where(
+                        BotLog.created_at >= day, BotLog.created_at < next_day, BotLog.id > max_id
+                    )
+                )).scalar()
+                if late:
+                    partition = None
+            if partition:
+                # 파티션 통째로 분리 후 삭제 (행 단위 DELETE 없음)
+                await session.execute(text(f"ALTER TABLE bot_logs DETACH PARTITION {partition}"))
+                await session.execute(text(f"DROP TABLE {partition}"))
+                self.dropped_partitions += 1
+            else:
+                await session.execute(
+                    delete(BotLog).where(
+                        BotLog.created_at >= day, BotLog.created_at < next_day, BotLog.id <= max_id
+                    )
+                )
+            await session.commit()
+
+    async def _partition_for(self, session, day: datetime) -> Optional[str]:
+        """일 단위 파티션 이름 (PostgreSQL이고 파티션이 있을 때만)"""
+        if session.bind.dialect.name != "postgresql":
+            return None
+        name = f"bot_logs_p{day:%Y%m%d}"
+        exists = (await session.execute(text("SELECT to_regclass(:name)"), {"name": name})).scalar()
+        return name if exists else None
+
+    def start(self):
+        """periodic_scheduler에 등록 (BOT_LOG_RETENTION_DAYS가 0이면 무시)"""
+        if self.retention_days <= 0:
+            return
+        from .periodic_scheduler import periodic_scheduler
+
+        periodic_scheduler.register(
+            "bot_log_retention", "all", interval=3600, func=self.run_once, owner=self,
+        )
+        logger.info(f"Bot log retention scheduled: keep {self.retention_days} days, archive to {self.archive_dir}")
+
+    def stop(self):
+        from .periodic_scheduler import periodic_scheduler
+
+        periodic_scheduler.unregister("bot_log_retention", "all", owner=self)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "retention_days": self.retention_days,
+            "archive_dir": str(self.archive_dir),
+            "archived_days": self.archived_days,
+            "archived_rows": self.archived_rows,
+            "dropped_partitions": self.dropped_partitions,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_error": self.last_error,
+        }
+
+
+# 싱글톤 인스턴스
+bot_log_retention = BotLogRetention()
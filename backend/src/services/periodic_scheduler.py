@@ -0,0 +1,354 @@
+"""
+주기 작업 스케줄러 (Periodic Scheduler)
+
+봇/에이전트의 주기 작업을 하나의 계층형 타이밍 휠로 실행합니다.
+
+- 작업은 (job_type, scope) 키로 등록 (예: ("market_regime", "BTCUSDT"), ("risk_monitor", user_id))
+- 같은 키를 여러 봇이 등록하면 하나의 작업으로 합쳐지고 소유자만 추가됨
+- 마지막 소유자가 해제하면 작업 취소
+- 실행 시점에 jitter를 더해 같은 주기의 작업이 한 tick에 몰리지 않음
+- 세마포어로 동시 실행 수 제한
+- 작업 종류별 실행 시간 / 지연(deadline 초과) / 겹침 건너뜀 통계
+
+봇마다 sleep 루프 태스크를 만들지 않고 1개의 tick 태스크만 사용합니다.
+
+사용 예시:
+    from services.periodic_scheduler import periodic_scheduler
+
+    periodic_scheduler.register(
+        "risk_monitor", user_id, interval=120,
+        func=lambda: check_risk(user_id), owner=bot_instance_id,
+    )
+    periodic_scheduler.unregister_owner(bot_instance_id)
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+JobKey = Tuple[str, Hashable]
+
+
+@dataclass
+class PeriodicJob:
+    """등록된 주기 작업"""
+
+    job_type: str
+    scope: Hashable
+    interval: float
+    func: Callable[[], Awaitable[Any]]
+    jitter: float
+    owners: Set[Hashable] = field(default_factory=set)
+    base_time: float = 0.0  # jitter 제외 예정 시각 (monotonic)
+    deadline: float = 0.0  # 이번 실행 예정 시각 (jitter 포함)
+    running: bool = False
+    cancelled: bool = False
+
+    @property
+    def key(self) -> JobKey:
+        return (self.job_type, self.scope)
+
+
+class TimingWheel:
+    """
+    계층형 타이밍 휠
+
+    level 0 슬롯 하나가 1 tick, level n 슬롯 하나가 level n-1 전체 범위입니다.
+    상위 레벨 슬롯 시점이 되면 항목을 하위 레벨로 내려 보냅니다 (cascade).
+    등록/만료 모두 O(1) (cascade는 항목당 레벨 수만큼).
+    """
+
+    def __init__(self, slots: Tuple[int, ...] = (64, 64, 64)):
+        self.slots = slots
+        self.spans: List[int] = []
+        span = 1
+        for n in slots:
+            self.spans.append(span)
+            span *= n
+        self.horizon = span  # 표현 가능한 최대 지연 (tick)
+        self.wheels: List[List[List[Tuple[int, Any]]]] = [[[] for _ in range(n)] for n in slots]
+        self.current = 0  # 경과 tick
+        self.size = 0
+
+    def schedule(self, item: Any, deadline_tick: int) -> bool:
+        """deadline_tick에 만료될 항목 등록 (이미 지난 시점이면 False)"""
+        if deadline_tick <= self.current:
+            return False
+        self._place(item, deadline_tick)
+        self.size += 1
+        return True
+
+    def _place(self, item: Any, deadline_tick: int):
+        delay = deadline_tick - self.current
+        for level, (n, span) in enumerate(zip(self.slots, self.spans)):
+            if delay < span * n:
+                self.wheels[level][(deadline_tick // span) % n].append((deadline_tick, item))
+                return
+
+        # 범위 초과: 최상위 레벨 마지막 슬롯에 두고 cascade 때 재배치
+        level = len(self.slots) - 1
+        slot_tick = self.current + self.horizon - 1
+        self.wheels[level][(slot_tick // self.spans[level]) % self.slots[level]].append(
+            (deadline_tick, item)
+        )
+
+    def advance(self) -> List[Any]:
+        """1 tick 진행 후 만료된 항목 반환"""
+        self.current += 1
+        due: List[Any] = []
+
+        # 상위 레벨부터 현재 슬롯을 하위 레벨로 재배치
+        for level in range(len(self.slots) - 1, 0, -1):
+            span = self.spans[level]
+            if self.current % span:
+                continue
+            slot = self.wheels[level][(self.current // span) % self.slots[level]]
+            entries, slot[:] = list(slot), []
+            for deadline_tick, item in entries:
+                if deadline_tick <= self.current:
+                    due.append(item)
+                    self.size -= 1
+                else:
+                    self._place(item, deadline_tick)
+
+        slot = self.wheels[0][self.current % self.slots[0]]
+        if slot:
+            for _, item in slot:
+                due.append(item)
+            self.size -= len(slot)
+            slot.clear()
+        return due
+
+
+class JobStats:
+    """작업 종류별 실행 통계"""
+
+    def __init__(self):
+        self.runs = 0
+        self.errors = 0
+        self.missed_deadlines = 0  # 예정 시각보다 tick 이상 늦게 시작
+        self.skipped_overlaps = 0  # 이전 실행이 끝나지 않아 건너뜀
+        self.total_run_time = 0.0
+        self.max_run_time = 0.0
+        self.max_lag = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "missed_deadlines": self.missed_deadlines,
+            "skipped_overlaps": self.skipped_overlaps,
+            "avg_run_ms": round(self.total_run_time / self.runs * 1000, 1) if self.runs else 0,
+            "max_run_ms": round(self.max_run_time * 1000, 1),
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+        }
+
+
+class PeriodicScheduler:
+    """타이밍 휠 기반 주기 작업 스케줄러"""
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        max_concurrency: int = 8,
+        slots: Tuple[int, ...] = (64, 64, 64),
+    ):
+        self.tick = tick
+        self.max_concurrency = max_concurrency
+        self.wheel = TimingWheel(slots)
+        self._jobs: Dict[JobKey, PeriodicJob] = {}
+        self._stats: Dict[str, JobStats] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._ticker: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+        self._started_at = 0.0
+
+    # ==================== 등록 ====================
+
+    def register(
+        self,
+        job_type: str,
+        scope: Hashable,
+        interval: float,
+        func: Callable[[], Awaitable[Any]],
+        owner: Hashable = None,
+        jitter: float = 0.1,
+        first_delay: Optional[float] = None,
+    ) -> PeriodicJob:
+        """
+        주기 작업 등록 (같은 키가 있으면 소유자만 추가)
+
+        Args:
+            job_type: 작업 종류 (통계 단위)
+            scope: 작업 범위 (심볼, 사용자 ID 등)
+            interval: 실행 주기 (초)
+            func: 실행할 코루틴 함수
+            owner: 등록 주체 (봇 ID 등, 모두 해제되면 작업 취소)
+            jitter: 주기 대비 최대 지연 비율 (0.1 → 최대 10% 늦게 실행)
+            first_delay: 첫 실행까지 대기 (초, None이면 jitter만큼)
+        """
+        key = (job_type, scope)
+        job = self._jobs.get(key)
+        if job is not None:
+            job.owners.add(owner)
+            if interval < job.interval:
+                job.interval = interval
+            return job
+
+        job = PeriodicJob(
+            job_type=job_type, scope=scope, interval=interval, func=func,
+            jitter=jitter, owners={owner},
+        )
+        self._jobs[key] = job
+        self._stats.setdefault(job_type, JobStats())
+
+        now = time.monotonic()
+        job.base_time = now + (first_delay or 0.0)
+        job.deadline = job.base_time + (
+            random.uniform(0, jitter * interval) if first_delay is None else 0.0
+        )
+        self._schedule(job)
+        self.start()
+        logger.info(f"Periodic job registered: {job_type}:{scope} every {interval}s")
+        return job
+
+    def unregister(self, job_type: str, scope: Hashable, owner: Hashable = None):
+        """소유자 해제 (마지막 소유자면 작업 취소)"""
+        job = self._jobs.get((job_type, scope))
+        if job is None:
+            return
+        job.owners.discard(owner)
+        if not job.owners:
+            self._cancel(job)
+
+    def unregister_owner(self, owner: Hashable):
+        """소유자가 등록한 모든 작업 해제 (봇 종료 시)"""
+        for job in list(self._jobs.values()):
+            if owner in job.owners:
+                job.owners.discard(owner)
+                if not job.owners:
+                    self._cancel(job)
+
+    def _cancel(self, job: PeriodicJob):
+        job.cancelled = True
+        self._jobs.pop(job.key, None)
+        logger.info(f"Periodic job cancelled: {job.job_type}:{job.scope}")
+
+    def _deadline_tick(self, deadline: float) -> int:
+        return max(self.wheel.current + 1, math.ceil((deadline - self._started_at) / self.tick))
+
+    def _schedule(self, job: PeriodicJob):
+        if not self._started_at:
+            self._started_at = time.monotonic()
+        self.wheel.schedule(job, self._deadline_tick(job.deadline))
+
+    # ==================== 실행 ====================
+
+    def start(self):
+        """tick 태스크 시작 (실행 중인 이벤트 루프 필요, 중복 호출 무시)"""
+        if self._ticker is not None and not self._ticker.done():
+            return
+        try:
+            self._ticker = asyncio.get_running_loop().create_task(self._run())
+        except RuntimeError:
+            logger.debug("No running event loop; periodic scheduler will start later")
+
+    async def stop(self):
+        """tick 태스크와 실행 중인 작업 중지"""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+            self._ticker = None
+        for task in list(self._running):
+            task.cancel()
+
+    async def _run(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        while True:
+            # 누적 오차 없이 다음 tick 시각까지 대기
+            next_at = self._started_at + (self.wheel.current + 1) * self.tick
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            for job in self.wheel.advance():
+                self._dispatch(job)
+
+    def _dispatch(self, job: PeriodicJob):
+        if job.cancelled:
+            return
+
+        stats = self._stats[job.job_type]
+        if job.running:
+            stats.skipped_overlaps += 1
+        else:
+            job.running = True
+            task = asyncio.create_task(self._execute(job, job.deadline))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+        # 다음 실행 예약 (jitter는 주기에 누적되지 않음)
+        now = time.monotonic()
+        job.base_time += job.interval
+        if job.base_time < now:
+            job.base_time = now + job.interval
+        job.deadline = job.base_time + random.uniform(0, job.jitter * job.interval)
+        self._schedule(job)
+
+    async def _execute(self, job: PeriodicJob, deadline: float):
+        stats = self._stats[job.job_type]
+        try:
+            async with self._semaphore:
+                started = time.monotonic()
+                lag = started - deadline
+                stats.max_lag = max(stats.max_lag, lag)
+                if lag > self.tick:
+                    stats.missed_deadlines += 1
+                try:
+                    await job.func()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    stats.errors += 1
+                    logger.error(f"Periodic job {job.job_type}:{job.scope} failed: {e}", exc_info=True)
+                finally:
+                    elapsed = time.monotonic() - started
+                    stats.runs += 1
+                    stats.total_run_time += elapsed
+                    stats.max_run_time = max(stats.max_run_time, elapsed)
+        finally:
+            job.running = False
+
+    # ==================== 조회 ====================
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                "job_type": job.job_type,
+                "scope": str(job.scope),
+                "interval": job.interval,
+                "owners": len(job.owners),
+                "running": job.running,
+                "next_run_in": round(max(0.0, job.deadline - now), 1),
+            }
+            for job in self._jobs.values()
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "jobs": len(self._jobs),
+            "running": len(self._running),
+            "wheel_entries": self.wheel.size,
+            "by_type": {job_type: stats.to_dict() for job_type, stats in self._stats.items()},
+        }
+
+
+# 싱글톤 인스턴스
+periodic_scheduler = PeriodicScheduler()
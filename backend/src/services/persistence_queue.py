@@ -0,0 +1,404 @@
+"""
+쓰기 지연 영속화 큐 (Write-Behind Persistence Queue)
+
+트레이딩 루프의 DB 쓰기(거래 기록, 봇 상태/통계)를 모아
+몇 ms마다 한 트랜잭션의 다중 행 문장으로 기록합니다.
+봇마다 commit을 기다리며 커넥션 풀을 점유하던 문제를 줄입니다.
+
+- INSERT: 같은 테이블/컬럼 구성끼리 executemany 한 번
+- UPDATE: 같은 행의 변경은 하나로 합침 (값은 마지막 것, 증가분은 합산)
+- 내구성: write()/update_durable()/flush()는 커밋이 끝난 뒤 반환 (거래 기록은 주문 체결 직후 이 경로 사용)
+  끝내 기록하지 못한 쓰기는 write()/update_durable()이 예외로, flush()는 실패한 행 키로 알림
+- 실패 시 재시도, 그래도 실패하면 항목별로 나눠 기록 (문제 행만 버림)
+- flush는 전용 태스크에서 실행: 호출한 봇 태스크가 취소돼도 다른 봇의 쓰기가 섞인 배치는 끝까지 기록
+
+사용 예시:
+    from services.persistence_queue import persistence_queue
+
+    # 거래 기록 (커밋 후 ID 반환)
+    trade_id = await persistence_queue.write(Trade, {"user_id": 1, "symbol": "BTCUSDT", ...})
+
+    # 봇 통계 (기다리지 않음)
+    persistence_queue.update(BotInstance, bot_id, increments={"total_trades": 1})
+
+    # 청산 기록 (커밋까지 대기, 실패 시 예외)
+    await persistence_queue.update_durable(Trade, trade_id, values={"exit_price": price})
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table, bindparam, func, insert, update
+
+from ..database.db import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Insert:
+    table: Table
+    row: Dict[str, Any]
+    future: Optional[asyncio.Future] = None  # write()로 들어온 경우 생성된 PK 전달
+
+
+@dataclass
+class _RowUpdate:
+    values: Dict[str, Any] = field(default_factory=dict)
+    increments: Dict[str, float] = field(default_factory=dict)
+    waiters: List[asyncio.Future] = field(default_factory=list)  # update_durable() 대기자
+
+
+_UpdateKey = Tuple[Table, Any]
+
+
+@dataclass
+class QueueMetrics:
+    """큐 깊이 / flush 통계"""
+
+    flushes: int = 0
+    rows_inserted: int = 0
+    rows_updated: int = 0
+    statements: int = 0
+    coalesced_updates: int = 0
+    retries: int = 0
+    errors: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+    flush_time_total: float = 0.0
+    flush_time_max: float = 0.0
+    last_flush_ms: float = 0.0
+    by_reason: Dict[str, int] = field(default_factory=dict)
+
+    def record_flush(self, elapsed: float, reason: str):
+        self.flushes += 1
+        self.flush_time_total += elapsed
+        self.flush_time_max = max(self.flush_time_max, elapsed)
+        self.last_flush_ms = elapsed * 1000
+        self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "flushes": self.flushes,
+            "rows_inserted": self.rows_inserted,
+            "rows_updated": self.rows_updated,
+            "statements": self.statements,
+            "coalesced_updates": self.coalesced_updates,
+            "retries": self.retries,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "max_depth": self.max_depth,
+            "avg_flush_ms": (
+                round(self.flush_time_total / self.flushes * 1000, 2) if self.flushes else 0
+            ),
+            "max_flush_ms": round(self.flush_time_max * 1000, 2),
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "by_reason": dict(self.by_reason),
+        }
+
+
+class PersistenceQueue:
+    """
+    DB 쓰기 지연 큐
+
+    모델은 ORM 클래스(Trade, BotInstance 등)를 받고, 행은 컬럼명 dict로 전달합니다.
+    flush는 한 번에 하나만 실행되므로 같은 행에 대한 쓰기 순서가 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        flush_interval: float = 0.005,
+        max_batch: int = 500,
+        max_retries: int = 2,
+    ):
+        self.session_factory = session_factory or AsyncSessionLocal
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+
+        self._inserts: List[_Insert] = []
+        self._updates: Dict[_UpdateKey, _RowUpdate] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_tasks: set = set()  # 실행 중인 flush 태스크 (참조 유지)
+        self._flush_lock = asyncio.Lock()
+        self.metrics = QueueMetrics()
+
+    # ==================== 쓰기 (버퍼링) ====================
+
+    @property
+    def depth(self) -> int:
+        """flush 대기 중인 항목 수"""
+        return len(self._inserts) + len(self._updates)
+
+    def add(self, model, row: Dict[str, Any]):
+        """행 추가 (기다리지 않음, 로그 등 손실 허용 쓰기용)"""
+        self._inserts.append(_Insert(model.__table__, row))
+        self._schedule_flush()
+
+    async def write(self, model, row: Dict[str, Any]) -> Any:
+        """
+        행 추가 후 커밋까지 대기 (거래 기록용)
+
+        다음 flush(최대 flush_interval 후)에 다른 쓰기와 함께 한 트랜잭션으로 기록됩니다.
+
+        Returns:
+            생성된 기본 키
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inserts.append(_Insert(model.__table__, row, future))
+        self._schedule_flush()
+        return await future
+
+    def update(
+        self,
+        model,
+        pk: Any,
+        values: Optional[Dict[str, Any]] = None,
+        increments: Optional[Dict[str, float]] = None,
+    ):
+        """
+        행 갱신 (기다리지 않음, 커밋 보장이 필요하면 update_durable() 사용)
+
+        Args:
+            model: ORM 모델 클래스
+            pk: 기본 키 값
+            values: 덮어쓸 컬럼 값
+            increments: 현재 값에 더할 컬럼 증가분 (NULL은 0으로 취급)
+        """
+        self._buffer_update(model, pk, values, increments)
+        self._schedule_flush()
+
+    async def update_durable(
+        self,
+        model,
+        pk: Any,
+        values: Optional[Dict[str, Any]] = None,
+        increments: Optional[Dict[str, float]] = None,
+    ):
+        """
+        행 갱신 후 커밋까지 대기 (청산/DCA 등 거래 기록 갱신용)
+
+        Raises:
+            재시도와 단독 기록까지 실패하면 마지막 DB 예외
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._buffer_update(model, pk, values, increments).waiters.append(future)
+        self._schedule_flush()
+        await future
+
+    def _buffer_update(
+        self,
+        model,
+        pk: Any,
+        values: Optional[Dict[str, Any]],
+        increments: Optional[Dict[str, float]],
+    ) -> _RowUpdate:
+        key = (model.__table__, pk)
+        pending = self._updates.get(key)
+        if pending is None:
+            pending = self._updates[key] = _RowUpdate()
+        else:
+            self.metrics.coalesced_updates += 1
+
+        for column, value in (values or {}).items():
+            pending.values[column] = value
+            pending.increments.pop(column, None)
+        for column, delta in (increments or {}).items():
+            if column in pending.values:
+                # 같은 배치에서 값을 덮어쓴 뒤의 증가분은 값에 바로 반영
+                pending.values[column] = (pending.values[column] or 0) + delta
+            else:
+                pending.increments[column] = pending.increments.get(column, 0) + delta
+        return pending
+
+    def _track_depth(self):
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+
+    def _schedule_flush(self):
+        self._track_depth()
+        if self.depth >= self.max_batch:
+            self._start_flush("size")
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self._timer = None  # flush 도중 들어온 쓰기는 새 타이머로 예약
+        await self.flush("time")
+
+    # ==================== flush ====================
+
+    async def flush(self, reason: str = "manual") -> List[Tuple[str, Any]]:
+        """
+        지금까지 쌓인 쓰기를 커밋 (반환 시점에 이전 쓰기는 모두 DB에 반영되었거나 실패가 확정됨)
+
+        호출자가 취소돼도 flush 태스크는 계속 실행되므로 배치가 유실되지 않습니다.
+
+        Returns:
+            기록하지 못하고 버린 UPDATE의 (테이블명, 기본 키) 목록
+            (호출 시점에 진행 중이던 flush 포함, 비어 있으면 모두 커밋됨)
+        """
+        own = self._start_flush(reason)
+        # 앞서 시작된 flush가 이전 쓰기를 가져갔을 수 있으므로 진행 중인 flush도 대기
+        tasks = [task for task in self._flush_tasks if task is own or not task.done()]
+        results = await asyncio.shield(asyncio.gather(*tasks, return_exceptions=True))
+
+        failed: List[Tuple[str, Any]] = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                if task is own:
+                    raise result
+                continue
+            failed.extend(result)
+        return failed
+
+    def _start_flush(self, reason: str) -> asyncio.Task:
+        task = asyncio.create_task(self._flush(reason))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+        return task
+
+    async def _flush(self, reason: str) -> List[Tuple[str, Any]]:
+        failed: List[Tuple[str, Any]] = []
+        async with self._flush_lock:
+            while self._inserts or self._updates:
+                inserts, self._inserts = self._inserts, []
+                updates, self._updates = self._updates, {}
+
+                started = time.perf_counter()
+                try:
+                    failed.extend(await self._commit_batch(inserts, updates))
+                except BaseException as e:
+                    # 이벤트 루프 종료 등으로 중단되면 대기자가 멈추지 않도록 실패 전달
+                    self._fail_waiters(inserts, updates, e)
+                    raise
+                finally:
+                    self.metrics.record_flush(time.perf_counter() - started, reason)
+        return failed
+
+    def _fail_waiters(
+        self,
+        inserts: List[_Insert],
+        updates: Dict[_UpdateKey, _RowUpdate],
+        error: BaseException,
+    ):
+        if isinstance(error, asyncio.CancelledError):
+            error = RuntimeError("Persistence flush was cancelled before commit")
+        futures = [item.future for item in inserts if item.future is not None]
+        for row_update in updates.values():
+            futures.extend(row_update.waiters)
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _commit_batch(
+        self, inserts: List[_Insert], updates: Dict[_UpdateKey, _RowUpdate]
+    ) -> List[Tuple[str, Any]]:
+        """배치 기록, 버린 UPDATE 키 반환"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._write(inserts, updates)
+                return []
+            except Exception as e:
+                self.metrics.errors += 1
+                if attempt < self.max_retries:
+                    self.metrics.retries += 1
+                    logger.warning(f"Persistence flush failed, retrying: {e}")
+                    await asyncio.sleep(0.05 * 2 ** attempt)
+                    continue
+                logger.error(
+                    f"Persistence flush failed ({len(inserts)} inserts, {len(updates)} updates), "
+                    f"writing items individually: {e}"
+                )
+
+        # 문제 행이 배치 전체를 막지 않도록 항목별 트랜잭션으로 기록
+        failed: List[Tuple[str, Any]] = []
+        for item in inserts:
+            await self._write_isolated([item], {})
+        for (table, pk), row_update in updates.items():
+            if not await self._write_isolated([], {(table, pk): row_update}):
+                failed.append((table.name, pk))
+        return failed
+
+    async def _write_isolated(
+        self, inserts: List[_Insert], updates: Dict[_UpdateKey, _RowUpdate]
+    ) -> bool:
+        try:
+            await self._write(inserts, updates)
+            return True
+        except Exception as e:
+            self.metrics.dropped += 1
+            logger.error(f"Persistence write dropped: {e}")
+            self._fail_waiters(inserts, updates, e)
+            return False
+
+    async def _write(self, inserts: List[_Insert], updates: Dict[_UpdateKey, _RowUpdate]):
+        """배치 하나를 한 트랜잭션으로 기록 (INSERT 먼저, 그 다음 UPDATE)"""
+        insert_groups: Dict[Tuple[Table, Tuple[str, ...]], List[_Insert]] = {}
+        for item in inserts:
+            insert_groups.setdefault((item.table, tuple(item.row)), []).append(item)
+
+        update_groups: Dict[Tuple[Table, Tuple[str, ...], Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for (table, pk), row_update in updates.items():
+            group = (table, tuple(sorted(row_update.values)), tuple(sorted(row_update.increments)))
+            params = {"_pk": pk}
+            params.update({f"_v_{c}": v for c, v in row_update.values.items()})
+            params.update({f"_inc_{c}": d for c, d in row_update.increments.items()})
+            update_groups.setdefault(group, []).append(params)
+
+        generated: List[Tuple[_Insert, Any]] = []
+        async with self.session_factory() as session:
+            async with session.begin():
+                for (table, _), items in insert_groups.items():
+                    pk_column = next(iter(table.primary_key.columns))
+                    stmt = insert(table).returning(pk_column, sort_by_parameter_order=True)
+                    result = await session.execute(stmt, [item.row for item in items])
+                    generated.extend(zip(items, result.scalars().all()))
+                    self.metrics.statements += 1
+
+                for (table, value_columns, increment_columns), params in update_groups.items():
+                    pk_column = next(iter(table.primary_key.columns))
+                    assignments = {c: bindparam(f"_v_{c}") for c in value_columns}
+                    assignments.update({
+                        c: func.coalesce(table.c[c], 0) + bindparam(f"_inc_{c}")
+                        for c in increment_columns
+                    })
+                    stmt = update(table).where(pk_column == bindparam("_pk")).values(assignments)
+                    await session.execute(stmt, params)
+                    self.metrics.statements += 1
+
+        self.metrics.rows_inserted += len(inserts)
+        self.metrics.rows_updated += len(updates)
+        for item, pk in generated:
+            if item.future is not None and not item.future.done():
+                item.future.set_result(pk)
+        for row_update in updates.values():
+            for future in row_update.waiters:
+                if not future.done():
+                    future.set_result(None)
+
+    # ==================== 수명 주기 ====================
+
+    async def close(self):
+        """타이머 정리 후 남은 쓰기 flush (진행 중인 flush는 끝까지 기록)"""
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+        await self.flush("close")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "pending_inserts": len(self._inserts),
+            "pending_updates": len(self._updates),
+            "flush_interval_ms": self.flush_interval * 1000,
+            **self.metrics.to_dict(),
+        }
+
+
+# 싱글톤 인스턴스
+persistence_queue = PersistenceQueue()
@@ -0,0 +1,243 @@
+"""
+전략 실행 풀 (Strategy Executor)
+
+generate_signal_with_strategy는 동기 함수이고 ML 경로에서는 피처 추출(pandas)과
+LightGBM 예측으로 수십 ms가 걸립니다. 이벤트 루프에서 직접 호출하면
+그동안 다른 봇, WebSocket, HTTP 요청이 모두 멈춥니다.
+
+- 시그널 생성을 워커 스레드에서 실행 (pandas/numpy/LightGBM 연산은 GIL을 풀어 병렬 실행)
+- 워커는 pin 키별로 고정: 같은 전략 인스턴스(사용자별 캐시)는 항상 같은 스레드에서 순서대로 실행
+- 루프는 deadline까지만 기다리고, 넘기면 "hold"로 대체
+- 이전 호출이 아직 실행 중인 봇(task_key)은 새 작업을 쌓지 않고 바로 "hold"
+  (pin은 스레드 고정에만 사용하므로 같은 사용자의 다른 봇은 건너뛰지 않음)
+- 전략별 CPU 시간, 실행 시간, 대기 시간, 타임아웃 통계
+
+프로세스 풀 대신 스레드를 쓰는 이유: 전략 인스턴스가 거래소 클라이언트와
+공유 모델(model_registry)을 참조하고 있어 프로세스 간 직렬화가 불가능합니다.
+
+사용 예시:
+    from services.strategy_executor import strategy_executor
+
+    signal = await strategy_executor.generate_signal(
+        pin=user_id, task_key=f"bot:{bot_instance_id}",
+        strategy_code="eth_ai_fusion", current_price=price, candles=candles, ...
+    )
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ..config import settings
+from .strategy_loader import generate_signal_with_strategy
+
+logger = logging.getLogger(__name__)
+
+_worker_state = threading.local()
+
+
+def in_strategy_worker() -> bool:
+    """현재 스레드가 전략 실행 워커인지 (워커 안에서는 블로킹 I/O 금지)"""
+    return getattr(_worker_state, "active", False)
+
+
+def _mark_worker():
+    _worker_state.active = True
+
+
+def hold_signal(reason: str) -> Dict[str, Any]:
+    """대체 시그널 (generate_signal_with_strategy 오류 응답과 같은 형식)"""
+    return {
+        "action": "hold",
+        "confidence": 0.0,
+        "reason": reason,
+        "stop_loss": None,
+        "take_profit": None,
+        "size": 0,
+    }
+
+
+@dataclass
+class StrategyStats:
+    """전략별 실행 통계"""
+    calls: int = 0
+    timeouts: int = 0
+    busy_skips: int = 0
+    errors: int = 0
+    cpu_time_total: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+    wait_time_total: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = max(self.calls - self.timeouts - self.busy_skips, 1)
+        return {
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "busy_skips": self.busy_skips,
+            "errors": self.errors,
+            "cpu_time_total_s": round(self.cpu_time_total, 3),
+            "avg_cpu_ms": round(self.cpu_time_total / completed * 1000, 2),
+            "avg_run_ms": round(self.run_time_total / completed * 1000, 2),
+            "max_run_ms": round(self.run_time_max * 1000, 2),
+            "avg_wait_ms": round(self.wait_time_total / completed * 1000, 2),
+        }
+
+
+class StrategyExecutor:
+    """
+    pin 키별 고정 워커 스레드 풀
+
+    워커마다 단일 스레드 ThreadPoolExecutor를 두고 pin 키 해시로 고릅니다.
+    """
+
+    def __init__(self, workers: int = 4, timeout: float = 2.0):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._shards: List[Optional[ThreadPoolExecutor]] = [None] * self.workers
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._stats: Dict[str, StrategyStats] = {}
+
+    def _shard(self, pin: Hashable) -> ThreadPoolExecutor:
+        index = hash(pin) % self.workers
+        shard = self._shards[index]
+        if shard is None:
+            shard = self._shards[index] = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"strategy-{index}",
+                initializer=_mark_worker,
+            )
+        return shard
+
+    def _stats_for(self, label: str) -> StrategyStats:
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = StrategyStats()
+        return stats
+
+    async def run(
+        self,
+        pin: Hashable,
+        func: Callable[..., Any],
+        *args,
+        task_key: Optional[Hashable] = None,
+        label: str = "default",
+        timeout: Optional[float] = None,
+        fallback: Any = None,
+        **kwargs,
+    ) -> Any:
+        """
+        pin 워커에서 func 실행
+
+        Args:
+            pin: 워커 고정 키 (같은 키는 같은 스레드에서 순서대로 실행)
+            task_key: 실행 중 건너뛰기 키 (봇 인스턴스별, 기본 pin)
+            label: 통계 구분 이름 (전략 코드)
+            timeout: 대기 시간 (초, 기본 self.timeout)
+            fallback: 타임아웃/실행 중일 때 반환값
+
+        Returns:
+            func 결과 또는 fallback (func 예외는 그대로 전달)
+        """
+        stats = self._stats_for(label)
+        stats.calls += 1
+
+        if task_key is None:
+            task_key = pin
+        pending = self._inflight.get(task_key)
+        if pending is not None and not pending.done():
+            stats.busy_skips += 1
+            return fallback
+
+        submitted = time.perf_counter()
+
+        def timed():
+            # 워커 스레드: 결과와 측정값만 돌려주고 통계는 루프 스레드에서 기록
+            started = time.perf_counter()
+            cpu_started = time.thread_time()
+            try:
+                outcome = (True, func(*args, **kwargs))
+            except Exception as e:
+                outcome = (False, e)
+            timings = (started - submitted, time.perf_counter() - started, time.thread_time() - cpu_started)
+            return outcome, timings
+
+        def record(done: asyncio.Future):
+            if self._inflight.get(task_key) is done:
+                del self._inflight[task_key]
+            if done.cancelled() or done.exception() is not None:
+                stats.errors += 1
+                return
+            (ok, _), (wait_time, run_time, cpu_time) = done.result()
+            if not ok:
+                stats.errors += 1
+            stats.wait_time_total += wait_time
+            stats.run_time_total += run_time
+            stats.run_time_max = max(stats.run_time_max, run_time)
+            stats.cpu_time_total += cpu_time
+
+        future = asyncio.get_running_loop().run_in_executor(self._shard(pin), timed)
+        self._inflight[task_key] = future
+        future.add_done_callback(record)
+
+        try:
+            (ok, value), _ = await asyncio.wait_for(
+                asyncio.shield(future), self.timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.warning(f"Strategy {label} timed out for {task_key}, using fallback")
+            return fallback
+        if not ok:
+            raise value
+        return value
+
+    async def generate_signal(
+        self, pin: Hashable, task_key: Optional[Hashable] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        generate_signal_with_strategy를 워커에서 실행 (타임아웃 시 hold)
+
+        Args:
+            pin: 워커 고정 키 (전략 인스턴스 캐시가 사용자별이므로 user_id)
+            task_key: 실행 중 건너뛰기 키 (봇 인스턴스별, 기본 pin)
+            **kwargs: generate_signal_with_strategy 인자
+        """
+        try:
+            return await self.run(
+                pin,
+                generate_signal_with_strategy,
+                task_key=task_key,
+                label=kwargs.get("strategy_code") or "legacy",
+                fallback=hold_signal("Strategy timeout"),
+                **kwargs,
+            )
+        except Exception as e:
+            logger.error(f"Strategy execution error for {task_key or pin}: {e}", exc_info=True)
+            return hold_signal(f"Error: {str(e)}")
+
+    def shutdown(self):
+        """워커 종료 (실행 중인 작업은 끝까지 실행)"""
+        for shard in self._shards:
+            if shard is not None:
+                shard.shutdown(wait=False)
+        self._shards = [None] * self.workers
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "timeout_ms": self.timeout * 1000,
+            "inflight": sum(1 for f in self._inflight.values() if not f.done()),
+            "strategies": {label: stats.to_dict() for label, stats in self._stats.items()},
+        }
+
+
+# 싱글톤 인스턴스
+strategy_executor = StrategyExecutor(
+    workers=settings.strategy_workers,
+    timeout=settings.strategy_timeout_ms / 1000,
+)
@@ -3,6 +3,7 @@
 """
 
 from .notifier import TelegramNotifier, get_telegram_notifier, init_telegram_notifier
+from .dispatcher import NotificationPriority, TelegramDispatcher
 from .messages import TelegramMessages
 from .types import (
     TradeInfo,
@@ -27,6 +28,8 @@ __all__ = [
     "TelegramMessages",
     "get_telegram_notifier",
     "init_telegram_notifier",
+    "NotificationPriority",
+    "TelegramDispatcher",
     "TradeInfo",
     "TradeResult",
     "BotConfig",
@@ -8,8 +8,8 @@ import logging
 from typing import Optional, Callable, Dict
 from datetime import datetime
 
-import httpx
-
+from ...utils.http_client import get_http_client
+from .dispatcher import NotificationPriority
 from .notifier import TelegramNotifier, get_telegram_notifier
 
 logger = logging.getLogger(__name__)
@@ -53,19 +53,21 @@ class TelegramBotHandler:
     async def _get_updates(self, offset: int = 0, timeout: int = 30) -> list:
         """텔레그램 업데이트 가져오기 (Long Polling)"""
         try:
-            async with httpx.AsyncClient(timeout=timeout + 10) as client:
-                response = await client.get(
-                    f"{self.base_url}/getUpdates",
-                    params={
-                        "offset": offset,
-                        "timeout": timeout,
-                        "allowed_updates": ["message"],
-                    },
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("ok"):
-                        return data.get("result", [])
+            # Long polling은 별도 커넥션 풀 사용 (알림 전송 커넥션 점유 방지)
+            client = get_http_client("telegram_updates")
+            response = await client.get(
+                f"{self.base_url}/getUpdates",
+                params={
+                    "offset": offset,
+                    "timeout": timeout,
+                    "allowed_updates": ["message"],
+                },
+                timeout=timeout + 10,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("ok"):
+                    return data.get("result", [])
         except Exception as e:
             logger.error(f"텔레그램 업데이트 조회 실패: {e}")
         return []
@@ -124,11 +126,11 @@ class TelegramBotHandler:
             await self._send_unknown_command(chat_id)
 
     async def _send_message(self, chat_id: int, text: str, keyboard: bool = True):
-        """메시지 전송"""
-        data = {"chat_id": chat_id, "text": text, "parse_mode": "HTML"}
+        """메시지 전송 (알림 큐 경유, 명령어 응답은 병합하지 않음)"""
+        reply_markup = None
 
         if keyboard:
-            data["reply_markup"] = {
+            reply_markup = {
                 "keyboard": [
                     [
                         {"text": "📊 오늘 현황"},
@@ -146,11 +148,16 @@ class TelegramBotHandler:
                 "resize_keyboard": True,
             }
 
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                await client.post(f"{self.base_url}/sendMessage", json=data)
-        except Exception as e:
-            logger.error(f"메시지 전송 실패: {e}")
+        queued = self.notifier.enqueue_message(
+            text,
+            kind="command_reply",
+            priority=NotificationPriority.HIGH,
+            chat_id=str(chat_id),
+            reply_markup=reply_markup,
+            coalesce=False,
+        )
+        if not queued:
+            logger.error(f"메시지 전송 실패: chat_id={chat_id}")
 
     # ==================== 명령어 핸들러 ====================
 
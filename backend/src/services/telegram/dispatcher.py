@@ -0,0 +1,317 @@
+"""
+텔레그램 메시지 디스패처
+
+알림을 큐에 넣고 백그라운드 워커가 텔레그램 rate limit에 맞춰 전송합니다.
+
+- 채팅별 전송 간격 (개인 채팅 1초, 그룹 3초)과 전역 초당 전송 수 제한
+- 우선순위 레인: 리스크 경고/에러가 일반 알림보다 먼저 전송
+- 같은 채팅의 같은 알림 유형이 대기 중이면 한 메시지로 병합
+- 429 응답 시 retry_after 만큼 해당 채팅 전송 보류 후 재시도
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationPriority(IntEnum):
+    """알림 우선순위 (값이 작을수록 먼저 전송)"""
+
+    CRITICAL = 0  # 리스크 경고, 에러
+    HIGH = 1  # 체결, 청산, 명령어 응답
+    NORMAL = 2  # 봇 시작/종료 등 시스템 알림
+    LOW = 3  # 시그널, 포지션 업데이트
+
+
+@dataclass
+class _Outgoing:
+    """전송 대기 메시지"""
+
+    chat_id: str
+    kind: str
+    priority: NotificationPriority
+    payload: dict
+    seq: int
+    coalesce: bool
+    merged: int = 1
+    attempts: int = 0
+
+
+class _ChatLane:
+    """채팅별 우선순위 레인"""
+
+    def __init__(self):
+        self.lanes: List[Deque[_Outgoing]] = [deque() for _ in NotificationPriority]
+        self.open: Dict[str, _Outgoing] = {}  # kind → 병합 가능한 대기 메시지
+        self.ready_at = 0.0
+
+    def head(self) -> Optional[_Outgoing]:
+        for lane in self.lanes:
+            if lane:
+                return lane[0]
+        return None
+
+    def pop(self) -> _Outgoing:
+        for lane in self.lanes:
+            if lane:
+                item = lane.popleft()
+                if self.open.get(item.kind) is item:
+                    del self.open[item.kind]
+                return item
+        raise IndexError("empty chat lane")
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.lanes)
+
+
+class TelegramDispatcher:
+    """텔레그램 전송 큐 + 백그라운드 워커"""
+
+    MAX_MESSAGE_LENGTH = 4096
+    MERGE_SEPARATOR = "\n\n"
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        send_func: Callable[[dict], Awaitable[Optional[dict]]],
+        private_interval: float = 1.0,
+        group_interval: float = 3.0,
+        global_rate: float = 25.0,
+        max_pending: int = 1000,
+    ):
+        """
+        Args:
+            send_func: sendMessage payload를 전송하고 텔레그램 응답(JSON)을 반환하는 함수
+            private_interval: 개인 채팅 최소 전송 간격 (초)
+            group_interval: 그룹 채팅 최소 전송 간격 (초)
+            global_rate: 전역 초당 최대 전송 수 (텔레그램 한도 30/s)
+            max_pending: 최대 대기 메시지 수 (초과 시 CRITICAL 외 버림)
+        """
+        self._send = send_func
+        self.private_interval = private_interval
+        self.group_interval = group_interval
+        self.global_interval = 1.0 / global_rate
+        self.max_pending = max_pending
+
+        self._chats: Dict[str, _ChatLane] = {}
+        self._pending = 0
+        self._seq = 0
+        self._global_ready_at = 0.0
+
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.stats = {"enqueued": 0, "merged": 0, "sent": 0, "failed": 0, "dropped": 0}
+
+    # ==================== 큐 ====================
+
+    def enqueue(
+        self,
+        chat_id: str,
+        text: str,
+        kind: str = "message",
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        parse_mode: Optional[str] = "HTML",
+        disable_notification: bool = False,
+        reply_markup: Optional[dict] = None,
+        coalesce: bool = True,
+    ) -> bool:
+        """
+        메시지 큐 등록 (즉시 반환)
+
+        Returns:
+            큐 등록(또는 병합) 여부
+        """
+        if self._closing:
+            return False
+
+        chat_id = str(chat_id)
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            chat = _ChatLane()
+            self._chats[chat_id] = chat
+
+        coalesce = coalesce and reply_markup is None
+        if coalesce and self._try_merge(chat, kind, text, parse_mode, disable_notification):
+            return True
+
+        if self._pending >= self.max_pending and priority != NotificationPriority.CRITICAL:
+            self.stats["dropped"] += 1
+            logger.warning(f"[Telegram] Queue full, dropping {kind} message for chat {chat_id}")
+            return False
+
+        payload = {
+            "chat_id": chat_id,
+            "text": text,
+            "disable_notification": disable_notification,
+        }
+        if parse_mode is not None:
+            payload["parse_mode"] = parse_mode
+        if reply_markup:
+            payload["reply_markup"] = reply_markup
+
+        self._seq += 1
+        item = _Outgoing(
+            chat_id=chat_id,
+            kind=kind,
+            priority=priority,
+            payload=payload,
+            seq=self._seq,
+            coalesce=coalesce,
+        )
+        chat.lanes[priority].append(item)
+        if coalesce:
+            chat.open[kind] = item
+
+        self._pending += 1
+        self.stats["enqueued"] += 1
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def _try_merge(
+        self,
+        chat: _ChatLane,
+        kind: str,
+        text: str,
+        parse_mode: Optional[str],
+        disable_notification: bool,
+    ) -> bool:
+        """대기 중인 같은 유형 메시지에 병합"""
+        existing = chat.open.get(kind)
+        if existing is None or existing.payload.get("parse_mode") != parse_mode:
+            return False
+
+        merged_text = existing.payload["text"] + self.MERGE_SEPARATOR + text
+        if len(merged_text) > self.MAX_MESSAGE_LENGTH:
+            # 다음 메시지부터 새로 모음
+            del chat.open[kind]
+            return False
+
+        existing.payload["text"] = merged_text
+        existing.payload["disable_notification"] = (
+            existing.payload["disable_notification"] and disable_notification
+        )
+        existing.merged += 1
+        self.stats["merged"] += 1
+        return True
+
+    def pending_count(self) -> int:
+        return self._pending
+
+    # ==================== 워커 ====================
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    def _interval_for(self, chat_id: str) -> float:
+        return self.group_interval if chat_id.startswith("-") else self.private_interval
+
+    def _next_ready(self, now: float) -> Tuple[Optional[_ChatLane], Optional[float]]:
+        """
+        전송 가능한 채팅 중 우선순위가 가장 높은 채팅 선택
+
+        Returns:
+            (채팅 레인, 없으면 다음 전송 가능 시점까지 대기 시간)
+        """
+        best: Optional[_ChatLane] = None
+        best_key = None
+        wait: Optional[float] = None
+
+        for chat in self._chats.values():
+            head = chat.head()
+            if head is None:
+                continue
+            if chat.ready_at > now:
+                delay = chat.ready_at - now
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            key = (head.priority, head.seq)
+            if best_key is None or key < best_key:
+                best, best_key = chat, key
+
+        return best, wait
+
+    async def _run(self):
+        """전송 루프 (대기 메시지가 없으면 종료, 다음 enqueue 시 재시작)"""
+        while self._pending > 0:
+            now = time.monotonic()
+            chat, wait = self._next_ready(now)
+
+            if chat is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            if now < self._global_ready_at:
+                await asyncio.sleep(self._global_ready_at - now)
+                continue
+
+            item = chat.pop()
+            self._pending -= 1
+            await self._deliver(chat, item)
+
+            sent_at = time.monotonic()
+            self._global_ready_at = sent_at + self.global_interval
+            chat.ready_at = max(chat.ready_at, sent_at + self._interval_for(item.chat_id))
+
+        # 빈 채팅 레인 정리 (전송 간격이 아직 남은 레인은 ready_at 유지를 위해 남겨 둠)
+        now = time.monotonic()
+        self._chats = {
+            cid: chat for cid, chat in self._chats.items() if len(chat) or chat.ready_at > now
+        }
+
+    async def _deliver(self, chat: _ChatLane, item: _Outgoing):
+        item.attempts += 1
+        try:
+            result = await self._send(item.payload)
+        except Exception as e:
+            logger.error(f"[Telegram] Send failed ({item.kind}): {e}")
+            result = None
+
+        if result and result.get("ok"):
+            self.stats["sent"] += 1
+            if item.merged > 1:
+                logger.debug(f"[Telegram] Sent {item.merged} merged {item.kind} messages")
+            return
+
+        retry_after = (result or {}).get("parameters", {}).get("retry_after")
+        if retry_after and item.attempts < self.MAX_ATTEMPTS:
+            # 429: 해당 채팅 보류 후 맨 앞에서 재시도
+            chat.ready_at = time.monotonic() + float(retry_after)
+            chat.lanes[item.priority].appendleft(item)
+            self._pending += 1
+            logger.warning(
+                f"[Telegram] Rate limited for chat {item.chat_id}, retry after {retry_after}s"
+            )
+            return
+
+        self.stats["failed"] += 1
+        logger.error(f"[Telegram] Dropping {item.kind} message after {item.attempts} attempt(s)")
+
+    async def close(self, timeout: float = 5.0):
+        """남은 메시지 전송 후 종료 (timeout 초과 시 취소)"""
+        self._closing = True
+        self._wakeup.set()
+
+        if self._worker and not self._worker.done():
+            try:
+                await asyncio.wait_for(self._worker, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[Telegram] Dispatcher closed with {self._pending} unsent message(s)"
+                )
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
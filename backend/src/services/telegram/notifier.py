@@ -3,13 +3,14 @@
 실제 텔레그램 API와 통신하는 메인 서비스
 """
 
-import asyncio
 import logging
 import os
 from typing import Optional, List, Callable, Dict
 
 import httpx
 
+from ...utils.http_client import get_http_client
+from .dispatcher import NotificationPriority, TelegramDispatcher
 from .messages import TelegramMessages
 from .types import (
     TradeInfo,
@@ -68,9 +69,8 @@ class TelegramNotifier:
         # 명령어 핸들러 (봇이 명령어를 받을 때 사용)
         self._command_handlers: Dict[str, Callable] = {}
 
-        # 메시지 큐 (rate limit 방지)
-        self._message_queue: asyncio.Queue = asyncio.Queue()
-        self._queue_task: Optional[asyncio.Task] = None
+        # 메시지 큐 (rate limit 준수, 우선순위, 병합) - 알림은 큐에만 넣고 즉시 반환
+        self._dispatcher = TelegramDispatcher(self._deliver)
 
         if self.enabled:
             logger.info("✅ 텔레그램 알림 서비스 활성화됨")
@@ -89,16 +89,19 @@ class TelegramNotifier:
             url = f"{self.base_url}/{method}"
             logger.debug(f"[Telegram] Sending request to: {method}")
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=data)
+            client = get_http_client("telegram")
+            response = await client.post(url, json=data)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(
-                        f"텔레그램 API 에러: {response.status_code} - {response.text}"
-                    )
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 429:
+                # retry_after 정보를 디스패처에 전달
+                return response.json()
+            else:
+                logger.error(
+                    f"텔레그램 API 에러: {response.status_code} - {response.text}"
+                )
+                return None
 
         except httpx.TimeoutException:
             logger.error("텔레그램 API 타임아웃")
@@ -154,6 +157,56 @@ class TelegramNotifier:
             logger.error("텔레그램 메시지 전송 실패")
             return False
 
+    async def _deliver(self, payload: dict) -> Optional[dict]:
+        """디스패처 워커용 sendMessage 전송"""
+        return await self._send_request("sendMessage", payload)
+
+    def enqueue_message(
+        self,
+        message: str,
+        kind: str = "message",
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        chat_id: Optional[str] = None,
+        parse_mode: Optional[str] = "HTML",
+        disable_notification: bool = False,
+        reply_markup: Optional[dict] = None,
+        coalesce: bool = True,
+    ) -> bool:
+        """
+        텔레그램 메시지 큐 등록 (전송을 기다리지 않음)
+
+        Args:
+            message: 전송할 메시지
+            kind: 알림 유형 (같은 채팅의 같은 유형 대기 메시지는 병합)
+            priority: 전송 우선순위
+            chat_id: 채팅 ID (None이면 기본값 사용)
+            parse_mode: 파싱 모드
+            disable_notification: 무음 알림 여부
+            reply_markup: 인라인 키보드 등 마크업 (있으면 병합하지 않음)
+            coalesce: 병합 허용 여부
+
+        Returns:
+            큐 등록 여부
+        """
+        if not self.enabled:
+            logger.debug("텔레그램 비활성화 - 메시지 큐 등록 스킵")
+            return False
+
+        return self._dispatcher.enqueue(
+            chat_id=chat_id or self.chat_id,
+            text=message,
+            kind=kind,
+            priority=priority,
+            parse_mode=parse_mode,
+            disable_notification=disable_notification,
+            reply_markup=reply_markup,
+            coalesce=coalesce,
+        )
+
+    async def close(self, timeout: float = 5.0):
+        """대기 중인 알림 전송 후 종료"""
+        await self._dispatcher.close(timeout=timeout)
+
     async def send_message_with_keyboard(
         self,
         message: str,
@@ -194,7 +247,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.new_trade(trade)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="new_trade", priority=NotificationPriority.HIGH
+        )
 
     async def notify_close_trade(self, trade: TradeResult) -> bool:
         """포지션 종료 알림"""
@@ -202,7 +257,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.close_trade(trade)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="close_trade", priority=NotificationPriority.HIGH
+        )
 
     # ==================== 시스템 알림 메서드 ====================
 
@@ -224,8 +281,12 @@ class TelegramNotifier:
         }
 
         # parse_mode=None으로 전송 (HTML 파싱 에러 방지)
-        return await self.send_message(
-            message=message, parse_mode=None, reply_markup=keyboard
+        return self.enqueue_message(
+            message,
+            kind="bot_start",
+            priority=NotificationPriority.NORMAL,
+            parse_mode=None,
+            reply_markup=keyboard,
         )
 
     async def notify_bot_stop(
@@ -236,7 +297,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.bot_stop(summary, reason)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="bot_stop", priority=NotificationPriority.NORMAL
+        )
 
     async def notify_open_positions_warning(
         self, positions: List[PositionInfo]
@@ -246,7 +309,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.open_positions_warning(positions)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="open_positions_warning", priority=NotificationPriority.CRITICAL
+        )
 
     async def notify_warning(self, warning: WarningInfo) -> bool:
         """일반 경고 알림"""
@@ -254,7 +319,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.warning(warning)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="warning", priority=NotificationPriority.CRITICAL
+        )
 
     # ==================== 에러 알림 메서드 ====================
 
@@ -264,7 +331,9 @@ class TelegramNotifier:
             return False
 
         message = TelegramMessages.error(error)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="error", priority=NotificationPriority.CRITICAL
+        )
 
     # ==================== 조회 메서드 ====================
 
@@ -321,49 +390,63 @@ class TelegramNotifier:
         if not self.notify_trades:
             return False
         message = TelegramMessages.limit_order_placed(order)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="limit_order", priority=NotificationPriority.HIGH
+        )
 
     async def notify_order_filled(self, order: OrderFilledInfo) -> bool:
         """주문 체결 알림"""
         if not self.notify_trades:
             return False
         message = TelegramMessages.order_filled(order)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="order_filled", priority=NotificationPriority.HIGH
+        )
 
     async def notify_stop_loss(self, info: StopLossInfo) -> bool:
         """손절 알림"""
         if not self.notify_trades:
             return False
         message = TelegramMessages.stop_loss_triggered(info)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="stop_loss", priority=NotificationPriority.HIGH
+        )
 
     async def notify_take_profit(self, info: TakeProfitInfo) -> bool:
         """익절 알림"""
         if not self.notify_trades:
             return False
         message = TelegramMessages.take_profit_triggered(info)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="take_profit", priority=NotificationPriority.HIGH
+        )
 
     async def notify_partial_close(self, info: PartialCloseInfo) -> bool:
         """부분 청산 알림"""
         if not self.notify_trades:
             return False
         message = TelegramMessages.partial_close(info)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="partial_close", priority=NotificationPriority.HIGH
+        )
 
     async def notify_risk_alert(self, info: RiskAlertInfo) -> bool:
         """리스크 경고 알림"""
         if not self.notify_system:
             return False
         message = TelegramMessages.risk_alert(info)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="risk_alert", priority=NotificationPriority.CRITICAL
+        )
 
     async def notify_signal(self, info: SignalInfo) -> bool:
         """전략 시그널 알림"""
         if not self.notify_trades:
             return False
         message = TelegramMessages.signal_detected(info)
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="signal", priority=NotificationPriority.LOW
+        )
 
     async def notify_position_update(
         self,
@@ -389,7 +472,9 @@ class TelegramNotifier:
             unrealized_pnl,
             unrealized_pnl_percent,
         )
-        return await self.send_message(message)
+        return self.enqueue_message(
+            message, kind="position_update", priority=NotificationPriority.LOW
+        )
 
     # ==================== 유틸리티 메서드 ====================
 
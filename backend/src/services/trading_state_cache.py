@@ -0,0 +1,252 @@
+"""
+주문 경로 상태 캐시 (Trading State Cache)
+
+사용자/심볼별 레버리지, 마진 모드, 포지션 모드, 계약 정밀도를 캐싱해
+주문 직전의 set_leverage 같은 사전 REST 호출을 생략합니다.
+
+- 봇 시작 시 warm_up으로 거래소 상태 로드
+- set_leverage 응답, Private 주문 스트림 이벤트로 갱신
+- 상태가 실제로 다를 때(또는 STATE_TTL 경과 시)만 set_leverage 호출
+- 신호 → 주문 ACK 지연 시간 통계
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SymbolTradingState:
+    """사용자/심볼별 주문 경로 상태"""
+
+    leverage: Optional[int] = None
+    margin_mode: Optional[str] = None  # crossed / isolated
+    position_mode: Optional[str] = None  # one_way_mode / hedge_mode
+    min_size: Optional[float] = None
+    size_precision: Optional[int] = None
+    price_precision: Optional[int] = None
+    leverage_updated_at: float = 0.0
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _first(data: Any) -> Dict[str, Any]:
+    """Bitget 응답(dict 또는 list) → 첫 항목"""
+    if isinstance(data, list):
+        return data[0] if data else {}
+    return data if isinstance(data, dict) else {}
+
+
+class TradingStateCache:
+    """
+    주문 경로 상태 캐시
+
+    사용 예:
+        await trading_state_cache.ensure_leverage(client, user_id, "BTCUSDT", 10)
+        await client.place_market_order(...)
+    """
+
+    # 이 시간 동안 레버리지 변경 이벤트가 없으면 다음 주문 때 한 번 재설정
+    # (거래소 UI에서 수동 변경한 경우 대비)
+    STATE_TTL = 600.0
+    LATENCY_SAMPLES = 500
+
+    def __init__(self):
+        self._states: Dict[Tuple[int, str], SymbolTradingState] = {}
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+        self._latencies: deque = deque(maxlen=self.LATENCY_SAMPLES)
+        self.stats = {
+            "leverage_calls": 0,
+            "leverage_calls_skipped": 0,
+            "warmups": 0,
+            "warmup_failures": 0,
+        }
+
+    def get(self, user_id: int, symbol: str) -> Optional[SymbolTradingState]:
+        return self._states.get((user_id, symbol))
+
+    def _state(self, user_id: int, symbol: str) -> SymbolTradingState:
+        key = (user_id, symbol)
+        state = self._states.get(key)
+        if state is None:
+            state = SymbolTradingState()
+            self._states[key] = state
+        return state
+
+    def _lock(self, user_id: int, symbol: str) -> asyncio.Lock:
+        key = (user_id, symbol)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    # ==================== 로드/갱신 ====================
+
+    async def warm_up(self, client, user_id: int, symbol: str, margin_coin: str = "USDT"):
+        """
+        봇 시작 시 거래소 상태 로드
+
+        get_symbol_account/get_contract_config를 제공하지 않는 클라이언트는
+        건너뛰고, 첫 주문에서 set_leverage 한 번으로 채워집니다.
+        """
+        state = self._state(user_id, symbol)
+
+        try:
+            if hasattr(client, "get_symbol_account"):
+                account = _first(await client.get_symbol_account(symbol, margin_coin))
+                self._apply_account(state, account)
+
+            if hasattr(client, "get_contract_config"):
+                contract = _first(await client.get_contract_config(symbol))
+                state.min_size = _to_float(contract.get("minTradeNum")) or state.min_size
+                state.size_precision = _to_int(contract.get("volumePlace"))
+                state.price_precision = _to_int(contract.get("pricePlace"))
+
+            self.stats["warmups"] += 1
+            logger.info(f"Trading state warmed up for user {user_id} {symbol}: {state}")
+        except Exception as e:
+            self.stats["warmup_failures"] += 1
+            logger.warning(f"Trading state warm-up failed for user {user_id} {symbol}: {e}")
+
+    def _apply_account(self, state: SymbolTradingState, account: Dict[str, Any]):
+        margin_mode = account.get("marginMode")
+        if margin_mode:
+            state.margin_mode = margin_mode
+        if account.get("posMode"):
+            state.position_mode = account["posMode"]
+
+        # 교차 마진은 crossedMarginLeverage, 격리 마진은 롱 레버리지 기준
+        field = "isolatedLongLever" if margin_mode == "isolated" else "crossedMarginLeverage"
+        leverage = _to_int(account.get(field) or account.get("leverage"))
+        if leverage:
+            state.leverage = leverage
+            state.leverage_updated_at = time.monotonic()
+
+    def apply_order_update(self, user_id: int, update: Dict[str, Any]):
+        """Private 주문 스트림 이벤트로 레버리지/마진 모드 갱신"""
+        symbol = update.get("symbol")
+        if not symbol:
+            return
+
+        state = self._states.get((user_id, symbol))
+        if state is None:
+            return
+
+        leverage = _to_int(update.get("leverage"))
+        if leverage:
+            state.leverage = leverage
+            state.leverage_updated_at = time.monotonic()
+        if update.get("margin_mode"):
+            state.margin_mode = update["margin_mode"]
+
+    def invalidate(self, user_id: int, symbol: Optional[str] = None):
+        """캐시 무효화 (symbol 생략 시 사용자 전체)"""
+        for key in [k for k in self._states if k[0] == user_id and (symbol is None or k[1] == symbol)]:
+            del self._states[key]
+
+    # ==================== 주문 경로 ====================
+
+    async def ensure_leverage(
+        self, client, user_id: int, symbol: str, leverage: int, margin_coin: str = "USDT"
+    ) -> bool:
+        """
+        레버리지가 다를 때만 set_leverage 호출
+
+        Returns:
+            실제로 set_leverage를 호출했으면 True
+
+        Raises:
+            set_leverage 실패 시 예외 그대로 (캐시된 레버리지는 무효화)
+        """
+        leverage = int(leverage)
+        state = self._state(user_id, symbol)
+
+        if self._is_current(state, leverage):
+            self.stats["leverage_calls_skipped"] += 1
+            return False
+
+        async with self._lock(user_id, symbol):
+            # 대기 중 다른 봇이 이미 설정했을 수 있음
+            if self._is_current(state, leverage):
+                self.stats["leverage_calls_skipped"] += 1
+                return False
+
+            self.stats["leverage_calls"] += 1
+            try:
+                await client.set_leverage(symbol=symbol, leverage=leverage, margin_coin=margin_coin)
+            except Exception:
+                state.leverage = None
+                raise
+
+            state.leverage = leverage
+            state.leverage_updated_at = time.monotonic()
+            return True
+
+    def _is_current(self, state: SymbolTradingState, leverage: int) -> bool:
+        return (
+            state.leverage == leverage
+            and time.monotonic() - state.leverage_updated_at < self.STATE_TTL
+        )
+
+    def min_size(self, user_id: int, symbol: str) -> Optional[float]:
+        """거래소 계약 정보의 최소 주문 수량 (미로드 시 None)"""
+        state = self._states.get((user_id, symbol))
+        return state.min_size if state else None
+
+    # ==================== 지연 시간 ====================
+
+    def record_order_latency(self, symbol: str, signal_to_ack: float, order_rtt: float):
+        """
+        주문 지연 시간 기록
+
+        Args:
+            signal_to_ack: 신호 생성 → 주문 ACK (초)
+            order_rtt: 주문 요청 왕복 시간 (초)
+        """
+        self._latencies.append((signal_to_ack, order_rtt))
+        logger.debug(
+            f"Order latency {symbol}: signal→ack {signal_to_ack * 1000:.0f}ms, "
+            f"order {order_rtt * 1000:.0f}ms"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시/지연 시간 통계"""
+
+        def summarize(values):
+            if not values:
+                return {"p50_ms": 0, "p95_ms": 0, "max_ms": 0}
+            ordered = sorted(values)
+            return {
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+
+        return {
+            **self.stats,
+            "cached_symbols": len(self._states),
+            "orders": len(self._latencies),
+            "signal_to_ack": summarize([s for s, _ in self._latencies]),
+            "order_rtt": summarize([r for _, r in self._latencies]),
+        }
+
+
+trading_state_cache = TradingStateCache()
@@ -13,12 +13,12 @@ except Exception:
     EnsemblePredictor = None
     ML_AVAILABLE = False
 
-# FinBERT 감성 분석 에이전트 (선택적)
+# FinBERT 감성 분석 - 백그라운드 공유 갱신 (선택적)
 try:
-    from src.agents.sentiment_analyzer import SentimentAnalyzerAgent
+    from src.agents.sentiment_analyzer.refresher import sentiment_refresher
     SENTIMENT_AVAILABLE = True
 except Exception:
-    SentimentAnalyzerAgent = None
+    sentiment_refresher = None
     SENTIMENT_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
@@ -51,26 +51,11 @@ class ETHAIFusionStrategy:
         self.timeframe = self.params.get("timeframe", "5m")
         self.enable_ml = self.params.get("enable_ml", True) and ML_AVAILABLE
 
-        # FinBERT 감성 분석 에이전트 (선택적)
+        # FinBERT 감성 분석 (선택적) - 코인 등록만 하고 결과는 sentiment_refresher에서 읽음
         self.enable_sentiment = self.params.get("enable_sentiment", True) and SENTIMENT_AVAILABLE
-        self._sentiment_agent = None
+        self._sentiment_coin = self.symbol.split("/")[0] if "/" in self.symbol else self.symbol
         if self.enable_sentiment:
-            try:
-                self._sentiment_agent = SentimentAnalyzerAgent(
-                    agent_id=f"sentiment_{user_id or 'default'}",
-                    name="SentimentAnalyzer",
-                    config={
-                        "extreme_positive": 0.5,
-                        "extreme_negative": -0.5,
-                        "block_entry": -0.7,
-                        "cache_ttl_minutes": 30,
-                    }
-                )
-                logger.info(f"✅ 감성 분석 에이전트 초기화 완료 (user_id={user_id})")
-            except Exception as e:
-                logger.error(f"❌ 감성 분석 에이전트 초기화 실패: {e}")
-                self._sentiment_agent = None
-                self.enable_sentiment = False
+            sentiment_refresher.track(self._sentiment_coin)
 
         self._state = PositionState()
         self._feature_pipeline = FeaturePipeline() if self.enable_ml and FeaturePipeline else None
@@ -175,54 +160,14 @@ class ETHAIFusionStrategy:
 
     def _get_sentiment_signal(self) -> Optional[Dict[str, Any]]:
         """
-        감성 분석 시그널 가져오기 (동기 래퍼)
+        감성 분석 시그널 가져오기 (백그라운드에서 게시된 마지막 값, 블로킹 없음)
 
         Returns:
-            감성 시그널 또는 None
+            감성 시그널 또는 None (비활성화 또는 아직 갱신 전)
         """
-        if not self._sentiment_agent:
+        if not self.enable_sentiment:
             return None
-
-        try:
-            import asyncio
-
-            # 심볼에서 코인 이름 추출 (ETH/USDT -> ETH)
-            coin_symbol = self.symbol.split("/")[0] if "/" in self.symbol else self.symbol
-
-            # 비동기 메서드를 동기적으로 호출
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # 이미 이벤트 루프가 실행 중이면 캐시된 값 사용
-                cached = getattr(self, "_cached_sentiment", None)
-                if cached:
-                    return cached
-                return None
-            else:
-                # 새 이벤트 루프 생성
-                sentiment = asyncio.run(
-                    self._sentiment_agent.analyze_market_sentiment(coin_symbol, hours=24)
-                )
-
-            if sentiment:
-                signal = self._sentiment_agent.generate_sentiment_signal(sentiment)
-                result = {
-                    "score": sentiment.score,
-                    "strength": sentiment.strength.value if sentiment.strength else "unknown",
-                    "should_block": signal.should_block if signal else False,
-                    "confidence_multiplier": signal.confidence_multiplier if signal else 1.0,
-                    "reason": signal.reason if signal else None,
-                }
-                self._cached_sentiment = result  # 캐싱
-                return result
-
-        except Exception as e:
-            logger.debug(f"감성 분석 실패 (무시됨): {e}")
-
-        return None
+        return sentiment_refresher.get_signal(self._sentiment_coin)
 
     def _manage_position(
         self,
@@ -4,11 +4,15 @@ Redis가 없어도 In-Memory 캐시로 작동 (Graceful Degradation)
 """
 import logging
 import asyncio
+import itertools
 import json
+import sys
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Optional, Any, Dict
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from typing import Optional, Any, Awaitable, Callable, Dict
+from datetime import datetime
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -27,81 +31,178 @@ class DecimalEncoder(json.JSONEncoder):
 class CacheEntry:
     """캐시 엔트리"""
     value: Any
-    expires_at: datetime
-    hits: int = 0
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    expires_at: float  # time.monotonic() 기준
+    size: int = 0  # 추정 바이트 수
+
+
+def estimate_size(value: Any) -> int:
+    """값의 대략적인 바이트 크기 (JSON 직렬화 길이, 실패 시 sys.getsizeof)"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    try:
+        return len(json.dumps(value, cls=DecimalEncoder))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
 
 
 class InMemoryCache:
-    """In-Memory 캐시 (Redis 백업)"""
+    """
+    In-Memory 캐시 (Redis 백업)
+
+    - OrderedDict 기반 LRU: get/set/제거 모두 O(1)
+    - TTL은 조회 시 지연 만료 + set 시 LRU 앞쪽 일부만 정리
+    - 항목 수(max_size)와 추정 바이트(max_bytes) 한도
+    - 이벤트 루프 단일 스레드에서 await 없이 동작하므로 락 불필요
+    """
+
+    EXPIRY_SWEEP = 8  # set마다 확인할 LRU 앞쪽 항목 수
 
-    def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, CacheEntry] = {}
+    def __init__(self, max_size: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.max_size = max_size
-        self._lock = asyncio.Lock()
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+        return entry
 
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 가져오기"""
-        async with self._lock:
-            if key not in self.cache:
-                return None
-
-            entry = self.cache[key]
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
 
-            # 만료 확인
-            if datetime.utcnow() > entry.expires_at:
-                del self.cache[key]
-                return None
+        # 만료 확인
+        if time.monotonic() > entry.expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
 
-            # 히트 카운트 증가
-            entry.hits += 1
-            return entry.value
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: int = 300) -> bool:
         """캐시에 값 저장"""
-        async with self._lock:
-            # 캐시 크기 제한 체크
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                # LRU 방식으로 가장 오래된 항목 제거
-                oldest_key = min(
-                    self.cache.keys(),
-                    key=lambda k: self.cache[k].created_at
-                )
-                del self.cache[oldest_key]
-
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-            self.cache[key] = CacheEntry(value=value, expires_at=expires_at)
-            return True
+        size = estimate_size(value)
+        # 새 값을 저장하지 못하더라도 이전 값이 계속 조회되지 않도록 먼저 제거
+        self._remove(key)
+        if size > self.max_bytes:
+            logger.debug(f"Cache value too large for in-memory tier: {key} ({size} bytes)")
+            return False
+
+        self._sweep_expired()
+
+        # 한도 초과 시 가장 오래 사용되지 않은 항목부터 제거
+        while self.cache and (
+            len(self.cache) >= self.max_size or self.current_bytes + size > self.max_bytes
+        ):
+            _, evicted = self.cache.popitem(last=False)
+            self.current_bytes -= evicted.size
+            self.evictions += 1
+
+        self.cache[key] = CacheEntry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self.current_bytes += size
+        return True
+
+    def _sweep_expired(self):
+        """LRU 앞쪽 일부 항목의 만료 정리 (전체 스캔 없음)"""
+        now = time.monotonic()
+        for key in list(itertools.islice(self.cache, self.EXPIRY_SWEEP)):
+            if self.cache[key].expires_at < now:
+                self._remove(key)
+                self.expirations += 1
+
+    async def get_or_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int = 300
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 loader 실행 후 저장
+
+        같은 키에 대한 동시 미스는 loader를 한 번만 실행합니다 (stampede 방지).
+        loader가 None을 반환하면 저장하지 않습니다.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+        return await single_flight(self, key, loader, lambda v: self.set(key, v, ttl))
 
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
-        async with self._lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
-            return False
+        return self._remove(key) is not None
 
     async def clear(self) -> bool:
         """전체 캐시 삭제"""
-        async with self._lock:
-            self.cache.clear()
-            return True
+        self.cache.clear()
+        self.current_bytes = 0
+        return True
 
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
-        return await self.get(key) is not None
+        entry = self.cache.get(key)
+        return entry is not None and time.monotonic() <= entry.expires_at
 
     def get_stats(self) -> dict:
         """캐시 통계"""
-        total_hits = sum(entry.hits for entry in self.cache.values())
+        lookups = self.hits + self.misses
         return {
             "type": "in-memory",
             "size": len(self.cache),
             "max_size": self.max_size,
-            "total_hits": total_hits,
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "total_hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced": self.coalesced,
         }
 
 
+async def single_flight(owner, key: str, loader, store) -> Any:
+    """
+    키별 single-flight 실행
+
+    owner._inflight에 진행 중인 future가 있으면 그 결과를 기다리고,
+    없으면 loader를 실행해 결과를 store로 저장한 뒤 대기자에게 전달합니다.
+    """
+    pending = owner._inflight.get(key)
+    if pending is not None:
+        owner.coalesced += 1
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    owner._inflight[key] = future
+    try:
+        value = await loader()
+        if value is not None:
+            await store(value)
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 경고 없이 정리
+        raise
+    finally:
+        owner._inflight.pop(key, None)
+
+    future.set_result(value)
+    return value
+
+
 class CacheManager:
     """
     통합 캐시 매니저
@@ -113,6 +214,8 @@ class CacheManager:
         self.memory_cache = InMemoryCache(max_size=1000)
         self.use_redis = False
         self._initialized = False
+        self._inflight: Dict[str, asyncio.Future] = {}  # Redis 경로 single-flight
+        self.coalesced = 0
 
     async def initialize(self):
         """캐시 매니저 초기화"""
@@ -186,6 +289,25 @@ class CacheManager:
             logger.error(f"Cache set error for key '{key}': {e}")
             return False
 
+    async def get_or_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int = 300
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 loader 실행 후 저장
+
+        같은 키에 대한 동시 미스는 loader를 한 번만 실행합니다 (stampede 방지).
+
+        사용 예:
+        data = await cache_manager.get_or_set(key, lambda: build_summary(user_id), ttl=60)
+        """
+        if not (self.use_redis and self.redis_client):
+            return await self.memory_cache.get_or_set(key, loader, ttl)
+
+        value = await self.get(key)
+        if value is not None:
+            return value
+        return await single_flight(self, key, loader, lambda v: self.set(key, v, ttl))
+
     async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
         try:
@@ -251,6 +373,7 @@ class CacheManager:
                     "type": "redis",
                     "keyspace_hits": info.get("keyspace_hits", 0),
                     "keyspace_misses": info.get("keyspace_misses", 0),
+                    "coalesced": self.coalesced,
                     "connected": True,
                 }
             else:
@@ -279,7 +402,7 @@ def make_cache_key(*args) -> str:
     return ":".join(str(arg) for arg in args)
 
 
-async def cached(
+def cached(
     key_prefix: str,
     ttl: int = 300,
 ):
@@ -296,19 +419,10 @@ async def cached(
             # 캐시 키 생성
             cache_key = make_cache_key(key_prefix, *args, *kwargs.values())
 
-            # 캐시에서 조회
-            cached_value = await cache_manager.get(cache_key)
-            if cached_value is not None:
-                logger.debug(f"Cache hit: {cache_key}")
-                return cached_value
-
-            # 캐시 미스, 함수 실행
-            logger.debug(f"Cache miss: {cache_key}")
-            result = await func(*args, **kwargs)
-
-            # 결과 캐싱
-            await cache_manager.set(cache_key, result, ttl)
-            return result
+            # 캐시 미스 시 함수 실행 (동시 미스는 한 번만 실행)
+            return await cache_manager.get_or_set(
+                cache_key, lambda: func(*args, **kwargs), ttl
+            )
 
         return wrapper
     return decorator
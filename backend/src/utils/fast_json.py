@@ -0,0 +1,51 @@
+"""
+시세/WebSocket 메시지용 JSON 직렬화
+
+- orjson 패키지가 설치되어 있으면 사용 (표준 json보다 파싱/직렬화가 수 배 빠름)
+- 없으면 표준 json으로 동작 (출력 형식은 Starlette send_json과 동일)
+- 브로드캐스트 메시지는 dumps()로 한 번만 직렬화하고 같은 문자열을 모든 소켓에 전송
+
+사용 예시:
+    from utils.fast_json import dumps, loads
+
+    message = loads(raw_frame)
+    text = dumps({"type": "price_update", "price": 50000.0})
+    for websocket in sockets:
+        await websocket.send_text(text)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # dict 키가 문자열이 아니어도 (int 등) 표준 json처럼 문자열로 변환, numpy 값도 허용
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """JSON 파싱 (WebSocket 텍스트/바이너리 프레임 모두 가능)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """UTF-8 JSON 바이트"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """JSON 문자열 (WebSocket send_text용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
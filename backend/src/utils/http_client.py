@@ -0,0 +1,181 @@
+"""
+공유 비동기 HTTP 클라이언트
+
+요청마다 httpx.AsyncClient를 새로 만들면 매번 TCP/TLS 핸드셰이크가 발생합니다.
+이름별로 커넥션 풀을 유지하는 httpx.AsyncClient를 재사용합니다.
+
+- h2 패키지가 설치되어 있으면 HTTP/2 사용
+- 이벤트 루프가 바뀌면(테스트 등) 클라이언트 재생성
+- 재시도 예산(RetryBudget): 장애 시 재시도 폭주로 부하가 증폭되지 않도록
+  전체 요청 대비 재시도 비율 제한
+- 애플리케이션 종료 시 lifespan에서 close_http_clients() 호출
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, Iterable, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+
+# name → (client, loop)
+_clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+
+    요청마다 ratio 만큼 토큰이 적립되고 재시도마다 1개를 사용합니다.
+    ratio=0.2 이면 정상 상태에서 전체 요청의 약 20%까지만 재시도합니다.
+    min_tokens는 트래픽이 적을 때도 최소한의 재시도를 허용합니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = min_tokens
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+_retry_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(name: str) -> RetryBudget:
+    """이름별 재시도 예산 반환"""
+    budget = _retry_budgets.get(name)
+    if budget is None:
+        budget = RetryBudget()
+        _retry_budgets[name] = budget
+    return budget
+
+
+def get_http_client(
+    name: str = "default",
+    base_url: str = "",
+    timeout: Optional[httpx.Timeout] = None,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """
+    이름별 공유 httpx.AsyncClient 반환
+
+    Args:
+        name: 클라이언트 이름 (서비스별 커넥션 풀 분리)
+        base_url: 기본 URL
+        timeout: 기본 타임아웃 (요청별 timeout 인자로 덮어쓰기 가능)
+        limits: 커넥션 풀 제한
+        http2: HTTP/2 사용 여부 (h2 미설치 시 무시)
+
+    Returns:
+        재사용 가능한 httpx.AsyncClient (호출자가 닫지 말 것)
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(name)
+
+    if entry is not None:
+        client, client_loop = entry
+        if not client.is_closed and client_loop is loop:
+            return client
+
+    client = httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout or DEFAULT_TIMEOUT,
+        limits=limits or DEFAULT_LIMITS,
+        http2=http2 and HTTP2_AVAILABLE,
+    )
+    _clients[name] = (client, loop)
+    logger.debug(f"HTTP client created: {name} (http2={http2 and HTTP2_AVAILABLE})")
+    return client
+
+
+async def request_with_retry(
+    name: str,
+    method: str,
+    url: str,
+    max_retries: int = 2,
+    backoff: float = 0.5,
+    retry_statuses: Iterable[int] = RETRYABLE_STATUS_CODES,
+    **kwargs,
+) -> httpx.Response:
+    """
+    공유 클라이언트로 요청 (타임아웃/일시적 오류 시 재시도 예산 내에서 재시도)
+
+    Args:
+        name: 클라이언트 이름 (get_http_client와 동일, 재시도 예산도 이름별)
+        method: HTTP 메서드
+        url: 요청 URL
+        max_retries: 요청당 최대 재시도 횟수
+        backoff: 지수 백오프 기본 지연 (초, jitter 적용)
+        retry_statuses: 재시도할 HTTP 상태 코드
+        **kwargs: httpx.AsyncClient.request 인자 (json, params, headers, timeout 등)
+
+    Returns:
+        마지막 응답 (재시도 가능한 상태 코드여도 재시도 소진 시 그대로 반환)
+
+    Raises:
+        httpx.TransportError: 재시도 소진 후에도 연결/타임아웃 오류
+    """
+    client = get_http_client(name)
+    budget = get_retry_budget(name)
+    budget.deposit()
+
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in retry_statuses:
+                return response
+            failure: Optional[Exception] = None
+        except httpx.TransportError as e:
+            response = None
+            failure = e
+
+        if attempt >= max_retries or not budget.try_withdraw():
+            if failure is not None:
+                raise failure
+            return response
+
+        attempt += 1
+        delay = backoff * (2 ** (attempt - 1)) * (0.5 + random.random())
+        logger.debug(f"HTTP retry {attempt}/{max_retries} for {name}: {failure or response.status_code}")
+        await asyncio.sleep(delay)
+
+
+async def close_http_clients():
+    """모든 공유 HTTP 클라이언트 종료 (lifespan 종료 시 호출)"""
+    close_count = 0
+    for name, (client, _) in list(_clients.items()):
+        try:
+            await client.aclose()
+            close_count += 1
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client {name}: {e}")
+
+    _clients.clear()
+    logger.info(f"✅ Closed {close_count} shared HTTP client(s)")
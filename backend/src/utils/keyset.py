@@ -0,0 +1,66 @@
+"""
+keyset(cursor) 페이지네이션 도구
+
+OFFSET 대신 마지막 행의 (정렬 값, id)를 cursor로 넘겨 다음 페이지를 조회합니다.
+앞 페이지를 건너뛰는 비용이 없고, 페이지 사이에 행이 추가돼도 중복/누락이 없습니다.
+
+사용 예시:
+    from utils.keyset import after, decode_cursor, encode_cursor
+
+    if cursor:
+        created_at, log_id = decode_cursor(cursor, "datetime")
+        query = query.where(after(BotLog.created_at, BotLog.id, created_at, log_id, descending=True))
+    ...
+    next_cursor = encode_cursor(last.created_at, last.id)
+"""
+
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Tuple
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(value: Any, row_id: int) -> str:
+    """(정렬 값, id) -> 불투명 cursor 문자열"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps([value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> Tuple[Any, int]:
+    """
+    cursor -> (정렬 값, id)
+
+    Args:
+        kind: 정렬 값 종류 ("int", "decimal", "datetime", "str")
+
+    Raises:
+        ValueError: 형식이 잘못된 cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, row_id = json.loads(raw)
+        if kind == "int":
+            value = int(value)
+        elif kind == "decimal":
+            value = Decimal(str(value))
+        elif kind == "datetime":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise TypeError(value)
+        return value, int(row_id)
+    except (TypeError, ValueError, ArithmeticError) as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+
+
+def after(expr, id_expr, value, row_id: int, descending: bool):
+    """keyset 조건: (expr, id)가 cursor 다음인 행"""
+    if descending:
+        return or_(expr < value, and_(expr == value, id_expr < row_id))
+    return or_(expr > value, and_(expr == value, id_expr > row_id))
@@ -0,0 +1,51 @@
+"""
+패키지 export 지연 로드 (PEP 562 모듈 __getattr__)
+
+pandas/lightgbm처럼 무거운 의존성을 가진 하위 모듈을, 패키지 import 시점이 아니라
+해당 이름을 처음 사용할 때 로드합니다. 첫 로드 시간은 startup_profile에 "lazy"로 기록됩니다.
+
+사용 예시 (패키지 __init__.py):
+    from ..utils.lazy_import import lazy_exports
+
+    __getattr__ = lazy_exports(__name__, {
+        "EnsemblePredictor": ".models.ensemble_predictor",
+    })
+
+    # 사용하는 쪽은 그대로
+    from src.ml import EnsemblePredictor  # 이 시점에 ensemble_predictor 로드
+"""
+
+import importlib
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from .startup_profile import startup_profile
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    패키지 모듈 __getattr__ 생성
+
+    Args:
+        package: 패키지 이름 (__name__)
+        exports: export 이름 -> 모듈 경로 (상대 경로는 package 기준)
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        resolved = importlib.util.resolve_name(module_name, package)
+        loaded = resolved in sys.modules
+        started = time.perf_counter()
+        module = importlib.import_module(resolved)
+        if not loaded:
+            startup_profile.record("lazy", resolved, (time.perf_counter() - started) * 1000, started)
+
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)  # 이후 조회는 일반 속성
+        return value
+
+    return __getattr__
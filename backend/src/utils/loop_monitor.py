@@ -0,0 +1,139 @@
+"""
+이벤트 루프 정지(stall) 감지기
+
+이벤트 루프에서 동기 I/O나 무거운 계산이 실행되면 모든 봇 루프와
+WebSocket이 함께 멈춥니다. 루프 안의 하트비트 코루틴이 주기적으로
+시각을 기록하고, 별도 감시 스레드가 하트비트가 threshold 이상
+갱신되지 않으면 루프 스레드의 스택을 샘플링해 경고 로그를 남깁니다.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopStallDetector:
+    """이벤트 루프 정지 감지기"""
+
+    def __init__(self, threshold_ms: float = 200.0, heartbeat_ms: Optional[float] = None):
+        """
+        Args:
+            threshold_ms: 이 시간 이상 루프가 응답하지 않으면 경고
+            heartbeat_ms: 하트비트 주기 (기본: threshold의 1/4)
+        """
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat = (heartbeat_ms or threshold_ms / 4) / 1000.0
+
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.stall_count = 0
+        self.max_stall_ms = 0.0
+
+    async def start(self):
+        """감지 시작 (이벤트 루프 안에서 호출)"""
+        if self._heartbeat_task is not None:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-stall-detector", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(f"Event loop stall detector started (threshold={self.threshold * 1000:.0f}ms)")
+
+    async def stop(self):
+        """감지 중지"""
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        self._watchdog = None
+
+    async def _heartbeat_loop(self):
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.heartbeat)
+
+    def _watch(self):
+        """감시 스레드: 정지 1회당 스택 샘플 1개 기록"""
+        reported_beat = None
+
+        while not self._stop.wait(self.heartbeat):
+            beat = self._last_beat
+            lag = time.monotonic() - beat - self.heartbeat
+
+            if lag < self.threshold:
+                if reported_beat is not None and beat != reported_beat:
+                    reported_beat = None
+                continue
+
+            if beat == reported_beat:
+                # 같은 정지 구간은 최대 지연만 갱신
+                self.max_stall_ms = max(self.max_stall_ms, lag * 1000)
+                continue
+
+            reported_beat = beat
+            self.stall_count += 1
+            self.max_stall_ms = max(self.max_stall_ms, lag * 1000)
+            logger.warning(
+                f"⚠️ Event loop blocked for {lag * 1000:.0f}ms+ "
+                f"(threshold {self.threshold * 1000:.0f}ms). Stack sample:\n{self._sample_stack()}"
+            )
+
+    def _sample_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return "<loop thread stack unavailable>"
+        return "".join(traceback.format_stack(frame))
+
+    def get_stats(self) -> dict:
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "stall_count": self.stall_count,
+            "max_stall_ms": round(self.max_stall_ms, 1),
+        }
+
+
+# 싱글톤 인스턴스
+_detector: Optional[EventLoopStallDetector] = None
+
+
+async def start_loop_monitor(threshold_ms: float = 200.0) -> EventLoopStallDetector:
+    """이벤트 루프 정지 감지 시작"""
+    global _detector
+
+    if _detector is None:
+        _detector = EventLoopStallDetector(threshold_ms=threshold_ms)
+    await _detector.start()
+    return _detector
+
+
+async def stop_loop_monitor():
+    """이벤트 루프 정지 감지 중지"""
+    global _detector
+
+    if _detector is not None:
+        await _detector.stop()
+        _detector = None
+
+
+def get_loop_monitor() -> Optional[EventLoopStallDetector]:
+    return _detector
@@ -0,0 +1,199 @@
+"""
+시작(cold start) 단계별 시간 측정
+
+- import 단계: track_imports() 동안 처음 로드되는 모듈의 누적 import 시간
+  (최상위 패키지 + 지정한 접두사, 예: ccxt, pandas, src.api.chart)
+- lifespan 단계: phase() 블록별 소요 시간과 실패 여부
+- lazy 단계: lazy_import로 미뤄 둔 모듈이 처음 쓰일 때의 로드 시간
+- readiness: 트레이딩 서브시스템 워밍업 중이거나 실패했으면 준비 안 됨 (/health/ready)
+
+import 시간은 누적(cumulative) 값이라 중첩됩니다.
+(src.api.positions 안에서 처음 로드된 ccxt 시간은 둘 다에 포함)
+
+사용 예시:
+    from utils.startup_profile import startup_profile
+
+    with startup_profile.track_imports(prefixes=("src.api.",)):
+        from .api import chart
+
+    with startup_profile.phase("cache manager"):
+        await cache_manager.initialize()
+
+    startup_profile.log_summary()
+"""
+
+import importlib.abc
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PhaseTiming:
+    """단계 하나의 소요 시간"""
+    group: str  # import / app / lifespan / lazy
+    name: str
+    ms: float
+    started_ms: float  # 프로세스 기준 시작 시각
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"group": self.group, "name": self.name, "ms": round(self.ms, 1), "at_ms": round(self.started_ms, 1)}
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """exec_module 시간을 재는 로더 래퍼 (실행 직전에 원래 로더로 되돌림)"""
+
+    def __init__(self, loader, profile: "StartupProfile"):
+        self.loader = loader
+        self.profile = profile
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # 모듈 코드에서 보이는 __loader__/__spec__.loader는 원래 로더
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+
+        started = time.perf_counter()
+        error = None
+        try:
+            self.loader.exec_module(module)
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.profile.record("import", module.__name__, (time.perf_counter() - started) * 1000, started, error)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """sys.meta_path 맨 앞에 두고 관심 모듈만 _TimedLoader로 감쌈"""
+
+    def __init__(self, profile: "StartupProfile", prefixes: Tuple[str, ...]):
+        self.profile = profile
+        self.prefixes = prefixes
+
+    def _wanted(self, fullname: str) -> bool:
+        return "." not in fullname or fullname.startswith(self.prefixes)
+
+    def find_spec(self, fullname, path, target=None):
+        if not self._wanted(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.profile)
+        return spec
+
+
+class StartupProfile:
+    """시작 단계 기록 + readiness 상태"""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.phases: List[PhaseTiming] = []
+        self.warming = False
+        self.ready_ms: Optional[float] = None
+        self.warmup_error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        return not self.warming and self.warmup_error is None
+
+    def _now_ms(self, at: Optional[float] = None) -> float:
+        return ((at if at is not None else time.perf_counter()) - self._origin) * 1000
+
+    def record(self, group: str, name: str, ms: float, started: Optional[float] = None, error: Optional[str] = None):
+        timing = PhaseTiming(group, name, ms, self._now_ms(started), error)
+        with self._lock:
+            self.phases.append(timing)
+
+    @contextmanager
+    def phase(self, name: str, group: str = "lifespan"):
+        """블록 소요 시간 기록 (예외는 기록 후 그대로 전파)"""
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(group, name, (time.perf_counter() - started) * 1000, started, error)
+
+    @contextmanager
+    def track_imports(self, prefixes: Tuple[str, ...] = ("src.api.",)):
+        """블록 안에서 처음 import되는 모듈별 누적 시간 기록"""
+        timer = _ImportTimer(self, prefixes)
+        sys.meta_path.insert(0, timer)
+        try:
+            yield
+        finally:
+            sys.meta_path.remove(timer)
+
+    def begin_warmup(self):
+        """트레이딩 서브시스템 워밍업 시작 (끝날 때까지 준비 안 됨)"""
+        self.warming = True
+        self.warmup_error = None
+
+    def mark_ready(self, error: Optional[str] = None):
+        """워밍업 종료 (error가 있으면 준비되지 않은 상태로 남음)"""
+        self.warming = False
+        self.ready_ms = self._now_ms()
+        self.warmup_error = error
+
+    def slowest(self, group: Optional[str] = None, limit: int = 10) -> List[PhaseTiming]:
+        with self._lock:
+            phases = [p for p in self.phases if group is None or p.group == group]
+        return sorted(phases, key=lambda p: p.ms, reverse=True)[:limit]
+
+    def log_summary(self, limit: int = 10):
+        for group in ("import", "lifespan", "lazy"):
+            slowest = self.slowest(group, limit)
+            if slowest:
+                logger.info(
+                    f"⏱️ Startup {group} (slowest {len(slowest)}): "
+                    + ", ".join(f"{p.name}={p.ms:.0f}ms" for p in slowest)
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self.phases)
+        totals: Dict[str, float] = {}
+        for p in phases:
+            if p.group != "import":  # import는 누적값이라 합산하지 않음
+                totals[p.group] = round(totals.get(p.group, 0.0) + p.ms, 1)
+        return {
+            "ready": self.ready,
+            "warming": self.warming,
+            "ready_at_ms": round(self.ready_ms, 1) if self.ready_ms is not None else None,
+            "warmup_error": self.warmup_error,
+            "totals_ms": totals,
+            "slowest_imports": [p.to_dict() for p in self.slowest("import", 20)],
+            "phases": [p.to_dict() for p in phases if p.group != "import"],
+        }
+
+
+# 싱글톤 인스턴스
+startup_profile = StartupProfile()
@@ -0,0 +1,341 @@
+"""
+토픽 기반 WebSocket 브로드캐스트 허브
+
+- 클라이언트는 토픽 단위로 구독: price:BTCUSDT, chart:ETHUSDT:1m, user:42
+- 메시지는 토픽당 한 번 직렬화하고 구독 연결의 송신 큐에 넣기만 함 (publish는 대기하지 않음)
+- 연결마다 상한이 있는 송신 큐 + 전용 writer 태스크 → 느린 브라우저가 다른 연결을 막지 않음
+- price/chart 토픽은 conflation: 아직 보내지 못한 같은 토픽 메시지는 최신 값으로 교체
+- 큐가 가득 차거나 전송 하나가 send_timeout을 넘기면 느린 소비자로 보고 연결 종료
+
+사용 예시:
+    from websockets.broadcast_hub import broadcast_hub
+
+    conn = broadcast_hub.connect(websocket, user_id)   # user:{user_id} 자동 구독
+    broadcast_hub.subscribe(conn, ["price:BTCUSDT", "chart:BTCUSDT:1m"])
+    broadcast_hub.publish("price:BTCUSDT", {"type": "price_update", "price": 50000.0})
+    await broadcast_hub.disconnect(conn)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+from ..services.exchanges.feed_manager import simple_symbol
+from ..utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+# 대기 중 메시지를 최신 값으로 교체하는 토픽 (중간 틱은 버려도 되는 시세성 데이터)
+CONFLATED_PREFIXES = ("price:", "chart:")
+
+# 느린 소비자 종료 코드 (1013 Try Again Later)
+WS_SLOW_CONSUMER = 1013
+
+# conflate_key 기본값 표시 (None은 "conflation 안 함")
+_TOPIC_DEFAULT = object()
+
+
+def user_topic(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def normalize_topic(topic: str, user_id: Optional[int] = None) -> Optional[str]:
+    """
+    클라이언트 토픽 정규화/검증
+
+    price:btc/usdt -> price:BTCUSDT, chart:BTC-USDT:1m -> chart:BTCUSDT:1m
+    user 토픽은 본인 것만 허용, 알 수 없는 토픽은 None
+    """
+    parts = topic.strip().split(":")
+    kind = parts[0].lower()
+    if kind == "price" and len(parts) == 2 and parts[1]:
+        return f"price:{simple_symbol(parts[1])}"
+    if kind == "chart" and len(parts) == 3 and parts[1] and parts[2]:
+        return f"chart:{simple_symbol(parts[1])}:{parts[2]}"
+    if kind == "user" and len(parts) == 2 and user_id is not None and parts[1] == str(user_id):
+        return user_topic(user_id)
+    return None
+
+
+class HubConnection:
+    """
+    연결 하나의 송신 큐와 writer 태스크
+
+    큐는 OrderedDict: conflation 키로 넣은 메시지는 자리를 유지한 채 값만 교체되고,
+    나머지는 순번 키로 들어가 순서대로 전송됩니다.
+    """
+
+    def __init__(self, websocket, user_id: int, max_queue: int, send_timeout: float):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.topics: Set[str] = set()
+        self.connected_at = time.time()
+        self.sent = 0
+        self.conflated = 0
+        self.max_send_ms = 0.0
+        self.closed = False
+        self.slow = False
+        self.close_reason: Optional[str] = None
+        self._sending_since = 0.0  # 진행 중인 전송 시작 시각 (0이면 대기 중)
+        self._queue: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._seq = 0
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._close_tasks: set = set()  # WebSocket close 태스크 (참조 유지)
+        self._on_close = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def enqueue(self, text: str, conflate_key: Optional[Hashable] = None) -> bool:
+        """송신 큐에 추가 (대기 없음). 닫혔거나 느린 소비자로 종료되면 False"""
+        if self.closed:
+            return False
+        if self._sending_since and time.monotonic() - self._sending_since > self.send_timeout:
+            self.close(f"send timeout ({self.send_timeout}s)", slow=True)
+            return False
+        if conflate_key is not None:
+            key = ("c", conflate_key)
+            if key in self._queue:
+                self._queue[key] = text
+                self.conflated += 1
+                return True
+        else:
+            self._seq += 1
+            key = ("s", self._seq)
+        if len(self._queue) >= self.max_queue:
+            self.close(f"send queue full ({self.max_queue})", slow=True)
+            return False
+        self._queue[key] = text
+        self._ready.set()
+        return True
+
+    def send(self, data: Any) -> bool:
+        """단일 연결 메시지 (구독 응답, ping 등)"""
+        return self.enqueue(data if isinstance(data, str) else fast_json.dumps(data))
+
+    def close(self, reason: str, slow: bool = False):
+        """종료 (느린 소비자면 진행 중인 전송을 취소하고 WebSocket close)"""
+        if self.closed:
+            return
+        self.closed = True
+        self.slow = slow
+        self.close_reason = reason
+        self._queue.clear()
+        self._ready.set()
+        if self._on_close:
+            self._on_close(self)
+        if slow:
+            logger.warning(f"Closing slow WebSocket consumer for user {self.user_id}: {reason}")
+            if self._task and self._sending_since:
+                self._task.cancel()
+            task = asyncio.ensure_future(self._close_socket())
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+
+    async def _close_socket(self):
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=WS_SLOW_CONSUMER, reason="Slow consumer"),
+                timeout=self.send_timeout,
+            )
+        except Exception:
+            pass
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._writer())
+
+    async def _writer(self):
+        """
+        큐 순서대로 전송
+
+        전송마다 wait_for 태스크를 만들지 않고, 전송 시작 시각만 기록해 두면
+        enqueue가 send_timeout을 넘긴 전송을 발견하고 이 태스크를 취소합니다.
+        """
+        try:
+            while not self.closed:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+
+                _, text = self._queue.popitem(last=False)
+                self._sending_since = started = time.monotonic()
+                try:
+                    await self.websocket.send_text(text)
+                except Exception as e:
+                    self.close(f"send failed: {e}")
+                    break
+                finally:
+                    self._sending_since = 0.0
+                self.sent += 1
+                elapsed_ms = (time.monotonic() - started) * 1000
+                if elapsed_ms > self.max_send_ms:
+                    self.max_send_ms = elapsed_ms
+        except asyncio.CancelledError:
+            return
+
+    async def wait_closed(self):
+        if self._task:
+            await asyncio.wait([self._task])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "topics": sorted(self.topics),
+            "queued": self.queued,
+            "sent": self.sent,
+            "conflated": self.conflated,
+            "max_send_ms": round(self.max_send_ms, 1),
+            "age_s": round(time.time() - self.connected_at, 1),
+        }
+
+
+class BroadcastHub:
+    """
+    토픽 → 연결 팬아웃
+
+    publish는 직렬화 한 번 + 구독 연결 수만큼 큐 추가만 하므로,
+    틱 하나의 팬아웃 비용은 가장 느린 연결과 무관합니다.
+    """
+
+    def __init__(self, max_queue: int = 256, send_timeout: float = 5.0):
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._connections: Set[HubConnection] = set()
+        self._topics: Dict[str, Set[HubConnection]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.slow_disconnects = 0
+
+    # ==================== 연결 ====================
+
+    def connect(self, websocket, user_id: int) -> HubConnection:
+        """연결 등록 + writer 시작 (user:{user_id} 자동 구독)"""
+        conn = HubConnection(websocket, user_id, self.max_queue, self.send_timeout)
+        conn._on_close = self._discard
+        self._connections.add(conn)
+        self.subscribe(conn, [user_topic(user_id)])
+        conn.start()
+        return conn
+
+    async def disconnect(self, conn: HubConnection):
+        """연결 해제 (남은 큐는 버림)"""
+        conn.close("disconnected")
+        if conn._task and not conn._task.done():
+            conn._task.cancel()
+        await conn.wait_closed()
+
+    def _discard(self, conn: HubConnection):
+        if conn.slow:
+            self.slow_disconnects += 1
+        self._connections.discard(conn)
+        for topic in conn.topics:
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._topics[topic]
+        conn.topics.clear()
+
+    # ==================== 구독 ====================
+
+    def subscribe(self, conn: HubConnection, topics: Iterable[str]) -> List[str]:
+        """토픽 구독 (정규화된 토픽만, 반환값은 실제 구독한 토픽)"""
+        accepted = []
+        if conn.closed:
+            return accepted
+        for topic in topics:
+            normalized = normalize_topic(topic, conn.user_id)
+            if normalized is None:
+                logger.debug(f"Rejected topic {topic!r} for user {conn.user_id}")
+                continue
+            conn.topics.add(normalized)
+            self._topics.setdefault(normalized, set()).add(conn)
+            accepted.append(normalized)
+        return accepted
+
+    def unsubscribe(self, conn: HubConnection, topics: Iterable[str]) -> List[str]:
+        removed = []
+        for topic in topics:
+            normalized = normalize_topic(topic, conn.user_id)
+            if normalized is None or normalized == user_topic(conn.user_id):
+                continue  # 본인 user 토픽은 연결이 살아 있는 동안 유지
+            if normalized in conn.topics:
+                conn.topics.discard(normalized)
+                subscribers = self._topics.get(normalized)
+                if subscribers is not None:
+                    subscribers.discard(conn)
+                    if not subscribers:
+                        del self._topics[normalized]
+                removed.append(normalized)
+        return removed
+
+    def has_subscribers(self, topic: str) -> bool:
+        return topic in self._topics
+
+    # ==================== 발행 ====================
+
+    def _fan_out(self, conns: Iterable[HubConnection], data: Any, conflate_key) -> int:
+        text = fast_json.dumps(data)
+        delivered = 0
+        for conn in list(conns):
+            if conn.enqueue(text, conflate_key):
+                delivered += 1
+        self.published += 1
+        self.delivered += delivered
+        return delivered
+
+    def publish(self, topic: str, data: Any, conflate_key: Optional[Hashable] = _TOPIC_DEFAULT) -> int:
+        """
+        토픽 구독자에게 발행 (대기 없음, 반환값은 큐에 넣은 연결 수)
+
+        conflate_key를 생략하면 price/chart 토픽은 토픽 이름으로 conflation,
+        None을 주면 conflation 없이 모두 전송 (완성 캔들 등 누락되면 안 되는 메시지).
+        """
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return 0
+        if conflate_key is _TOPIC_DEFAULT:
+            conflate_key = topic if topic.startswith(CONFLATED_PREFIXES) else None
+        return self._fan_out(subscribers, data, conflate_key)
+
+    def publish_user(self, user_id: int, data: Any, conflate_key: Optional[Hashable] = None) -> int:
+        """사용자의 모든 연결에 발행"""
+        return self.publish(user_topic(user_id), data, conflate_key)
+
+    def broadcast(self, data: Any) -> int:
+        """모든 연결에 발행"""
+        if not self._connections:
+            return 0
+        return self._fan_out(self._connections, data, None)
+
+    # ==================== 관리 ====================
+
+    async def close(self):
+        """모든 연결 writer 종료 (서버 종료 시)"""
+        for conn in list(self._connections):
+            await self.disconnect(conn)
+
+    def get_stats(self) -> Dict[str, Any]:
+        conns = sorted(self._connections, key=lambda c: c.queued, reverse=True)
+        return {
+            "connections": len(conns),
+            "topics": {topic: len(subs) for topic, subs in self._topics.items()},
+            "published": self.published,
+            "delivered": self.delivered,
+            "slow_disconnects": self.slow_disconnects,
+            "max_queue": self.max_queue,
+            "send_timeout_s": self.send_timeout,
+            "queued_total": sum(c.queued for c in conns),
+            "busiest": [c.to_dict() for c in conns[:10]],
+        }
+
+
+# 싱글톤 인스턴스
+broadcast_hub = BroadcastHub()
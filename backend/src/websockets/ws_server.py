@@ -8,9 +8,13 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..utils import fast_json
 from ..utils.jwt_auth import JWTAuth
+from .broadcast_hub import HubConnection, broadcast_hub
 from ..database.db import AsyncSessionLocal
+from ..services.account_state_service import account_state_service, usdt_balance
 from ..services.exchange_service import ExchangeService
+from ..services.exchanges.feed_manager import feed_manager, simple_symbol
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +28,9 @@ class ConnectionState:
     connected_at: datetime = field(default_factory=datetime.utcnow)
     last_ping: Optional[datetime] = None
     last_pong: Optional[datetime] = None
-    message_count: int = 0
     error_count: int = 0
     is_alive: bool = True
+    hub: Optional[HubConnection] = None  # 송신 큐/writer (broadcast_hub)
 
 
 # 연결된 WebSocket 관리 (개선됨)
@@ -43,9 +47,9 @@ MAX_ERROR_COUNT = 5  # 최대 에러 횟수
 
 
 # 모듈 레벨 함수 (하위 호환성)
-async def broadcast_to_user(user_id: int, data: dict):
+async def broadcast_to_user(user_id: int, data: dict, conflate_key: Optional[str] = None):
     """특정 사용자에게 메시지 전송 (모듈 레벨 함수)"""
-    return await WebSocketManager.broadcast_to_user(user_id, data)
+    return await WebSocketManager.broadcast_to_user(user_id, data, conflate_key)
 
 
 async def broadcast_to_all(data: dict):
@@ -111,47 +115,18 @@ class WebSocketManager:
     """WebSocket 연결 및 메시지 브로드캐스트 관리 (개선됨)"""
 
     @staticmethod
-    async def broadcast_to_user(user_id: int, data: dict):
-        """특정 사용자에게 메시지 전송 (에러 처리 강화)"""
-        async with send_lock:
-            conn_states = connections.get(user_id, [])
-            for conn_state in conn_states[:]:  # 복사본으로 순회
-                if not conn_state.is_alive:
-                    continue
+    async def broadcast_to_user(user_id: int, data: dict, conflate_key: Optional[str] = None):
+        """
+        특정 사용자의 모든 연결에 메시지 전송 (user:{user_id} 토픽)
 
-                try:
-                    await conn_state.websocket.send_json(data)
-                    conn_state.message_count += 1
-                except WebSocketDisconnect:
-                    logger.info(f"WebSocket disconnected while sending to user {user_id}")
-                    conn_state.is_alive = False
-                    conn_states.remove(conn_state)
-                except Exception as e:
-                    logger.error(f"Failed to send to user {user_id}: {e}")
-                    conn_state.error_count += 1
-                    if conn_state.error_count >= MAX_ERROR_COUNT:
-                        conn_state.is_alive = False
-                        conn_states.remove(conn_state)
+        연결별 송신 큐에 넣기만 하고 기다리지 않음. conflate_key가 같은 미전송 메시지는 최신 값으로 교체.
+        """
+        broadcast_hub.publish_user(user_id, data, conflate_key)
 
     @staticmethod
     async def broadcast_to_all(data: dict):
-        """모든 연결된 사용자에게 메시지 전송 (에러 처리 강화)"""
-        async with send_lock:
-            for user_id, conn_states in list(connections.items()):
-                for conn_state in conn_states[:]:  # 복사본으로 순회
-                    if not conn_state.is_alive:
-                        continue
-
-                    try:
-                        await conn_state.websocket.send_json(data)
-                        conn_state.message_count += 1
-                    except WebSocketDisconnect:
-                        logger.info(f"WebSocket disconnected while broadcasting to user {user_id}")
-                        conn_state.is_alive = False
-                        conn_states.remove(conn_state)
-                    except Exception as e:
-                        logger.error(f"Failed to broadcast to user {user_id}: {e}")
-                        conn_state.error_count += 1
+        """모든 연결에 메시지 전송 (연결별 송신 큐, 느린 연결이 다른 연결을 막지 않음)"""
+        broadcast_hub.broadcast(data)
 
     @staticmethod
     async def send_price_update(
@@ -167,6 +142,7 @@ class WebSocketManager:
                     "price": price,
                     "timestamp": timestamp,
                 },
+                conflate_key=f"price:{symbol}",
             )
 
     @staticmethod
@@ -257,32 +233,27 @@ async def heartbeat_sender(user_id: int, conn_state: ConnectionState):
         while user_id in connections and conn_state.is_alive:
             await asyncio.sleep(HEARTBEAT_INTERVAL)
 
-            try:
-                # Ping 전송
-                await conn_state.websocket.send_json({
-                    "type": "ping",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                })
-                conn_state.last_ping = datetime.utcnow()
-                logger.debug(f"Sent ping to user {user_id}")
-
-            except WebSocketDisconnect:
-                logger.info(f"WebSocket disconnected during heartbeat for user {user_id}")
+            # Ping 전송 (송신 큐 경유, 큐가 닫혔으면 연결 종료된 것)
+            if not conn_state.hub.send({
+                "type": "ping",
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+            }):
+                logger.info(f"WebSocket closed during heartbeat for user {user_id}")
                 conn_state.is_alive = False
                 break
-            except Exception as e:
-                logger.error(f"Heartbeat error for user {user_id}: {e}")
-                conn_state.error_count += 1
-                if conn_state.error_count >= MAX_ERROR_COUNT:
-                    conn_state.is_alive = False
-                    break
+            conn_state.last_ping = datetime.utcnow()
+            logger.debug(f"Sent ping to user {user_id}")
 
     except Exception as e:
         logger.error(f"Failed heartbeat sender for user {user_id}: {e}")
 
 
 async def start_price_stream(user_id: int, symbols: List[str]):
-    """실시간 가격 데이터 스트리밍 (백그라운드 태스크, 에러 복구 개선)"""
+    """
+    실시간 가격 데이터 스트리밍 (백그라운드 태스크, 에러 복구 개선)
+
+    사용자 거래소가 feed_manager에서 지원되면 WebSocket 스트림, 아니면 REST 폴링.
+    """
     error_count = 0
     max_retries = 3
 
@@ -292,37 +263,41 @@ async def start_price_stream(user_id: int, symbols: List[str]):
                 session, user_id
             )
 
-            while user_id in connections and "price" in subscriptions.get(user_id, set()):
-                try:
-                    for symbol in symbols:
-                        # Bitget API에서 현재 가격 조회
-                        ticker = await client.fetch_ticker(symbol)
-                        price = ticker.get("last", 0)
-
-                        await WebSocketManager.send_price_update(
-                            user_id, symbol, price, datetime.utcnow().isoformat() + "Z"
-                        )
+        if feed_manager.supports(exchange_name):
+            await _stream_prices(user_id, exchange_name, symbols)
+            return
 
-                    await asyncio.sleep(1)  # 1초마다 업데이트
-                    error_count = 0  # 성공 시 에러 카운트 리셋
+        while user_id in connections and "price" in subscriptions.get(user_id, set()):
+            try:
+                for symbol in symbols:
+                    # 거래소 REST API에서 현재 가격 조회 (피드 미지원 거래소)
+                    ticker = await client.fetch_ticker(symbol)
+                    price = ticker.get("last", 0)
 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(
-                        f"Price stream error for user {user_id} (attempt {error_count}/{max_retries}): {e}"
+                    await WebSocketManager.send_price_update(
+                        user_id, symbol, price, datetime.utcnow().isoformat() + "Z"
                     )
 
-                    if error_count >= max_retries:
-                        logger.error(f"Price stream failed after {max_retries} retries for user {user_id}")
-                        await WebSocketManager.send_alert(
-                            user_id,
-                            "ERROR",
-                            "가격 스트리밍 연결이 실패했습니다. 잠시 후 다시 시도합니다."
-                        )
-                        await asyncio.sleep(30)  # 30초 대기 후 재시도
-                        error_count = 0
-                    else:
-                        await asyncio.sleep(5)  # 에러 시 5초 대기
+                await asyncio.sleep(1)  # 1초마다 업데이트
+                error_count = 0  # 성공 시 에러 카운트 리셋
+
+            except Exception as e:
+                error_count += 1
+                logger.error(
+                    f"Price stream error for user {user_id} (attempt {error_count}/{max_retries}): {e}"
+                )
+
+                if error_count >= max_retries:
+                    logger.error(f"Price stream failed after {max_retries} retries for user {user_id}")
+                    await WebSocketManager.send_alert(
+                        user_id,
+                        "ERROR",
+                        "가격 스트리밍 연결이 실패했습니다. 잠시 후 다시 시도합니다."
+                    )
+                    await asyncio.sleep(30)  # 30초 대기 후 재시도
+                    error_count = 0
+                else:
+                    await asyncio.sleep(5)  # 에러 시 5초 대기
 
     except Exception as e:
         logger.error(f"Failed to start price stream for user {user_id}: {e}")
@@ -333,6 +308,45 @@ async def start_price_stream(user_id: int, symbols: List[str]):
         )
 
 
+async def _stream_prices(user_id: int, exchange_name: str, symbols: List[str]):
+    """
+    거래소 WebSocket 시세 스트리밍 (feed_manager 공유 연결, REST 폴링 없음)
+
+    틱은 심볼별 최신 가격만 보관하고 1초마다 바뀐 심볼만 전송합니다.
+    """
+    requested = {simple_symbol(symbol): symbol for symbol in symbols}
+    latest: Dict[str, float] = {}
+
+    def on_tick(record):
+        latest[record.symbol] = record.price
+
+    subs = [
+        await feed_manager.subscribe(exchange_name, "ticker", symbol, on_tick)
+        for symbol in requested
+    ]
+    try:
+        while user_id in connections and "price" in subscriptions.get(user_id, set()):
+            await asyncio.sleep(1)
+            pending = list(latest.items())
+            latest.clear()
+            for symbol, price in pending:
+                await WebSocketManager.send_price_update(
+                    user_id, requested.get(symbol, symbol), price, datetime.utcnow().isoformat() + "Z"
+                )
+    finally:
+        for sub in subs:
+            await feed_manager.unsubscribe(sub)
+
+
+async def _wait_account_update(updated: asyncio.Event, timeout: float):
+    """다른 소비자가 스냅샷을 갱신하거나 timeout이 지날 때까지 대기"""
+    updated.clear()
+    try:
+        await asyncio.wait_for(updated.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
 async def start_position_monitor(user_id: int):
     """포지션 변경 모니터링 (백그라운드 태스크)"""
     try:
@@ -342,44 +356,55 @@ async def start_position_monitor(user_id: int):
             )
             previous_positions = {}
 
-            while user_id in connections and "position" in subscriptions.get(
-                user_id, set()
-            ):
-                try:
-                    # 현재 포지션 조회
-                    positions = await client.fetch_positions()
-
-                    # 변경 감지
-                    for pos in positions:
-                        symbol = pos.get("symbol", "")
-                        contracts = pos.get("contracts", 0)
+            # 봇/알림 모니터가 포지션을 갱신하면 즉시 깨어남
+            updated = asyncio.Event()
+            token = account_state_service.subscribe(
+                user_id, lambda kind, _: updated.set() if kind == "positions" else None
+            )
 
-                        if contracts == 0:
-                            continue
+            try:
+                while user_id in connections and "position" in subscriptions.get(
+                    user_id, set()
+                ):
+                    try:
+                        # 현재 포지션 조회 (공유 스냅샷, 최대 2초 지난 값)
+                        positions = await account_state_service.get_positions(
+                            user_id, client, max_age=2
+                        )
 
-                        # 새로운 포지션 또는 변경된 포지션
-                        pos_key = f"{symbol}_{pos.get('side', '')}"
-                        if (
-                            pos_key not in previous_positions
-                            or previous_positions[pos_key] != contracts
-                        ):
-                            await WebSocketManager.send_position_update(
-                                user_id,
-                                {
-                                    "symbol": symbol,
-                                    "side": pos.get("side", ""),
-                                    "contracts": contracts,
-                                    "entryPrice": pos.get("entryPrice", 0),
-                                    "unrealizedPnl": pos.get("unrealizedPnl", 0),
-                                },
-                            )
-                            previous_positions[pos_key] = contracts
+                        # 변경 감지
+                        for pos in positions:
+                            symbol = pos.get("symbol", "")
+                            contracts = pos.get("contracts", 0)
+
+                            if contracts == 0:
+                                continue
+
+                            # 새로운 포지션 또는 변경된 포지션
+                            pos_key = f"{symbol}_{pos.get('side', '')}"
+                            if (
+                                pos_key not in previous_positions
+                                or previous_positions[pos_key] != contracts
+                            ):
+                                await WebSocketManager.send_position_update(
+                                    user_id,
+                                    {
+                                        "symbol": symbol,
+                                        "side": pos.get("side", ""),
+                                        "contracts": contracts,
+                                        "entryPrice": pos.get("entryPrice", 0),
+                                        "unrealizedPnl": pos.get("unrealizedPnl", 0),
+                                    },
+                                )
+                                previous_positions[pos_key] = contracts
 
-                    await asyncio.sleep(2)  # 2초마다 체크
+                        await _wait_account_update(updated, 2)  # 최대 2초마다 체크
 
-                except Exception as e:
-                    logger.error(f"Position monitor error for user {user_id}: {e}")
-                    await asyncio.sleep(5)
+                    except Exception as e:
+                        logger.error(f"Position monitor error for user {user_id}: {e}")
+                        await asyncio.sleep(5)
+            finally:
+                account_state_service.unsubscribe(user_id, token)
 
     except Exception as e:
         logger.error(f"Failed to start position monitor for user {user_id}: {e}")
@@ -394,35 +419,46 @@ async def start_balance_monitor(user_id: int):
             )
             previous_balance = None
 
-            while user_id in connections and "balance" in subscriptions.get(
-                user_id, set()
-            ):
-                try:
-                    # 잔고 조회
-                    balance = await client.fetch_balance()
-                    usdt_balance = balance.get("USDT", {})
-                    current_total = float(usdt_balance.get("total", 0))
-
-                    # 변경 감지 (0.01 USDT 이상 차이)
-                    if (
-                        previous_balance is None
-                        or abs(current_total - previous_balance) > 0.01
-                    ):
-                        await WebSocketManager.send_balance_update(
-                            user_id,
-                            {
-                                "total": current_total,
-                                "free": float(usdt_balance.get("free", 0)),
-                                "used": float(usdt_balance.get("used", 0)),
-                            },
+            # 봇/알림 모니터가 잔고를 갱신하면 즉시 깨어남
+            updated = asyncio.Event()
+            token = account_state_service.subscribe(
+                user_id, lambda kind, _: updated.set() if kind == "balance" else None
+            )
+
+            try:
+                while user_id in connections and "balance" in subscriptions.get(
+                    user_id, set()
+                ):
+                    try:
+                        # 잔고 조회 (공유 스냅샷, 최대 5초 지난 값)
+                        balance = await account_state_service.get_balance(
+                            user_id, client, max_age=5
                         )
-                        previous_balance = current_total
+                        usdt = usdt_balance(balance)
+                        current_total = usdt["total"]
+
+                        # 변경 감지 (0.01 USDT 이상 차이)
+                        if (
+                            previous_balance is None
+                            or abs(current_total - previous_balance) > 0.01
+                        ):
+                            await WebSocketManager.send_balance_update(
+                                user_id,
+                                {
+                                    "total": current_total,
+                                    "free": usdt["free"],
+                                    "used": usdt["used"],
+                                },
+                            )
+                            previous_balance = current_total
 
-                    await asyncio.sleep(5)  # 5초마다 체크
+                        await _wait_account_update(updated, 5)  # 최대 5초마다 체크
 
-                except Exception as e:
-                    logger.error(f"Balance monitor error for user {user_id}: {e}")
-                    await asyncio.sleep(10)
+                    except Exception as e:
+                        logger.error(f"Balance monitor error for user {user_id}: {e}")
+                        await asyncio.sleep(10)
+            finally:
+                account_state_service.unsubscribe(user_id, token)
 
     except Exception as e:
         logger.error(f"Failed to start balance monitor for user {user_id}: {e}")
@@ -435,7 +471,8 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
 
     클라이언트 메시지 형식:
     - {"action": "subscribe", "channels": ["price", "position", "order", "balance"]}
-    - {"action": "unsubscribe", "channels": ["price"]}
+    - {"action": "subscribe", "topics": ["price:BTCUSDT", "chart:BTCUSDT:1m"]}  (공유 토픽)
+    - {"action": "unsubscribe", "channels": ["price"], "topics": ["chart:BTCUSDT:1m"]}
     - {"action": "ping"}
 
     서버 메시지 형식:
@@ -444,6 +481,10 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
     - {"type": "order_update", "data": {...}, "timestamp": "..."}
     - {"type": "balance_update", "data": {...}, "timestamp": "..."}
     - {"type": "alert", "level": "ERROR", "message": "...", "timestamp": "..."}
+    - {"type": "candle_update", "symbol": "BTCUSDT", "timeframe": "1m", "current_candle": {...}}
+
+    송신은 모두 broadcast_hub의 연결별 송신 큐를 거치며, 큐가 넘치거나 전송이 멈춘 연결은
+    1013 (Slow consumer)으로 종료됩니다.
     """
     # JWT 토큰 검증
     try:
@@ -470,8 +511,9 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
     # WebSocket 연결 수락
     await websocket.accept()
 
-    # ConnectionState 생성 및 등록
-    conn_state = ConnectionState(websocket=websocket)
+    # ConnectionState 생성 및 등록 (이후 송신은 모두 연결별 송신 큐 경유)
+    conn_state = ConnectionState(websocket=websocket, hub=broadcast_hub.connect(websocket, user_id))
+    hub_conn = conn_state.hub
     connections.setdefault(user_id, []).append(conn_state)
     subscriptions.setdefault(user_id, set())
 
@@ -485,7 +527,7 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
 
     try:
         # 환영 메시지
-        await websocket.send_json(
+        hub_conn.send(
             {
                 "type": "connected",
                 "message": "WebSocket connected successfully",
@@ -506,18 +548,18 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
 
                 # Handle ping/pong keepalive (plain text)
                 if message.strip().lower() == "ping":
-                    await websocket.send_text("pong")
+                    hub_conn.send("pong")
                     continue
 
                 # Parse JSON
                 import json
                 try:
-                    data = json.loads(message)
+                    data = fast_json.loads(message)
                 except json.JSONDecodeError as e:
                     # Only log non-ping messages as warnings
                     if message.strip().lower() not in ["ping", "pong"]:
                         logger.warning(f"Invalid JSON from user {user_id}: {e}, message: {message[:100]}")
-                        await websocket.send_json({
+                        hub_conn.send({
                             "type": "error",
                             "message": "Invalid JSON format",
                             "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -540,6 +582,9 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
                 channels = data.get("channels", [])
                 subscriptions[user_id].update(channels)
 
+                # 공유 토픽 구독 (price:BTCUSDT, chart:BTCUSDT:1m)
+                broadcast_hub.subscribe(hub_conn, data.get("topics", []))
+
                 # 구독에 따라 백그라운드 태스크 시작
                 if "price" in channels and not any(
                     t.get_name() == f"price_{user_id}" for t in background_tasks
@@ -563,10 +608,11 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
                     task.set_name(f"balance_{user_id}")
                     background_tasks.append(task)
 
-                await websocket.send_json(
+                hub_conn.send(
                     {
                         "type": "subscribed",
                         "channels": list(subscriptions[user_id]),
+                        "topics": sorted(hub_conn.topics),
                         "timestamp": datetime.utcnow().isoformat() + "Z",
                     }
                 )
@@ -574,17 +620,19 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
             elif action == "unsubscribe":
                 channels = data.get("channels", [])
                 subscriptions[user_id].difference_update(channels)
+                topics = broadcast_hub.unsubscribe(hub_conn, data.get("topics", []))
 
-                await websocket.send_json(
+                hub_conn.send(
                     {
                         "type": "unsubscribed",
                         "channels": channels,
+                        "topics": topics,
                         "timestamp": datetime.utcnow().isoformat() + "Z",
                     }
                 )
 
             elif action == "ping":
-                await websocket.send_json(
+                hub_conn.send(
                     {
                         "type": "pong",
                         "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -601,7 +649,7 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
                 from ..utils.log_broadcaster import get_recent_logs
                 limit = data.get("limit", 100)
                 logs = get_recent_logs(user_id, limit)
-                await websocket.send_json(
+                hub_conn.send(
                     {
                         "type": "recent_logs",
                         "logs": logs,
@@ -616,6 +664,7 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
     finally:
         # 정리
         conn_state.is_alive = False
+        await broadcast_hub.disconnect(hub_conn)
 
         # ConnectionState 제거
         if user_id in connections and conn_state in connections[user_id]:
@@ -638,7 +687,7 @@ async def user_socket(websocket: WebSocket, user_id: int, token: str | None = Qu
         duration = (datetime.utcnow() - conn_state.connected_at).total_seconds()
         logger.info(
             f"Connection closed for user {user_id} - "
-            f"Duration: {duration:.1f}s, Messages: {conn_state.message_count}, "
+            f"Duration: {duration:.1f}s, Messages: {hub_conn.sent}, "
             f"Errors: {conn_state.error_count}"
         )
 
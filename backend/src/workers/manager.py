@@ -9,12 +9,14 @@
 """
 
 import asyncio
+import json
 import logging
 from typing import List, Set
 from sqlalchemy import select, and_
 
-from ..database.models import BotStatus, BotInstance
+from ..database.models import BotStatus, BotInstance, Strategy
 from ..services.bot_runner import BotRunner
+from ..services.candle_warm_start import candle_warm_store
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +103,9 @@ class BotManager:
 
             logger.info(f"Found {len(bot_instances)} bot instance(s) to restore")
 
+            # 봇 시작 전에 (심볼, 타임프레임)별 캔들을 로컬에서 한 번씩 로드
+            await self._preload_candles(session, bot_instances)
+
             for instance in bot_instances:
                 try:
                     from ..utils.log_broadcaster import attach_log_handler
@@ -126,6 +131,29 @@ class BotManager:
                 f"Bot instance bootstrap: {started_count} started, {failed_count} failed"
             )
 
+    async def _preload_candles(self, session, bot_instances: List[BotInstance]):
+        """복구할 봇들의 고유 (심볼, 타임프레임) 캔들을 웜스타트 저장소에 미리 로드"""
+        try:
+            strategy_ids = {i.strategy_id for i in bot_instances if i.strategy_id}
+            params_by_id = {}
+            if strategy_ids:
+                result = await session.execute(
+                    select(Strategy.id, Strategy.params).where(Strategy.id.in_(strategy_ids))
+                )
+                params_by_id = {row.id: row.params for row in result}
+
+            keys = set()
+            for instance in bot_instances:
+                if not instance.symbol:
+                    continue
+                params = params_by_id.get(instance.strategy_id)
+                timeframe = (json.loads(params) if params else {}).get("timeframe", "5m")
+                keys.add((instance.symbol, timeframe))
+
+            await candle_warm_store.preload(keys)
+        except Exception as e:
+            logger.warning(f"Candle warm-start preload failed: {e}")
+
     # ============================================================
     # 기존 API (하위 호환성)
     # ============================================================
@@ -0,0 +1,135 @@
+"""
+AccountStateService 유닛 테스트
+
+사용자별 잔고/포지션 스냅샷 공유와 동시 요청 합치기 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.services.account_state_service import AccountStateService, usdt_balance
+
+
+class FakeClient:
+    """호출 횟수를 기록하는 거래소 클라이언트"""
+
+    def __init__(self, fail=False):
+        self.balance_calls = 0
+        self.position_calls = 0
+        self.fail = fail
+
+    async def fetch_balance(self):
+        self.balance_calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("exchange down")
+        return {"USDT": {"total": 100.0 + self.balance_calls, "free": 80.0, "used": 20.0}}
+
+    async def get_positions(self):
+        self.position_calls += 1
+        return [{"symbol": "BTCUSDT", "total": "0.01"}]
+
+
+class TestAccountStateService:
+    """AccountStateService 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """같은 사용자의 동시 잔고 조회는 한 번만 호출"""
+        service = AccountStateService()
+        client = FakeClient()
+
+        results = await asyncio.gather(*[service.get_balance(1, client) for _ in range(10)])
+
+        assert client.balance_calls == 1
+        assert all(r is results[0] for r in results)
+        assert service.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_snapshot_respects_max_age(self):
+        """스냅샷 나이가 max_age를 넘으면 다시 조회"""
+        service = AccountStateService()
+        client = FakeClient()
+
+        await service.get_balance(1, client)
+        await service.get_balance(1, client, max_age=5)
+        assert client.balance_calls == 1
+
+        await service.get_balance(1, client, max_age=0)
+        assert client.balance_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_users_are_isolated(self):
+        """사용자별로 별도 스냅샷"""
+        service = AccountStateService()
+        client = FakeClient()
+
+        await service.get_positions(1, client)
+        await service.get_positions(2, client)
+
+        assert client.position_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self):
+        """API 실패는 대기 중인 모든 호출자에게 전달"""
+        service = AccountStateService()
+        client = FakeClient(fail=True)
+
+        results = await asyncio.gather(
+            *[service.get_balance(1, client) for _ in range(3)], return_exceptions=True
+        )
+
+        assert client.balance_calls == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert service.peek(1, "balance") is None
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_updates(self):
+        """스냅샷 갱신 시 구독자에게 push"""
+        service = AccountStateService()
+        client = FakeClient()
+        received = []
+
+        token = service.subscribe(1, lambda kind, value: received.append(kind))
+        await service.get_balance(1, client)
+        await service.get_positions(1, client)
+        service.unsubscribe(1, token)
+        await service.get_balance(1, client, max_age=0)
+
+        assert received == ["balance", "positions"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """주문 후 무효화하면 다음 조회는 새로 호출"""
+        service = AccountStateService()
+        client = FakeClient()
+
+        await service.get_balance(1, client)
+        service.invalidate(1)
+        await service.get_balance(1, client)
+
+        assert client.balance_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_started_before_invalidate_is_not_reused(self):
+        """무효화 이전에 시작된 조회는 합류하지도 캐시하지도 않음"""
+        service = AccountStateService()
+        client = FakeClient()
+
+        before_fill = asyncio.create_task(service.get_balance(1, client))
+        await asyncio.sleep(0)
+        service.invalidate(1, "balance")
+        after_fill = await service.get_balance(1, client)
+        stale = await before_fill
+
+        assert client.balance_calls == 2
+        assert stale is not after_fill
+        assert await service.get_balance(1, client) is after_fill
+        assert service.get_stats()["stale_discarded"] == 1
+
+    def test_usdt_balance_formats(self):
+        """REST 클라이언트/거래소 어댑터 잔고 형식 모두 지원"""
+        assert usdt_balance({"USDT": {"total": 10, "free": 7, "used": 3}}) == {
+            "total": 10.0, "free": 7.0, "used": 3.0,
+        }
+        assert usdt_balance({"total": 5, "free": 5, "used": 0, "assets": []})["total"] == 5.0
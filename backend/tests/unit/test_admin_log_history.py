@@ -0,0 +1,135 @@
+"""
+admin_log_history / log_retention 유닛 테스트
+
+(created_at, id) keyset 페이지, NDJSON 내보내기, BotLog 일 단위 보관/삭제 테스트.
+"""
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotLog, Trade, User
+from src.services.admin_log_history import (
+    bot_log_query,
+    fetch_page,
+    iter_ndjson,
+    log_row,
+    trade_log_query,
+)
+from src.services.log_retention import BotLogRetention
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def seed(session):
+    """로그 25건: 같은 시각 5건씩 (id로만 구분), 3일에 걸쳐"""
+    session.add(User(id=1, email="a@example.com"))
+    session.add(User(id=2, email="b@example.com"))
+    for i in range(25):
+        session.add(BotLog(
+            user_id=1 + i % 2,
+            event_type="bot_error" if i % 3 == 0 else "bot_started",
+            message=f"log {i}",
+            created_at=NOW - timedelta(days=i // 10, minutes=i // 5),
+        ))
+    session.add(Trade(user_id=2, symbol="ETHUSDT", side="buy", qty=1, entry_price=10, pnl=1, created_at=NOW))
+    await session.commit()
+
+
+class TestLogPages:
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_newest_first(self, async_session):
+        await seed(async_session)
+        query = bot_log_query("bot")
+
+        seen, cursor = [], None
+        while True:
+            rows, cursor = await fetch_page(async_session, query, BotLog, 4, cursor)
+            seen.extend(rows)
+            if cursor is None:
+                break
+
+        keys = [(row.created_at, row.id) for row in seen]
+        assert len(keys) == len(set(keys)) == 25
+        assert keys == sorted(keys, reverse=True)
+        assert {row.user_email for row in seen} == {"a@example.com", "b@example.com"}
+
+    @pytest.mark.asyncio
+    async def test_filters(self, async_session):
+        await seed(async_session)
+
+        rows, _ = await fetch_page(async_session, bot_log_query("system", level="error"), BotLog, 100)
+        assert len(rows) == 9 and all("error" in row.event_type for row in rows)
+
+        query = bot_log_query("bot", user_id=2, start=NOW - timedelta(hours=1))
+        rows, _ = await fetch_page(async_session, query, BotLog, 100)
+        assert {row.user_id for row in rows} == {2} and len(rows) == 5
+
+        rows, _ = await fetch_page(async_session, trade_log_query(symbol="ethusdt"), Trade, 100)
+        assert [row.user_email for row in rows] == ["b@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, async_session):
+        with pytest.raises(ValueError):
+            await fetch_page(async_session, bot_log_query("bot"), BotLog, 10, cursor="garbage")
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, async_session, session_factory):
+        await seed(async_session)
+
+        chunks = [
+            chunk
+            async for chunk in iter_ndjson(
+                bot_log_query("bot"), BotLog, log_row, batch_size=7, session_factory=session_factory
+            )
+        ]
+
+        lines = b"".join(chunks).splitlines()
+        assert len(chunks) == 4
+        assert len(lines) == 25
+        created = [json.loads(line)["created_at"] for line in lines]
+        assert created == sorted(created)  # 오래된 순
+
+
+class TestBotLogRetention:
+    @pytest.mark.asyncio
+    async def test_archives_and_deletes_old_days(self, async_session, session_factory, tmp_path):
+        await seed(async_session)
+        retention = BotLogRetention(
+            retention_days=1, archive_dir=str(tmp_path), batch_size=3, session_factory=session_factory
+        )
+
+        archived = await retention.run_once(now=NOW + timedelta(days=1))
+
+        # 기준: 다음 날 0시 - 1일 = 3/10 0시 → 3/8 5건, 3/9 10건 보관, 3/10 10건 유지
+        assert archived == 15
+        assert retention.get_stats()["archived_days"] == 2
+        assert retention.last_error is None
+        remaining = (await async_session.execute(select(func.count()).select_from(BotLog))).scalar()
+        assert remaining == 10
+
+        files = sorted((tmp_path / "bot_logs" / "2026").glob("*.ndjson.gz"))
+        assert [f.name for f in files] == [
+            "bot_logs-2026-03-08.part0.ndjson.gz",
+            "bot_logs-2026-03-09.part0.ndjson.gz",
+        ]
+        with gzip.open(files[1], "rt") as f:
+            rows = [json.loads(line) for line in f]
+        assert len(rows) == 10
+        assert all(row["created_at"].startswith("2026-03-09") for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, async_session, session_factory, tmp_path):
+        await seed(async_session)
+        retention = BotLogRetention(retention_days=0, archive_dir=str(tmp_path), session_factory=session_factory)
+
+        assert await retention.run_once(now=NOW) == 0
+        assert not (tmp_path / "bot_logs").exists()
@@ -0,0 +1,132 @@
+"""
+admin_user_stats 유닛 테스트
+
+회원 목록 집계/keyset 페이지네이션/필터, 회원 상세 통계 SQL 집계 테스트.
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.database.models import BotStatus, Trade, User
+from src.services.admin_user_stats import (
+    decode_cursor,
+    encode_cursor,
+    list_users_page,
+    profit_stats,
+    trade_stats,
+)
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+async def seed(session):
+    """회원 5명, 거래 (user 1: +30/-10/0, user 2: +5, user 3: -40), user 2 봇 실행 중"""
+    for i in range(1, 6):
+        session.add(User(
+            id=i, email=f"user{i}@example.com", role="admin" if i == 5 else "user",
+            is_active=i != 4, created_at=NOW - timedelta(days=10 - i),
+        ))
+    trades = [(1, 30, 0), (1, -10, 2), (1, 0, 20), (2, 5, 0), (3, -40, 40)]
+    for user_id, pnl, days_ago in trades:
+        session.add(Trade(
+            user_id=user_id, symbol="BTCUSDT", side="buy", qty=1, entry_price=100,
+            pnl=pnl, created_at=NOW - timedelta(days=days_ago, hours=1),
+        ))
+    session.add(BotStatus(user_id=2, is_running=True))
+    session.add(BotStatus(user_id=3, is_running=False))
+    await session.commit()
+
+
+async def all_pages(session, **kwargs):
+    users, cursor = [], None
+    while True:
+        page = await list_users_page(session, cursor=cursor, **kwargs)
+        users.extend(page["users"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return users
+
+
+class TestListUsers:
+    @pytest.mark.asyncio
+    async def test_stats_match_per_user_totals(self, async_session):
+        await seed(async_session)
+
+        page = await list_users_page(async_session)
+
+        by_id = {u["id"]: u for u in page["users"]}
+        assert [u["id"] for u in page["users"]] == [1, 2, 3, 4, 5]
+        assert (by_id[1]["total_trades"], by_id[1]["total_pnl"]) == (3, 20.0)
+        assert (by_id[3]["total_trades"], by_id[3]["total_pnl"]) == (1, -40.0)
+        assert (by_id[4]["total_trades"], by_id[4]["total_pnl"]) == (0, 0.0)
+        assert [by_id[i]["active_bots_count"] for i in (1, 2, 3)] == [0, 1, 0]
+        assert page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort", ["id", "created_at", "email", "total_pnl", "total_trades", "active_bots_count"])
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    async def test_keyset_pages_cover_sorted_list(self, async_session, sort, order):
+        """페이지를 이어 붙이면 한 번에 정렬한 결과와 같음 (중복/누락 없음)"""
+        await seed(async_session)
+
+        full = (await list_users_page(async_session, sort=sort, order=order))["users"]
+        paged = await all_pages(async_session, sort=sort, order=order, limit=2)
+
+        assert [u["id"] for u in paged] == [u["id"] for u in full]
+        values = [(u[sort] if sort != "email" else u["email"], u["id"]) for u in full]
+        assert values == sorted(values, reverse=order == "desc")
+
+    @pytest.mark.asyncio
+    async def test_filters(self, async_session):
+        await seed(async_session)
+
+        assert [u["id"] for u in await all_pages(async_session, is_active=False)] == [4]
+        assert [u["id"] for u in await all_pages(async_session, role="admin")] == [5]
+        assert [u["id"] for u in await all_pages(async_session, search="USER3")] == [3]
+
+    @pytest.mark.asyncio
+    async def test_invalid_sort_or_cursor(self, async_session):
+        with pytest.raises(ValueError):
+            await list_users_page(async_session, sort="password_hash")
+        with pytest.raises(ValueError):
+            await list_users_page(async_session, sort="total_pnl", cursor="not-a-cursor")
+
+    def test_cursor_round_trip(self):
+        at = datetime(2026, 1, 2, 3, 4, 5)
+
+        assert decode_cursor(encode_cursor(at, 7), "created_at") == (at, 7)
+        assert decode_cursor(encode_cursor(Decimal("-1.5"), 3), "total_pnl") == (Decimal("-1.5"), 3)
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(1, 3), "email")
+
+
+class TestUserStats:
+    @pytest.mark.asyncio
+    async def test_trade_stats(self, async_session):
+        await seed(async_session)
+
+        stats = await trade_stats(async_session, 1)
+
+        assert stats["total_trades"] == 3
+        assert (stats["winning_trades"], stats["losing_trades"]) == (1, 1)
+        assert stats["total_pnl"] == 20.0
+        assert stats["win_rate"] == 33.3
+        assert stats["profit_factor"] == 3.0
+        assert (await trade_stats(async_session, 4))["total_trades"] == 0
+
+    @pytest.mark.asyncio
+    async def test_profit_stats_windows(self, async_session):
+        await seed(async_session)
+
+        stats = await profit_stats(async_session, 1, now=NOW)
+
+        assert (stats["today"]["total_trades"], stats["today"]["total_pnl"]) == (1, 30.0)
+        assert stats["week"]["total_trades"] == 2
+        assert stats["month"]["total_trades"] == 3
+        assert stats["all_time"]["max_profit"] == 30.0
+        assert stats["all_time"]["max_loss"] == -10.0
+        daily = {d["date"]: d for d in stats["daily_pnl"]}
+        assert len(stats["daily_pnl"]) == 7
+        assert stats["daily_pnl"][-1] == {"date": "2026-03-10", "pnl": 30.0, "trades": 1}
+        assert daily["2026-03-08"] == {"date": "2026-03-08", "pnl": -10.0, "trades": 1}
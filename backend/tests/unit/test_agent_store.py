@@ -0,0 +1,226 @@
+"""
+AgentStore 유닛 테스트
+
+write-behind 배치, MGET/MSET, TTL, 메트릭, 에이전트 주입/종료 테스트 (메모리 구현 사용).
+"""
+import asyncio
+
+import pytest
+
+from src.agents.agent_store import (
+    InMemoryAgentStore,
+    JsonSerializer,
+    RedisAgentStore,
+    as_agent_store,
+)
+
+
+class FakePipeline:
+    """실행된 명령을 기록하는 파이프라인"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value, ex))
+
+    def lpush(self, key, value):
+        self.commands.append(("lpush", key, value))
+
+    def ltrim(self, key, start, end):
+        self.commands.append(("ltrim", key, start, end))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    async def execute(self):
+        self.redis.executed.append(self.commands)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.executed = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def mget(self, keys):
+        return [None] * len(keys)
+
+
+class TestAgentStore:
+    """InMemoryAgentStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_read_your_writes_before_flush(self):
+        """flush 전에도 방금 쓴 값 조회"""
+        store = InMemoryAgentStore(flush_interval=60)
+
+        await store.set("a", {"x": 1}, ttl=60)
+
+        assert store.get_stats()["buffered_ops"] == 1
+        assert await store.get("a") == {"x": 1}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_mset_mget(self):
+        """MSET 값은 한 번의 flush, MGET은 순서 유지"""
+        store = InMemoryAgentStore(flush_interval=60)
+
+        await store.mset({"a": 1, "b": [1, 2]})
+        await store.flush()
+
+        assert await store.mget(["b", "missing", "a"], default=0) == [[1, 2], 0, 1]
+        stats = store.get_stats()
+        assert stats["flushes"] == 1
+        assert stats["flushed_ops"] == 2
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_size_flush(self):
+        """max_batch에 도달하면 즉시 flush"""
+        store = InMemoryAgentStore(max_batch=3, flush_interval=60)
+
+        for i in range(3):
+            await store.set(f"k{i}", i)
+        await asyncio.sleep(0)
+
+        stats = store.get_stats()
+        assert stats["flush_reasons"] == {"size": 1}
+        assert stats["fill_rate"] == 1.0
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_time_flush(self):
+        """flush_interval 이후 자동 flush"""
+        store = InMemoryAgentStore(flush_interval=0.01)
+
+        await store.set("a", 1)
+        await asyncio.sleep(0.05)
+
+        assert store.get_stats()["flush_reasons"] == {"time": 1}
+        assert store.get_stats()["buffered_ops"] == 0
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_delete(self):
+        """TTL 만료 및 삭제"""
+        store = InMemoryAgentStore(flush_interval=60)
+
+        await store.set("short", 1, ttl=0.01)
+        await store.set("gone", 2)
+        await store.flush()
+        await store.delete("gone")
+
+        assert await store.get("gone") is None
+        await asyncio.sleep(0.02)
+        assert await store.get("short") is None
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_lpush_trim(self):
+        """최근 N개 리스트 유지"""
+        store = InMemoryAgentStore(flush_interval=60)
+
+        for i in range(5):
+            await store.lpush_trim("recent", i, 3)
+
+        assert await store.lrange("recent") == [4, 3, 2]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_to_subscriber(self):
+        """메모리 pub/sub"""
+        store = InMemoryAgentStore()
+        received = []
+        store.subscribe("events", received.append)
+
+        assert await store.publish("events", {"type": "x"}) == 1
+        assert received == ['{"type": "x"}']
+
+    @pytest.mark.asyncio
+    async def test_redis_pipeline_batches_ops(self):
+        """Redis 구현은 버퍼된 쓰기를 파이프라인 한 번으로 전송"""
+        redis = FakeRedis()
+        store = RedisAgentStore(redis, serializer=JsonSerializer(), flush_interval=60)
+
+        await store.set("a", 1, ttl=10)
+        await store.lpush_trim("list", "id", 20)
+        await store.flush()
+
+        assert redis.executed == [[
+            ("set", "a", "1", 10),
+            ("lpush", "list", '"id"'),
+            ("ltrim", "list", 0, 19),
+        ]]
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_inflight_timed_flush(self):
+        """전송 중인 시간 기준 flush는 close로 타이머가 취소돼도 끝까지 전송"""
+        store = InMemoryAgentStore(flush_interval=0.01)
+        started = asyncio.Event()
+        original = store._execute
+
+        async def slow_execute(ops):
+            started.set()
+            await asyncio.sleep(0.05)
+            await original(ops)
+
+        store._execute = slow_execute
+        await store.set("a", 1)
+        await started.wait()
+        await store.close()
+
+        assert await store.get("a") == 1
+        assert store._timer is None
+        assert store.get_stats()["errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_awaits_size_flush_tasks(self):
+        """크기 기준 flush 태스크는 참조를 유지하고 close에서 완료를 기다림"""
+        store = InMemoryAgentStore(max_batch=2, flush_interval=60)
+
+        await store.set("a", 1)
+        await store.set("b", 2)
+        assert len(store._flush_tasks) == 1
+        await store.close()
+
+        assert not store._flush_tasks
+        assert store.get_stats()["flushed_ops"] == 2
+
+
+class TestAgentStoreWiring:
+    """에이전트 생성 시 저장소 주입"""
+
+    def test_as_agent_store(self):
+        """클라이언트 종류별 변환"""
+        redis = FakeRedis()
+        store = InMemoryAgentStore()
+
+        class LegacyRedisClient:  # agents.redis_client.RedisClient 형태
+            _client = redis
+
+        assert as_agent_store(None) is None
+        assert as_agent_store(store) is store
+        assert as_agent_store(redis).redis is redis
+        assert as_agent_store(LegacyRedisClient()).redis is redis
+        with pytest.raises(TypeError):
+            as_agent_store(object())
+
+    @pytest.mark.asyncio
+    async def test_agents_wrap_redis_and_flush_on_stop(self):
+        """Redis 클라이언트를 받은 에이전트는 lpush_trim/ttl 쓰기를 파이프라인으로 보내고 stop에서 flush"""
+        from src.agents.anomaly_detector.agent import AnomalyDetectionAgent
+
+        redis = FakeRedis()
+        agent = AnomalyDetectionAgent("anomaly", "Anomaly", redis_client=redis)
+        await agent.redis_client.set("agent:anomaly:alert:1", {"id": 1}, ttl=3600)
+        await agent.redis_client.lpush_trim("agent:anomaly:user:1:alerts", "1", 100)
+
+        await agent.start()
+        await agent.stop(timeout=1)
+
+        assert isinstance(agent.redis_client, RedisAgentStore)
+        assert len(redis.executed) == 1
+        assert [command[0] for command in redis.executed[0]] == ["set", "lpush", "ltrim"]
@@ -0,0 +1,198 @@
+"""
+BroadcastHub 유닛 테스트
+
+토픽 구독/정규화, 1회 직렬화 팬아웃, price 토픽 conflation, 느린 소비자 종료 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.utils import fast_json
+from src.websockets.broadcast_hub import WS_SLOW_CONSUMER, BroadcastHub, normalize_topic
+
+
+class FakeSocket:
+    """send_text 기록 (gate가 닫혀 있으면 전송이 멈춤 = 느린 브라우저)"""
+
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def send_text(self, text):
+        await self.gate.wait()
+        self.sent.append(fast_json.loads(text))
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestTopics:
+    def test_normalize_topic(self):
+        assert normalize_topic("price:btc/usdt") == "price:BTCUSDT"
+        assert normalize_topic("chart:BTC-USDT:1m") == "chart:BTCUSDT:1m"
+        assert normalize_topic("user:42", user_id=42) == "user:42"
+        assert normalize_topic("user:43", user_id=42) is None
+        assert normalize_topic("orders:BTCUSDT") is None
+
+
+class TestBroadcastHub:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribers_only(self, monkeypatch):
+        """토픽 구독자에게만, 직렬화는 한 번"""
+        calls = []
+        original = fast_json.dumps
+        monkeypatch.setattr(fast_json, "dumps", lambda obj: calls.append(obj) or original(obj))
+        hub = BroadcastHub()
+        first, second, other = FakeSocket(), FakeSocket(), FakeSocket()
+        for user_id, socket in enumerate((first, second, other)):
+            conn = hub.connect(socket, user_id)
+            if socket is not other:
+                assert hub.subscribe(conn, ["price:BTC/USDT"]) == ["price:BTCUSDT"]
+
+        delivered = hub.publish("price:BTCUSDT", {"type": "price_update", "price": 1.0})
+        await settle()
+
+        assert delivered == 2
+        assert len(calls) == 1
+        assert first.sent == second.sent == [{"type": "price_update", "price": 1.0}]
+        assert other.sent == []
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_user_topic(self):
+        hub = BroadcastHub()
+        mine, theirs = FakeSocket(), FakeSocket()
+        hub.connect(mine, 1)
+        hub.connect(theirs, 2)
+
+        hub.publish_user(1, {"type": "alert"})
+        await settle()
+
+        assert mine.sent == [{"type": "alert"}]
+        assert theirs.sent == []
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_connection_does_not_block_others(self):
+        hub = BroadcastHub()
+        slow, fast = FakeSocket(blocked=True), FakeSocket()
+        for user_id, socket in enumerate((slow, fast)):
+            hub.subscribe(hub.connect(socket, user_id), ["price:BTCUSDT"])
+
+        for price in range(3):
+            hub.publish("price:BTCUSDT", {"price": price})
+            await settle()
+
+        assert [m["price"] for m in fast.sent] == [0, 1, 2]
+        assert slow.sent == []
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_price_conflation(self):
+        """전송 대기 중인 price 메시지는 최신 값으로 교체, user 메시지는 모두 순서대로"""
+        hub = BroadcastHub()
+        socket = FakeSocket(blocked=True)
+        conn = hub.connect(socket, 7)
+        hub.subscribe(conn, ["price:BTCUSDT"])
+
+        hub.publish("price:BTCUSDT", {"price": 0})
+        await settle()  # 첫 메시지는 전송 중 (gate에서 대기)
+        for price in (1, 2, 3):
+            hub.publish("price:BTCUSDT", {"price": price})
+        hub.publish_user(7, {"type": "order_update", "n": 1})
+        hub.publish_user(7, {"type": "order_update", "n": 2})
+
+        socket.gate.set()
+        await settle()
+
+        assert socket.sent == [
+            {"price": 0},
+            {"price": 3},
+            {"type": "order_update", "n": 1},
+            {"type": "order_update", "n": 2},
+        ]
+        assert conn.conflated == 2
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_full_disconnects_slow_consumer(self):
+        hub = BroadcastHub(max_queue=3)
+        slow, fast = FakeSocket(blocked=True), FakeSocket()
+        slow_conn = hub.connect(slow, 1)
+        hub.connect(fast, 2)
+        await settle()
+
+        for n in range(5):
+            hub.broadcast({"n": n})
+            await settle()
+
+        assert slow_conn.closed and slow_conn.slow
+        assert slow.closed_with == WS_SLOW_CONSUMER
+        assert [m["n"] for m in fast.sent] == [0, 1, 2, 3, 4]
+        stats = hub.get_stats()
+        assert stats["connections"] == 1
+        assert stats["slow_disconnects"] == 1
+        assert "user:1" not in stats["topics"]
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_disconnects(self):
+        """전송 하나가 send_timeout을 넘기면 다음 발행 때 종료"""
+        hub = BroadcastHub(send_timeout=0.01)
+        socket = FakeSocket(blocked=True)
+        conn = hub.connect(socket, 1)
+
+        hub.publish_user(1, {"n": 1})
+        await settle()
+        await asyncio.sleep(0.02)
+
+        assert hub.publish_user(1, {"n": 2}) == 0
+        await settle()
+
+        assert conn.closed
+        assert conn.close_reason.startswith("send timeout")
+        assert socket.closed_with == WS_SLOW_CONSUMER
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_close_task_is_tracked(self):
+        """느린 소비자 WebSocket close 태스크는 끝날 때까지 참조 유지"""
+        hub = BroadcastHub()
+        socket = FakeSocket()
+        closing = asyncio.Event()
+
+        async def close(code=1000, reason=""):
+            await closing.wait()
+            socket.closed_with = code
+
+        socket.close = close
+        conn = hub.connect(socket, 1)
+        conn.close("queue full", slow=True)
+        await settle()
+
+        assert len(conn._close_tasks) == 1
+        closing.set()
+        await settle()
+
+        assert not conn._close_tasks
+        assert socket.closed_with == WS_SLOW_CONSUMER
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_unsubscribes(self):
+        hub = BroadcastHub()
+        conn = hub.connect(FakeSocket(), 1)
+        hub.subscribe(conn, ["chart:BTCUSDT:1m"])
+
+        await hub.disconnect(conn)
+
+        assert hub.publish("chart:BTCUSDT:1m", {}) == 0
+        assert hub.get_stats()["slow_disconnects"] == 0
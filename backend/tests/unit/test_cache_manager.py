@@ -0,0 +1,125 @@
+"""
+InMemoryCache 유닛 테스트
+
+LRU 제거, 바이트 한도, 지연 만료, single-flight 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.utils.cache_manager import InMemoryCache
+
+
+class TestInMemoryCache:
+    """InMemoryCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """최근 사용한 항목은 유지, 가장 오래 사용되지 않은 항목 제거"""
+        cache = InMemoryCache(max_size=2)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_limit(self):
+        """바이트 한도 초과 시 제거, 한도보다 큰 값은 저장하지 않음"""
+        cache = InMemoryCache(max_bytes=10)
+
+        await cache.set("a", "xxxxxx")
+        await cache.set("b", "yyyyyy")
+
+        assert await cache.get("a") is None
+        assert cache.get_stats()["bytes"] == 6
+        assert await cache.set("big", "z" * 11) is False
+
+    @pytest.mark.asyncio
+    async def test_oversized_overwrite_drops_stale_value(self):
+        """한도보다 큰 값으로 덮어쓰면 이전 값도 더 이상 조회되지 않음"""
+        cache = InMemoryCache(max_bytes=10)
+
+        await cache.set("a", "old")
+        assert await cache.set("a", "z" * 11) is False
+
+        assert await cache.get("a") is None
+        assert cache.get_stats()["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expiry(self):
+        """TTL 지난 항목은 조회 시 제거"""
+        cache = InMemoryCache()
+
+        await cache.set("a", 1, ttl=0)
+        await asyncio.sleep(0.01)
+
+        assert await cache.get("a") is None
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+        assert stats["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_overwrite_updates_bytes(self):
+        """같은 키 덮어쓰기 시 크기 재계산"""
+        cache = InMemoryCache()
+
+        await cache.set("a", "xxxx")
+        await cache.set("a", "xx")
+
+        assert cache.get_stats()["bytes"] == 2
+        assert await cache.delete("a") is True
+        assert cache.get_stats()["bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_single_flight(self):
+        """동시 미스는 loader 한 번만 실행"""
+        cache = InMemoryCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 42}
+
+        results = await asyncio.gather(*[cache.get_or_set("k", loader) for _ in range(5)])
+
+        assert results == [{"value": 42}] * 5
+        assert len(calls) == 1
+        assert cache.get_stats()["coalesced"] == 4
+        assert await cache.get_or_set("k", loader) == {"value": 42}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_error_propagates(self):
+        """loader 실패는 모든 대기자에게 전달, 캐싱하지 않음"""
+        cache = InMemoryCache()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("k", loader) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_counters(self):
+        cache = InMemoryCache()
+
+        await cache.get("missing")
+        await cache.set("a", 1)
+        await cache.get("a")
+
+        stats = cache.get_stats()
+        assert stats["total_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
@@ -0,0 +1,114 @@
+"""
+CandleWarmStartStore / StartAdmission 유닛 테스트
+
+로컬 웜스타트 로드, 증분 보충, 동시 요청 합치기, 시작 속도 제한 테스트.
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.services.candle_warm_start import CandleWarmStartStore, StartAdmission
+
+FIVE_MIN = 5 * 60 * 1000
+
+
+def make_bars(end_ts: int, count: int):
+    return [
+        {"timestamp": end_ts - (count - 1 - i) * FIVE_MIN, "open": 1.0, "high": 1.0,
+         "low": 1.0, "close": float(i), "volume": 1.0}
+        for i in range(count)
+    ]
+
+
+class FakeClient:
+    """get_historical_candles 호출 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_historical_candles(self, symbol, interval, limit):
+        self.calls.append((symbol, interval, limit))
+        await asyncio.sleep(0.01)
+        now = int(time.time() * 1000) // FIVE_MIN * FIVE_MIN
+        return make_bars(now, limit)
+
+
+class TestCandleWarmStartStore:
+    """CandleWarmStartStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_bots_share_one_request(self, tmp_path):
+        """같은 키에 대한 동시 요청은 API 한 번"""
+        store = CandleWarmStartStore(cache_dir=tmp_path)
+        client = FakeClient()
+
+        results = await asyncio.gather(
+            *[store.get_candles("BTC/USDT", "5m", limit=200, client=client) for _ in range(10)]
+        )
+
+        assert client.calls == [("BTCUSDT", "5m", 200)]
+        assert all(len(r) == 200 for r in results)
+        assert store.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_snapshot_enables_incremental_top_up(self, tmp_path):
+        """저장된 스냅샷으로 재시작 시 부족한 캔들만 요청"""
+        first = CandleWarmStartStore(cache_dir=tmp_path)
+        await first.get_candles("BTCUSDT", "5m", client=FakeClient())
+
+        restarted = CandleWarmStartStore(cache_dir=tmp_path)
+        await restarted.preload([("BTCUSDT", "5m")])
+        client = FakeClient()
+        candles = await restarted.get_candles("BTCUSDT", "5m", limit=200, client=client)
+
+        assert len(candles) == 200
+        assert client.calls[0][2] <= 3
+        assert restarted.get_stats()["disk_loads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_csv_tail_preload(self, tmp_path):
+        """스냅샷이 없으면 캔들 캐시 CSV 끝부분 로드"""
+        now = int(time.time() * 1000) // FIVE_MIN * FIVE_MIN
+        rows = make_bars(now, 600)
+        lines = ["timestamp,open,high,low,close,volume"] + [
+            f"{r['timestamp']},{r['open']},{r['high']},{r['low']},{r['close']},{r['volume']}"
+            for r in rows
+        ]
+        (tmp_path / "ETHUSDT_5m.csv").write_text("\n".join(lines))
+
+        store = CandleWarmStartStore(cache_dir=tmp_path)
+        candles = await store.get_candles("ETHUSDT", "5m", limit=100)
+
+        assert len(candles) == 100
+        assert candles[-1]["close"] == 599.0
+
+    @pytest.mark.asyncio
+    async def test_fresh_data_skips_api(self, tmp_path):
+        store = CandleWarmStartStore(cache_dir=tmp_path, max_age=60)
+        client = FakeClient()
+
+        await store.get_candles("BTCUSDT", "5m", client=client)
+        await store.get_candles("BTCUSDT", "5m", client=client)
+
+        assert len(client.calls) == 1
+        assert json.loads((tmp_path / "warm_start" / "BTCUSDT_5m.json").read_text())
+
+
+class TestStartAdmission:
+    """StartAdmission 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_starts(self):
+        """burst 이후에는 rate에 맞춰 허용"""
+        admission = StartAdmission(rate=50.0, burst=2)
+
+        started = time.monotonic()
+        await asyncio.gather(*[admission.admit() for _ in range(6)])
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.07  # 추가 4개 × 20ms
+        stats = admission.get_stats()
+        assert stats["admitted"] == 6
+        assert stats["delayed"] >= 4
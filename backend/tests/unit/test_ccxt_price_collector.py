@@ -0,0 +1,121 @@
+"""
+CCXTPriceCollector 유닛 테스트
+
+봇/차트 기반 심볼 등록, 일괄 시세 조회, 틱 지연 통계 테스트.
+"""
+import asyncio
+import time
+
+import pytest
+
+from src.services.ccxt_price_collector import (
+    CCXTPriceCollector,
+    to_ccxt_symbol,
+    to_simple_symbol,
+)
+
+
+class FakeExchange:
+    """fetch_tickers 호출을 기록하는 거래소"""
+
+    def __init__(self, bulk: bool = True):
+        self.has = {"fetchTickers": bulk}
+        self.bulk_calls = []
+        self.single_calls = []
+
+    def _ticker(self, symbol):
+        return {"symbol": symbol, "last": 100.0, "baseVolume": 5.0, "timestamp": time.time() * 1000 - 250}
+
+    async def fetch_tickers(self, symbols):
+        self.bulk_calls.append(list(symbols))
+        return {s: self._ticker(s) for s in symbols}
+
+    async def fetch_ticker(self, symbol):
+        self.single_calls.append(symbol)
+        if symbol.startswith("BAD"):
+            raise ValueError("bad symbol")
+        return self._ticker(symbol)
+
+
+class TestSymbolConversion:
+    def test_round_trip(self):
+        assert to_simple_symbol("BTC/USDT:USDT") == "BTCUSDT"
+        assert to_simple_symbol("eth-usdt") == "ETHUSDT"
+        assert to_ccxt_symbol("SOLUSDT") == "SOL/USDT:USDT"
+        assert to_ccxt_symbol("BTCUSD") is None
+
+
+class TestCollectorSymbols:
+    """심볼 등록 테스트"""
+
+    def test_symbols_follow_bots(self):
+        collector = CCXTPriceCollector()
+        collector.add_symbol("SOLUSDT", owner=1)
+        collector.add_symbol("SOL/USDT", owner=2)
+        collector.add_symbol("BTCUSDT", owner=2)
+
+        assert collector.symbols() == ["BTCUSDT", "SOLUSDT"]
+
+        collector.remove_owner(2)
+        assert collector.symbols() == ["SOLUSDT"]
+
+        collector.remove_owner(1)
+        assert collector.symbols() == []
+
+    def test_chart_symbols_expire(self):
+        collector = CCXTPriceCollector(chart_ttl=0.05)
+        collector.touch_chart("ethusdt")
+
+        assert collector.symbols() == ["ETHUSDT"]
+        time.sleep(0.06)
+        assert collector.symbols() == []
+
+    @pytest.mark.asyncio
+    async def test_new_symbol_wakes_collector(self):
+        """새 심볼 등록 시 다음 주기를 기다리지 않음"""
+        collector = CCXTPriceCollector(interval=10.0)
+        waiter = asyncio.create_task(collector._wait_next())
+        await asyncio.sleep(0)
+
+        collector.add_symbol("XRPUSDT", owner=1)
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+
+class TestCollectorFetch:
+    """시세 조회/게시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_bulk_call(self):
+        collector = CCXTPriceCollector()
+        exchange = FakeExchange()
+
+        tickers = await collector.fetch_tickers(exchange, ["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+
+        assert exchange.bulk_calls == [["BTC/USDT:USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"]]
+        assert exchange.single_calls == []
+        assert set(tickers) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_per_symbol(self):
+        """일괄 조회 미지원 시 심볼별 조회, 실패한 심볼만 제외"""
+        collector = CCXTPriceCollector()
+        exchange = FakeExchange(bulk=False)
+
+        tickers = await collector.fetch_tickers(exchange, ["BTCUSDT", "BADUSDT"])
+
+        assert set(tickers) == {"BTCUSDT"}
+        assert collector.bulk_errors == 1
+
+    def test_publish_records_latency(self):
+        collector = CCXTPriceCollector()
+        market_queue = asyncio.Queue(maxsize=1)
+        market_queue.put_nowait({"symbol": "OLD"})
+        ticker = FakeExchange()._ticker("BTC/USDT:USDT")
+
+        collector.publish("BTCUSDT", ticker, market_queue)
+
+        assert market_queue.get_nowait()["symbol"] == "BTCUSDT"
+        stats = collector.get_stats()["symbols"]["BTCUSDT"]
+        assert stats["ticks"] == 1
+        assert stats["last_latency_ms"] >= 250
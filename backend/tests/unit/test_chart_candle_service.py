@@ -0,0 +1,118 @@
+"""
+ChartCandleService 유닛 테스트
+
+틱 → 1분봉 → 상위 타임프레임 롤업과 백필 병합 테스트.
+"""
+import time
+
+import pytest
+
+from src.services.chart_candle_service import Bar, ChartCandleService
+
+BASE = 1_700_006_400  # 4시간 경계 (UTC)
+
+
+def _service(history=None):
+    service = ChartCandleService(max_bars=100)
+    calls = []
+
+    async def load_from_cache(symbol, timeframe):
+        return []
+
+    async def fetch_from_exchange(symbol, timeframe):
+        calls.append((symbol, timeframe))
+        return list((history or {}).get(timeframe, []))
+
+    service._load_from_cache = load_from_cache
+    service._fetch_from_exchange = fetch_from_exchange
+    return service, calls
+
+
+class TestChartCandleService:
+    """ChartCandleService 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_forming_bar_updates_in_place(self):
+        """같은 분의 틱은 현재 1분봉을 갱신"""
+        service, _ = _service()
+
+        service.process_tick("BTCUSDT", 100.0, timestamp=BASE + 1)
+        service.process_tick("BTCUSDT", 105.0, timestamp=BASE + 20)
+        service.process_tick("BTCUSDT", 98.0, timestamp=BASE + 40)
+
+        candles = await service.get_candles("BTCUSDT", "1m", limit=10)
+
+        assert candles[-1] == {
+            "time": BASE, "open": 100.0, "high": 105.0, "low": 98.0,
+            "close": 98.0, "volume": 0.0, "tick_count": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_rollup_to_higher_timeframe(self):
+        """닫힌 1분봉이 5분봉으로 롤업"""
+        service, _ = _service()
+
+        prices = [100.0, 110.0, 90.0, 105.0, 101.0, 120.0]
+        for i, price in enumerate(prices):
+            service.process_tick("BTCUSDT", price, timestamp=BASE + i * 60)
+
+        candles = await service.get_candles("BTCUSDT", "5m", limit=10)
+
+        closed, current = candles[-2], candles[-1]
+        assert closed["time"] == BASE
+        assert (closed["open"], closed["high"], closed["low"], closed["close"]) == (
+            100.0, 110.0, 90.0, 101.0,
+        )
+        assert current["time"] == BASE + 300
+        assert current["close"] == 120.0
+
+    @pytest.mark.asyncio
+    async def test_forming_higher_bar_includes_current_minute(self):
+        """상위 타임프레임 현재봉 = 롤업된 분봉 + 현재 1분봉"""
+        service, _ = _service()
+
+        service.process_tick("BTCUSDT", 100.0, timestamp=BASE)
+        service.process_tick("BTCUSDT", 130.0, timestamp=BASE + 60)
+
+        candles = await service.get_candles("BTCUSDT", "1h", limit=5)
+
+        assert candles[-1]["open"] == 100.0
+        assert candles[-1]["high"] == 130.0
+        assert candles[-1]["close"] == 130.0
+
+    @pytest.mark.asyncio
+    async def test_backfill_runs_once(self):
+        """백필은 심볼/타임프레임당 한 번만 실행"""
+        history = {"15m": [Bar(BASE - 900 * i, 1, 2, 0.5, 1.5, 10, 1) for i in range(3, 0, -1)]}
+        service, calls = _service(history)
+        service.process_tick("BTCUSDT", 100.0, timestamp=BASE)
+
+        first = await service.get_candles("BTCUSDT", "15m", limit=10)
+        await service.get_candles("BTCUSDT", "15m", limit=10)
+
+        assert calls == [("BTCUSDT", "15m")]
+        assert [c["time"] for c in first] == [BASE - 2700, BASE - 1800, BASE - 900, BASE]
+
+    @pytest.mark.asyncio
+    async def test_exchange_bar_replaces_partial_first_live_bar(self):
+        """백필 데이터가 중간부터 시작된 첫 라이브 봉보다 우선"""
+        now = int(time.time())
+        minute = now - now % 60
+        history = {"1m": [Bar(minute - 120, 1, 1, 1, 1, 5, 1), Bar(minute - 60, 2, 9, 1, 3, 5, 1)]}
+        service, _ = _service(history)
+
+        service.process_tick("BTCUSDT", 4.0, timestamp=minute - 30)
+        service.process_tick("BTCUSDT", 5.0, timestamp=minute + 1)
+
+        candles = await service.get_candles("BTCUSDT", "1m", limit=10, include_current=False)
+
+        assert [c["time"] for c in candles] == [minute - 120, minute - 60]
+        assert candles[-1]["high"] == 9
+
+    @pytest.mark.asyncio
+    async def test_unsupported_timeframe(self):
+        """지원하지 않는 타임프레임"""
+        service, _ = _service()
+
+        with pytest.raises(ValueError):
+            await service.get_candles("BTCUSDT", "3m")
@@ -0,0 +1,53 @@
+"""
+fast_json 유닛 테스트
+
+직렬화 형식, orjson/표준 json 동작 일치 테스트.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from src.utils import fast_json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestFastJson:
+    """loads/dumps"""
+
+    def test_round_trip(self, backend):
+        data = {"type": "price_update", "symbol": "BTCUSDT", "price": 50000.5, "tags": ["a", "한글"]}
+
+        text = fast_json.dumps(data)
+
+        assert isinstance(text, str)
+        assert fast_json.loads(text) == data
+        assert fast_json.loads(text.encode()) == data
+        assert fast_json.dumps_bytes(data) == text.encode("utf-8")
+
+    def test_compact_output(self, backend):
+        """표준 json과 같은 compact 형식 (공백 없음, 유니코드 그대로)"""
+        data = {"a": 1, "b": [1, 2], "c": "한글"}
+
+        assert fast_json.dumps(data) == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def test_non_str_keys(self, backend):
+        assert fast_json.loads(fast_json.dumps({1: "x"})) == {"1": "x"}
+
+    def test_numpy_values(self):
+        if not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        assert fast_json.loads(fast_json.dumps({"v": np.array([1.5, 2.5])})) == {"v": [1.5, 2.5]}
+
+    def test_invalid_json_is_json_decode_error(self, backend):
+        """기존 except json.JSONDecodeError 처리가 그대로 동작"""
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.loads("{not json")
+
@@ -0,0 +1,265 @@
+"""
+FeedManager 유닛 테스트
+
+거래소 메시지 정규화, 구독 참조 카운트, 재연결 후 재구독, 누락 감지 테스트.
+"""
+import asyncio
+import json
+
+import pytest
+
+from src.services.exchanges.feed_manager import (
+    BinanceFeedProtocol,
+    BybitFeedProtocol,
+    FeedManager,
+    OKXFeedProtocol,
+    simple_symbol,
+)
+
+
+class FakeConnection:
+    """연결 하나 (send 기록, push로 메시지 주입, drop으로 끊기)"""
+
+    def __init__(self):
+        self.sent = []
+        self._incoming = asyncio.Queue()
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    def push(self, message):
+        self._incoming.put_nowait(json.dumps(message))
+
+    def drop(self):
+        self._incoming.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class FakeConnector:
+    """connect(url) 대체 - 연결할 때마다 새 FakeConnection"""
+
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self, url):
+        connector = self
+
+        class _Context:
+            async def __aenter__(self):
+                conn = FakeConnection()
+                connector.connections.append(conn)
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Context()
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def binance_trade(trade_id, price="100.5"):
+    return {
+        "stream": "btcusdt@aggTrade",
+        "data": {"e": "aggTrade", "a": trade_id, "p": price, "q": "0.2", "T": 1700000000000, "m": True},
+    }
+
+
+class TestProtocols:
+    """거래소별 메시지 -> FeedRecord"""
+
+    def test_simple_symbol(self):
+        assert simple_symbol("BTC/USDT:USDT") == "BTCUSDT"
+        assert simple_symbol("ETH-USDT-SWAP") == "ETHUSDT"
+        assert simple_symbol("sol_usdt") == "SOLUSDT"
+
+    def test_binance_kline(self):
+        protocol = BinanceFeedProtocol()
+        key = ("candle", "BTCUSDT", "5m")
+        protocol.register(key)
+
+        [(parsed_key, record)] = protocol.parse(json.dumps({
+            "stream": "btcusdt@kline_5m",
+            "data": {"k": {"t": 1700000000000, "o": "1", "h": "3", "l": "0.5", "c": "2", "v": "10", "x": True}},
+        }))
+
+        assert parsed_key == key
+        assert (record.exchange, record.kind, record.symbol) == ("binance", "candle", "BTCUSDT")
+        assert (record.open, record.high, record.low, record.price) == (1.0, 3.0, 0.5, 2.0)
+        assert record.interval == "5m"
+        assert record.closed is True
+
+    def test_okx_ticker(self):
+        protocol = OKXFeedProtocol()
+        protocol.register(("ticker", "ETHUSDT", ""))
+
+        [(_, record)] = protocol.parse(json.dumps({
+            "arg": {"channel": "tickers", "instId": "ETH-USDT-SWAP"},
+            "data": [{"instId": "ETH-USDT-SWAP", "last": "2500.1", "vol24h": "42", "ts": "1700000000000"}],
+        }))
+
+        assert record.symbol == "ETHUSDT"
+        assert record.price == 2500.1
+        assert record.ts == 1700000000000
+
+    def test_bybit_ticker_delta_without_price_skipped(self):
+        protocol = BybitFeedProtocol()
+        protocol.register(("ticker", "BTCUSDT", ""))
+
+        records = protocol.parse(json.dumps({
+            "topic": "tickers.BTCUSDT", "type": "delta", "ts": 1, "data": {"fundingRate": "0.0001"},
+        }))
+
+        assert records == []
+
+    def test_subscribe_message_format(self):
+        protocol = OKXFeedProtocol()
+
+        [message] = protocol.subscribe_messages([("candle", "BTCUSDT", "1h")])
+
+        assert json.loads(message) == {
+            "op": "subscribe",
+            "args": [{"channel": "candle1H", "instId": "BTC-USDT-SWAP"}],
+        }
+
+
+class TestFeedManager:
+    """구독/연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shared_subscription_refcount(self):
+        """같은 스트림 구독자 둘은 거래소 구독 하나를 공유"""
+        connector = FakeConnector()
+        manager = FeedManager(connect=connector)
+        first, second = [], []
+
+        sub1 = await manager.subscribe("binance", "trade", "BTC/USDT", first.append)
+        sub2 = await manager.subscribe("binance", "trade", "BTCUSDT", second.append)
+        await settle()
+
+        conn = connector.connections[0]
+        assert [m["method"] for m in conn.sent] == ["SUBSCRIBE"]
+        assert conn.sent[0]["params"] == ["btcusdt@aggTrade"]
+
+        conn.push(binance_trade(1))
+        await settle()
+        assert len(first) == len(second) == 1
+        assert first[0].price == 100.5
+        assert first[0].side == "sell"
+
+        await manager.unsubscribe(sub1)
+        assert [m["method"] for m in conn.sent] == ["SUBSCRIBE"]
+
+        await manager.unsubscribe(sub2)
+        assert conn.sent[-1]["method"] == "UNSUBSCRIBE"
+        assert manager.get_stats()["binance"]["connected"] is False
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_during_unsubscribe_keeps_routing(self):
+        """해제 메시지 전송 중 같은 스트림을 다시 구독해도 새 구독자가 메시지를 받음"""
+        connector = FakeConnector()
+        manager = FeedManager(connect=connector)
+        received = []
+
+        old = await manager.subscribe("binance", "trade", "BTCUSDT", lambda r: None)
+        await manager.subscribe("binance", "trade", "ETHUSDT", lambda r: None)
+        await settle()
+        conn = connector.connections[0]
+        send = conn.send
+
+        async def slow_send(message):
+            await asyncio.sleep(0.01)
+            await send(message)
+
+        conn.send = slow_send
+        await asyncio.gather(
+            manager.unsubscribe(old),
+            manager.subscribe("binance", "trade", "BTCUSDT", received.append),
+        )
+        conn.push(binance_trade(1))
+        await settle()
+
+        assert len(received) == 1
+        assert [m["method"] for m in conn.sent[-2:]] == ["UNSUBSCRIBE", "SUBSCRIBE"]
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_after_reconnect(self):
+        """재연결 시 살아 있는 스트림 재구독 + reconnect 누락 알림"""
+        connector = FakeConnector()
+        manager = FeedManager(connect=connector, min_backoff=0.01)
+        gaps = []
+
+        await manager.subscribe("binance", "trade", "BTCUSDT", lambda r: None, on_gap=gaps.append)
+        await settle()
+        connector.connections[0].drop()
+
+        for _ in range(100):
+            if len(connector.connections) > 1 and connector.connections[1].sent:
+                break
+            await asyncio.sleep(0.01)
+
+        assert connector.connections[1].sent[0]["params"] == ["btcusdt@aggTrade"]
+        assert [gap.reason for gap in gaps] == ["reconnect"]
+        assert manager.get_stats()["binance"]["reconnects"] == 1
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_sequence_gap_detected(self):
+        connector = FakeConnector()
+        manager = FeedManager(connect=connector)
+        received, gaps = [], []
+
+        await manager.subscribe("binance", "trade", "BTCUSDT", received.append, on_gap=gaps.append)
+        await settle()
+        conn = connector.connections[0]
+
+        for trade_id in (10, 11, 14):
+            conn.push(binance_trade(trade_id))
+        await settle()
+
+        assert len(received) == 3
+        assert [gap.reason for gap in gaps] == ["sequence"]
+        assert manager.get_stats()["binance"]["gaps"] == {"sequence": 1}
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_async_callback_errors_counted(self):
+        """코루틴 콜백은 끝날 때까지 참조 유지, 예외는 callback_errors로 집계"""
+        connector = FakeConnector()
+        manager = FeedManager(connect=connector)
+        received = []
+
+        async def on_record(record):
+            received.append(record)
+            raise ValueError("handler failed")
+
+        await manager.subscribe("binance", "trade", "BTCUSDT", on_record)
+        await settle()
+        connector.connections[0].push(binance_trade(1))
+        await settle()
+
+        assert len(received) == 1
+        assert manager._feeds["binance"]._callback_tasks == set()
+        assert manager.get_stats()["binance"]["callback_errors"] == 1
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_unsupported_exchange(self):
+        manager = FeedManager(connect=FakeConnector())
+
+        with pytest.raises(ValueError):
+            await manager.subscribe("kraken", "ticker", "BTCUSDT", lambda r: None)
+        assert FeedManager.supports("OKX") is True
+
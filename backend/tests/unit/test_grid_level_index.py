@@ -0,0 +1,142 @@
+"""
+GridLevelIndex / 주문 스트림 파싱 유닛 테스트
+
+그리드 봇의 체결 이벤트 매칭, 스트림 끊김 시 REST 대사 테스트.
+"""
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.database.models import GridOrder, GridOrderStatus
+from src.services.bitget_order_stream import normalize_symbol, parse_order_update
+from src.services.grid_bot_runner import GridBotRunner, GridLevelIndex
+
+
+def _make_orders(prices):
+    return [
+        GridOrder(grid_index=i, grid_price=Decimal(str(p)), status=GridOrderStatus.PENDING)
+        for i, p in enumerate(prices)
+    ]
+
+
+class TestGridLevelIndex:
+    """GridLevelIndex 테스트"""
+
+    def test_find_tracked_order(self):
+        """발주한 주문 ID로 그리드 조회"""
+        orders = _make_orders([100, 110])
+        index = GridLevelIndex(orders)
+
+        orders[0].buy_order_id = "b-1"
+        index.track("b-1", orders[0])
+
+        assert index.find("b-1") is orders[0]
+        assert index.find("unknown") is None
+
+    def test_find_ignores_replaced_order_id(self):
+        """사이클 재시작으로 교체된 주문 ID는 무시"""
+        orders = _make_orders([100, 110])
+        orders[0].buy_order_id = "old"
+        index = GridLevelIndex(orders)
+
+        orders[0].buy_order_id = "new"
+        index.track("new", orders[0])
+
+        assert index.find("old") is None
+        assert index.find("new") is orders[0]
+
+    def test_next_price(self):
+        """한 단계 위 그리드 가격"""
+        index = GridLevelIndex(_make_orders([100, 110, 120]))
+
+        assert index.next_price(0) == 110.0
+        assert index.next_price(2) is None
+
+
+class _FakeBitget:
+    def __init__(self, open_ids, history):
+        self.open_ids = open_ids
+        self.history = history
+
+    async def get_open_orders(self, symbol=None):
+        return [{"orderId": order_id} for order_id in self.open_ids]
+
+    async def get_order_history(self, symbol):
+        return self.history
+
+
+class TestFallbackReconcile:
+    """주문 스트림 끊김 시 미체결 목록 기반 REST 대사"""
+
+    @pytest.mark.asyncio
+    async def test_fill_reverted_within_poll_is_detected(self):
+        """현재가가 되돌아가 교차가 없어도 미체결 목록에서 사라진 체결 주문은 처리"""
+        orders = _make_orders([100, 110, 120])
+        orders[0].status, orders[0].buy_order_id = GridOrderStatus.BUY_PLACED, "b-0"
+        orders[1].status, orders[1].buy_order_id = GridOrderStatus.BUY_PLACED, "b-1"
+        orders[2].status, orders[2].sell_order_id = GridOrderStatus.SELL_PLACED, "s-2"
+        client = _FakeBitget(
+            open_ids={"b-0"},
+            history=[
+                {"orderId": "b-1", "state": "filled", "priceAvg": "110", "baseVolume": "0.5"},
+                {"orderId": "s-2", "state": "canceled"},
+            ],
+        )
+        runner = GridBotRunner(asyncio.Queue())
+        fills = []
+        runner._apply_fill = AsyncMock(
+            side_effect=lambda *args: fills.append((args[5].grid_index, args[6], args[7]))
+        )
+        session = SimpleNamespace(commit=AsyncMock())
+
+        await runner._reconcile_open_orders(
+            session, client, SimpleNamespace(symbol="BTCUSDT"), None, orders
+        )
+
+        assert fills == [(1, 110.0, 0.5)]
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_history_lookup_when_all_orders_open(self):
+        """모든 그리드 주문이 미체결이면 이력 조회 생략"""
+        orders = _make_orders([100])
+        orders[0].status, orders[0].buy_order_id = GridOrderStatus.BUY_PLACED, "b-0"
+        client = _FakeBitget(open_ids={"b-0"}, history=None)
+        runner = GridBotRunner(asyncio.Queue())
+        runner._apply_fill = AsyncMock()
+
+        await runner._reconcile_open_orders(
+            SimpleNamespace(commit=AsyncMock()), client, SimpleNamespace(symbol="BTCUSDT"), None, orders
+        )
+
+        runner._apply_fill.assert_not_awaited()
+
+
+class TestOrderStreamParsing:
+    """주문 스트림 메시지 파싱 테스트"""
+
+    def test_parse_filled_order(self):
+        """v2 orders 채널 체결 메시지 변환"""
+        update = parse_order_update({
+            "instId": "BTCUSDT",
+            "orderId": "123",
+            "side": "buy",
+            "status": "filled",
+            "priceAvg": "65000.5",
+            "accBaseVolume": "0.01",
+            "uTime": "1700000000000",
+        })
+
+        assert update["order_id"] == "123"
+        assert update["status"] == "filled"
+        assert update["avg_price"] == 65000.5
+        assert update["filled_qty"] == 0.01
+
+    def test_normalize_symbol(self):
+        """심볼 표기 통일"""
+        assert normalize_symbol("BTC/USDT:USDT") == "BTCUSDT"
+        assert normalize_symbol("BTCUSDT_UMCBL") == "BTCUSDT"
+        assert normalize_symbol("btc-usdt") == "BTCUSDT"
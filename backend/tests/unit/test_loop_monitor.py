@@ -0,0 +1,50 @@
+"""
+EventLoopStallDetector 유닛 테스트
+
+이벤트 루프 블로킹 감지 및 스택 샘플 로깅 테스트.
+"""
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.utils.loop_monitor import EventLoopStallDetector
+
+
+def _blocking_call(seconds: float):
+    time.sleep(seconds)
+
+
+class TestEventLoopStallDetector:
+    """EventLoopStallDetector 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call_with_stack(self, caplog):
+        """루프 블로킹 감지 시 블로킹 함수가 포함된 스택 로그"""
+        detector = EventLoopStallDetector(threshold_ms=50)
+        await detector.start()
+
+        with caplog.at_level(logging.WARNING, logger="src.utils.loop_monitor"):
+            await asyncio.sleep(0.05)
+            _blocking_call(0.3)
+            await asyncio.sleep(0.1)
+
+        await detector.stop()
+
+        assert detector.stall_count == 1
+        assert detector.max_stall_ms >= 50
+        assert "_blocking_call" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_no_report_when_loop_is_responsive(self):
+        """정상 루프에서는 경고 없음"""
+        detector = EventLoopStallDetector(threshold_ms=200)
+        await detector.start()
+
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+
+        await detector.stop()
+
+        assert detector.stall_count == 0
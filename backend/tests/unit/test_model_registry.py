@@ -0,0 +1,98 @@
+"""
+ModelRegistry 유닛 테스트
+
+프로세스당 한 번 로드, 동시 로드 합치기, 버전 교체, 메모리 통계 테스트.
+"""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.ml.models.ensemble_predictor import EnsemblePredictor, reload_ensemble_models
+from src.ml.models.model_registry import ModelRegistry, model_registry
+
+
+class TestModelRegistry:
+    """ModelRegistry 테스트"""
+
+    def test_loads_once_across_threads(self):
+        """여러 스레드가 동시에 요청해도 로드는 한 번"""
+        registry = ModelRegistry()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return np.zeros(1024)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("m", loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert all(r is results[0] for r in results)
+        assert registry.get_stats()["models"]["m"]["hits"] == 8
+
+    def test_swap_replaces_version(self):
+        """교체 후 새 버전 반환, 기존 참조는 그대로 사용 가능"""
+        registry = ModelRegistry()
+        old = registry.get("m", lambda: {"w": np.ones(4)}, version="v1")
+
+        new = registry.swap("m", lambda: {"w": np.ones(8)}, version="v2")
+
+        assert registry.get("m", lambda: None) is new
+        assert old["w"].shape == (4,)
+        stats = registry.get_stats()["models"]["m"]
+        assert stats["version"] == "v2"
+        assert stats["swaps"] == 1
+
+    def test_failed_swap_keeps_current(self):
+        registry = ModelRegistry()
+        current = registry.get("m", lambda: "model-v1", version="v1")
+
+        def broken():
+            raise RuntimeError("corrupt model file")
+
+        with pytest.raises(RuntimeError):
+            registry.swap("m", broken, version="v2")
+
+        assert registry.get("m", broken) == current
+        assert registry.entry("m").version == "v1"
+
+    def test_memory_estimate(self):
+        """numpy 배열 크기로 메모리 추정"""
+        registry = ModelRegistry()
+        registry.get("m", lambda: (np.zeros(1024 * 1024, dtype=np.float32), None))
+
+        assert registry.get_stats()["models"]["m"]["size_mb"] == pytest.approx(4.0)
+
+
+class TestEnsemblePredictorSharing:
+    """EnsemblePredictor 모델 공유 테스트"""
+
+    def test_instances_share_bundle(self, tmp_path):
+        """같은 디렉토리의 예측기는 같은 모델 묶음 사용"""
+        first = EnsemblePredictor(models_dir=tmp_path)
+        second = EnsemblePredictor(models_dir=tmp_path)
+
+        assert first.bundle is second.bundle
+
+    def test_reload_only_when_files_change(self, tmp_path):
+        predictor = EnsemblePredictor(models_dir=tmp_path)
+        before = predictor.bundle
+
+        assert reload_ensemble_models(tmp_path)["swapped"] is False
+
+        (tmp_path / "lightgbm_direction.txt").write_text("retrained")
+        result = reload_ensemble_models(tmp_path)
+
+        assert result["swapped"] is True
+        assert predictor.bundle is not before
+        assert model_registry.entry(f"lightgbm:{tmp_path.resolve()}").version == result["version"]
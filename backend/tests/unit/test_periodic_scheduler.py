@@ -0,0 +1,128 @@
+"""
+PeriodicScheduler 유닛 테스트
+
+타이밍 휠 만료, 키 병합, 소유자 해제, 동시 실행 제한 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.services.periodic_scheduler import PeriodicScheduler, TimingWheel
+
+
+class TestTimingWheel:
+    """TimingWheel 테스트"""
+
+    def test_expires_across_levels(self):
+        """하위/상위 레벨 항목 모두 정확한 tick에 만료"""
+        wheel = TimingWheel(slots=(4, 4, 4))
+        deadlines = [1, 3, 5, 17, 63, 100]
+        for d in deadlines:
+            wheel.schedule(d, d)
+
+        fired = {}
+        for _ in range(110):
+            for item in wheel.advance():
+                fired[item] = wheel.current
+
+        assert fired == {d: d for d in deadlines}
+        assert wheel.size == 0
+
+    def test_past_deadline_rejected(self):
+        wheel = TimingWheel()
+        assert wheel.schedule("x", 0) is False
+
+
+class TestPeriodicScheduler:
+    """PeriodicScheduler 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_merge(self):
+        """같은 키 등록은 하나의 작업으로 합쳐짐"""
+        scheduler = PeriodicScheduler(tick=0.01)
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        for bot_id in (1, 2, 3):
+            scheduler.register("risk_monitor", 7, interval=0.05, func=job, owner=bot_id, first_delay=0)
+
+        await asyncio.sleep(0.13)
+        await scheduler.stop()
+
+        assert scheduler.get_stats()["jobs"] == 1
+        assert 2 <= len(calls) <= 4
+        assert scheduler.get_jobs()[0]["owners"] == 3
+
+    @pytest.mark.asyncio
+    async def test_last_owner_cancels(self):
+        """마지막 소유자 해제 시 작업 취소"""
+        scheduler = PeriodicScheduler(tick=0.01)
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        scheduler.register("market_regime", "BTCUSDT", interval=0.03, func=job, owner=1, first_delay=0)
+        scheduler.register("market_regime", "BTCUSDT", interval=0.03, func=job, owner=2, first_delay=0)
+
+        scheduler.unregister_owner(1)
+        assert scheduler.get_stats()["jobs"] == 1
+        scheduler.unregister_owner(2)
+        assert scheduler.get_stats()["jobs"] == 0
+
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_stats(self):
+        """동시 실행 수 제한, 종류별 실행 통계"""
+        scheduler = PeriodicScheduler(tick=0.01, max_concurrency=2)
+        active = []
+        peak = []
+
+        async def job():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.03)
+            active.pop()
+
+        for symbol in ("A", "B", "C", "D"):
+            scheduler.register("market_regime", symbol, interval=10, func=job, first_delay=0)
+
+        await asyncio.sleep(0.12)
+        await scheduler.stop()
+
+        assert max(peak) == 2
+        stats = scheduler.get_stats()["by_type"]["market_regime"]
+        assert stats["runs"] == 4
+        assert stats["missed_deadlines"] >= 1  # 세마포어 대기로 늦게 시작
+
+    @pytest.mark.asyncio
+    async def test_overlap_skipped(self):
+        """이전 실행이 끝나지 않았으면 다음 실행 건너뜀"""
+        scheduler = PeriodicScheduler(tick=0.01)
+
+        async def slow():
+            await asyncio.sleep(0.1)
+
+        scheduler.register("alert_checks", "all", interval=0.02, func=slow, first_delay=0)
+        await asyncio.sleep(0.08)
+        await scheduler.stop()
+
+        assert scheduler.get_stats()["by_type"]["alert_checks"]["skipped_overlaps"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_job_error_recorded(self):
+        scheduler = PeriodicScheduler(tick=0.01)
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        scheduler.register("risk_monitor", 1, interval=10, func=failing, first_delay=0)
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+
+        assert scheduler.get_stats()["by_type"]["risk_monitor"]["errors"] == 1
@@ -0,0 +1,197 @@
+"""
+PersistenceQueue 유닛 테스트
+
+배치 INSERT/UPDATE, 같은 행 변경 합치기, 커밋 대기, 실패 격리, 호출자 취소 테스트.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.models import BotLog, Trade, User
+from src.services.persistence_queue import PersistenceQueue
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def create_user(session_factory) -> int:
+    async with session_factory() as session:
+        user = User(email="queue@example.com", password_hash="x")
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+def trade_row(user_id: int, symbol: str = "BTCUSDT"):
+    return {
+        "user_id": user_id,
+        "symbol": symbol,
+        "side": "BUY",
+        "qty": 0.1,
+        "entry_price": 100,
+        "leverage": 5,
+    }
+
+
+class TestPersistenceQueue:
+    """PersistenceQueue 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_flush(self, session_factory):
+        """동시 거래 기록은 한 트랜잭션에 묶이고 각자 ID를 받음"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory)
+
+        ids = await asyncio.gather(
+            *[queue.write(Trade, trade_row(user_id, f"SYM{i}USDT")) for i in range(5)]
+        )
+
+        assert len(set(ids)) == 5
+        async with session_factory() as session:
+            rows = (await session.execute(select(Trade.id, Trade.symbol))).all()
+        assert {row.id: row.symbol for row in rows} == {
+            trade_id: f"SYM{i}USDT" for i, trade_id in enumerate(ids)
+        }
+        stats = queue.get_stats()
+        assert stats["rows_inserted"] == 5
+        assert stats["statements"] == 1
+
+    @pytest.mark.asyncio
+    async def test_updates_coalesce_per_row(self, session_factory):
+        """같은 행의 값 변경은 마지막 값, 증가분은 합산"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=0.01)
+        trade_id = await queue.write(Trade, trade_row(user_id))
+
+        queue.update(Trade, trade_id, values={"qty": 0.2})
+        queue.update(Trade, trade_id, values={"qty": 0.3}, increments={"leverage": 1})
+        queue.update(Trade, trade_id, increments={"leverage": 2, "pnl": 1.5})
+        assert queue.depth == 1
+
+        await queue.flush()
+
+        async with session_factory() as session:
+            trade = await session.get(Trade, trade_id)
+        assert trade.qty == pytest.approx(0.3)
+        assert trade.leverage == 8
+        assert float(trade.pnl) == pytest.approx(1.5)
+        assert queue.get_stats()["coalesced_updates"] == 2
+
+    @pytest.mark.asyncio
+    async def test_background_flush(self, session_factory):
+        """기다리지 않는 쓰기는 flush_interval 후 기록"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=0.01)
+
+        for i in range(3):
+            queue.add(BotLog, {"user_id": user_id, "event_type": "order_execution", "message": f"m{i}"})
+        assert queue.depth == 3
+
+        await asyncio.sleep(0.1)
+
+        async with session_factory() as session:
+            messages = (await session.execute(select(BotLog.message))).scalars().all()
+        assert sorted(messages) == ["m0", "m1", "m2"]
+        assert queue.depth == 0
+        assert queue.get_stats()["by_reason"] == {"time": 1}
+
+    @pytest.mark.asyncio
+    async def test_bad_row_isolated(self, session_factory):
+        """실패한 행만 버리고 나머지는 기록"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, max_retries=0)
+
+        queue.add(BotLog, {"user_id": user_id, "event_type": "pnl_update", "message": "ok"})
+        queue.add(BotLog, {"user_id": user_id, "event_type": "pnl_update", "message": None})
+        await queue.flush()
+
+        async with session_factory() as session:
+            messages = (await session.execute(select(BotLog.message))).scalars().all()
+        assert messages == ["ok"]
+        assert queue.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_raises(self, session_factory):
+        """거래 기록 실패는 호출자에게 전달"""
+        queue = PersistenceQueue(session_factory, max_retries=0)
+
+        with pytest.raises(IntegrityError):
+            await queue.write(Trade, {"user_id": 1, "side": "BUY"})  # symbol 누락
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_lose_batch(self, session_factory):
+        """flush를 호출한 봇 태스크가 취소돼도 다른 봇의 거래 기록은 커밋되고 write()가 반환"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=60)
+        original_write = queue._write
+
+        async def slow_write(inserts, updates):
+            await asyncio.sleep(0.05)
+            await original_write(inserts, updates)
+
+        queue._write = slow_write
+        other_bot = asyncio.create_task(queue.write(Trade, trade_row(user_id)))
+        await asyncio.sleep(0)
+        stopping_bot = asyncio.create_task(queue.flush())
+        await asyncio.sleep(0.01)
+        stopping_bot.cancel()
+
+        trade_id = await asyncio.wait_for(other_bot, 1)
+
+        async with session_factory() as session:
+            assert await session.get(Trade, trade_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_close_during_timed_flush(self, session_factory):
+        """close가 진행 중인 시간 기준 flush 타이머를 취소해도 배치는 기록"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=0.01)
+        started = asyncio.Event()
+        original_write = queue._write
+
+        async def slow_write(inserts, updates):
+            started.set()
+            await asyncio.sleep(0.05)
+            await original_write(inserts, updates)
+
+        queue._write = slow_write
+        queue.add(BotLog, {"user_id": user_id, "event_type": "pnl_update", "message": "kept"})
+        await started.wait()
+        await queue.close()
+
+        async with session_factory() as session:
+            messages = (await session.execute(select(BotLog.message))).scalars().all()
+        assert messages == ["kept"]
+
+    @pytest.mark.asyncio
+    async def test_update_durable_waits_for_commit(self, session_factory):
+        """update_durable은 커밋 후 반환"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=0.01)
+        trade_id = await queue.write(Trade, trade_row(user_id))
+
+        await asyncio.wait_for(queue.update_durable(Trade, trade_id, values={"qty": 0.5}), 1)
+
+        async with session_factory() as session:
+            trade = await session.get(Trade, trade_id)
+        assert trade.qty == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_dropped_update_is_reported(self, session_factory):
+        """끝내 기록하지 못한 갱신은 update_durable 예외와 flush 반환값으로 알림"""
+        user_id = await create_user(session_factory)
+        queue = PersistenceQueue(session_factory, flush_interval=0.01, max_retries=0)
+        trade_id = await queue.write(Trade, trade_row(user_id))
+
+        with pytest.raises(IntegrityError):
+            await queue.update_durable(Trade, trade_id, values={"symbol": None})
+
+        queue.update(Trade, trade_id, values={"symbol": None})
+        queue.update(BotLog, 999, values={"message": "no such row"})
+        assert await queue.flush() == [("trades", trade_id)]
+        assert queue.get_stats()["dropped"] == 2
@@ -6,13 +6,14 @@ rate_limit_improved.py의 RateLimitStore, EnhancedRateLimitMiddleware, EndpointR
 import pytest
 import time
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from collections import defaultdict
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from src.middleware.rate_limit_improved import (
     RateLimitStore,
+    RedisRateLimitStore,
+    SlidingWindowCounter,
     EnhancedRateLimitMiddleware,
     EndpointRateLimiter
 )
@@ -81,9 +82,10 @@ class TestRateLimitStore:
         """슬라이딩 윈도우 테스트"""
         store = RateLimitStore()
 
-        # 오래된 요청 시뮬레이션
-        old_time = time.time() - 70  # 70초 전 (60초 윈도우 밖)
-        store.ip_requests["test_key"] = [old_time] * 10
+        # 오래된 요청 시뮬레이션 (2 윈도우 이전에 가득 찬 카운터)
+        counter = SlidingWindowCounter(time.time() - 130, 60)
+        counter.current = 10
+        store.ip_requests["test_key"] = counter
 
         # 새 요청
         allowed, remaining, reset_time = store.check_and_record(
@@ -94,17 +96,52 @@ class TestRateLimitStore:
         )
 
         assert allowed is True  # 오래된 요청은 무시됨
-        assert len(store.ip_requests["test_key"]) == 1  # 새 요청만
+        assert store.ip_requests["test_key"].previous == 0
+        assert store.ip_requests["test_key"].current == 1  # 새 요청만
+
+    def test_previous_window_is_weighted(self):
+        """직전 윈도우 요청은 경과 비율만큼 가중"""
+        store = RateLimitStore()
+
+        # 직전 윈도우 10회, 현재 윈도우 절반 경과 → 약 5회로 계산
+        counter = SlidingWindowCounter(time.time() - 90, 60)
+        counter.current = 10
+        store.ip_requests["test_key"] = counter
+
+        results = [
+            store.check_and_record(
+                key="test_key", storage=store.ip_requests, limit=10, window=60
+            )[0]
+            for _ in range(6)
+        ]
+
+        assert results[:4] == [True] * 4
+        assert results[-1] is False
+
+    def test_memory_is_constant_per_key(self):
+        """요청 수와 관계없이 키당 카운터 1개"""
+        store = RateLimitStore()
+
+        for _ in range(500):
+            store.check_and_record(
+                key="test_key", storage=store.ip_requests, limit=1000, window=60
+            )
+
+        counter = store.ip_requests["test_key"]
+        assert isinstance(counter, SlidingWindowCounter)
+        assert counter.current == 500
+        assert len(store._ip_heap) == 1
 
     def test_cleanup_old_entries(self):
         """오래된 엔트리 정리 테스트"""
         store = RateLimitStore()
-        store._last_cleanup = time.time() - 400  # 5분 이상 경과
 
-        # 오래된 IP 엔트리 추가
-        old_time = time.time() - 4000  # 1시간 이상 전
-        store.ip_requests["old_ip"] = [old_time]
-        store.ip_requests["recent_ip"] = [time.time() - 100]
+        # 오래된 IP 엔트리 추가 (1시간 이상 전)
+        for key, started in (("old_ip", time.time() - 4000), ("recent_ip", time.time() - 100)):
+            counter = SlidingWindowCounter(started, 60)
+            counter.current = 1
+            store.ip_requests[key] = counter
+            store._schedule_expiry(store.ip_requests, key, counter)
 
         # cleanup 트리거
         store.check_and_record(
@@ -122,33 +159,31 @@ class TestRateLimitStore:
         """IP 저장소 크기 제한 테스트"""
         store = RateLimitStore()
         store.MAX_IP_ENTRIES = 100  # 테스트용으로 줄임
-        store._last_cleanup = time.time() - 400
 
         # 많은 IP 엔트리 추가
         for i in range(150):
-            store.ip_requests[f"ip_{i}"] = [time.time()]
-
-        # cleanup 트리거
-        store.check_and_record(
-            key="trigger",
-            storage=store.ip_requests,
-            limit=10,
-            window=60
-        )
+            store.check_and_record(
+                key=f"ip_{i}",
+                storage=store.ip_requests,
+                limit=10,
+                window=60
+            )
 
-        # 최대 크기 이하로 줄어듦
-        assert len(store.ip_requests) <= store.MAX_IP_ENTRIES + 1
+        # 최대 크기 이하로 유지, 가장 오래된 키부터 제거
+        assert len(store.ip_requests) <= store.MAX_IP_ENTRIES
+        assert "ip_0" not in store.ip_requests
+        assert "ip_149" in store.ip_requests
 
     def test_user_storage_cleanup(self):
         """사용자별 저장소 정리 테스트"""
         store = RateLimitStore()
-        store._last_cleanup = time.time() - 400
 
-        # 빈 엔드포인트 추가
-        store.user_requests[1] = defaultdict(list)
-        store.user_requests[1]["empty_endpoint"] = []
-        store.user_requests[2] = defaultdict(list)
-        store.user_requests[2]["active_endpoint"] = [time.time()]
+        # 사용자 1은 오래된 요청만, 사용자 2는 최근 요청
+        for user_id, started in ((1, time.time() - 4000), (2, time.time())):
+            counter = SlidingWindowCounter(started, 60)
+            counter.current = 1
+            store.user_requests[user_id]["general"] = counter
+            store._schedule_expiry(store.user_requests[user_id], "general", counter)
 
         # cleanup 트리거
         store.check_and_record(
@@ -159,9 +194,36 @@ class TestRateLimitStore:
         )
 
         # 빈 사용자 엔트리 삭제됨
-        assert 1 not in store.user_requests or not store.user_requests[1]
+        assert 1 not in store.user_requests
         assert 2 in store.user_requests
 
+    def test_ip_churn_does_not_evict_user_counters(self):
+        """IP 키가 크기 제한을 넘어도 사용자 카운터는 유지 (저장소별 힙/제한)"""
+        store = RateLimitStore()
+        store.MAX_IP_ENTRIES = 10
+
+        for _ in range(3):
+            store.check_and_record("order", store.user_requests[1], limit=3, window=60)
+        for i in range(50):
+            store.check_and_record(f"ip_{i}", store.ip_requests, limit=10, window=60)
+
+        allowed, _, _ = store.check_and_record("order", store.user_requests[1], limit=3, window=60)
+        assert allowed is False
+        assert len(store.ip_requests) <= store.MAX_IP_ENTRIES
+
+    def test_max_user_entries_evicts_only_users(self):
+        """사용자 수 제한 초과 시 사용자 카운터만 제거"""
+        store = RateLimitStore()
+        store.MAX_USER_ENTRIES = 5
+
+        store.check_and_record("ip:1", store.ip_requests, limit=10, window=60)
+        for user_id in range(20):
+            store.check_and_record("general", store.user_requests[user_id], limit=10, window=60)
+
+        assert len(store.user_requests) <= store.MAX_USER_ENTRIES
+        assert 19 in store.user_requests
+        assert "ip:1" in store.ip_requests
+
     def test_reset_time_calculation(self):
         """리셋 시간 계산 테스트"""
         store = RateLimitStore()
@@ -182,10 +244,96 @@ class TestRateLimitStore:
             window=60
         )
 
-        # 리셋 시간은 가장 오래된 요청 + 윈도우
-        expected_reset = int(min(store.ip_requests["test_key"]) + 60)
+        # 리셋 시간은 현재 윈도우 시작 + 윈도우
+        expected_reset = int(store.ip_requests["test_key"].window_start + 60)
         assert reset_time == expected_reset
 
+    def test_reset_time_when_blocked(self):
+        """차단 시 리셋 시간은 미래이며 윈도우 2배 이내"""
+        store = RateLimitStore()
+
+        for _ in range(11):
+            allowed, remaining, reset_time = store.check_and_record(
+                key="test_key", storage=store.ip_requests, limit=10, window=60
+            )
+
+        now = time.time()
+        assert allowed is False
+        assert now < reset_time <= now + 121
+
+
+class _FakeRedis:
+    """Lua 슬라이딩 윈도우 스크립트를 파이썬으로 흉내내는 최소 Redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    def register_script(self, lua):
+        async def script(keys, args):
+            limit, window, elapsed = args
+            previous = int(self.data.get(keys[1], 0))
+            current = int(self.data.get(keys[0], 0))
+            if previous * (window - elapsed) / window + current + 1 > limit:
+                return [0, current, previous]
+            self.data[keys[0]] = current + 1
+            return [1, current + 1, previous]
+
+        return script
+
+
+class TestRedisRateLimitStore:
+    """RedisRateLimitStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limit_and_key_layout(self):
+        """허용/차단과 IP/사용자 키 분리"""
+        redis = _FakeRedis()
+        store = RedisRateLimitStore(redis)
+        local = RateLimitStore()
+
+        results = [
+            (await store.check_and_record("ip:1.2.3.4", local.ip_requests, limit=3, window=60))[0]
+            for _ in range(4)
+        ]
+        allowed, remaining, reset_time = await store.check_and_record(
+            "order", local.user_requests[7], limit=3, window=60
+        )
+
+        assert results == [True, True, True, False]
+        assert allowed is True and remaining <= 2
+        assert reset_time > time.time()
+        assert any(key.startswith("ratelimit:ip:1.2.3.4:") for key in redis.data)
+        assert any(key.startswith("ratelimit:user:7:order:") for key in redis.data)
+
+    @pytest.mark.asyncio
+    async def test_workers_share_counters(self):
+        """같은 Redis를 쓰는 저장소(워커)끼리 카운터 공유"""
+        redis = _FakeRedis()
+        local = RateLimitStore()
+        workers = [RedisRateLimitStore(redis), RedisRateLimitStore(redis)]
+
+        results = [
+            (await workers[i % 2].check_and_record("ip:x", local.ip_requests, limit=2, window=60))[0]
+            for i in range(3)
+        ]
+
+        assert results == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_middleware_falls_back_to_local_store_on_redis_error(self):
+        """Redis 오류 시 워커 로컬 저장소로 폴백"""
+        middleware = EnhancedRateLimitMiddleware(Mock())
+        failing = Mock()
+        failing.check_and_record = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        with patch.object(middleware, "_get_shared_store", return_value=failing):
+            allowed, remaining, _ = await middleware._check(
+                "ip:1", middleware.store.ip_requests, 5, 60
+            )
+
+        assert allowed is True and remaining == 4
+        assert "ip:1" in middleware.store.ip_requests
+
 
 class TestEndpointRateLimiter:
     """EndpointRateLimiter 테스트"""
@@ -245,8 +393,9 @@ class TestEndpointRateLimiter:
         limiter = EndpointRateLimiter(limit=2, window=60, name="test_limiter")
 
         # 오래된 요청 시뮬레이션
-        old_time = time.time() - 70
-        limiter.requests[1] = [old_time, old_time]
+        counter = SlidingWindowCounter(time.time() - 130, 60)
+        counter.current = 2
+        limiter.requests[1] = counter
 
         # 새 요청 가능 (오래된 요청 무시됨)
         allowed, remaining, reset_time = limiter.check(user_id=1)
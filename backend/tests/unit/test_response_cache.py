@@ -0,0 +1,155 @@
+"""
+ResponseCacheManager / AI 호출 합치기 유닛 테스트
+
+컨텍스트 양자화, 프로세스 내 LRU, 동시 동일 요청 single-flight 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.services.ai_optimization.integrated_ai_service import IntegratedAIService
+from src.services.ai_optimization.response_cache import ResponseCacheManager, quantize_value
+
+
+class TestQuantization:
+    """컨텍스트 양자화 테스트"""
+
+    def test_nearby_prices_share_key(self):
+        """0.2% 버킷 안의 가격은 같은 캐시 키"""
+        cache = ResponseCacheManager()
+
+        a = cache.build_query("market_analysis", "price 65000.0", {"symbol": "BTCUSDT", "price": 65000.0})
+        b = cache.build_query("market_analysis", "price 65010.0", {"symbol": "BTCUSDT", "price": 65010.0})
+        c = cache.build_query("market_analysis", "price 66000.0", {"symbol": "BTCUSDT", "price": 66000.0})
+
+        assert cache.get_cache_key("market_analysis", a) == cache.get_cache_key("market_analysis", b)
+        assert cache.get_cache_key("market_analysis", a) != cache.get_cache_key("market_analysis", c)
+
+    def test_unconfigured_type_uses_prompt(self):
+        """규칙이 없는 타입은 프롬프트와 원본 컨텍스트로 키 생성"""
+        cache = ResponseCacheManager()
+
+        query = cache.build_query("anomaly_detection", "prompt", {"severity": 0.123})
+
+        assert query == {"prompt": "prompt", "context": {"severity": 0.123}}
+
+    def test_quantize_value_methods(self):
+        """양자화 방식별 결과"""
+        assert quantize_value(0.73, ("step", 0.05)) == pytest.approx(0.70)
+        assert quantize_value(1.234, ("round", 1)) == 1.2
+        assert quantize_value("BUY", ("round", 1)) == "BUY"
+        assert quantize_value(True, ("step", 0.5)) is True
+
+    def test_list_values_quantized_per_element(self):
+        """리스트 컨텍스트는 원소별로 양자화"""
+        assert quantize_value([1.234, 2.26, "x"], ("round", 1)) == [1.2, 2.3, "x"]
+
+    @pytest.mark.asyncio
+    async def test_signal_validation_key_includes_rule_outcome_and_price(self):
+        """규칙 결과/점수/가격이 다르면 검증 응답 캐시를 공유하지 않음"""
+        from src.agents.signal_validator.agent import SignalValidatorAgent
+
+        cache = ResponseCacheManager()
+        keys = []
+
+        class FakeAI:
+            async def call_ai(self, agent_type, prompt, context, response_type, **kwargs):
+                query = cache.build_query(response_type, prompt, context, agent_type)
+                keys.append(cache.get_cache_key(response_type, query))
+                return {"response": ""}
+
+        agent = SignalValidatorAgent("validator", "Validator", ai_service=FakeAI())
+        regime = {"regime_type": "trending_up", "volatility": 2.0, "trend_strength": 0.5}
+
+        async def validate(signal_id, price, result, score, failed):
+            await agent._validate_with_ai(
+                signal_id, "BTCUSDT", "buy", 0.8, price, regime, result, score, failed
+            )
+
+        await validate("s1", 65000.0, "APPROVED", 0.9, [])
+        await validate("s2", 65001.0, "APPROVED", 0.9, [])
+        await validate("s3", 65000.0, "REJECTED", 0.9, [])
+        await validate("s4", 65000.0, "APPROVED", 0.4, [])
+        await validate("s5", 65000.0, "APPROVED", 0.9, ["volume"])
+        await validate("s6", 70000.0, "APPROVED", 0.9, [])
+
+        assert keys[0] == keys[1]  # signal_id/미세한 가격 차이는 공유
+        assert len(set(keys[1:])) == 5
+
+    def test_configure_rejects_unknown_method(self):
+        """알 수 없는 양자화 방식"""
+        cache = ResponseCacheManager()
+
+        with pytest.raises(ValueError):
+            cache.configure_quantization("risk_assessment", {"var": ("log2", 1)})
+
+
+class TestLocalTier:
+    """프로세스 내 LRU 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_works_without_redis(self):
+        """Redis 없이도 응답 캐싱"""
+        cache = ResponseCacheManager(redis_client=None)
+        query = {"prompt": "p", "context": {}}
+
+        assert await cache.get_cached_response("general", query, agent_type="test_agent") is None
+        await cache.set_cached_response("general", query, {"response": "ok", "cost_info": {"total_cost_usd": 0.01}})
+        cached = await cache.get_cached_response("general", query, agent_type="test_agent")
+
+        assert cached["response"] == "ok"
+        stats = cache.get_cache_stats()["by_agent"]["test_agent"]
+        assert stats["local_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+        assert stats["cost_saved_usd"] == 0.01
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest(self):
+        """최대 크기 초과 시 가장 오래된 항목 제거"""
+        cache = ResponseCacheManager(local_max_size=2)
+
+        for i in range(3):
+            await cache.set_cached_response("general", {"i": i}, {"response": str(i)})
+
+        assert await cache.get_cached_response("general", {"i": 0}) is None
+        assert (await cache.get_cached_response("general", {"i": 2}))["response"] == "2"
+
+
+class TestSingleFlight:
+    """동시 동일 요청 합치기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_api_call(self):
+        """동시에 들어온 같은 쿼리는 API를 한 번만 호출"""
+        service = IntegratedAIService.__new__(IntegratedAIService)
+        service.response_cache = ResponseCacheManager()
+        service._inflight = {}
+        calls = []
+
+        async def call_provider(agent_type, prompt, query_data, *args):
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return {"response": "TRENDING", "cost_info": {"total_cost_usd": 0.02},
+                    "cache_hit": False, "sampled": True}
+
+        service._call_provider = call_provider
+
+        results = await asyncio.gather(*[
+            service.call_ai(
+                agent_type="market_regime",
+                prompt=f"price {65000 + i}",
+                context={"symbol": "BTCUSDT", "price": 65000.0 + i},
+                response_type="market_analysis",
+                enable_sampling=False,
+            )
+            for i in range(3)
+        ])
+
+        assert len(calls) == 1
+        assert [r["response"] for r in results] == ["TRENDING"] * 3
+        assert sum(1 for r in results if r.get("coalesced")) == 2
+        stats = service.response_cache.get_cache_stats()["by_agent"]["market_regime"]
+        assert stats["coalesced"] == 2
+        assert stats["cost_saved_usd"] == 0.04
+        assert service._inflight == {}
@@ -0,0 +1,270 @@
+"""
+ReturnCovarianceEngine 유닛 테스트
+
+봇 수익률 EWMA 공분산/상관관계 점진 갱신 테스트.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.agents.portfolio_optimizer.covariance import ReturnCovarianceEngine
+
+
+START = datetime(2025, 1, 1)
+
+
+def _feed(engine, user_id, series, capital=1000.0):
+    """series: {bot_id: [pnl_day0, pnl_day1, ...]}"""
+    days = len(next(iter(series.values())))
+    for bot_id in series:
+        engine.set_allocation(user_id, bot_id, capital)
+    for day in range(days):
+        ts = START + timedelta(days=day, hours=12)
+        for bot_id, pnls in series.items():
+            engine.record_trade(user_id, bot_id, pnls[day], ts)
+    # 마지막 버킷 닫기
+    engine.record_equity(user_id, capital * len(series), START + timedelta(days=days, hours=12))
+
+
+class TestReturnCovarianceEngine:
+    """ReturnCovarianceEngine 테스트"""
+
+    def test_identity_without_history(self):
+        """관측치 없으면 독립(단위 행렬)"""
+        engine = ReturnCovarianceEngine()
+        corr = engine.correlation(1, [10, 20])
+
+        assert np.allclose(corr, np.eye(2))
+
+    def test_positively_correlated_bots(self):
+        """같은 방향으로 움직이는 봇은 양의 상관관계"""
+        engine = ReturnCovarianceEngine(min_observations=3)
+        rng = np.random.default_rng(0)
+        base = rng.normal(0, 10, 40)
+        _feed(engine, 1, {10: list(base), 20: list(base * 2 + rng.normal(0, 1, 40))})
+
+        corr = engine.correlation(1, [10, 20])
+
+        assert corr[0, 1] > 0.9
+        assert corr[0, 1] == pytest.approx(corr[1, 0])
+        assert np.allclose(np.diag(corr), 1.0)
+
+    def test_negatively_correlated_bots(self):
+        """반대 방향 봇은 음의 상관관계"""
+        engine = ReturnCovarianceEngine(min_observations=3)
+        base = list(np.random.default_rng(1).normal(0, 10, 40))
+        _feed(engine, 1, {10: base, 20: [-x for x in base]})
+
+        corr = engine.correlation(1, [10, 20])
+
+        assert corr[0, 1] < -0.99
+
+    def test_matches_order_of_requested_ids(self):
+        """요청한 봇 순서대로 행렬 반환"""
+        engine = ReturnCovarianceEngine(min_observations=3)
+        base = list(np.random.default_rng(2).normal(0, 10, 30))
+        _feed(engine, 1, {10: base, 20: base, 30: [-x for x in base]})
+
+        corr = engine.correlation(1, [30, 10])
+
+        assert corr[0, 1] < -0.99
+
+    def test_insufficient_observations_treated_as_independent(self):
+        """관측치가 부족한 봇은 상관관계 0"""
+        engine = ReturnCovarianceEngine(min_observations=10)
+        base = list(np.random.default_rng(3).normal(0, 10, 5))
+        _feed(engine, 1, {10: base, 20: base})
+
+        corr = engine.correlation(1, [10, 20])
+
+        assert corr[0, 1] == 0.0
+
+    def test_remove_bot_keeps_other_pairs(self):
+        """봇 제거 후에도 나머지 쌍의 상관관계 유지"""
+        engine = ReturnCovarianceEngine(min_observations=3)
+        base = list(np.random.default_rng(4).normal(0, 10, 30))
+        _feed(engine, 1, {10: base, 20: list(np.ones(30)), 30: base})
+
+        before = engine.correlation(1, [10, 30])[0, 1]
+        engine.remove_bot(1, 20)
+        after = engine.correlation(1, [10, 30])[0, 1]
+
+        assert after == pytest.approx(before)
+
+    def test_equity_used_as_capital_base(self):
+        """할당 금액이 없으면 에퀴티 기준으로 수익률 계산"""
+        engine = ReturnCovarianceEngine(min_observations=1)
+        engine.record_equity(1, 1000.0, START)
+        engine.record_trade(1, 10, 10.0, START + timedelta(hours=1))
+        engine.record_equity(1, 1010.0, START + timedelta(days=1))
+
+        cov = engine.covariance(1, [10])
+
+        assert engine.observation_count(1) == 1
+        assert cov[0, 0] > 0
+
+
+class TestPortfolioAgentHistory:
+    """에이전트의 DB 이력 warm start"""
+
+    @pytest.mark.asyncio
+    async def test_failed_history_load_is_retried(self, monkeypatch):
+        from src.agents.portfolio_optimizer import agent as agent_module
+
+        calls = []
+
+        async def flaky_load(session, user_id, lookback_days):
+            calls.append(user_id)
+            if len(calls) == 1:
+                raise ConnectionError("db down")
+            return []
+
+        monkeypatch.setattr(agent_module, "load_return_history", flaky_load)
+        agent = agent_module.PortfolioOptimizationAgent("portfolio", "Portfolio", db_session=object())
+
+        assert await agent._ensure_return_history(1) is False
+        assert await agent._ensure_return_history(1) is True
+        assert await agent._ensure_return_history(1) is False
+        assert calls == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_caller_waits_for_history_load(self, monkeypatch):
+        """로드 중에 들어온 호출은 빈 행렬로 진행하지 않고 로드 완료를 기다림"""
+        import asyncio
+
+        from src.agents.portfolio_optimizer import agent as agent_module
+
+        release = asyncio.Event()
+        calls = []
+
+        async def slow_load(session, user_id, lookback_days):
+            calls.append(user_id)
+            await release.wait()
+            return [(START, "trade", {"bot_id": 7, "pnl": 10.0})]
+
+        monkeypatch.setattr(agent_module, "load_return_history", slow_load)
+        agent = agent_module.PortfolioOptimizationAgent("portfolio", "Portfolio", db_session=object())
+
+        first = asyncio.create_task(agent._ensure_return_history(1))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(agent._ensure_return_history(1))
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        release.set()
+        assert await first is True
+        assert await second is True
+        assert calls == [1]
+        assert 1 in agent._history_loaded
+
+    @pytest.mark.asyncio
+    async def test_history_loaded_with_session_factory(self, monkeypatch):
+        """session_factory가 있으면 로드마다 새 세션 사용"""
+        from src.agents.portfolio_optimizer import agent as agent_module
+
+        sessions = []
+
+        class FakeSession:
+            async def __aenter__(self):
+                sessions.append(self)
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        async def load(session, user_id, lookback_days):
+            assert session is sessions[-1]
+            return []
+
+        monkeypatch.setattr(agent_module, "load_return_history", load)
+        agent = agent_module.PortfolioOptimizationAgent(
+            "portfolio", "Portfolio", session_factory=FakeSession
+        )
+
+        assert await agent._ensure_return_history(1) is True
+        assert len(sessions) == 1
+
+    @pytest.mark.asyncio
+    async def test_allocation_applied_before_replay(self, monkeypatch):
+        from src.agents.portfolio_optimizer import agent as agent_module
+        from src.agents.portfolio_optimizer.models import BotPerformanceMetrics
+
+        async def load(session, user_id, lookback_days):
+            return [(START, "trade", {"bot_id": 7, "pnl": 10.0})]
+
+        monkeypatch.setattr(agent_module, "load_return_history", load)
+        agent = agent_module.PortfolioOptimizationAgent(
+            "portfolio", "Portfolio", config={"enable_ai": False}, db_session=object()
+        )
+        engine = agent.covariance_engines["daily"]
+        allocations_at_replay = []
+        original_replay = engine.replay
+        monkeypatch.setattr(
+            engine, "replay",
+            lambda user_id, events: allocations_at_replay.append(
+                dict(engine._get_state(user_id).allocations)
+            ) or original_replay(user_id, events),
+        )
+        bots = [
+            BotPerformanceMetrics.model_construct(bot_instance_id=bot_id, current_allocation_amount=500.0)
+            for bot_id in (7, 8)
+        ]
+
+        await agent._calculate_correlation_internal(bots, user_id=1)
+
+        assert allocations_at_replay == [{7: 500.0, 8: 500.0}]
+
+
+class TestPortfolioAgentAIInsights:
+    """AI 포트폴리오 분석 프롬프트/캐시 컨텍스트 구성"""
+
+    @pytest.mark.asyncio
+    async def test_ai_analysis_uses_model_fields(self):
+        from src.agents.portfolio_optimizer.agent import PortfolioOptimizationAgent
+        from src.agents.portfolio_optimizer.models import (
+            BotPerformanceMetrics,
+            CorrelationMatrix,
+            PortfolioAnalysis,
+            RiskContribution,
+            RiskLevel,
+        )
+
+        calls = []
+
+        class FakeAIService:
+            async def call_ai(self, **kwargs):
+                calls.append(kwargs)
+                return {"response": '{"insights": ["a"], "warnings": [], "recommendations": ["b"]}'}
+
+        bots = [
+            BotPerformanceMetrics(
+                bot_instance_id=bot_id, bot_name=f"bot{bot_id}", symbol="BTCUSDT",
+                roi=roi, total_pnl=roi * 10, win_rate=60.0, sharpe_ratio=1.2,
+                max_drawdown=-5.0, volatility=10.0, total_trades=20, winning_trades=12,
+                current_allocation_percent=50.0, current_allocation_amount=500.0,
+            )
+            for bot_id, roi in ((10, 12.5), (20, -3.0))
+        ]
+        analysis = PortfolioAnalysis(
+            user_id=1, total_bots=2, total_equity=1000.0, bot_performance=bots,
+            correlation_matrix=CorrelationMatrix(bot_ids=[10, 20], matrix=[[1.0, 0.4], [0.4, 1.0]]),
+            risk_contributions=[
+                RiskContribution(
+                    bot_instance_id=10, bot_name="bot10",
+                    marginal_var=0.1, component_var=0.05, contribution_percent=70.0,
+                )
+            ],
+            portfolio_roi=4.75, portfolio_volatility=8.0, portfolio_sharpe=0.9,
+        )
+        agent = PortfolioOptimizationAgent("portfolio", "Portfolio", ai_service=FakeAIService())
+
+        result = await agent._analyze_portfolio_with_ai(1, analysis, bots, RiskLevel.MODERATE)
+
+        assert result == {"insights": ["a"], "warnings": [], "recommendations": ["b"]}
+        context = calls[0]["context"]
+        assert context["bot_ids"] == [10, 20]
+        assert context["bot_returns"] == [12.5, -3.0]
+        assert context["risk_contributions"] == [[10, 70.0]]
+        assert context["average_correlation"] == pytest.approx(0.4)
+        assert "Bot 10: ROI=12.5%" in calls[0]["prompt"]
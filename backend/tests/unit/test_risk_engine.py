@@ -0,0 +1,79 @@
+"""
+RiskEngine 유닛 테스트
+
+심볼별 포지션 테이블, 벡터화 평가, 알림 발생 조건 테스트.
+"""
+import pytest
+
+from src.agents.risk_monitor.engine import RiskEngine
+from src.agents.risk_monitor.models import RiskLevel
+
+
+class TestRiskEngine:
+    """RiskEngine 테스트"""
+
+    def test_pnl_for_all_positions_on_symbol(self):
+        """tick 하나로 같은 심볼의 모든 포지션 평가"""
+        engine = RiskEngine()
+        engine.upsert(1, "BTCUSDT", "long", size=0.5, entry_price=100.0, leverage=10)
+        engine.upsert(2, "BTC/USDT", "short", size=1.0, entry_price=100.0, leverage=5)
+        engine.upsert(3, "ETHUSDT", "long", size=1.0, entry_price=10.0, leverage=2)
+
+        engine.on_price("BTCUSDT", 102.0)
+
+        assert engine.get_position(1)["unrealized_pnl"] == pytest.approx(1.0)
+        assert engine.get_position(2)["unrealized_pnl"] == pytest.approx(-2.0)
+        assert engine.get_position(2)["unrealized_pnl_percent"] == pytest.approx(-2.0)
+        assert engine.get_position(3)["unrealized_pnl"] == 0.0
+        assert engine.get_stats()["positions_evaluated"] == 2
+
+    def test_loss_alert_edge_triggered(self):
+        """손실 알림은 조건 진입 시 한 번만"""
+        engine = RiskEngine(max_position_loss_percent=5.0, liquidation_warning_percent=1.0)
+        received = []
+        engine.subscribe(lambda position_id, alert: received.append((position_id, alert)))
+        engine.upsert(1, "BTCUSDT", "long", size=1.0, entry_price=100.0, leverage=1)
+
+        engine.on_price("BTCUSDT", 94.0)
+        engine.on_price("BTCUSDT", 93.0)
+        assert [(pid, a.alert_type) for pid, a in received] == [(1, "position_loss")]
+
+        engine.on_price("BTCUSDT", 99.0)  # 회복 후 재진입
+        engine.on_price("BTCUSDT", 94.0)
+        assert len(received) == 2
+
+    def test_liquidation_alert(self):
+        """추정 청산가 접근 시 CRITICAL 알림"""
+        engine = RiskEngine(max_position_loss_percent=50.0, liquidation_warning_percent=10.0)
+        engine.upsert(7, "BTCUSDT", "long", size=1.0, entry_price=100.0, leverage=10)
+
+        alerts = engine.on_price("BTCUSDT", 95.0)  # 청산가 91 → 거리 4.2%
+
+        assert len(alerts) == 1
+        position_id, alert = alerts[0]
+        assert position_id == 7
+        assert alert.risk_level == RiskLevel.CRITICAL
+        assert alert.metadata["liquidation_price"] == pytest.approx(91.0)
+
+    def test_remove_keeps_other_rows(self):
+        """행 삭제 후에도 나머지 포지션 값 유지"""
+        engine = RiskEngine()
+        for i in range(20):
+            engine.upsert(i, "BTCUSDT", "long", size=1.0, entry_price=100.0 + i, leverage=10)
+
+        engine.remove(0)
+        engine.remove(5)
+        engine.on_price("BTCUSDT", 110.0)
+
+        assert engine.get_position(0) is None
+        assert engine.get_position(19)["entry_price"] == 119.0
+        assert engine.get_position(19)["unrealized_pnl"] == pytest.approx(-9.0)
+        assert engine.get_stats()["positions"] == 18
+
+    def test_symbol_change_moves_position(self):
+        engine = RiskEngine()
+        engine.upsert(1, "BTCUSDT", "long", size=1.0, entry_price=100.0, leverage=10)
+        engine.upsert(1, "ETHUSDT", "long", size=1.0, entry_price=10.0, leverage=10)
+
+        assert engine.get_position(1)["symbol"] == "ETHUSDT"
+        assert engine.get_stats()["symbols"] == 1
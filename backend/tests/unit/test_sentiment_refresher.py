@@ -0,0 +1,109 @@
+"""
+SentimentRefresher 유닛 테스트
+
+새 헤드라인만 배치 점수 계산, 점수 캐시, 게시된 시그널 조회 테스트.
+"""
+from datetime import datetime
+
+import pytest
+
+from src.agents.sentiment_analyzer.agent import SentimentAnalyzerAgent
+from src.agents.sentiment_analyzer.models import NewsItem, SentimentLabel
+from src.agents.sentiment_analyzer.refresher import SentimentRefresher
+
+
+def make_news(news_id: str, title: str) -> NewsItem:
+    return NewsItem(
+        title=title,
+        url=f"https://example.com/{news_id}",
+        source="cryptopanic",
+        published_at=datetime.utcnow(),
+        currencies=["ETH"],
+        news_id=news_id,
+    )
+
+
+class FakeSentimentAgent(SentimentAnalyzerAgent):
+    """FinBERT 대신 고정 점수를 돌려주는 에이전트"""
+
+    def __init__(self):
+        super().__init__(agent_id="test", name="test")
+        self.news = []
+        self.batches = []
+
+    def _load_model(self):
+        pass
+
+    async def _fetch_all_news(self, coins, hours=24):
+        return list(self.news)
+
+    def analyze_batch(self, texts, batch_size=32):
+        self.batches.append(list(texts))
+        return [(-0.9, SentimentLabel.NEGATIVE, 0.9) for _ in texts]
+
+
+@pytest.fixture
+def agent():
+    return FakeSentimentAgent()
+
+
+@pytest.fixture
+def refresher(agent):
+    return SentimentRefresher(agent_factory=lambda: agent)
+
+
+class TestSentimentRefresher:
+    """SentimentRefresher 테스트"""
+
+    def test_no_signal_before_refresh(self, refresher):
+        refresher.track("eth")
+
+        assert refresher.get_signal("ETH") is None
+
+    @pytest.mark.asyncio
+    async def test_scores_new_headlines_in_one_batch(self, refresher, agent):
+        """처음 보는 헤드라인은 한 번의 배치로 계산"""
+        agent.news = [make_news("1", "ETH ETF delayed"), make_news("2", "Exchange hacked")]
+        refresher.track("ETH")
+
+        await refresher.refresh()
+
+        assert agent.batches == [["ETH ETF delayed", "Exchange hacked"]]
+        signal = refresher.get_signal("eth")
+        assert signal["score"] == pytest.approx(-0.9)
+        assert signal["should_block"] is True
+        assert signal["confidence_multiplier"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_repeated_news_not_rescored(self, refresher, agent):
+        """다시 수집된 뉴스는 캐시된 점수 사용"""
+        agent.news = [make_news("1", "ETH ETF delayed")]
+        refresher.track("ETH")
+        await refresher.refresh()
+
+        agent.news = [make_news("1", "ETH ETF delayed"), make_news("3", "Gas fees spike")]
+        await refresher.refresh()
+
+        assert agent.batches == [["ETH ETF delayed"], ["Gas fees spike"]]
+        assert refresher.stats["score_cache_hits"] == 1
+        assert refresher.get_sentiment("ETH").news_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_news_publishes_neutral(self, refresher, agent):
+        refresher.track("BTC")
+
+        await refresher.refresh()
+
+        assert agent.batches == []
+        assert refresher.get_signal("BTC")["score"] == 0.0
+        assert refresher.get_signal("BTC")["should_block"] is False
+
+    @pytest.mark.asyncio
+    async def test_score_cache_bounded(self, agent):
+        refresher = SentimentRefresher(agent_factory=lambda: agent, max_scores=2)
+        agent.news = [make_news(str(i), f"headline {i}") for i in range(5)]
+        refresher.track("ETH")
+
+        await refresher.refresh()
+
+        assert refresher.get_stats()["cached_scores"] == 2
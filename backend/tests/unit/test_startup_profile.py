@@ -0,0 +1,122 @@
+"""
+startup_profile / lazy_import 유닛 테스트
+
+단계 시간 기록, import 시간 추적, 지연 export, readiness 상태 테스트.
+"""
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.utils.lazy_import import lazy_exports
+from src.utils.startup_profile import StartupProfile, startup_profile
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestStartupProfile:
+    def test_phase_records_time_and_error(self):
+        profile = StartupProfile()
+
+        with profile.phase("cache manager"):
+            pass
+        with pytest.raises(RuntimeError):
+            with profile.phase("bot manager bootstrap"):
+                raise RuntimeError("boom")
+
+        ok, failed = profile.phases
+        assert (ok.group, ok.name, ok.error) == ("lifespan", "cache manager", None)
+        assert failed.error == "RuntimeError: boom"
+        assert profile.get_stats()["totals_ms"]["lifespan"] >= 0
+
+    def test_track_imports(self, tmp_path, monkeypatch):
+        """처음 import되는 모듈 시간 기록, 모듈에서 보이는 로더는 원래 로더"""
+        (tmp_path / "startup_probe_mod.py").write_text("LOADER = __loader__\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        profile = StartupProfile()
+
+        with profile.track_imports():
+            import startup_probe_mod
+        try:
+            [timing] = [p for p in profile.phases if p.name == "startup_probe_mod"]
+            assert timing.group == "import"
+            assert type(startup_probe_mod.LOADER).__name__ != "_TimedLoader"
+            assert not any(type(f).__name__ == "_ImportTimer" for f in sys.meta_path)
+        finally:
+            sys.modules.pop("startup_probe_mod", None)
+
+    def test_readiness(self):
+        profile = StartupProfile()
+        assert profile.ready  # lifespan 없이 (테스트 클라이언트) 는 준비 상태
+
+        profile.begin_warmup()
+        assert not profile.ready
+
+        profile.mark_ready(error="RuntimeError: boom")
+        assert not profile.ready
+        assert profile.get_stats()["warmup_error"] == "RuntimeError: boom"
+
+        profile.begin_warmup()
+        profile.mark_ready()
+        assert profile.ready
+
+
+class TestLazyExports:
+    def test_submodule_loaded_on_first_use(self, tmp_path, monkeypatch):
+        package = tmp_path / "lazy_probe_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "heavy.py").write_text("VALUE = 42\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        import lazy_probe_pkg
+        lazy_probe_pkg.__getattr__ = lazy_exports("lazy_probe_pkg", {"VALUE": ".heavy"})
+        try:
+            assert "lazy_probe_pkg.heavy" not in sys.modules
+
+            from lazy_probe_pkg import VALUE
+
+            assert VALUE == 42
+            assert "lazy_probe_pkg.heavy" in sys.modules
+            assert any(p.group == "lazy" and p.name == "lazy_probe_pkg.heavy" for p in startup_profile.phases)
+            assert not hasattr(lazy_probe_pkg, "MISSING")
+        finally:
+            for name in ("lazy_probe_pkg", "lazy_probe_pkg.heavy"):
+                sys.modules.pop(name, None)
+
+    def test_model_registry_does_not_load_ml_stack(self):
+        """model_registry만 쓰는 쪽은 pandas/lightgbm 모듈을 로드하지 않음 (새 인터프리터)"""
+        code = textwrap.dedent("""
+            import sys
+            from src.ml.models.model_registry import model_registry
+            loaded = [m for m in ("src.ml.models.ensemble_predictor", "src.ml.features.feature_pipeline",
+                                  "pandas", "lightgbm") if m in sys.modules]
+            print(",".join(loaded))
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_ROOT, capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_agents_defer_ml_stack_until_first_analysis(self):
+        """BotRunner가 만드는 에이전트는 생성 시점에 ML 모듈을 로드하지 않음 (새 인터프리터)"""
+        code = textwrap.dedent("""
+            import sys
+            from src.agents.market_regime.agent import MarketRegimeAgent
+            from src.agents.signal_validator.agent import SignalValidatorAgent
+            MarketRegimeAgent("regime", "Regime")
+            SignalValidatorAgent("validator", "Validator")
+            loaded = [m for m in ("src.ml.models.ensemble_predictor", "src.ml.features.feature_pipeline")
+                      if m in sys.modules]
+            print(",".join(loaded))
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_ROOT, capture_output=True, text=True, timeout=60
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
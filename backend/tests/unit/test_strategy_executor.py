@@ -0,0 +1,108 @@
+"""
+StrategyExecutor 유닛 테스트
+
+워커 고정, 타임아웃 시 대체값, 실행 중 건너뛰기, 루프 비차단, CPU 시간 통계 테스트.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.strategy_executor import StrategyExecutor, hold_signal, in_strategy_worker
+
+
+class TestStrategyExecutor:
+    """StrategyExecutor 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_same_pin_same_thread(self):
+        """같은 pin은 항상 같은 워커 스레드에서 실행"""
+        executor = StrategyExecutor(workers=4, timeout=1.0)
+
+        threads = [await executor.run(7, threading.get_ident) for _ in range(5)]
+
+        assert len(set(threads)) == 1
+        assert threads[0] != threading.get_ident()
+        assert await executor.run(7, in_strategy_worker) is True
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_fallback_and_skips_busy(self):
+        """deadline 초과 시 대체값, 이전 호출이 끝나기 전 호출은 바로 대체값"""
+        executor = StrategyExecutor(workers=1, timeout=0.05)
+        fallback = hold_signal("Strategy timeout")
+
+        first = await executor.run(1, time.sleep, 0.2, label="slow", fallback=fallback)
+        second = await executor.run(1, lambda: "ok", label="slow", fallback=fallback)
+        await asyncio.sleep(0.2)
+        third = await executor.run(1, lambda: "ok", label="slow", fallback=fallback)
+
+        assert first == fallback
+        assert second == fallback
+        assert third == "ok"
+        stats = executor.get_stats()["strategies"]["slow"]
+        assert stats["timeouts"] == 1
+        assert stats["busy_skips"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_loop_not_blocked(self):
+        """CPU 작업 중에도 이벤트 루프는 계속 실행"""
+        executor = StrategyExecutor(workers=2, timeout=1.0)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        def busy():
+            end = time.perf_counter() + 0.1
+            while time.perf_counter() < end:
+                pass
+
+        await asyncio.gather(executor.run(1, busy), ticker())
+
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_and_cpu_stats(self):
+        executor = StrategyExecutor(workers=1, timeout=1.0)
+
+        def busy():
+            end = time.perf_counter() + 0.02
+            while time.perf_counter() < end:
+                pass
+
+        def failing():
+            raise ValueError("bad candles")
+
+        await executor.run(1, busy, label="eth_ai_fusion")
+        with pytest.raises(ValueError):
+            await executor.run(1, failing, label="eth_ai_fusion")
+
+        stats = executor.get_stats()["strategies"]["eth_ai_fusion"]
+        assert stats["errors"] == 1
+        assert stats["cpu_time_total_s"] >= 0.015
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_busy_skip_is_per_bot_not_per_pin(self):
+        """같은 사용자(pin)의 다른 봇은 앞선 봇이 실행 중이어도 건너뛰지 않음"""
+        executor = StrategyExecutor(workers=1, timeout=1.0)
+
+        slow = asyncio.create_task(
+            executor.run(1, time.sleep, 0.1, task_key="bot:10", fallback="hold")
+        )
+        await asyncio.sleep(0.01)
+        same_bot = await executor.run(1, lambda: "ok", task_key="bot:10", fallback="hold")
+        other_bot = await executor.run(1, lambda: "ok", task_key="bot:11", fallback="hold")
+        await slow
+
+        assert same_bot == "hold"
+        assert other_bot == "ok"
+        assert executor.get_stats()["strategies"]["default"]["busy_skips"] == 1
+        executor.shutdown()
@@ -0,0 +1,120 @@
+"""
+TelegramDispatcher 유닛 테스트
+
+텔레그램 알림 큐의 우선순위, 병합, rate limit 재시도 테스트.
+"""
+import asyncio
+import time
+
+import pytest
+
+from src.services.telegram.dispatcher import NotificationPriority, TelegramDispatcher
+
+
+def _make_dispatcher(responses=None):
+    sent = []
+    responses = list(responses or [])
+
+    async def send(payload):
+        if responses:
+            result = responses.pop(0)
+            if not result.get("ok"):
+                return result
+        sent.append(payload)
+        return {"ok": True}
+
+    dispatcher = TelegramDispatcher(
+        send, private_interval=0.01, group_interval=0.01, global_rate=1000
+    )
+    return dispatcher, sent
+
+
+class TestTelegramDispatcher:
+    """TelegramDispatcher 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_critical_sent_before_routine(self):
+        """리스크 경고가 일반 알림보다 먼저 전송"""
+        dispatcher, sent = _make_dispatcher()
+
+        dispatcher.enqueue("1", "signal", kind="signal", priority=NotificationPriority.LOW)
+        dispatcher.enqueue("1", "risk", kind="risk_alert", priority=NotificationPriority.CRITICAL)
+        await dispatcher.close(timeout=2)
+
+        assert [p["text"] for p in sent] == ["risk", "signal"]
+
+    @pytest.mark.asyncio
+    async def test_burst_of_same_kind_is_merged(self):
+        """같은 채팅의 같은 유형 알림은 한 메시지로 병합"""
+        dispatcher, sent = _make_dispatcher()
+
+        for i in range(3):
+            dispatcher.enqueue("1", f"close {i}", kind="close_trade")
+        await dispatcher.close(timeout=2)
+
+        assert len(sent) == 1
+        assert sent[0]["text"] == "close 0\n\nclose 1\n\nclose 2"
+        assert dispatcher.stats["merged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_chats_are_not_merged(self):
+        """다른 채팅은 병합하지 않음"""
+        dispatcher, sent = _make_dispatcher()
+
+        dispatcher.enqueue("1", "a", kind="close_trade")
+        dispatcher.enqueue("2", "b", kind="close_trade")
+        await dispatcher.close(timeout=2)
+
+        assert sorted(p["chat_id"] for p in sent) == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_reply_markup_disables_merge(self):
+        """키보드가 있는 메시지는 병합하지 않음"""
+        dispatcher, sent = _make_dispatcher()
+
+        dispatcher.enqueue("1", "a", kind="reply", reply_markup={"keyboard": []})
+        dispatcher.enqueue("1", "b", kind="reply", reply_markup={"keyboard": []})
+        await dispatcher.close(timeout=2)
+
+        assert len(sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_rate_limit(self):
+        """429 응답 시 retry_after 후 재전송"""
+        dispatcher, sent = _make_dispatcher(
+            responses=[{"ok": False, "parameters": {"retry_after": 0.05}}]
+        )
+
+        dispatcher.enqueue("1", "fill", kind="order_filled")
+        await dispatcher.close(timeout=2)
+
+        assert [p["text"] for p in sent] == ["fill"]
+        assert dispatcher.stats["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_enqueue_after_close_is_rejected(self):
+        """종료 후 등록 거부"""
+        dispatcher, sent = _make_dispatcher()
+        await dispatcher.close(timeout=1)
+
+        assert dispatcher.enqueue("1", "late") is False
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_chat_interval_kept_after_queue_drains(self):
+        """큐가 비어 워커가 끝난 직후에 온 같은 채팅 메시지도 채팅별 간격을 지킴"""
+        sent_at = []
+
+        async def send(payload):
+            sent_at.append(time.monotonic())
+            return {"ok": True}
+
+        dispatcher = TelegramDispatcher(send, private_interval=0.2, global_rate=1000)
+
+        dispatcher.enqueue("1", "first", kind="a")
+        await asyncio.sleep(0.05)  # 첫 메시지 전송 후 워커 종료
+        dispatcher.enqueue("1", "second", kind="b")
+        await dispatcher.close(timeout=2)
+
+        assert len(sent_at) == 2
+        assert sent_at[1] - sent_at[0] >= 0.19
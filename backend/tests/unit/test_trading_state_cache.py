@@ -0,0 +1,110 @@
+"""
+TradingStateCache 유닛 테스트
+
+주문 경로의 레버리지 캐싱, 계좌 상태 로드, 지연 시간 통계 테스트.
+"""
+import asyncio
+
+import pytest
+
+from src.services.trading_state_cache import TradingStateCache
+
+
+class FakeClient:
+    """set_leverage 호출을 기록하는 거래소 클라이언트"""
+
+    def __init__(self, account=None, contract=None):
+        self.leverage_calls = []
+        self.account = account
+        self.contract = contract
+
+    async def set_leverage(self, symbol, leverage, margin_coin="USDT"):
+        await asyncio.sleep(0)
+        self.leverage_calls.append((symbol, leverage))
+        return {"symbol": symbol}
+
+    async def get_symbol_account(self, symbol, margin_coin="USDT"):
+        return self.account
+
+    async def get_contract_config(self, symbol):
+        return [self.contract]
+
+
+class TestTradingStateCache:
+    """TradingStateCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_leverage_set_once(self):
+        """같은 레버리지는 한 번만 설정"""
+        cache = TradingStateCache()
+        client = FakeClient()
+
+        assert await cache.ensure_leverage(client, 1, "BTCUSDT", 10) is True
+        assert await cache.ensure_leverage(client, 1, "BTCUSDT", 10) is False
+        assert await cache.ensure_leverage(client, 1, "BTCUSDT", 5) is True
+
+        assert client.leverage_calls == [("BTCUSDT", 10), ("BTCUSDT", 5)]
+        assert cache.get_stats()["leverage_calls_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_bots_share_one_call(self):
+        """같은 사용자의 봇이 동시에 주문해도 set_leverage는 한 번"""
+        cache = TradingStateCache()
+        client = FakeClient()
+
+        await asyncio.gather(*[cache.ensure_leverage(client, 1, "ETHUSDT", 3) for _ in range(5)])
+
+        assert client.leverage_calls == [("ETHUSDT", 3)]
+
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_account_and_contract(self):
+        """봇 시작 시 로드한 레버리지로 주문 전 호출 생략"""
+        cache = TradingStateCache()
+        client = FakeClient(
+            account={"marginMode": "crossed", "crossedMarginLeverage": "10", "posMode": "one_way_mode"},
+            contract={"minTradeNum": "0.001", "volumePlace": "3", "pricePlace": "1"},
+        )
+
+        await cache.warm_up(client, 1, "BTCUSDT")
+
+        assert await cache.ensure_leverage(client, 1, "BTCUSDT", 10) is False
+        assert client.leverage_calls == []
+        assert cache.min_size(1, "BTCUSDT") == 0.001
+        assert cache.get(1, "BTCUSDT").position_mode == "one_way_mode"
+
+    @pytest.mark.asyncio
+    async def test_stale_state_is_refreshed(self):
+        """STATE_TTL이 지나면 한 번 재설정"""
+        cache = TradingStateCache()
+        cache.STATE_TTL = 0
+        client = FakeClient()
+
+        await cache.ensure_leverage(client, 1, "BTCUSDT", 10)
+        await cache.ensure_leverage(client, 1, "BTCUSDT", 10)
+
+        assert len(client.leverage_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_order_update_changes_leverage(self):
+        """주문 스트림의 레버리지 변경 반영"""
+        cache = TradingStateCache()
+        client = FakeClient()
+        await cache.ensure_leverage(client, 1, "BTCUSDT", 10)
+
+        cache.apply_order_update(1, {"symbol": "BTCUSDT", "leverage": "20", "margin_mode": "isolated"})
+
+        assert await cache.ensure_leverage(client, 1, "BTCUSDT", 10) is True
+        assert cache.get(1, "BTCUSDT").margin_mode == "isolated"
+
+    def test_latency_stats(self):
+        """신호 → ACK 지연 시간 통계"""
+        cache = TradingStateCache()
+
+        for ms in (100, 200, 300):
+            cache.record_order_latency("BTCUSDT", ms / 1000, ms / 2000)
+
+        stats = cache.get_stats()
+        assert stats["orders"] == 3
+        assert stats["signal_to_ack"]["p50_ms"] == 200.0
+        assert stats["signal_to_ack"]["max_ms"] == 300.0
+        assert stats["order_rtt"]["max_ms"] == 150.0